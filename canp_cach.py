@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_cach.py
+	Cache
+	Decoded card state saved on disk (columnar), keyed by the log and configuration contents
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+import hashlib
+#import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+#from typing import Callable
+from typing import Dict
+from typing import List
+#from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+#from canp_enum import CANP_ENUM__HEAD_DATA
+from canp_enum import CANP_ENUM__HEAD_LIST
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+
+#from canp_enum import CANP_ENUM__VAL_DEFAULT
+
+
+from canp_jour import canp_jour
+
+
+from canp_load import CANP_LOAD__DATA_MAX
+
+from canp_node import canp_node
+
+from canp_objs import canp_objs
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Cache folder (next to the log file), one file per key
+CANP_CACH__STR_DIR = ".canp_cache"
+CANP_CACH__STR_EXT = ".npz"
+CANP_CACH__INT_VERSION = 3
+
+# Hash (hexadecimal key of 32 characters)
+CANP_CACH__HASH_SIZE = 16
+CANP_CACH__HASH_BLOCK = 1 << 20
+
+# Value column of an object history
+CANP_CACH__KIND_INT = 0
+CANP_CACH__KIND_FLOAT = 1
+CANP_CACH__KIND_ANY = 2					# Anything else (pickled)
+
+# Columns
+CANP_CACH__COL_VERSION = "version"
+CANP_CACH__COL_KEY = "key"
+CANP_CACH__COL_OBJ_KEYS = "obj_keys"	# (chan, node, idx, sub) per history
+CANP_CACH__COL_OBJ_OFFS = "obj_offs"	# First value per history (plus total)
+CANP_CACH__COL_OBJ_KIND = "obj_kind"	# Value column per history
+CANP_CACH__COL_OBJ_TIME = "obj_time"
+CANP_CACH__COL_OBJ_INT = "obj_int"
+CANP_CACH__COL_OBJ_FLOAT = "obj_float"
+CANP_CACH__COL_OBJ_ANY = "obj_any"
+CANP_CACH__COL_CHAN_KEYS = "chan_keys"	# Chan per journal
+CANP_CACH__COL_CHAN_OFFS = "chan_offs"	# First frame per journal (plus total)
+CANP_CACH__COL_CHAN_TIME = "chan_time"
+CANP_CACH__COL_CHAN_COBID = "chan_cobid"
+CANP_CACH__COL_CHAN_DLC = "chan_dlc"
+CANP_CACH__COL_CHAN_DATA = "chan_data"
+CANP_CACH__COL_NODE_KEYS = "node_keys"	# (chan, node) per node
+CANP_CACH__COL_NODE_OFFS = "node_offs"
+CANP_CACH__COL_NODE_STATE = "node_state"
+CANP_CACH__COL_NODE_NMT = "node_nmt"	# Nmt state (see 'canp_node.nmt_get')
+CANP_CACH__COL_NODE_ACC = "node_acc"
+CANP_CACH__COL_NODE_SEQ = "node_seq"	# Frames kept by the node (position in its chan journal)
+
+# Node decoder state (saved as is)
+list_CANP_CACH__NODE_STATE = [
+	"m_int_date",
+	"m_int_time",
+	"m_int_idx",
+	"m_int_sub",
+	"m_int_cmd",
+	"m_int_acc",
+]
+
+# File hashes (key = file name, value = (size, mtime, hash))
+g_dict_hashes: Dict[str, Tuple[int, int, str]] = {}
+
+#  --- CLASS ---
+
+class canp_cach:
+	""" Decoded card cache
+		Object histories, raw frames and node decoder states stored column-wise
+		Restored only for the very same log, configuration files and parse settings
+	"""
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("cach")
+
+	@staticmethod
+	def str_hash(
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> str:
+		""" File content hash (remembered while size and mtime stay the same)
+		"""
+		l_str_ret: str = CANP_ENUM__STR_EMPTY
+
+		try:
+			l_obj_stat = os.stat(i_str_file)
+			l_tuple_hash = g_dict_hashes.get(i_str_file)
+
+			if l_tuple_hash is not None \
+			and l_tuple_hash[0] == l_obj_stat.st_size \
+			and l_tuple_hash[1] == l_obj_stat.st_mtime_ns:
+				l_str_ret = l_tuple_hash[2]
+			else:
+				l_obj_hash = hashlib.blake2b(digest_size = CANP_CACH__HASH_SIZE)
+				with open(i_str_file, "rb") as l_obj_file:
+					while True:
+						l_bytes_block = l_obj_file.read(CANP_CACH__HASH_BLOCK)
+						if not l_bytes_block:
+							break
+						l_obj_hash.update(l_bytes_block)
+
+				l_str_ret = l_obj_hash.hexdigest()
+				g_dict_hashes[i_str_file] = (l_obj_stat.st_size, l_obj_stat.st_mtime_ns, l_str_ret)
+			# - except OSError -
+		except OSError:
+			canp_cach.m_logs.error(f"cach.str_hash.file[{i_str_file}].unknown")
+
+		return l_str_ret
+
+	@staticmethod
+	def str_key(
+				i_obj_card: Any,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_list_args: List[Any] = []
+			) -> str:
+		""" Cache key : log content, configuration of every node, parse settings
+		"""
+		l_obj_hash = hashlib.blake2b(digest_size = CANP_CACH__HASH_SIZE)
+
+		l_obj_hash.update(f"{CANP_CACH__INT_VERSION}:{canp_cach.str_hash(i_str_file)}".encode())
+
+		for l_int_chan in sorted(i_obj_card.chan_list()):
+			l_obj_chan = i_obj_card[l_int_chan]
+			for l_int_node in sorted(l_obj_chan.node_list()):
+				# Configured nodes only (others are created while parsing)
+				l_str_conf = l_obj_chan[l_int_node].m_str_conf
+				if l_str_conf != CANP_ENUM__STR_EMPTY:
+					l_obj_hash.update(f"|{l_int_chan}.{l_int_node}:{canp_cach.str_hash(l_str_conf)}".encode())
+
+				# Objects left undecoded (lazy decoding)
+				l_set_want = l_obj_chan[l_int_node].m_set_want
+				if l_set_want is not None:
+					l_obj_hash.update(f"|{l_int_chan}.{l_int_node}:{sorted(l_set_want)}".encode())
+
+				# Objects stored change-only (timestamps spread in runs)
+				l_dict_runs = l_obj_chan[l_int_node].m_dict_runs
+				if l_dict_runs is not None:
+					l_obj_hash.update(f"|{l_int_chan}.{l_int_node}:{sorted(l_dict_runs.items(), key = repr)}".encode())
+
+		l_obj_hash.update(repr(i_list_args).encode())
+
+		return l_obj_hash.hexdigest()
+
+	@staticmethod
+	def str_file(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_key: str = CANP_ENUM__STR_EMPTY,
+				i_str_dir: str = CANP_ENUM__STR_EMPTY
+			) -> str:
+		""" Cache file name (cache folder next to the log file by default)
+		"""
+		if i_str_dir == CANP_ENUM__STR_EMPTY:
+			i_str_dir = os.path.join(os.path.dirname(os.path.abspath(i_str_file)), CANP_CACH__STR_DIR)
+
+		return os.path.join(i_str_dir, i_str_key + CANP_CACH__STR_EXT)
+
+	@staticmethod
+	def narr_rows(
+				i_list_data: List[Any] = []
+			) -> Any:
+		""" Payload rows of every chan joined (zero padded to the widest rows, see 'canp_jour.data_wide')
+		"""
+		l_int_data: int = max(l_narr_data.shape[1] for l_narr_data in i_list_data)
+
+		return np.concatenate([
+			np.pad(l_narr_data, ((0, 0), (0, l_int_data - l_narr_data.shape[1])))
+			for l_narr_data in i_list_data])
+
+	@staticmethod
+	def card_save(
+				i_obj_card: Any,
+				i_str_cache: str = CANP_ENUM__STR_EMPTY,
+				i_str_key: str = CANP_ENUM__STR_EMPTY
+			) -> bool:
+		""" Card state saving (chans, nodes, object histories, raw frames)
+		"""
+		l_bool_ret: bool = False
+
+		l_list_obj_keys: List[Tuple[int, int, int, int]] = []
+		l_list_obj_offs: List[int] = [0]
+		l_list_obj_kind: List[int] = []
+		l_list_obj_time: List[float] = []
+		l_list_obj_vals: List[List[Any]] = [[], [], []]
+
+		l_list_chan_keys: List[int] = []
+		l_list_chan_offs: List[int] = [0]
+		l_list_chan_cols: List[List[Any]] = [
+			[np.empty(0, dtype = np.float64)],
+			[np.empty(0, dtype = np.int64)],
+			[np.empty(0, dtype = np.uint8)],
+			[np.empty((0, CANP_LOAD__DATA_MAX), dtype = np.uint8)]]
+
+		l_list_node_keys: List[Tuple[int, int]] = []
+		l_list_node_offs: List[int] = [0]
+		l_list_node_state: List[List[int]] = []
+		l_list_node_nmt: List[int] = []
+		l_list_node_acc: List[Any] = []
+		l_list_node_seq: List[int] = []
+
+		for l_int_chan in sorted(i_obj_card.chan_list()):
+			l_obj_chan = i_obj_card[l_int_chan]
+
+			l_list_chan_keys.append(l_int_chan)
+			# Journal columns (time, cobid, dlc, data)
+			for l_list_col, l_narr_col in zip(l_list_chan_cols, l_obj_chan.m_obj_jour.narr_cols()):
+				l_list_col.append(l_narr_col)
+			l_list_chan_offs.append(l_list_chan_offs[-1] + len(l_obj_chan.m_obj_jour))
+
+			for l_int_node in sorted(l_obj_chan.node_list()):
+				l_obj_node = l_obj_chan[l_int_node]
+
+				l_list_node_keys.append((l_int_chan, l_int_node))
+				l_list_node_state.append([getattr(l_obj_node, l_str_attr) for l_str_attr in list_CANP_CACH__NODE_STATE])
+				l_list_node_nmt.append(l_obj_node.nmt_get())
+				l_list_node_acc.append(l_obj_node.m_byte_acc)
+
+				l_obj_raws = l_obj_chan.node_raws(l_int_node)
+				if l_obj_raws is not None:
+					# Position from the first frame kept
+					l_list_node_seq.extend((l_obj_raws.narr_seq() - l_obj_chan.m_obj_jour.seq_base()).tolist())
+				l_list_node_offs.append(len(l_list_node_seq))
+
+				for l_int_idx in l_obj_node.obj_list():
+					for l_int_sub, l_obj_ent in l_obj_node[l_int_idx].items():
+						if l_obj_node.m_cls_objs.ent_own(l_int_idx, l_int_sub) == False:
+							# Default value (shared, see 'canp_node.conf_dflt')
+							continue
+
+						l_list_vals = l_obj_ent.m_obj_hist.list_vals()
+
+						# Typed column when every value has the same type
+						if all(type(l_any_val) is int for l_any_val in l_list_vals) \
+						and all(-(1 << 63) <= l_any_val < (1 << 63) for l_any_val in l_list_vals):
+							l_int_kind = CANP_CACH__KIND_INT
+						elif all(type(l_any_val) is float for l_any_val in l_list_vals):
+							l_int_kind = CANP_CACH__KIND_FLOAT
+						else:
+							l_int_kind = CANP_CACH__KIND_ANY
+
+						l_list_obj_keys.append((l_int_chan, l_int_node, l_int_idx, l_int_sub))
+						l_list_obj_kind.append(l_int_kind)
+						l_list_obj_time.extend(l_obj_ent.m_obj_hist.list_time())
+						l_list_obj_vals[l_int_kind].extend(l_list_vals)
+						l_list_obj_offs.append(len(l_list_obj_time))
+
+		l_narr_obj_any = np.empty(len(l_list_obj_vals[CANP_CACH__KIND_ANY]), dtype = object)
+		l_narr_obj_any[:] = l_list_obj_vals[CANP_CACH__KIND_ANY]
+		l_narr_node_acc = np.empty(len(l_list_node_acc), dtype = object)
+		l_narr_node_acc[:] = l_list_node_acc
+
+		try:
+			os.makedirs(os.path.dirname(i_str_cache) or ".", exist_ok = True)
+
+			with open(i_str_cache, "wb") as l_obj_file:
+				np.savez(
+					l_obj_file,
+					**{
+						CANP_CACH__COL_VERSION: CANP_CACH__INT_VERSION,
+						CANP_CACH__COL_KEY: i_str_key,
+						CANP_CACH__COL_OBJ_KEYS: np.array(l_list_obj_keys, dtype = np.int64).reshape(-1, 4),
+						CANP_CACH__COL_OBJ_OFFS: np.array(l_list_obj_offs, dtype = np.int64),
+						CANP_CACH__COL_OBJ_KIND: np.array(l_list_obj_kind, dtype = np.int8),
+						CANP_CACH__COL_OBJ_TIME: np.array(l_list_obj_time, dtype = np.float64),
+						CANP_CACH__COL_OBJ_INT: np.array(l_list_obj_vals[CANP_CACH__KIND_INT], dtype = np.int64),
+						CANP_CACH__COL_OBJ_FLOAT: np.array(l_list_obj_vals[CANP_CACH__KIND_FLOAT], dtype = np.float64),
+						CANP_CACH__COL_OBJ_ANY: l_narr_obj_any,
+						CANP_CACH__COL_CHAN_KEYS: np.array(l_list_chan_keys, dtype = np.int64),
+						CANP_CACH__COL_CHAN_OFFS: np.array(l_list_chan_offs, dtype = np.int64),
+						CANP_CACH__COL_CHAN_TIME: np.concatenate(l_list_chan_cols[0]),
+						CANP_CACH__COL_CHAN_COBID: np.concatenate(l_list_chan_cols[1]),
+						CANP_CACH__COL_CHAN_DLC: np.concatenate(l_list_chan_cols[2]),
+						CANP_CACH__COL_CHAN_DATA: canp_cach.narr_rows(l_list_chan_cols[3]),
+						CANP_CACH__COL_NODE_KEYS: np.array(l_list_node_keys, dtype = np.int64).reshape(-1, 2),
+						CANP_CACH__COL_NODE_OFFS: np.array(l_list_node_offs, dtype = np.int64),
+						CANP_CACH__COL_NODE_STATE: np.array(l_list_node_state, dtype = np.int64).reshape(-1, len(list_CANP_CACH__NODE_STATE)),
+						CANP_CACH__COL_NODE_NMT: np.array(l_list_node_nmt, dtype = np.uint8),
+						CANP_CACH__COL_NODE_ACC: l_narr_node_acc,
+						CANP_CACH__COL_NODE_SEQ: np.array(l_list_node_seq, dtype = np.int64),
+					})
+			l_bool_ret = True
+			# - except OSError -
+		except OSError:
+			canp_cach.m_logs.warning(f"cach.card_save.file[{i_str_cache}].readonly")
+
+		return l_bool_ret
+
+	@staticmethod
+	def card_load(
+				i_obj_card: Any,
+				i_str_cache: str = CANP_ENUM__STR_EMPTY,
+				i_str_key: str = CANP_ENUM__STR_EMPTY
+			) -> bool:
+		""" Card state loading (if present and matching the key)
+			Chan and Node should already be configured first (configuration objects kept)
+		"""
+		l_bool_ret: bool = False
+
+		try:
+			# Own file (objects of any type pickled)
+			with np.load(i_str_cache, allow_pickle = True) as l_dict_cach:
+				# - except OSError -
+				# - except ValueError -
+				if int(l_dict_cach[CANP_CACH__COL_VERSION]) == CANP_CACH__INT_VERSION \
+				and str(l_dict_cach[CANP_CACH__COL_KEY]) == i_str_key:
+					l_dict_cols = {l_str_col: l_dict_cach[l_str_col] for l_str_col in l_dict_cach.files}
+					l_bool_ret = True
+				else:
+					canp_cach.m_logs.info(f"cach.card_load.file[{i_str_cache}].stale")
+			# - except FileNotFoundError -
+		except FileNotFoundError:
+			pass
+		except (KeyError, OSError, ValueError, EOFError):
+			canp_cach.m_logs.warning(f"cach.card_load.file[{i_str_cache}].corrupted")
+
+		if l_bool_ret == True:
+			# Chans (raw frames journal)
+			l_list_offs = l_dict_cols[CANP_CACH__COL_CHAN_OFFS].tolist()
+
+			for l_int_pos, l_int_chan in enumerate(l_dict_cols[CANP_CACH__COL_CHAN_KEYS].tolist()):
+				i_obj_card.chan_set(l_int_chan)
+				l_obj_chan = i_obj_card[l_int_chan]
+				l_int_start, l_int_stop = l_list_offs[l_int_pos], l_list_offs[l_int_pos + 1]
+
+				l_obj_chan.m_obj_jour = canp_jour(l_obj_chan.m_tuple_keep)
+				l_obj_chan.m_obj_jour.extend_cols(*[
+					l_dict_cols[l_str_col][l_int_start:l_int_stop]
+					for l_str_col in [
+						CANP_CACH__COL_CHAN_TIME,
+						CANP_CACH__COL_CHAN_COBID,
+						CANP_CACH__COL_CHAN_DLC,
+						CANP_CACH__COL_CHAN_DATA]])
+
+			# Nodes (decoder state, raw frames kept)
+			l_list_offs = l_dict_cols[CANP_CACH__COL_NODE_OFFS].tolist()
+			l_list_seq = l_dict_cols[CANP_CACH__COL_NODE_SEQ].tolist()
+			l_list_state = l_dict_cols[CANP_CACH__COL_NODE_STATE].tolist()
+			l_list_nmt = l_dict_cols[CANP_CACH__COL_NODE_NMT].tolist()
+			l_list_acc = l_dict_cols[CANP_CACH__COL_NODE_ACC].tolist()
+
+			for l_int_pos, (l_int_chan, l_int_node) in enumerate(l_dict_cols[CANP_CACH__COL_NODE_KEYS].tolist()):
+				i_obj_card.chan_set(l_int_chan)
+				i_obj_card[l_int_chan].node_set(l_int_node)
+				l_obj_node = i_obj_card[l_int_chan][l_int_node]
+
+				for l_str_attr, l_int_val in zip(list_CANP_CACH__NODE_STATE, l_list_state[l_int_pos]):
+					setattr(l_obj_node, l_str_attr, l_int_val)
+				l_obj_node.nmt_set(l_list_nmt[l_int_pos])
+				l_obj_node.m_byte_acc = l_list_acc[l_int_pos]
+
+				l_int_start, l_int_stop = l_list_offs[l_int_pos], l_list_offs[l_int_pos + 1]
+				if l_int_stop > l_int_start:
+					# Position from the first frame kept
+					i_obj_card[l_int_chan].m_obj_jour.node_add(l_int_node, [
+						i_obj_card[l_int_chan].m_obj_jour.seq_base() + l_int_seq
+						for l_int_seq in l_list_seq[l_int_start:l_int_stop]])
+
+				if l_obj_node.m_cls_objs is not None:
+					# Default values kept (shared)
+					l_obj_node.m_cls_objs = canp_objs(l_obj_node.m_cls_objs.m_cls_base)
+				l_obj_node.m_dict_lazy = None
+
+			# Object histories (objects written while parsing, over the defaults)
+			l_list_offs = l_dict_cols[CANP_CACH__COL_OBJ_OFFS].tolist()
+			l_list_time = l_dict_cols[CANP_CACH__COL_OBJ_TIME].tolist()
+			l_list_vals = [
+				l_dict_cols[CANP_CACH__COL_OBJ_INT].tolist(),
+				l_dict_cols[CANP_CACH__COL_OBJ_FLOAT].tolist(),
+				l_dict_cols[CANP_CACH__COL_OBJ_ANY].tolist()]
+			l_list_base = [0, 0, 0]
+
+			for l_int_pos, (l_int_chan, l_int_node, l_int_idx, l_int_sub) in enumerate(l_dict_cols[CANP_CACH__COL_OBJ_KEYS].tolist()):
+				l_obj_node = i_obj_card[l_int_chan][l_int_node]
+				l_int_kind = int(l_dict_cols[CANP_CACH__COL_OBJ_KIND][l_int_pos])
+				l_int_start, l_int_stop = l_list_offs[l_int_pos], l_list_offs[l_int_pos + 1]
+				l_int_base = l_list_base[l_int_kind]
+				l_list_base[l_int_kind] += l_int_stop - l_int_start
+
+				if l_obj_node.m_cls_objs is None:
+					l_obj_node.m_cls_objs = canp_objs()
+
+				# Whole history saved (default value included)
+				l_obj_ent = l_obj_node.m_cls_objs.ent_set(
+					l_int_idx,
+					l_int_sub,
+					canp_node.ent_new(l_obj_node.m_cls_cnfs, l_int_idx, l_int_sub))
+				l_obj_ent.m_obj_hist.extend_cols(
+					l_list_time[l_int_start:l_int_stop],
+					l_list_vals[l_int_kind][l_int_base:l_int_base + l_int_stop - l_int_start])
+				l_obj_ent.m_any_data = l_obj_ent.m_obj_hist[-1][1] if l_int_stop > l_int_start else None
+
+			for l_obj_chan in i_obj_card.m_dict_chans.values():
+				# Change-only storage (restored histories grouped in runs again)
+				for l_obj_node in l_obj_chan.m_dict_nodes.values():
+					l_obj_node.runs_apply()
+
+				# Retention policies (restored stores bounded again)
+				l_obj_chan.keep_apply()
+
+		return l_bool_ret
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+	EDS_FILE = "PAC-P3_v1.0.eds"
+
+	from canp_card import canp_card
+
+	if True:
+		print("--- CACHE ---")
+		for l_int_loop in range(2):
+			l_obj_card = canp_card()
+			l_obj_card.node_conf(i_int_chan = 2, i_int_node = 1, i_str_file = EDS_FILE)
+
+			l_float_time = time.perf_counter()
+			l_bool_hit = l_obj_card.cache_parse(i_str_file = LOG_FILE)
+			l_float_time = time.perf_counter() - l_float_time
+
+			print(f"{'hit' if l_bool_hit == True else 'miss'} : {len(l_obj_card[2][1][0x6064][0][CANP_ENUM__HEAD_LIST])} values in {l_float_time:.3f}s")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
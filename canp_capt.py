@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_capt.py
+	Capture
+	Binary capture file (fixed size records, memory mapped reader, buffered writer)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import struct
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+#from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+#from typing import Optional
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__BLOCK_SIZE
+from canp_load import CANP_LOAD__COB_STD
+from canp_load import CANP_LOAD__COL_COBID
+from canp_load import CANP_LOAD__COL_DLC
+from canp_load import CANP_LOAD__COL_TIME
+from canp_load import CANP_LOAD__DATA_MAX
+from canp_load import CANP_LOAD__DTYPE_FRAME
+from canp_load import CANP_LOAD__FLAG_EXT
+from canp_load import CANP_LOAD__FLAG_NONE
+
+
+from canp_seek import CANP_SEEK__COB_SYNC
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# File extension ('capture.canp')
+CANP_CAPT__EXT = "canp"
+
+# Header (16 bytes, records stay 8 bytes aligned)
+CANP_CAPT__MAGIC = b"CANPCAPT"
+CANP_CAPT__VERSION = 1
+
+CANP_CAPT__COL_MAGIC = "magic"
+CANP_CAPT__COL_VERSION = "version"
+CANP_CAPT__COL_SIZE = "size"			# Record size (bytes)
+CANP_CAPT__COL_RESV = "resv"
+
+CANP_CAPT__DTYPE_HEAD = np.dtype([
+		(CANP_CAPT__COL_MAGIC, "S8"),
+		(CANP_CAPT__COL_VERSION, "<u2"),
+		(CANP_CAPT__COL_SIZE, "<u2"),
+		(CANP_CAPT__COL_RESV, "<u4"),
+	])
+
+# Record, same layout as 'canp_load' frames (time, chan, cobid, dlc, flag, data)
+CANP_CAPT__STRUCT_FRAME = struct.Struct(f"<dHIBB{CANP_LOAD__DATA_MAX}s")
+
+# Records buffered before writing
+CANP_CAPT__BUFF_COUNT = 4096
+
+#  --- CLASS ---
+
+class canp_capt:
+	""" CAN capture writer (readers are static)
+	"""
+
+	# Capture file name
+	m_str_file: str = CANP_ENUM__STR_EMPTY
+	# Capture file object
+	m_obj_file: Any = None
+	# Record buffer (and records in it)
+	m_bytes_buff: Any = None
+	m_int_buff: int = 0
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("capt")
+
+	def __init__(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_buff: int = CANP_CAPT__BUFF_COUNT,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+			Capture file created (or truncated), header written
+		"""
+		super().__init__(**i_dict_args)
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			self.m_str_file = i_str_file
+			self.m_obj_file = open(i_str_file, "wb")
+			self.m_obj_file.write(canp_capt.bytes_head())
+
+			self.m_bytes_buff = bytearray(max(i_int_buff, 1) * CANP_LOAD__DTYPE_FRAME.itemsize)
+			self.m_int_buff = 0
+		else:
+			self.m_logs.error(f"capt.init.file[{i_str_file}].unknown")
+
+	def frame_add(self,
+				i_float_time: float = 0.0,
+				i_int_chan: int = 0,
+				i_int_cobid: int = 0,
+				i_any_data: Any = b"",
+				i_int_flag: int = CANP_LOAD__FLAG_NONE
+			) -> None:
+		""" Append one frame (written once the buffer is full)
+		"""
+		if i_int_cobid > CANP_LOAD__COB_STD:
+			i_int_flag |= CANP_LOAD__FLAG_EXT
+
+		CANP_CAPT__STRUCT_FRAME.pack_into(
+			self.m_bytes_buff,
+			self.m_int_buff * CANP_LOAD__DTYPE_FRAME.itemsize,
+			i_float_time,
+			i_int_chan,
+			i_int_cobid,
+			len(i_any_data),
+			i_int_flag,
+			bytes(i_any_data))
+
+		self.m_int_buff += 1
+		if self.m_int_buff * CANP_LOAD__DTYPE_FRAME.itemsize >= len(self.m_bytes_buff):
+			self.flush()
+
+	def narr_add(self,
+				i_narr_frame: Any = None
+			) -> None:
+		""" Append many frames ('canp_load' records, written as is)
+		"""
+		if i_narr_frame is not None and len(i_narr_frame) > 0:
+			self.flush()
+			self.m_obj_file.write(
+				np.ascontiguousarray(i_narr_frame, dtype = CANP_LOAD__DTYPE_FRAME).tobytes())
+
+	def flush(self,
+			) -> None:
+		""" Write the buffered frames
+		"""
+		if self.m_int_buff > 0:
+			self.m_obj_file.write(
+				memoryview(self.m_bytes_buff)[:self.m_int_buff * CANP_LOAD__DTYPE_FRAME.itemsize])
+			self.m_int_buff = 0
+
+	def close(self,
+			) -> None:
+		""" Write the buffered frames and close the file
+		"""
+		if self.m_obj_file is not None:
+			self.flush()
+			self.m_obj_file.close()
+
+		self.m_obj_file = None
+
+	@staticmethod
+	def bytes_head(
+			) -> bytes:
+		""" File header
+		"""
+		l_narr_head = np.zeros(1, dtype = CANP_CAPT__DTYPE_HEAD)
+		l_narr_head[CANP_CAPT__COL_MAGIC] = CANP_CAPT__MAGIC
+		l_narr_head[CANP_CAPT__COL_VERSION] = CANP_CAPT__VERSION
+		l_narr_head[CANP_CAPT__COL_SIZE] = CANP_LOAD__DTYPE_FRAME.itemsize
+
+		return l_narr_head.tobytes()
+
+	@staticmethod
+	def capt_test(
+				i_bytes_head: bytes
+			) -> bool:
+		""" Magic number and record layout
+		"""
+		l_bool_ret: bool = False
+
+		if len(i_bytes_head) >= CANP_CAPT__DTYPE_HEAD.itemsize:
+			l_narr_head = np.frombuffer(i_bytes_head[:CANP_CAPT__DTYPE_HEAD.itemsize], dtype = CANP_CAPT__DTYPE_HEAD)[0]
+			if l_narr_head[CANP_CAPT__COL_MAGIC] == CANP_CAPT__MAGIC:
+				if l_narr_head[CANP_CAPT__COL_VERSION] == CANP_CAPT__VERSION \
+				and l_narr_head[CANP_CAPT__COL_SIZE] == CANP_LOAD__DTYPE_FRAME.itemsize:
+					l_bool_ret = True
+				else:
+					canp_capt.m_logs.error(f"capt.capt_test.version[{l_narr_head[CANP_CAPT__COL_VERSION]}].size[{l_narr_head[CANP_CAPT__COL_SIZE]}].unknown")
+
+		return l_bool_ret
+
+	@staticmethod
+	def capt_dump(
+				i_narr_frame: Any,
+				i_dict_state: Dict
+			) -> bytes:
+		""" Block writer (header first, records as is)
+		"""
+		l_bytes_ret: bytes = b""
+
+		if i_dict_state.get(CANP_CAPT__COL_MAGIC) is None:
+			i_dict_state[CANP_CAPT__COL_MAGIC] = CANP_CAPT__MAGIC
+			l_bytes_ret = canp_capt.bytes_head()
+
+		if i_narr_frame is not None:
+			l_bytes_ret += np.ascontiguousarray(i_narr_frame, dtype = CANP_LOAD__DTYPE_FRAME).tobytes()
+
+		return l_bytes_ret
+
+	@staticmethod
+	def narr_read(
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> Any:
+		""" Frames of a capture file (memory mapped, read only, no copy)
+			A truncated last record (interrupted capture) is ignored
+		"""
+		l_narr_ret: Any = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			with open(i_str_file, "rb") as l_obj_file:
+				l_bytes_head = l_obj_file.read(CANP_CAPT__DTYPE_HEAD.itemsize)
+
+			l_int_count = (os.path.getsize(i_str_file) - CANP_CAPT__DTYPE_HEAD.itemsize) // CANP_LOAD__DTYPE_FRAME.itemsize
+
+			if canp_capt.capt_test(l_bytes_head) == True:
+				if l_int_count > 0:
+					l_narr_ret = np.memmap(
+						i_str_file,
+						dtype = CANP_LOAD__DTYPE_FRAME,
+						mode = "r",
+						offset = CANP_CAPT__DTYPE_HEAD.itemsize,
+						shape = (l_int_count,))
+			else:
+				canp_capt.m_logs.error(f"capt.narr_read.file[{i_str_file}].invalid")
+		else:
+			canp_capt.m_logs.error(f"capt.narr_read.file[{i_str_file}].unknown")
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_blocks(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Iterator[Any]:
+		""" Frames by block (views on the memory mapped file)
+		"""
+		l_narr_frame = canp_capt.narr_read(i_str_file)
+		l_int_step = max(i_int_block // CANP_LOAD__DTYPE_FRAME.itemsize, 1)
+
+		for l_int_start in range(0, len(l_narr_frame), l_int_step):
+			yield l_narr_frame[l_int_start:l_int_start + l_int_step]
+
+	@staticmethod
+	def narr_time(
+				i_narr_frame: Any,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf")
+			) -> Any:
+		""" Frames within a time window [start, stop[ (binary search, no copy)
+		"""
+		l_narr_time = i_narr_frame[CANP_LOAD__COL_TIME]
+
+		return i_narr_frame[
+			int(np.searchsorted(l_narr_time, i_float_start, side = "left")):
+			int(np.searchsorted(l_narr_time, i_float_stop, side = "left"))]
+
+	@staticmethod
+	def narr_sync(
+				i_narr_frame: Any,
+				i_int_sync: int = 0,
+				i_int_count: int = 1
+			) -> Any:
+		""" Frames from the N-th sync (0 based) up to the (N + count)-th sync (no copy)
+		"""
+		l_narr_ret: Any = i_narr_frame[:0]
+
+		if i_int_sync >= 0 and i_int_count > 0:
+			l_narr_pos = np.flatnonzero(
+				(i_narr_frame[CANP_LOAD__COL_COBID] == CANP_SEEK__COB_SYNC)
+				& (i_narr_frame[CANP_LOAD__COL_DLC] == 0))
+
+			if i_int_sync < len(l_narr_pos):
+				if i_int_sync + i_int_count < len(l_narr_pos):
+					l_narr_ret = i_narr_frame[l_narr_pos[i_int_sync]:l_narr_pos[i_int_sync + i_int_count]]
+				else:
+					l_narr_ret = i_narr_frame[l_narr_pos[i_int_sync]:]
+
+		return l_narr_ret
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+	CAPT_FILE = "canp_capt.canp"
+
+	if True:
+		print("--- CAPTURE ---")
+		l_float_time = time.perf_counter()
+		l_narr_frame = canp_load.log_narr(LOG_FILE)
+		l_float_log = time.perf_counter() - l_float_time
+
+		# Frame by frame (as 'can_parse' would do)
+		l_obj_capt = canp_capt(CAPT_FILE)
+		l_float_time = time.perf_counter()
+		for l_list_frame in canp_load.list_narr(l_narr_frame):
+			l_obj_capt.frame_add(*l_list_frame)
+		l_obj_capt.close()
+		l_float_write = time.perf_counter() - l_float_time
+
+		l_float_time = time.perf_counter()
+		l_narr_capt = canp_capt.narr_read(CAPT_FILE)
+		l_float_read = time.perf_counter() - l_float_time
+
+		print(f"log : {len(l_narr_frame)} frames in {l_float_log:.3f}s ({os.path.getsize(LOG_FILE)} bytes)")
+		print(f"capture : written in {l_float_write:.3f}s, read in {l_float_read * 1000:.3f}ms ({os.path.getsize(CAPT_FILE)} bytes)")
+		print(f"same frames : {np.array_equal(l_narr_frame, l_narr_capt)}")
+
+		del l_narr_capt
+		os.remove(CAPT_FILE)
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -15,10 +15,12 @@
 
 # Standard libraries (installed with python)
 
+import io
 import logging
 import os
 import re
 import sys
+import time
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -27,21 +29,64 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Union
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # External libraries (installed with pip, conda, setup.py, ...)
 
-import can
+#import can
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # Included libraries (this module, local files)
 
+from canp_cach import canp_cach
+
+
+from canp_capt import canp_capt
+
+
 from canp_chan import canp_chan
 
 
+from canp_disk import canp_disk
+
+
+from canp_flow import canp_flow
+
+from canp_flow import CANP_FLOW__DECODE_WAIT
+
+from canp_hist import CANP_HIST__KEEP_NONE
+from canp_hist import CANP_HIST__RUNS_EXACT
+
+
+from canp_form import canp_form
+
+from canp_form import CANP_FORM__CAPT
+from canp_form import CANP_FORM__COMP_NONE
+from canp_form import CANP_FORM__LOG
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__COB_STD
+from canp_load import CANP_LOAD__COL_CHAN
+from canp_load import CANP_LOAD__COL_COBID
+from canp_load import CANP_LOAD__COL_DATA
+from canp_load import CANP_LOAD__COL_DLC
+from canp_load import CANP_LOAD__COL_TIME
+from canp_load import CANP_LOAD__DATA_MAX
+
+
+from canp_pool import canp_pool
+
+
+from canp_seek import canp_seek
+
+
 from canp_enum import CANP_ENUM__APP_NAME
 from canp_enum import CANP_ENUM__BASE_HEXA
 from canp_enum import CANP_ENUM__EOL_LF
@@ -59,13 +104,15 @@ from canp_enum import CANP_ENUM__STR_PIPE
 from canp_enum import CANP_ENUM__STR_SPACE
 from canp_enum import CANP_ENUM__STR_ZERO
 
+from canp_enum import CANP_ENUM__VAL_DEFAULT
+
 
 from canp_args import canp_args
 from canp_logs import canp_logs
 
 
-from canp_path import canp_path
-from canp_path import CANP_PATH__IDX_EXT
+#from canp_path import canp_path
+#from canp_path import CANP_PATH__IDX_EXT
 
 #  --- GLOBAL ---
 
@@ -79,6 +126,12 @@ CANP_CARD__BAUD_50K = 50 * CANP_CARD__BAUD_1K
 CANP_CARD__BAUD_20K = 20 * CANP_CARD__BAUD_1K
 CANP_CARD__BAUD_10K = 10 * CANP_CARD__BAUD_1K
 
+# Frames decoded at once (line by line reading)
+CANP_CARD__BATCH_SIZE = 4096
+
+# Follow mode polling (seconds)
+CANP_CARD__FOLLOW_PERIOD = 1.0
+
 dict_CANP_CARD__BAUD = {
 		"1m": int(CANP_CARD__BAUD_1M),
 		#"800k": int(CANP_CARD__BAUD_800K),
@@ -114,6 +167,12 @@ class canp_card:
 	# Channel objects (key = chan number, not necessarily starting at 0)
 	m_dict_chans: Dict[int, Any] = {}
 
+	# Followed log files (key = file name, value = 'canp_form.form_tail' state)
+	m_dict_tails: Dict[str, Dict] = None
+
+	# Retention policy of every chan (count, seconds, bytes, see 'canp_hist.keep_set')
+	m_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+
 	# Logger object
 	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("card")
 
@@ -124,6 +183,8 @@ class canp_card:
 		"""
 		super().__init__(**i_dict_args)
 
+		self.m_dict_tails = {}
+
 	def __getitem__(self,
 				i_int_index
 			) -> Any:
@@ -170,6 +231,10 @@ class canp_card:
 			except KeyError:
 				self.m_dict_chans[i_int_chan] = canp_chan()
 
+			if self.m_tuple_keep != CANP_HIST__KEEP_NONE and self.m_dict_chans[i_int_chan].m_tuple_keep == CANP_HIST__KEEP_NONE:
+				# Card policy (unless the chan has its own)
+				self.m_dict_chans[i_int_chan].keep_set(self.m_tuple_keep)
+
 	def node_conf(self,
 				i_int_chan: int = 0,
 				i_int_node: int = 0,
@@ -188,6 +253,93 @@ class canp_card:
 			except KeyError:
 				self.m_logs.error(f"card.node_conf.chan[{i_int_chan}].unknown")
 
+	def node_lazy(self,
+				i_int_chan: int = 0,
+				i_int_node: int = 0,
+				i_bool_lazy: bool = True,
+				i_set_want: Optional[Set[Tuple[int, int]]] = None
+			) -> None:
+		""" Lazy decoding set (through chan)
+			'i_set_want' : objects (index, sub-index) decoded on access, the others stay undecoded (None = all)
+		"""
+		if i_int_chan >= 0:
+			self.chan_set(i_int_chan)
+
+			try:
+				self.m_dict_chans[i_int_chan].node_lazy(
+					i_int_node,
+					i_bool_lazy,
+					i_set_want)
+				# - except KeyError -
+			except KeyError:
+				self.m_logs.error(f"card.node_lazy.chan[{i_int_chan}].unknown")
+
+	def node_keep(self,
+				i_int_chan: int = 0,
+				i_int_node: int = 0,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				i_int_idx: Optional[int] = None,
+				i_int_sub: Optional[int] = None
+			) -> None:
+		""" Retention policy set (through chan)
+			'i_tuple_keep' : (count, seconds, bytes), 0 : unbounded, whole node if 'i_int_idx' is None
+		"""
+		if i_int_chan >= 0:
+			self.chan_set(i_int_chan)
+
+			try:
+				self.m_dict_chans[i_int_chan].node_keep(
+					i_int_node,
+					i_tuple_keep,
+					i_int_idx,
+					i_int_sub)
+				# - except KeyError -
+			except KeyError:
+				self.m_logs.error(f"card.node_keep.chan[{i_int_chan}].unknown")
+
+	def node_runs(self,
+				i_int_chan: int = 0,
+				i_int_node: int = 0,
+				i_int_idx: int = 0,
+				i_int_sub: Optional[int] = None,
+				i_int_runs: int = CANP_HIST__RUNS_EXACT
+			) -> None:
+		""" Change-only storage set (through chan)
+			Repeated values of the object stored once as a run (whole index if 'i_int_sub' is None)
+		"""
+		if i_int_chan >= 0:
+			self.chan_set(i_int_chan)
+
+			try:
+				self.m_dict_chans[i_int_chan].node_runs(
+					i_int_node,
+					i_int_idx,
+					i_int_sub,
+					i_int_runs)
+				# - except KeyError -
+			except KeyError:
+				self.m_logs.error(f"card.node_runs.chan[{i_int_chan}].unknown")
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+			) -> None:
+		""" Retention policy of every chan and node (present and next ones)
+			Long running captures keep a flat memory profile (oldest values dropped)
+		"""
+		self.m_tuple_keep = tuple(i_tuple_keep)
+
+		for l_obj_chan in self.m_dict_chans.values():
+			l_obj_chan.keep_set(self.m_tuple_keep)
+
+	def disk_set(self,
+				i_int_bytes: int = 0,
+				i_str_path: Optional[str] = None
+			) -> None:
+		""" RAM budget of the unbounded histories (bytes, 0 : never spilled) and their column files folder
+			Endurance captures keep every value, the histories growing past the budget being memory-mapped files
+		"""
+		canp_disk.budget_set(i_int_bytes, i_str_path)
+
 	def frame_parse(self,
 				i_list_frame: List[Any] = [],
 				i_float_time: float = 0.0,
@@ -237,36 +389,128 @@ class canp_card:
 		except KeyError:
 			self.m_logs.error(f"card.frame_parse.chan[{i_int_chan}].unknown")
 
+	def frame_parse_many(self,
+				i_list_time: List[float] = [],
+				i_list_chan: List[int] = [],
+				i_list_cobid: List[int] = [],
+				i_list_data: List[bytearray] = []
+			) -> None:
+		""" Frames parser (batch, through chan)
+			Same result as 'frame_parse' on each frame in order
+			Consecutive frames of a same channel are passed along at once
+			Chan and Node should already be configured first
+		"""
+		l_int_start: int = 0
+		l_int_chan: int = 0
+
+		for l_int_stop in range(1, len(i_list_chan) + 1):
+			if l_int_stop == len(i_list_chan) or i_list_chan[l_int_stop] != i_list_chan[l_int_start]:
+				l_int_chan = i_list_chan[l_int_start]
+
+				try:
+					self.m_dict_chans[l_int_chan]
+					# - except KeyError -
+				except KeyError:
+					# Create channel (beware of chan id)
+					self.chan_set(l_int_chan)
+
+				try:
+					self.m_dict_chans[l_int_chan].frame_parse_many(
+						i_list_time[l_int_start:l_int_stop],
+						i_list_cobid[l_int_start:l_int_stop],
+						i_list_data[l_int_start:l_int_stop])
+					# - except KeyError -
+				except KeyError:
+					self.m_logs.error(f"card.frame_parse.chan[{l_int_chan}].unknown")
+
+				l_int_start = l_int_stop
+
+	def narr_parse(self,
+				i_narr_frame: Any = None
+			) -> None:
+		""" Frames parser (from 'canp_load' records)
+			Chan and Node should already be configured first
+		"""
+		if i_narr_frame is not None:
+			i_narr_frame = canp_load.narr_keep(i_narr_frame)
+
+			# Whole columns converted at once (no per field conversion)
+			l_list_dlc = i_narr_frame[CANP_LOAD__COL_DLC].tolist()
+			l_bytes_data = i_narr_frame[CANP_LOAD__COL_DATA].tobytes()
+
+			self.frame_parse_many(
+				i_narr_frame[CANP_LOAD__COL_TIME].tolist(),
+				i_narr_frame[CANP_LOAD__COL_CHAN].tolist(),
+				i_narr_frame[CANP_LOAD__COL_COBID].tolist(),
+				[
+					bytearray(l_bytes_data[l_int_pos:l_int_pos + l_int_dlc])
+					for l_int_pos, l_int_dlc in zip(
+						range(0, len(l_list_dlc) * CANP_LOAD__DATA_MAX, CANP_LOAD__DATA_MAX),
+						l_list_dlc)])
+
 	def log_parse(self,
-				i_str_file: str = CANP_ENUM__STR_EMPTY
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_bool_bulk: bool = True,
+				i_int_jobs: int = 1,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf"),
+				i_list_chan: List[int] = [],
+				i_list_filter: List[Tuple[int, int]] = []
 			) -> None:
 		""" Log reader
-			Read file line by line (might be made async)
+			Format detected from the content (candump, asc, trc, csv, see 'canp_form')
+			Read file by blocks (bulk) or line by line (candump only, might be made async)
+			'i_int_jobs' processes (0 = all cores) load chunks and decode nodes in parallel
+			Only frames within [start, stop[, on 'i_list_chan' and accepted by 'i_list_filter'
+			(cobid, mask) are decoded, the others are dropped before decoding (empty list = all)
 			Chan and Node should already be configured first
 		"""
 		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
-			l_str_ext = canp_path.list_str(i_str_path = i_str_file)[CANP_PATH__IDX_EXT]
-			with open(i_str_file, newline = None) as l_obj_file:
-				for l_num_line, l_str_line in enumerate(l_obj_file, 1):
-					if l_str_ext == "asc" and l_num_line <= 3:
-						# Skip 3 lines header (time, format and reference)
-						pass
-					else:
+			l_str_form = canp_form.form_detect(i_str_file)
+			if i_int_jobs != 1:
+				# Multi-process (chunked loading for plain candump, per node decoding)
+				if l_str_form == CANP_FORM__LOG and canp_form.file_comp(i_str_file) == CANP_FORM__COMP_NONE:
+					l_narr_frame = canp_pool.log_narr(i_str_file, i_int_jobs)
+				else:
+					l_narr_frame = canp_form.log_narr(i_str_file, l_str_form)
+
+				canp_pool.card_parse(
+					self,
+					canp_load.narr_filter(
+						l_narr_frame,
+						i_float_start,
+						i_float_stop,
+						i_list_chan,
+						i_list_filter),
+					i_int_jobs)
+			elif i_bool_bulk == True or l_str_form != CANP_FORM__LOG:
+				# Column-wise loading, then decoding over the records (filtered block by block)
+				for l_narr_frame in canp_form.form_blocks(i_str_file, l_str_form):
+					self.narr_parse(
+						canp_load.narr_filter(
+							l_narr_frame,
+							i_float_start,
+							i_float_stop,
+							i_list_chan,
+							i_list_filter))
+			else:
+				# Line by line (identifier, channel and time checked before any other conversion)
+				l_list_accept = canp_load.narr_accept(i_list_filter).tolist()
+				l_set_chan = set(i_list_chan)
+				l_list_time: List[float] = []
+				l_list_chan: List[int] = []
+				l_list_cobid: List[int] = []
+				l_list_data: List[bytearray] = []
+
+				with io.TextIOWrapper(canp_form.file_open(i_str_file), newline = None) as l_obj_file:
+					for l_str_line in l_obj_file:
 						l_str_line.strip()
 						# '(142.844095) 2 381#6C4E0000FEFFFFFF'
 
 						l_list_line = CANP_CARD__RE_FRAME.split(l_str_line)
 						l_list_line = CANP_ENUM__STR_SPACE.join(l_list_line).split()
 						#        0             1    2      3
-						# log : ['142.844095', '2', '381', '6C4E0000FEFFFFFF']
-						# asc : ['0.000288', '2', '381', 'Rx', 'd', '8', '00', '44', '07', '00', 'E7', 'FF', 'FF', 'FF']
-						#        0           1    2      3     4    5    6     7     8     9     10    11    12    13
-
-						if l_str_ext == "asc":
-							del l_list_line[3:6]	# Remove ['Rx', 'd', '8']
-							# ['0.000288', '2', '381', '00', '44', '07', '00', 'E7', 'FF', 'FF', 'FF']
-							l_list_line = l_list_line[0:3] + [CANP_ENUM__STR_EMPTY.join(l_list_line[3:])]
-							# ['0.000288', '2', '381', '00440700E7FFFFFF']
+						#        ['142.844095', '2', '381', '6C4E0000FEFFFFFF']
 
 						try:
 							# Check if empty data (, '']) has been removed from the list
@@ -277,9 +521,21 @@ class canp_card:
 							l_list_line.append(CANP_ENUM__STR_EMPTY)
 
 						# Extract fields (with proper casting)
-						l_float_time = float(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_TIME])
-						l_int_chan = int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_CHAN])
 						l_int_cobid = int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_COBID], CANP_ENUM__BASE_HEXA)
+						if l_int_cobid <= CANP_LOAD__COB_STD:
+							if l_list_accept[l_int_cobid] == False:
+								continue
+						elif canp_load.bool_accept(l_int_cobid, i_list_filter) == False:
+							continue
+
+						l_int_chan = int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_CHAN])
+						if len(l_set_chan) > 0 and l_int_chan not in l_set_chan:
+							continue
+
+						l_float_time = float(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_TIME])
+						if l_float_time < i_float_start or l_float_time >= i_float_stop:
+							continue
+
 						l_any_data = bytearray.fromhex(l_list_line[CANP_LOG__IDX_DATA])
 
 						if False:
@@ -295,67 +551,221 @@ class canp_card:
 							self.frame_parse(
 								i_list_frame = l_list_line)
 						else:
-							# Via args
-							self.frame_parse(
-								i_float_time = l_float_time,
-								i_int_chan = l_int_chan,
-								i_int_cobid = l_int_cobid,
-								i_any_data = l_any_data)
+							# Batched (see 'frame_parse_many')
+							l_list_time.append(l_float_time)
+							l_list_chan.append(l_int_chan)
+							l_list_cobid.append(l_int_cobid)
+							l_list_data.append(l_any_data)
+
+							if len(l_list_time) >= CANP_CARD__BATCH_SIZE:
+								self.frame_parse_many(l_list_time, l_list_chan, l_list_cobid, l_list_data)
+								l_list_time, l_list_chan, l_list_cobid, l_list_data = [], [], [], []
+
+				# Remaining frames
+				self.frame_parse_many(l_list_time, l_list_chan, l_list_cobid, l_list_data)
 		else:
 			self.m_logs.error(f"card.log_parse.file[{i_str_file}].unknown")
 
+	def cache_parse(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_dir: str = CANP_ENUM__STR_EMPTY,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf"),
+				i_list_chan: List[int] = [],
+				i_list_filter: List[Tuple[int, int]] = []
+			) -> bool:
+		""" Log reader (through the decoded cache)
+			Decoded state reloaded if the log, the node configurations and the filters are the same
+			Otherwise the log is parsed ('log_parse') then the result saved for the next time
+			Returns True when loaded from the cache
+			Chan and Node should already be configured first
+		"""
+		l_bool_ret: bool = False
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			l_str_key = canp_cach.str_key(
+				self,
+				i_str_file,
+				[i_float_start, i_float_stop, sorted(i_list_chan), sorted(i_list_filter)])
+			l_str_cache = canp_cach.str_file(i_str_file, l_str_key, i_str_dir)
+
+			l_bool_ret = canp_cach.card_load(self, l_str_cache, l_str_key)
+			if l_bool_ret == False:
+				self.log_parse(
+					i_str_file = i_str_file,
+					i_float_start = i_float_start,
+					i_float_stop = i_float_stop,
+					i_list_chan = i_list_chan,
+					i_list_filter = i_list_filter)
+
+				canp_cach.card_save(self, l_str_cache, l_str_key)
+		else:
+			self.m_logs.error(f"card.cache_parse.file[{i_str_file}].unknown")
+
+		return l_bool_ret
+
+	def seek_parse(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf"),
+				i_int_sync: int = CANP_ENUM__VAL_DEFAULT,
+				i_int_count: int = 1,
+				i_list_chan: List[int] = [],
+				i_list_filter: List[Tuple[int, int]] = []
+			) -> None:
+		""" Log reader (slice only, candump format or binary capture)
+			Either a time window [start, stop[ or 'count' sync periods from the N-th sync (0 based)
+			The log index is built on first use (saved next to the log file)
+			Frames of the slice can be restricted further (channels, (cobid, mask) filters)
+			Chan and Node should already be configured first
+		"""
+		l_narr_frame: Any = None
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			if canp_form.file_comp(i_str_file) != CANP_FORM__COMP_NONE:
+				# Compressed, not seekable (streamed up to the end of the window)
+				if i_int_sync >= 0:
+					self.m_logs.error(f"card.seek_parse.file[{i_str_file}].compressed (sync not supported)")
+				else:
+					for l_narr_block in canp_form.form_blocks(i_str_file):
+						if len(l_narr_block) > 0 and l_narr_block[CANP_LOAD__COL_TIME][0] >= i_float_stop:
+							break
+						self.narr_parse(
+							canp_load.narr_filter(
+								l_narr_block,
+								i_float_start,
+								i_float_stop,
+								i_list_chan,
+								i_list_filter))
+			elif canp_form.form_detect(i_str_file) == CANP_FORM__CAPT:
+				# Binary capture, already random access (memory mapped)
+				l_narr_frame = canp_capt.narr_read(i_str_file)
+
+				if i_int_sync >= 0:
+					l_narr_frame = canp_capt.narr_sync(l_narr_frame, i_int_sync, i_int_count)
+				else:
+					l_narr_frame = canp_capt.narr_time(l_narr_frame, i_float_start, i_float_stop)
+			else:
+				l_obj_seek = canp_seek(i_str_file)
+
+				if i_int_sync >= 0:
+					l_narr_frame = l_obj_seek.narr_sync(
+						i_int_sync,
+						i_int_count)
+				else:
+					l_narr_frame = l_obj_seek.narr_time(
+						i_float_start,
+						i_float_stop)
+
+				l_obj_seek.close()
+
+			if l_narr_frame is not None:
+				self.narr_parse(
+					canp_load.narr_filter(
+						l_narr_frame,
+						i_list_chan = i_list_chan,
+						i_list_filter = i_list_filter))
+		else:
+			self.m_logs.error(f"card.seek_parse.file[{i_str_file}].unknown")
+
+	def tail_parse(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> int:
+		""" Log reader (follow mode, one poll)
+			Only the frames appended since the previous poll are decoded
+			The nodes keep their state (NMT, SDO transfers, PDO mappings) between polls
+			Returns the number of frames read
+		"""
+		l_int_ret: int = 0
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			l_dict_tail = self.m_dict_tails.setdefault(i_str_file, {})
+
+			for l_narr_frame in canp_form.form_tail(i_str_file, l_dict_tail):
+				self.narr_parse(l_narr_frame)
+				l_int_ret += len(l_narr_frame)
+		else:
+			self.m_logs.error(f"card.tail_parse.file[{i_str_file}].unknown")
+
+		return l_int_ret
+
+	def tail_reset(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> None:
+		""" Forget a followed log file (next poll reads it from the start)
+		"""
+		self.m_dict_tails.pop(i_str_file, None)
+
+	def follow_parse(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_float_period: float = CANP_CARD__FOLLOW_PERIOD,
+				i_int_polls: int = 0,
+				i_func_poll: Callable[[int], Any] = None
+			) -> int:
+		""" Log reader (follow mode, like 'tail -f')
+			Polls the file every 'i_float_period' seconds, 'i_int_polls' times (0 = until interrupted)
+			'i_func_poll' is called after each poll with the number of new frames
+			Returns the number of frames read
+		"""
+		l_int_ret: int = 0
+		l_int_poll: int = 0
+
+		try:
+			while i_int_polls == 0 or l_int_poll < i_int_polls:
+				l_int_count = self.tail_parse(i_str_file)
+				l_int_ret += l_int_count
+				l_int_poll += 1
+
+				if i_func_poll is not None:
+					i_func_poll(l_int_count)
+
+				if i_int_polls == 0 or l_int_poll < i_int_polls:
+					time.sleep(i_float_period)
+			# - except KeyboardInterrupt -
+		except KeyboardInterrupt:
+			self.m_logs.info(f"card.follow_parse.file[{i_str_file}].stopped ({l_int_ret} frames)")
+
+		return l_int_ret
+
+	def flow_parse(self,
+				i_iter_frame: Any = None,
+				i_float_wait: float = 0.0,
+				i_bool_keep: bool = False
+			) -> int:
+		""" Flow reader
+			Pull frames from a 'canp_flow' source (or stage) and parse them
+			'i_float_wait' : seconds a frame waits for its batch at most (bus sources, see 'canp_flow.flow_decode')
+			'i_bool_keep' : batches failing to decode logged and skipped (reader kept running)
+			Chan and Node should already be configured
+		"""
+		return canp_flow.flow_sink(
+			canp_flow.flow_decode(i_iter_frame, self, i_float_wait = i_float_wait, i_bool_keep = i_bool_keep))
+
 	def can_parse(self,
 				i_str_card: str = CANP_ENUM__STR_EMPTY,
 				i_str_chan: str = CANP_ENUM__STR_EMPTY,
 				i_int_baud: int = CANP_CARD__BAUD_1M,
-				i_int_count: int = 0
+				i_int_count: int = 0,
+				i_str_file: str = CANP_ENUM__STR_EMPTY
 			) -> None:
 		""" Can reader
 			Read data from a 'python-can' adapter (might be made async)
+			Frames also recorded into 'i_str_file' if given (candump format, '.gz', '.xz', '.bz2' compressed)
 			Chan and Node should already be configured
 		"""
-		l_int_count: int = 0
-
-		try:
-			with can.interface.Bus(
-						bustype = i_str_card,
-						channel = i_str_chan,
-						bitrate = i_int_baud
-					) as l_obj_bus:
-				try:
-					while i_int_count == 0 or l_int_count < i_int_count:
-						# Read one frame at a time (beware of buffer occupation)
-						l_obj_msg = l_obj_bus.recv(1)
-						if l_obj_msg is not None:
-							# Parse the can frame
-							if False:
-								# Compose the list (only needed attributes)
-								l_list_line = [
-									l_obj_msg.timestamp,
-									l_obj_msg.channel,
-									l_obj_msg.arbitration_id,
-									l_obj_msg.data]
-								# [142.844095, 2, 897, b'\x6c\x4e\x00\x00\xfe\xff\xff\xff']
-
-								# Via list (convenient but slightly slower)
-								self.frame_parse(
-									i_list_frame = l_list_line)
-							else:
-								# Via args
-								self.frame_parse(
-									i_float_time = l_obj_msg.timestamp,
-									i_int_chan = l_obj_msg.channel,
-									i_int_cobid = l_obj_msg.arbitration_id,
-									i_any_data = l_obj_msg.data)
-
-							# Limiter
-							l_int_count += 1
-					else:
-						self.m_logs.info(f"card.can_parse.limit_reached ({i_int_count})")
-				except:
-					self.m_logs.error("card.can_parse.error.unknown")
-		except:
-			self.m_logs.error("card.can_parse.error.connection")
+		l_iter_frame = canp_flow.can_frames(
+			i_str_card = i_str_card,
+			i_str_chan = i_str_chan,
+			i_int_baud = i_int_baud,
+			i_int_count = i_int_count,
+			i_bool_idle = True)
+
+		if i_str_file != CANP_ENUM__STR_EMPTY:
+			l_iter_frame = canp_flow.flow_record(l_iter_frame, i_str_file)
+
+		# Decoded soon after arrival (batches flushed on a time bound, and when the bus is idle)
+		# A bad batch is logged, the reader goes on
+		self.flow_parse(l_iter_frame, CANP_FLOW__DECODE_WAIT, i_bool_keep = True)
 
 #  --- MAIN ---
 
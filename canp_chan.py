@@ -21,18 +21,24 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from bisect import bisect_left
+
 from typing import Any
 #from typing import Callable
 from typing import Dict
 from typing import List
-#from typing import Optional
-#from typing import Tuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
 #from typing import Union
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # External libraries (installed with pip, conda, setup.py, ...)
 
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # Included libraries (this module, local files)
@@ -60,6 +66,15 @@ from canp_node import canp_node
 
 from canp_node import CANP_NODE__COB_NMT
 from canp_node import CANP_NODE__COB_SYNC
+from canp_node import CANP_NODE__NMT_DTYPE
+
+from canp_node import list_CANP_NODE__NMT_FSM
+
+from canp_hist import CANP_HIST__KEEP_NONE
+from canp_hist import CANP_HIST__RUNS_EXACT
+
+
+from canp_jour import canp_jour
 
 
 from canp_args import canp_args
@@ -79,10 +94,16 @@ class canp_chan:
 	""" CAN channel
 	"""
 
-	# Node objects (key = node index)
-	m_dict_nodes: Dict[int, Any] = {}
-	# Frames analysed (key = cobid, value = {timestamp, data})
-	m_dict_raws: Dict[int, Any] = {}
+	# Node objects (key = node index, own to the chan)
+	m_dict_nodes: Dict[int, Any] = None
+	# Nmt states of the nodes (key = node index, as 'm_dict_nodes', own to the chan, see 'canp_node.nmt_link')
+	m_narr_nmt: Any = None
+	# Node ids seen by the broadcast frames (see 'node_keys')
+	m_narr_keys: Any = None
+	# Frames analysed (journal, read per cobid as the former dict, see 'canp_jour')
+	m_obj_jour: Optional[canp_jour] = None
+	# Retention policy of raw frames and nodes (count, seconds, bytes, see 'canp_hist.keep_set')
+	m_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
 
 	# Logger object
 	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("chan")
@@ -94,6 +115,11 @@ class canp_chan:
 		"""
 		super().__init__(**i_dict_args)
 
+		self.m_dict_nodes = {}
+		self.m_narr_nmt = np.zeros(CANP_ENUM__NODE_MAX + 1, dtype = CANP_NODE__NMT_DTYPE)
+		self.m_obj_jour = canp_jour(self.m_tuple_keep)
+		self.m_narr_keys = np.zeros(0, dtype = np.int64)
+
 	def __getitem__(self,
 				i_int_index
 			) -> Any:
@@ -133,6 +159,7 @@ class canp_chan:
 				if i_bool_force == True:
 					# Overwrite node
 					self.m_dict_nodes[i_int_node] = canp_node()
+					self.m_dict_nodes[i_int_node].nmt_link(self.m_narr_nmt, i_int_node)
 				else:
 					# Check node
 					self.m_dict_nodes[i_int_node]
@@ -140,6 +167,11 @@ class canp_chan:
 			except KeyError:
 				# Create node
 				self.m_dict_nodes[i_int_node] = canp_node()
+				self.m_dict_nodes[i_int_node].nmt_link(self.m_narr_nmt, i_int_node)
+
+			if self.m_tuple_keep != CANP_HIST__KEEP_NONE and self.m_dict_nodes[i_int_node].m_tuple_keep == CANP_HIST__KEEP_NONE:
+				# Channel policy (unless the node has its own)
+				self.m_dict_nodes[i_int_node].keep_set(self.m_tuple_keep)
 		else:
 			self.m_logs.error(f"chan.node_set.node[{i_int_node}].impossible")
 
@@ -158,6 +190,147 @@ class canp_chan:
 		except KeyError:
 			self.m_logs.error(f"chan.node_conf.node[{i_int_node}].unknown")
 
+	def node_lazy(self,
+				i_int_node: int = 0,
+				i_bool_lazy: bool = True,
+				i_set_want: Optional[Set[Tuple[int, int]]] = None
+			) -> None:
+		""" Lazy decoding set (objects decoded on access, see 'canp_node.lazy_set')
+		"""
+		self.node_set(i_int_node)
+
+		try:
+			self.m_dict_nodes[i_int_node].lazy_set(
+				i_bool_lazy,
+				i_set_want)
+			# - except KeyError -
+		except KeyError:
+			self.m_logs.error(f"chan.node_lazy.node[{i_int_node}].unknown")
+
+	def node_keep(self,
+				i_int_node: int = 0,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				i_int_idx: Optional[int] = None,
+				i_int_sub: Optional[int] = None
+			) -> None:
+		""" Retention policy set (whole node or one object, see 'canp_node.keep_set')
+		"""
+		self.node_set(i_int_node)
+
+		try:
+			self.m_dict_nodes[i_int_node].keep_set(
+				i_tuple_keep,
+				i_int_idx,
+				i_int_sub)
+			# - except KeyError -
+		except KeyError:
+			self.m_logs.error(f"chan.node_keep.node[{i_int_node}].unknown")
+
+	def node_runs(self,
+				i_int_node: int = 0,
+				i_int_idx: int = 0,
+				i_int_sub: Optional[int] = None,
+				i_int_runs: int = CANP_HIST__RUNS_EXACT
+			) -> None:
+		""" Change-only storage of an object (whole index if 'i_int_sub' is None, see 'canp_node.runs_set')
+		"""
+		self.node_set(i_int_node)
+
+		try:
+			self.m_dict_nodes[i_int_node].runs_set(
+				i_int_idx,
+				i_int_sub,
+				i_int_runs)
+			# - except KeyError -
+		except KeyError:
+			self.m_logs.error(f"chan.node_runs.node[{i_int_node}].unknown")
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+			) -> None:
+		""" Retention policy (count, seconds, bytes) of the raw frames and of every node (present and next ones)
+		"""
+		self.m_tuple_keep = tuple(i_tuple_keep)
+
+		for l_obj_node in self.m_dict_nodes.values():
+			l_obj_node.keep_set(self.m_tuple_keep)
+
+		self.keep_apply()
+
+	def keep_apply(self) -> None:
+		""" Retention policy applied to the raw frames
+		"""
+		self.m_obj_jour.keep_set(self.m_tuple_keep)
+
+		for l_obj_node in self.m_dict_nodes.values():
+			l_obj_node.keep_apply()
+
+	def node_raws(self,
+				i_int_node: int = 0
+			) -> Any:
+		""" Raw frames kept by a node as (time, (cobid, data)) (None if none, see 'canp_jour.node_view')
+		"""
+		return self.m_obj_jour.node_view(i_int_node)
+
+	def node_keys(self) -> Any:
+		""" Node ids (numpy, rebuilt only once nodes were added)
+			Nodes added read the broadcast frames from the next journal position on (see 'canp_jour.node_born')
+		"""
+		if len(self.m_narr_keys) != len(self.m_dict_nodes):
+			self.m_narr_keys = np.fromiter(
+				self.m_dict_nodes.keys(),
+				dtype = np.int64,
+				count = len(self.m_dict_nodes))
+
+			for l_int_node in self.m_dict_nodes.keys():
+				self.m_obj_jour.node_born(l_int_node, self.m_obj_jour.m_int_seq)
+
+		return self.m_narr_keys
+
+	def nmt_bcast(self,
+				i_int_cmd: int = 0,
+				i_narr_keys: Any = None
+			) -> List[int]:
+		""" Nmt command to every node, states updated at once (see 'canp_node.nmt_table')
+			'i_narr_keys' : nodes existing at that frame (batch, every node if None, see 'node_keys')
+			Returns the nodes keeping the frame (state changed, as 'canp_node.frame_nmt')
+		"""
+		l_narr_keys: Any = None
+		l_narr_prev: Any = None
+		l_narr_next: Any = None
+		l_narr_keep: Any = None
+		l_int_init: int = 0
+		l_int_same: int = 0
+		l_int_fail: int = 0
+
+		l_narr_keys = i_narr_keys
+		if l_narr_keys is None:
+			l_narr_keys = self.node_keys()
+
+		l_narr_prev = self.m_narr_nmt[l_narr_keys]
+		l_narr_next = canp_node.nmt_table()[l_narr_prev, i_int_cmd]
+		self.m_narr_nmt[l_narr_keys] = l_narr_next
+
+		l_narr_keep = (l_narr_next != l_narr_prev) & (l_narr_prev != 0x0)
+
+		if len(l_narr_keys) > 0:
+			# Once per frame (not per node)
+			if i_int_cmd in list_CANP_NODE__NMT_FSM:
+				l_int_init = int(np.count_nonzero(l_narr_prev == 0x0))
+				l_int_same = int(np.count_nonzero(l_narr_prev == i_int_cmd)) + l_int_init
+				l_int_fail = len(l_narr_keys) - l_int_same - int(np.count_nonzero(l_narr_keep))
+
+				if l_int_init > 0:
+					self.m_logs.info(f"chan.frame_parse.nmt.fsm.init[{l_int_init}]")
+				if l_int_same > 0:
+					self.m_logs.error(f"chan.frame_parse.nmt.fsm.same[{l_int_same}]")
+				if l_int_fail > 0:
+					self.m_logs.error(f"chan.frame_parse.nmt.fsm.error[{l_int_fail}]")
+			else:
+				self.m_logs.error("chan.frame_parse.nmt.cmd.unlisted")
+
+		return l_narr_keys[l_narr_keep].tolist()
+
 	def frame_parse(self,
 				i_list_frame: List[Any] = [],
 				i_float_time: float = 0.0,
@@ -174,7 +347,10 @@ class canp_chan:
 		# 2 : frame (bytearray, dlc = len)
 		l_bool_frame: bool = False
 		l_bool_store: bool = False
+		l_bool_sync: bool = False
+		l_list_keep: List[int] = []
 		#l_int_cobid: int = 0
+		l_int_cmd: int = 0
 		l_int_node: int = 0
 		l_int_dlc: int = 0
 
@@ -200,22 +376,22 @@ class canp_chan:
 			l_int_node = canp_conv.int_bytes(
 				i_bool_bytes = l_int_node)
 
-		if (i_int_cobid == CANP_NODE__COB_NMT and l_int_node == 0 and l_int_dlc == 2) \
-		or (i_int_cobid == CANP_NODE__COB_SYNC and l_int_node == 0 and l_int_dlc == 0):
-			# broadcast (only existing nodes)
-			# sync (emit pdo, configurable)
-			for l_int_node, l_obj_node in self.m_dict_nodes.items():
-				if l_bool_frame == True:
-					# Via list (convenient but slightly slower)
-					l_obj_node.frame_parse(
-						i_list_frame = i_list_frame)
-				else:
-					# Via args
-					l_obj_node.frame_parse(
-						i_float_time = i_float_time,
-						i_int_cobid = i_int_cobid,
-						i_any_data = i_any_data)
+		if i_int_cobid == CANP_NODE__COB_NMT and l_int_node == 0 and l_int_dlc == 2:
+			# broadcast (only existing nodes, states updated at once)
+			if l_bool_frame == True:
+				l_int_cmd = canp_conv.int_bytes(
+					i_bool_bytes = i_list_frame[CANP_LOG__IDX_DATA][0:1])
+			else:
+				l_int_cmd = canp_conv.int_bytes(
+					i_bool_bytes = i_any_data[0:1])
 
+			l_list_keep = self.nmt_bcast(l_int_cmd)
+			l_bool_store = True
+		elif i_int_cobid == CANP_NODE__COB_SYNC and l_int_node == 0 and l_int_dlc == 0:
+			# sync (emit pdo, configurable)
+			# Stored once, read by every existing node (see 'canp_jour.bcast_add')
+			self.node_keys()
+			l_bool_sync = True
 			l_bool_store = True
 		elif i_int_cobid == CANP_NODE__COB_SYNC and l_int_node == 0 and l_int_dlc == 0:
 			# sync (emit pdo, configurable)
@@ -230,16 +406,19 @@ class canp_chan:
 				try:
 					if l_bool_frame == True:
 						# Via list (convenient but slightly slower)
-						self.m_dict_nodes[l_int_node].frame_parse(
+						l_bool_keep = self.m_dict_nodes[l_int_node].frame_parse(
 							i_list_frame = i_list_frame)
 					else:
 						# Via args
-						self.m_dict_nodes[l_int_node].frame_parse(
+						l_bool_keep = self.m_dict_nodes[l_int_node].frame_parse(
 							i_float_time = i_float_time,
 							i_int_cobid = i_int_cobid,
 							i_any_data = i_any_data)
 					# - except KeyError -
 					l_bool_store = True
+
+					if l_bool_keep == True:
+						l_list_keep.append(l_int_node)
 				except KeyError:
 					self.m_logs.error(f"chan.frame_parse.node[{l_int_node}].unknown")
 			else:
@@ -247,16 +426,142 @@ class canp_chan:
 
 		if l_bool_store == True:
 			if l_bool_frame == True:
+				i_float_time = i_list_frame[CANP_LOG__IDX_TIME]
 				i_any_data = i_list_frame[CANP_LOG__IDX_DATA]
 
-			try:
-				self.m_dict_raws[i_int_cobid].append((i_float_time, i_any_data))
-				# - except KeyError -
-			except:
-				self.m_dict_raws[i_int_cobid] = [(i_float_time, i_any_data)]
-				pass
+			# Stored once (nodes keep its position)
+			l_int_seq = self.m_obj_jour.append(i_float_time, i_int_cobid, i_any_data)
+
+			for l_int_node in l_list_keep:
+				self.m_obj_jour.node_add(l_int_node, [l_int_seq])
 
-			self.m_dict_raws[CANP_ENUM__VAL_DEFAULT] = i_int_cobid
+			if l_bool_sync == True:
+				self.m_obj_jour.bcast_add([l_int_seq])
+
+	def frame_parse_many(self,
+				i_list_time: List[float] = [],
+				i_list_cobid: List[int] = [],
+				i_list_data: List[bytearray] = []
+			) -> None:
+		""" Frames parser (batch, same result as 'frame_parse' on each frame in order)
+			Frames are grouped by node once, then each node parses its own frames in a row
+			Nmt broadcasts update the nodes existing at that time at once, between their frames before and after (see 'nmt_bcast')
+			Sync frames are stored once (see 'canp_jour.bcast_add')
+			Node should already be configured first
+		"""
+		l_dict_pos: Dict[int, List[int]] = {}
+		l_dict_next: Dict[int, int] = {}
+		l_list_store: List[bool] = []
+		l_dict_keep: Dict[int, List[int]] = {}
+		l_list_sync: List[int] = []
+		l_list_nmt: List[Tuple[int, int, int]] = []
+		l_dict_born: Dict[int, int] = {}
+		l_narr_keys: Any = None
+		l_int_node: int = 0
+		l_int_dlc: int = 0
+		l_int_next: int = 0
+		l_int_end: int = 0
+
+		# Frames of each node (existing nodes first, as the sequential parser)
+		for l_int_node in self.m_dict_nodes.keys():
+			l_dict_pos[l_int_node] = []
+
+		for l_int_pos, (l_int_cobid, l_any_data) in enumerate(zip(i_list_cobid, i_list_data)):
+			l_int_node = l_int_cobid & CANP_ENUM__NODE_MAX
+
+			if l_int_node == 0 and (l_int_cobid == CANP_NODE__COB_NMT or l_int_cobid == CANP_NODE__COB_SYNC):
+				# Broadcast candidates (same rules as 'frame_parse')
+				l_int_dlc = len(l_any_data)
+
+				if l_int_cobid == CANP_NODE__COB_NMT and l_int_dlc == 2:
+					# Node from frame (byte 1)
+					l_int_node = canp_conv.int_bytes(
+						i_bool_bytes = l_any_data[1:2])
+
+				if (l_int_cobid == CANP_NODE__COB_NMT and l_int_node == 0 and l_int_dlc == 2) \
+				or (l_int_cobid == CANP_NODE__COB_SYNC and l_int_dlc == 0):
+					# Broadcast (read by every existing node, see 'node_keys')
+					if len(l_dict_born) != len(l_dict_pos):
+						for l_int_node in l_dict_pos.keys():
+							l_dict_born.setdefault(l_int_node, l_int_pos)
+
+					if l_int_cobid == CANP_NODE__COB_NMT:
+						# nmt (command and nodes existing, applied in order below)
+						l_list_nmt.append((
+							l_int_pos,
+							canp_conv.int_bytes(i_bool_bytes = l_any_data[0:1]),
+							len(l_dict_pos)))
+					else:
+						# sync (emit pdo, configurable, stored once)
+						l_list_sync.append(l_int_pos)
+
+					l_list_store.append(True)
+					continue
+
+			if l_int_node >= CANP_ENUM__NODE_MIN and l_int_node <= CANP_ENUM__NODE_MAX:
+				# Node specific (created on first frame)
+				try:
+					l_dict_pos[l_int_node].append(l_int_pos)
+					# - except KeyError -
+				except KeyError:
+					self.node_set(l_int_node)
+					l_dict_pos[l_int_node] = [l_int_pos]
+
+				l_list_store.append(True)
+			else:
+				self.m_logs.error(f"chan.frame_parse.node[{l_int_node}].impossible")
+				l_list_store.append(False)
+
+		if len(l_list_nmt) > 0:
+			# Nodes in creation order (as 'm_dict_nodes')
+			l_narr_keys = np.fromiter(l_dict_pos.keys(), dtype = np.int64, count = len(l_dict_pos))
+
+		# Each node over its own frames, up to each nmt broadcast (then applied to every node at once)
+		for l_int_nmt, l_int_cmd, l_int_nodes in l_list_nmt + [(len(l_list_store), None, 0)]:
+			for l_int_node, l_list_pos in l_dict_pos.items():
+				l_int_next = l_dict_next.get(l_int_node, 0)
+				l_int_end = bisect_left(l_list_pos, l_int_nmt, l_int_next)
+
+				if l_int_end > l_int_next:
+					l_list_fail, l_list_kept = self.m_dict_nodes[l_int_node].frame_parse_many(
+						[i_list_time[l_int_pos] for l_int_pos in l_list_pos[l_int_next:l_int_end]],
+						[i_list_cobid[l_int_pos] for l_int_pos in l_list_pos[l_int_next:l_int_end]],
+						[i_list_data[l_int_pos] for l_int_pos in l_list_pos[l_int_next:l_int_end]])
+
+					for l_int_fail in l_list_fail:
+						# Not stored (as the sequential parser)
+						self.m_logs.error(f"chan.frame_parse.node[{l_int_node}].unknown")
+						l_list_store[l_list_pos[l_int_next + l_int_fail]] = False
+
+					l_dict_keep.setdefault(l_int_node, []).extend(l_list_pos[l_int_next + l_int_kept] for l_int_kept in l_list_kept)
+					l_dict_next[l_int_node] = l_int_end
+
+			if l_int_cmd is not None:
+				for l_int_node in self.nmt_bcast(l_int_cmd, l_narr_keys[:l_int_nodes]):
+					l_dict_keep.setdefault(l_int_node, []).append(l_int_nmt)
+
+		# Raw frames (stored once, in order, nodes keep their positions)
+		l_list_idx = [l_int_pos for l_int_pos, l_bool_store in enumerate(l_list_store) if l_bool_store == True]
+		l_int_seq = self.m_obj_jour.extend(
+			[i_list_time[l_int_pos] for l_int_pos in l_list_idx],
+			[i_list_cobid[l_int_pos] for l_int_pos in l_list_idx],
+			[i_list_data[l_int_pos] for l_int_pos in l_list_idx])
+
+		l_list_seq = [CANP_ENUM__VAL_DEFAULT] * len(l_list_store)
+		for l_int_off, l_int_pos in enumerate(l_list_idx):
+			l_list_seq[l_int_pos] = l_int_seq + l_int_off
+
+		for l_int_node, l_list_kept in l_dict_keep.items():
+			if len(l_list_kept) > 0:
+				self.m_obj_jour.node_add(l_int_node, [
+					l_list_seq[l_int_pos]
+					for l_int_pos in l_list_kept
+					if l_list_store[l_int_pos] == True])
+
+		for l_int_node, l_int_pos in l_dict_born.items():
+			self.m_obj_jour.node_born(l_int_node, l_list_seq[l_int_pos])
+
+		self.m_obj_jour.bcast_add([l_list_seq[l_int_pos] for l_int_pos in l_list_sync])
 
 #  --- MAIN ---
 
@@ -30,6 +30,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 #from typing import Union
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
@@ -42,6 +43,10 @@ from typing import Optional
 
 from canp_conv import canp_conv
 
+from canp_objs import canp_objs
+
+from canp_objs import CANP_OBJS__SUB_BITS
+
 
 from canp_enum import CANP_ENUM__APP_NAME
 from canp_enum import CANP_ENUM__BASE_HEXA
@@ -231,6 +236,22 @@ CANP_CONF__SDO_RX = 0
 CANP_CONF__SDO_TX = 1
 
 
+# Entry slots (key = parameter, the others kept in 'm_dict_more')
+dict_CANP_CONF__SLOT = {
+		enum_CANP_CONF__TYPE.AccessType: "m_enum_accs",
+		enum_CANP_CONF__TYPE.CompactSubObj: "m_any_cpct",
+		enum_CANP_CONF__TYPE.DataType: "m_enum_type",
+		enum_CANP_CONF__TYPE.DefaultValue: "m_any_dflt",
+		enum_CANP_CONF__TYPE.HighLimit: "m_any_high",
+		enum_CANP_CONF__TYPE.LowLimit: "m_any_low",
+		enum_CANP_CONF__TYPE.ObjFlags: "m_any_flag",
+		enum_CANP_CONF__TYPE.ObjectType: "m_enum_objt",
+		enum_CANP_CONF__TYPE.PDOMapping: "m_any_pdom",
+		enum_CANP_CONF__TYPE.ParameterName: "m_str_name",
+		enum_CANP_CONF__TYPE.ParameterValue: "m_any_parv",
+		enum_CANP_CONF__TYPE.SubNumber: "m_any_subn",
+	}
+
 CANP_CONF__STR_RE_SUB = r"[0-9a-fA-F]+sub[0-9a-fA-F]+"
 CANP_CONF__RE_SUB = re.compile(CANP_CONF__STR_RE_SUB)
 
@@ -239,14 +260,121 @@ CANP_CONF__RE_VAL = re.compile(CANP_CONF__STR_RE_VAL)
 
 #  --- CLASS ---
 
+class canp_conf_ent:
+	""" Configuration entry (object sub-index or index header)
+		Frequent parameters in slots (see 'dict_CANP_CONF__SLOT'), the others in 'm_dict_more'
+		Read as the former dict (key = parameter, KeyError if absent)
+	"""
+
+	__slots__ = tuple(dict_CANP_CONF__SLOT.values()) + ("m_dict_more",)
+
+	def __init__(self) -> None:
+		""" Constructor
+		"""
+		self.m_dict_more = None
+
+	def __getitem__(self,
+				i_enum_key: enum_CANP_CONF__TYPE
+			) -> Any:
+		""" Get at (key = parameter, KeyError if absent)
+		"""
+		l_any_ret: Any = None
+
+		try:
+			l_any_ret = getattr(self, dict_CANP_CONF__SLOT[i_enum_key])
+			# - except KeyError - not a slot
+			# - except AttributeError - not set
+		except KeyError:
+			if self.m_dict_more is None:
+				raise
+			l_any_ret = self.m_dict_more[i_enum_key]
+		except AttributeError:
+			raise KeyError(i_enum_key)
+
+		return l_any_ret
+
+	def __setitem__(self,
+				i_enum_key: enum_CANP_CONF__TYPE,
+				i_any_val: Any
+			) -> None:
+		""" Set at (key = parameter)
+		"""
+		try:
+			setattr(self, dict_CANP_CONF__SLOT[i_enum_key], i_any_val)
+			# - except KeyError - not a slot
+		except KeyError:
+			if self.m_dict_more is None:
+				self.m_dict_more = {}
+			self.m_dict_more[i_enum_key] = i_any_val
+
+	def __contains__(self,
+				i_enum_key: enum_CANP_CONF__TYPE
+			) -> bool:
+		""" Parameter present
+		"""
+		return i_enum_key in self.keys()
+
+	def __len__(self) -> int:
+		""" Size of (number of parameters)
+		"""
+		return len(self.keys())
+
+	def keys(self) -> List[enum_CANP_CONF__TYPE]:
+		""" Parameters (slots first)
+		"""
+		l_list_ret: List[enum_CANP_CONF__TYPE] = [
+			l_enum_key for l_enum_key, l_str_slot in dict_CANP_CONF__SLOT.items()
+			if hasattr(self, l_str_slot)]
+
+		if self.m_dict_more is not None:
+			l_list_ret.extend(self.m_dict_more.keys())
+
+		return l_list_ret
+
+	def items(self) -> List[Tuple[enum_CANP_CONF__TYPE, Any]]:
+		""" Parameters and values
+		"""
+		return [(l_enum_key, self[l_enum_key]) for l_enum_key in self.keys()]
+
+	def get(self,
+				i_enum_key: enum_CANP_CONF__TYPE,
+				i_any_def: Any = None
+			) -> Any:
+		""" Get at (default if absent)
+		"""
+		l_any_ret: Any = i_any_def
+
+		try:
+			l_any_ret = self[i_enum_key]
+			# - except KeyError -
+		except KeyError:
+			pass
+
+		return l_any_ret
+
+	def copy(self) -> "canp_conf_ent":
+		""" Copy (parameters not shared)
+		"""
+		l_obj_ret: canp_conf_ent = canp_conf_ent()
+
+		for l_enum_key, l_any_val in self.items():
+			l_obj_ret[l_enum_key] = l_any_val
+
+		return l_obj_ret
+
+	def __repr__(self) -> str:
+		""" Representation (as the former dict)
+		"""
+		return repr(dict(self.items()))
+
 class canp_conf:
 	""" CAN configuration
 	"""
 
 	# Parameter
 	m_dict_par: Dict[str, Any] = {}
-	# Object (key = index, sub-indexes)
-	m_dict_obj: Dict[int, Any] = {}
+	# Objects (flat, key = (index << 8) | sub-index, see 'canp_objs')
+	m_cls_objs: Optional[canp_objs] = None
 	# PDO mapper
 	m_list_pdo: List[Dict[int, int]] = []
 	# SDO mapper
@@ -279,12 +407,12 @@ class canp_conf:
 			) -> Any:
 		""" Get at (key = object index, if present)
 		"""
-		return self.m_dict_obj[i_int_index]
+		return self.m_cls_objs[i_int_index]
 
 	def __len__(self):
 		""" Size of (number of objects)
 		"""
-		return len(self.m_dict_obj)
+		return 0 if self.m_cls_objs is None else len(self.m_cls_objs)
 
 	@staticmethod
 	def conv_cnf(
@@ -317,63 +445,88 @@ class canp_conf:
 
 		return l_any_ret
 
-	def conv_obj(self,
+	def type_obj(self,
 				i_int_idx: int = 0,
 				i_int_sub: int = 0,
-				i_bytes_data: bytearray = b''
+				i_bool_logs: bool = True
 			) -> Any:
-		""" Type converter
+		""" Object data type (None if unknown, logged if 'i_bool_logs')
 		"""
 		l_any_ret: Any = None
-		l_dict_idx: Any = None
-		l_dict_sub: Any = None
-		l_int_max: int = 0
-		l_enum_typ: int = 0
+		l_obj_ent: Optional[canp_conf_ent] = None
 
-		l_any_ret = i_bytes_data
+		if i_int_idx in self.m_cls_objs:
+			l_obj_ent = self.ent_obj(i_int_idx, i_int_sub)
 
-		if isinstance(i_bytes_data, bytearray) and len(i_bytes_data) > 0:
+			if l_obj_ent is not None:
+				try:
+					l_any_ret = l_obj_ent.m_enum_type
+					# - except AttributeError - not set
+				except AttributeError:
+					if i_bool_logs == True:
+						self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].data.type.unknown")
+			elif i_bool_logs == True:
+				self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].unknown")
+		elif i_bool_logs == True:
+			self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].unknown")
+
+		return l_any_ret
+
+	def ent_obj(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> Optional[canp_conf_ent]:
+		""" Object entry (one probe, index header if no such sub-index, None if unknown)
+		"""
+		l_obj_ret: Optional[canp_conf_ent] = None
+
+		try:
+			# Object sub-index
+			l_obj_ret = self.m_cls_objs.m_dict_ents[(i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub]
+			# - except KeyError -
+			# ParameterName=
+			# ObjectType=
+			# DataType=
+			# AccessType=
+			# PDOMapping=
+			# DefaultValue=
+			# ...
+		except KeyError:
 			try:
 				# Object index
-				l_dict_idx = self.m_dict_obj[i_int_idx]
+				l_obj_ret = self.m_cls_objs.m_dict_head[i_int_idx]
 				# - except KeyError -
 				# ParameterName=
 				# SubNumber=
 				# ObjectType=
 				# ...
+			except KeyError:
+				pass
+
+		return l_obj_ret
+
+	def conv_obj(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0,
+				i_bytes_data: bytearray = b''
+			) -> Any:
+		""" Type converter
+		"""
+		l_any_ret: Any = None
+		l_enum_typ: Any = None
 
+		l_any_ret = i_bytes_data
+
+		if isinstance(i_bytes_data, bytearray) and len(i_bytes_data) > 0:
+			l_enum_typ = self.type_obj(i_int_idx, i_int_sub)
+			if l_enum_typ is not None:
 				try:
-					# Object sub-index
-					l_dict_sub = l_dict_idx[i_int_sub]
+					l_any_ret = canp_conv.any_bytes(
+						l_enum_typ,
+						i_bytes_data)
 					# - except KeyError -
-					# ParameterName=
-					# ObjectType=
-					# DataType=
-					# AccessType=
-					# PDOMapping=
-					# DefaultValue=
-					# ...
-
 				except KeyError:
-					try:
-						l_dict_sub = l_dict_idx[CANP_ENUM__VAL_DEFAULT]
-					except KeyError:
-						# Handle the error below (== None)
-						pass
-
-				if l_dict_sub is not None:
-					try:
-						l_enum_typ = l_dict_sub[enum_CANP_CONF__TYPE.DataType]
-						# - except KeyError -
-						l_any_ret = canp_conv.any_bytes(
-							l_enum_typ,
-							i_bytes_data)
-					except KeyError:
-						self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].data.type.unknown")
-				else:
-					self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].unknown")
-			except KeyError:
-				self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].unknown")
+					self.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].data.type.unknown")
 
 		return l_any_ret
 
@@ -398,11 +551,11 @@ class canp_conf:
 
 		# Maximum sub-index
 		try:
-			l_int_max = self.m_dict_obj[i_int_idx][CANP_ENUM__VAL_DEFAULT][enum_CANP_CONF__TYPE.SubNumber]
+			l_int_max = self.m_cls_objs.ent_get(i_int_idx, CANP_ENUM__VAL_DEFAULT)[enum_CANP_CONF__TYPE.SubNumber]
 			# - except KeyError -
 			if l_int_max > 0:
-				# Subtract CANP_ENUM__VAL_DEFAULT
-				l_int_len = len(self.m_dict_obj[i_int_idx]) - 1
+				# Sub-indexes (CANP_ENUM__VAL_DEFAULT not included)
+				l_int_len = len(self.m_cls_objs.ent_list(i_int_idx))
 				if l_int_max != l_int_len:
 					self.m_logs.error(f"{l_str_err}.sub[{l_int_max}].len[{l_int_len}].mismatch {i_str_chk}".rstrip())
 
@@ -410,13 +563,13 @@ class canp_conf:
 				# Number of mapped objects (variable)
 				try:
 					# Parameter value (from DCF file)
-					l_any_data = self.m_dict_obj[i_int_idx][0][enum_CANP_CONF__TYPE.ParameterValue]
+					l_any_data = self.m_cls_objs.ent_get(i_int_idx, 0)[enum_CANP_CONF__TYPE.ParameterValue]
 					# - except KeyError -
 					l_bool_ok = True
 				except KeyError:
 					try:
 						# Default value (from EDS file)
-						l_any_data = self.m_dict_obj[i_int_idx][0][enum_CANP_CONF__TYPE.DefaultValue]
+						l_any_data = self.m_cls_objs.ent_get(i_int_idx, 0)[enum_CANP_CONF__TYPE.DefaultValue]
 						# - except KeyError -
 						l_bool_ok = True
 					except KeyError:
@@ -452,7 +605,7 @@ class canp_conf:
 		"""
 		if i_str_file != CANP_ENUM__STR_EMPTY:
 			self.m_dict_par = {}
-			self.m_dict_obj = {}
+			self.m_cls_objs = canp_objs()
 			self.m_list_pdo = [{}, {}]
 			self.m_list_sdo = [0, 0]
 
@@ -494,6 +647,7 @@ class canp_conf:
 				l_enum_lst: int = 0
 				l_enum_val: int = 0
 				l_list_acc: List[str] = []
+				l_obj_ent: Optional[canp_conf_ent] = None
 
 				# Using heavy duck-typing to identify sections (fuzzy logic)
 				# False positives are filtered out below
@@ -615,18 +769,11 @@ class canp_conf:
 				else:
 					# Object (by default)
 					try:
-						# Check index
-						self.m_dict_obj[l_int_obj]
-						# - except KeyError -
-					except KeyError:
-						self.m_dict_obj[l_int_obj] = {}
-
-					try:
-						# Check sub-index
-						self.m_dict_obj[l_int_obj][l_int_sub]
+						# Check entry (index header if no sub-index)
+						l_obj_ent = self.m_cls_objs.ent_get(l_int_obj, l_int_sub)
 						# - except KeyError -
 					except KeyError:
-						self.m_dict_obj[l_int_obj][l_int_sub] = {}
+						l_obj_ent = self.m_cls_objs.ent_set(l_int_obj, l_int_sub, canp_conf_ent())
 
 					# Check previous object integrity
 					if l_int_old != l_int_obj:
@@ -639,7 +786,7 @@ class canp_conf:
 						# Compact sub-object
 						l_enum_lst = enum_CANP_CONF__TYPE.NrOfEntries
 						try:
-							l_int_max = self.m_dict_obj[l_int_obj][CANP_ENUM__VAL_DEFAULT][enum_CANP_CONF__TYPE.CompactSubObj]
+							l_int_max = self.m_cls_objs.ent_get(l_int_obj, CANP_ENUM__VAL_DEFAULT)[enum_CANP_CONF__TYPE.CompactSubObj]
 							# - except KeyError -
 						except KeyError:
 							self.m_logs.error(f"{l_str_err}.obj[{l_str_sect}].compact.unknown (possible orphan?)")
@@ -655,7 +802,7 @@ class canp_conf:
 							or l_enum_key == enum_CANP_CONF__TYPE.ParameterValue:
 								# Convert using proper DataType
 								try:
-									l_enum_val = self.m_dict_obj[l_int_obj][l_int_sub][enum_CANP_CONF__TYPE.DataType]
+									l_enum_val = l_obj_ent[enum_CANP_CONF__TYPE.DataType]
 									# - except KeyError -
 									# Specific cases (cleaning up the dirt)
 									l_str_val = l_str_val.replace('$NODEID+', CANP_ENUM__STR_EMPTY)
@@ -677,7 +824,7 @@ class canp_conf:
 								l_any_val = self.conv_cnf(l_enum_key, l_str_val)
 
 							# Store (using the proper data type)
-							self.m_dict_obj[l_int_obj][l_int_sub][l_enum_key] = l_any_val
+							l_obj_ent[l_enum_key] = l_any_val
 
 							if l_enum_lst == l_enum_key:
 								# Compact sub-object
@@ -689,19 +836,22 @@ class canp_conf:
 								# Compact sub-object
 								l_int_sub = self.conv_cnf(l_enum_lst, l_str_key)
 								try:
-									# Copy reference object
-									self.m_dict_obj[l_int_obj][l_int_sub] = self.m_dict_obj[l_int_obj][CANP_ENUM__VAL_DEFAULT]
+									# Copy reference object (own values)
+									l_obj_ent = self.m_cls_objs.ent_set(
+										l_int_obj,
+										l_int_sub,
+										self.m_cls_objs.ent_get(l_int_obj, CANP_ENUM__VAL_DEFAULT).copy())
 									# - except KeyError -
 									try:
-										l_enum_val = self.m_dict_obj[l_int_obj][l_int_sub][enum_CANP_CONF__TYPE.DataType]
+										l_enum_val = l_obj_ent[enum_CANP_CONF__TYPE.DataType]
 										# - except KeyError -
 										l_any_val = canp_conv.any_str(l_enum_val, l_str_val)
 										# Store as right type (beware for later conversion)
-										self.m_dict_obj[l_int_obj][l_int_sub][enum_CANP_CONF__TYPE.ParameterValue] = l_any_val
+										l_obj_ent[enum_CANP_CONF__TYPE.ParameterValue] = l_any_val
 									except KeyError:
 										self.m_logs.error(f"{l_str_err}.obj[{l_str_sect}].compact.datatype.missing")
 										# Store as string (later conversion needed, maybe)
-										self.m_dict_obj[l_int_obj][l_int_sub][enum_CANP_CONF__TYPE.ParameterValue] = l_str_val
+										l_obj_ent[enum_CANP_CONF__TYPE.ParameterValue] = l_str_val
 								except KeyError:
 									pass
 
@@ -717,14 +867,14 @@ class canp_conf:
 				self.m_str_name = l_str_file
 
 			# Filter configured PDOs
-			for l_int_pdo in self.m_dict_obj:
+			for l_int_pdo in self.m_cls_objs:
 				l_bool_ok: bool = False
 				l_int_val: int = 0
 
 				if l_int_pdo == CANP_CONF__CPA_SSDO_CP:
 					# sdo : 0x1200
 					try:
-						l_int_val = self.m_dict_obj[l_int_pdo][1][enum_CANP_CONF__TYPE.DefaultValue]
+						l_int_val = self.m_cls_objs.ent_get(l_int_pdo, 1)[enum_CANP_CONF__TYPE.DefaultValue]
 						# - except KeyError - index
 						if l_int_val & CANP_CONF__PDO_COB_VALID == CANP_CONF__PDO_COB_VALID__VALID:
 							# Activated
@@ -742,7 +892,7 @@ class canp_conf:
 					except KeyError:
 						pass
 					try:
-						l_int_val = self.m_dict_obj[l_int_pdo][2][enum_CANP_CONF__TYPE.DefaultValue]
+						l_int_val = self.m_cls_objs.ent_get(l_int_pdo, 2)[enum_CANP_CONF__TYPE.DefaultValue]
 						# - except KeyError - index
 						if l_int_val & CANP_CONF__PDO_COB_VALID == CANP_CONF__PDO_COB_VALID__VALID:
 							# Activated
@@ -762,7 +912,7 @@ class canp_conf:
 				elif l_int_pdo >= CANP_CONF__CPA_TPDO_CP and l_int_pdo < (CANP_CONF__CPA_TPDO_CP + CANP_CONF__CPA__CP_LEN):
 					# Tpdo : 0x1800 / 0x1A00
 					try:
-						l_int_val = self.m_dict_obj[l_int_pdo][1][enum_CANP_CONF__TYPE.DefaultValue]
+						l_int_val = self.m_cls_objs.ent_get(l_int_pdo, 1)[enum_CANP_CONF__TYPE.DefaultValue]
 						# - except KeyError - index
 						if l_int_val & CANP_CONF__PDO_COB_VALID == CANP_CONF__PDO_COB_VALID__VALID:
 							# Activated
@@ -782,7 +932,7 @@ class canp_conf:
 				elif l_int_pdo >= CANP_CONF__CPA_RPDO_CP and l_int_pdo < (CANP_CONF__CPA_RPDO_CP + CANP_CONF__CPA__CP_LEN):
 					# Rpdo : 0x1400 / 0x1600
 					try:
-						l_int_val = self.m_dict_obj[l_int_pdo][1][enum_CANP_CONF__TYPE.DefaultValue]
+						l_int_val = self.m_cls_objs.ent_get(l_int_pdo, 1)[enum_CANP_CONF__TYPE.DefaultValue]
 						# - except KeyError - index
 						if l_int_val & CANP_CONF__PDO_COB_VALID == CANP_CONF__PDO_COB_VALID__VALID:
 							# Activated
@@ -18,20 +18,27 @@
 import os
 import struct
 import sys
+import time
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from datetime import datetime, timedelta
+
 from typing import Any
 #from typing import Callable
-#from typing import Dict
+from typing import Dict
 from typing import List
 #from typing import Optional
+from typing import Tuple
 #from typing import Union
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # External libraries (installed with pip, conda, setup.py, ...)
 
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # Included libraries (this module, local files)
@@ -59,7 +66,7 @@ from canp_enum import enum_TYPE
 from canp_enum import list_TYPE_BOOL
 from canp_enum import list_TYPE_INT, list_TYPE_SINT
 from canp_enum import list_TYPE_REAL
-from canp_enum import list_TYPE_STRING
+#from canp_enum import list_TYPE_STRING
 from canp_enum import list_TYPE_TIME
 
 
@@ -68,6 +75,91 @@ from canp_logs import canp_logs
 
 #  --- GLOBAL ---
 
+# Array typecode (python 'array' and numpy dtype) of the decoded values
+dict_CANP_CONV__TYPE_CODE = {
+		enum_TYPE.Boolean: "B",
+		enum_TYPE.Integer8: "b",
+		enum_TYPE.Integer16: "h",
+		enum_TYPE.Integer24: "i",
+		enum_TYPE.Integer32: "i",
+		enum_TYPE.Integer40: "q",
+		enum_TYPE.Integer48: "q",
+		enum_TYPE.Integer56: "q",
+		enum_TYPE.Integer64: "q",
+		enum_TYPE.Unsigned8: "B",
+		enum_TYPE.Unsigned16: "H",
+		enum_TYPE.Unsigned24: "I",
+		enum_TYPE.Unsigned32: "I",
+		enum_TYPE.Unsigned40: "Q",
+		enum_TYPE.Unsigned48: "Q",
+		enum_TYPE.Unsigned56: "Q",
+		enum_TYPE.Unsigned64: "Q",
+		enum_TYPE.Real32: "f",
+		enum_TYPE.Real64: "d",
+	}
+
+# Struct format (little-endian) of the native widths (others through 'int.from_bytes')
+dict_CANP_CONV__STRUCT_FMT = {
+		enum_TYPE.Boolean: "<?",
+		enum_TYPE.Integer8: "<b",
+		enum_TYPE.Integer16: "<h",
+		enum_TYPE.Integer32: "<i",
+		enum_TYPE.Integer64: "<q",
+		enum_TYPE.Unsigned8: "<B",
+		enum_TYPE.Unsigned16: "<H",
+		enum_TYPE.Unsigned32: "<I",
+		enum_TYPE.Unsigned64: "<Q",
+		enum_TYPE.Real32: "<f",
+		enum_TYPE.Real64: "<d",
+		enum_TYPE.TimeOfDay: "<IH",			# ms after midnight (28 bits), days
+		enum_TYPE.TimeDifference: "<IH",
+	}
+
+# Numpy dtype of the decoded values (see 'canp_conv.narr_bytes', object if none fits)
+dict_CANP_CONV__DTYPE = {
+		enum_TYPE.Boolean: np.dtype("?"),
+		enum_TYPE.Integer8: np.dtype("i1"),
+		enum_TYPE.Integer16: np.dtype("<i2"),
+		enum_TYPE.Integer24: np.dtype("<i4"),
+		enum_TYPE.Integer32: np.dtype("<i4"),
+		enum_TYPE.Integer40: np.dtype("<i8"),
+		enum_TYPE.Integer48: np.dtype("<i8"),
+		enum_TYPE.Integer56: np.dtype("<i8"),
+		enum_TYPE.Integer64: np.dtype("<i8"),
+		enum_TYPE.Unsigned8: np.dtype("u1"),
+		enum_TYPE.Unsigned16: np.dtype("<u2"),
+		enum_TYPE.Unsigned24: np.dtype("<u4"),
+		enum_TYPE.Unsigned32: np.dtype("<u4"),
+		enum_TYPE.Unsigned40: np.dtype("<u8"),
+		enum_TYPE.Unsigned48: np.dtype("<u8"),
+		enum_TYPE.Unsigned56: np.dtype("<u8"),
+		enum_TYPE.Unsigned64: np.dtype("<u8"),
+		enum_TYPE.Real32: np.dtype("<f4"),
+		enum_TYPE.Real64: np.dtype("<f8"),
+		enum_TYPE.TimeOfDay: np.dtype("datetime64[ms]"),
+		enum_TYPE.TimeDifference: np.dtype("timedelta64[ms]"),
+		enum_TYPE.VisibleString: np.dtype("O"),
+		enum_TYPE.OctetString: np.dtype("O"),
+		enum_TYPE.UnicodeString: np.dtype("O"),
+		enum_TYPE.Domain: np.dtype("O"),
+	}
+
+# Codec (see 'canp_conv.codec_new')
+CANP_CONV__CODEC_SIZE = 0			# Size in bytes (-1 : variable length)
+CANP_CONV__CODEC_SIGN = 1			# Signed integer
+CANP_CONV__CODEC_STRUCT = 2			# 'struct.Struct' (None if not a native width)
+CANP_CONV__CODEC_DEC = 3			# Value from bytes
+CANP_CONV__CODEC_ENC = 4			# Bytes from value
+
+# Time (CiA 301 TIME_OF_DAY / TIME_DIFFERENCE)
+CANP_CONV__TIME_EPOCH = datetime(1984, 1, 1)
+CANP_CONV__TIME_EPOCH64 = np.datetime64("1984-01-01", "ms")
+CANP_CONV__TIME_MS = 0x0FFFFFFF
+CANP_CONV__TIME_DAY = 86400000
+CANP_CONV__DTYPE_TIME = np.dtype([("ms", "<u4"), ("days", "<u2")])
+
+# Codecs per DataType (filled once the class is defined)
+dict_CANP_CONV__CODEC: Dict[Any, Tuple[Any, ...]] = {}
 
 #  --- CLASS ---
 
@@ -78,6 +170,110 @@ class canp_conv:
 	# Logger object
 	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("conv")
 
+	@staticmethod
+	def codec_new(
+				i_enum_typ: Any
+			) -> Tuple[Any, ...]:
+		""" Codec of a DataType (size, signed, struct, decoder, encoder)
+			Decoder and encoder are single calls on little-endian bytes (CiA 301 basic types)
+		"""
+		l_int_len: int = 0
+		l_bool_sign: bool = False
+		l_int_sign: int = 0
+		l_int_mask: int = 0
+		l_obj_struct: Any = None
+		l_func_dec: Any = None
+		l_func_enc: Any = None
+
+		l_int_len = dict_SIZE_TYPE[i_enum_typ]
+		l_bool_sign = (i_enum_typ in list_TYPE_SINT)
+
+		if i_enum_typ in dict_CANP_CONV__STRUCT_FMT:
+			l_obj_struct = struct.Struct(dict_CANP_CONV__STRUCT_FMT[i_enum_typ])
+
+		if i_enum_typ in list_TYPE_INT:
+			# Integer (signed ones also accepted as their unsigned pattern)
+			l_int_mask = (1 << (l_int_len * 8)) - 1
+			if l_bool_sign == True:
+				l_int_sign = 1 << (l_int_len * 8 - 1)
+
+			if l_obj_struct is not None:
+				l_func_unpack = l_obj_struct.unpack_from
+				l_func_pack = struct.Struct(dict_CANP_CONV__STRUCT_FMT[i_enum_typ].upper()).pack
+
+				def l_func_dec(i_bytes_val):
+					return l_func_unpack(i_bytes_val)[0]
+			else:
+				# 24/40/48/56 bits
+				def l_func_dec(i_bytes_val):
+					return int.from_bytes(i_bytes_val[:l_int_len], byteorder = CANP_ENUM__BYTE_LITTLE, signed = l_bool_sign)
+
+				def l_func_pack(i_int_val):
+					return i_int_val.to_bytes(l_int_len, byteorder = CANP_ENUM__BYTE_LITTLE)
+
+			def l_func_enc(i_any_val):
+				if i_any_val < -l_int_sign:
+					raise OverflowError
+				elif i_any_val < 0:
+					i_any_val &= l_int_mask
+				return bytearray(l_func_pack(i_any_val))
+		elif l_obj_struct is not None and i_enum_typ in list_TYPE_TIME:
+			# Time (ms after midnight, days)
+			l_func_unpack = l_obj_struct.unpack_from
+			l_func_pack = l_obj_struct.pack
+
+			if i_enum_typ == enum_TYPE.TimeOfDay:
+				# Date and time since 01/01/84
+				def l_func_dec(i_bytes_val):
+					l_int_ms, l_int_days = l_func_unpack(i_bytes_val)
+					return CANP_CONV__TIME_EPOCH + timedelta(days = l_int_days, milliseconds = l_int_ms & CANP_CONV__TIME_MS)
+
+				def l_func_enc(i_any_val):
+					l_obj_delta = i_any_val - CANP_CONV__TIME_EPOCH
+					return bytearray(l_func_pack(l_obj_delta.seconds * 1000 + l_obj_delta.microseconds // 1000, l_obj_delta.days))
+			else:
+				# Duration
+				def l_func_dec(i_bytes_val):
+					l_int_ms, l_int_days = l_func_unpack(i_bytes_val)
+					return timedelta(days = l_int_days, milliseconds = l_int_ms & CANP_CONV__TIME_MS)
+
+				def l_func_enc(i_any_val):
+					return bytearray(l_func_pack(i_any_val.seconds * 1000 + i_any_val.microseconds // 1000, i_any_val.days))
+		elif l_obj_struct is not None:
+			# Boolean - Real
+			l_func_unpack = l_obj_struct.unpack_from
+			l_func_pack = l_obj_struct.pack
+
+			def l_func_dec(i_bytes_val):
+				return l_func_unpack(i_bytes_val)[0]
+
+			def l_func_enc(i_any_val):
+				return bytearray(l_func_pack(i_any_val))
+		elif i_enum_typ == enum_TYPE.VisibleString:
+			def l_func_dec(i_bytes_val):
+				return i_bytes_val.decode("utf-8", errors = "replace")
+
+			def l_func_enc(i_any_val):
+				return bytearray(i_any_val.encode("utf-8"))
+		elif i_enum_typ == enum_TYPE.UnicodeString:
+			# Unsigned16 characters
+			def l_func_dec(i_bytes_val):
+				return i_bytes_val.decode("utf-16-le", errors = "replace")
+
+			def l_func_enc(i_any_val):
+				return bytearray(i_any_val.encode("utf-16-le"))
+		else:
+			# OctetString - Domain (bytes as is)
+			def l_func_dec(i_bytes_val):
+				return bytearray(i_bytes_val)
+
+			def l_func_enc(i_any_val):
+				if isinstance(i_any_val, str):
+					i_any_val = i_any_val.encode("utf-8")
+				return bytearray(i_any_val)
+
+		return (l_int_len, l_bool_sign, l_obj_struct, l_func_dec, l_func_enc)
+
 	@staticmethod
 	def any_str(
 				i_enum_typ: int,
@@ -87,6 +283,7 @@ class canp_conv:
 			DataType returned is the closest from the requested 'i_enum_typ'
 		"""
 		l_any_ret: Any = None
+		l_int_sign: int = 0
 
 		l_any_ret = i_str_val
 
@@ -99,27 +296,24 @@ class canp_conv:
 				l_any_ret = int(i_str_val, CANP_ENUM__BASE_HEXA)
 			else:
 				l_any_ret = int(CANP_ENUM__STR_ZERO + i_str_val, CANP_ENUM__BASE_DECI)
+
+			if i_enum_typ in list_TYPE_SINT and l_any_ret >= 0:
+				# Two's complement pattern (0x80000000 is Integer32 minimum)
+				l_int_sign = 1 << (dict_SIZE_TYPE[i_enum_typ] * 8 - 1)
+				l_any_ret = ((l_any_ret & ((l_int_sign << 1) - 1)) ^ l_int_sign) - l_int_sign
 		elif i_enum_typ in list_TYPE_REAL:
 			# Real
 			l_any_ret = float(CANP_ENUM__STR_ZERO + i_str_val)
-		elif i_enum_typ in list_TYPE_STRING:
-			# String
-			if i_enum_typ == enum_TYPE.OctetString:
-				try:
-					# If proper format (hex str)
-					l_any_ret = bytearray.fromhex(i_str_val)
-					# - except ValueError -
-				except ValueError:
-					# Otherwise...
-					l_any_ret = bytearray(i_str_val.encode("utf-8"))
-			else:
-				# VisibleString - UnicodeString
-				l_any_ret = i_str_val
-		elif i_enum_typ in list_TYPE_TIME:
-			# TODO : Time
-			l_any_ret = i_str_val
+		elif i_enum_typ == enum_TYPE.OctetString:
+			try:
+				# If proper format (hex str)
+				l_any_ret = bytearray.fromhex(i_str_val)
+				# - except ValueError -
+			except ValueError:
+				# Otherwise...
+				l_any_ret = bytearray(i_str_val.encode("utf-8"))
 		else:
-			# Go figure...
+			# VisibleString - UnicodeString - Time (TODO) - Go figure...
 			l_any_ret = i_str_val
 
 		return l_any_ret
@@ -133,66 +327,19 @@ class canp_conv:
 			Bytes returned are the closest conversion from the requested 'i_enum_typ'
 		"""
 		l_bytes_ret: bytearray = b""
-		l_bool_sign: bool = False
-		l_int_len: int = 0
-		l_str_fun: str = CANP_ENUM__STR_EMPTY
+		l_func_enc: Any = None
 
-		l_int_len = dict_SIZE_TYPE[i_enum_typ]
-		l_str_fun = sys._getframe().f_code.co_name
+		l_func_enc = dict_CANP_CONV__CODEC[i_enum_typ][CANP_CONV__CODEC_ENC]
 
-		if i_enum_typ in list_TYPE_BOOL:
-			# Boolean
-			if i_any_val == 0:
-				l_bytes_ret = bytearray(b"\x00")
-			else:
-				l_bytes_ret = bytearray(b"\x01")
-		elif i_enum_typ in list_TYPE_INT:
-			# Integer
-			if i_enum_typ in list_TYPE_SINT:
-				# OverflowError if True on 0x80000000
-				l_bool_sign = False
-			else:
-				l_bool_sign = False
-
-			try:
-				l_bytes_ret = bytearray(
-					i_any_val.to_bytes(
-						l_int_len,
-						byteorder = CANP_ENUM__BYTE_LITTLE,
-						signed = l_bool_sign))
-				# - except OverflowError -
-			except OverflowError:
-				#m_logs.error("conv.bytes_any.int.overflow")
-				pass
-		elif i_enum_typ in list_TYPE_REAL:
-			# Real
-			if i_enum_typ == enum_TYPE.Real32:
-				l_bytes_ret = bytearray(
-					struct.pack(
-						'f',
-						i_any_val))
-			elif i_enum_typ == enum_TYPE.Real64:
-				l_bytes_ret = bytearray(
-					struct.pack(
-						'd',
-						i_any_val))
-			else:
-				#m_logs.error("conv.bytes_any.data.type.real.unknown")
-				pass
-		elif i_enum_typ in list_TYPE_STRING:
-			# String (mostly)
-			if i_enum_typ == enum_TYPE.OctetString:
-				l_bytes_ret = i_any_val
-			else:
-				# Assuming UTF-8 though
-				l_bytes_ret = bytearray(i_any_val.encode("utf-8"))
-		elif i_enum_typ in list_TYPE_TIME:
-			# TODO : Time
-			#m_logs.error("conv.bytes_any.data.type.time.unknown")
-			l_bytes_ret = bytearray(b'\x00')
-		else:
-			# Go figure...
-			#m_logs.error("conv.bytes_any.data.type.unknown")
+		try:
+			l_bytes_ret = l_func_enc(i_any_val)
+			# - except OverflowError, struct.error - out of range
+			# - except AttributeError, TypeError - value not of the type
+		except (OverflowError, struct.error):
+			#m_logs.error("conv.bytes_any.int.overflow")
+			pass
+		except (AttributeError, TypeError):
+			#m_logs.error("conv.bytes_any.data.type.mismatch")
 			l_bytes_ret = bytearray(b'\x00')
 
 		return l_bytes_ret
@@ -206,45 +353,130 @@ class canp_conv:
 			Value returned are the closest conversion from the requested 'i_enum_typ'
 		"""
 		l_any_ret: Any = None
-		l_int_len: int = 0
-		l_str_fun: str = CANP_ENUM__STR_EMPTY
+		l_tuple_codec: Tuple[Any, ...] = None
 
 		l_any_ret = i_bytes_val
+		l_tuple_codec = dict_CANP_CONV__CODEC[i_enum_typ]
+
+		if l_tuple_codec[CANP_CONV__CODEC_SIZE] <= len(i_bytes_val):
+			l_any_ret = l_tuple_codec[CANP_CONV__CODEC_DEC](i_bytes_val)
+		else:
+			#m_logs.error("conv.any_bytes.size.mismatch")
+			pass
+
+		return l_any_ret
+
+	@staticmethod
+	def narr_rows(
+				i_list_bytes: List[bytearray] = []
+			) -> Any:
+		""" Bytes matrix (N, k) from payloads (zero padded up to the longest one)
+		"""
+		l_narr_ret: Any = None
+		l_int_len: int = 0
+
+		l_int_len = max((len(l_any_data) for l_any_data in i_list_bytes), default = 0)
+		if all(len(l_any_data) == l_int_len for l_any_data in i_list_bytes):
+			l_narr_ret = np.frombuffer(b"".join(i_list_bytes), dtype = np.uint8).reshape(-1, l_int_len)
+		else:
+			l_narr_ret = np.frombuffer(b"".join([bytes(l_any_data).ljust(l_int_len, b"\x00") for l_any_data in i_list_bytes]), dtype = np.uint8).reshape(-1, l_int_len)
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_bytes(
+				i_enum_typ: int,
+				i_narr_bytes: Any = None,
+				i_int_off: int = 0
+			) -> Any:
+		""" Values array from DataType bytes matrix (N, k), values starting at column 'i_int_off'
+			Array returned is the closest conversion from the requested 'i_enum_typ' (see 'dict_CANP_CONV__DTYPE')
+			Odd integer widths (24/40/48/56 bits) are widened then sign extended for signed types
+		"""
+		l_narr_ret: Any = None
+		l_narr_cols: Any = None
+		l_narr_wide: Any = None
+		l_dtype_val: Any = None
+		l_int_len: int = 0
+		l_int_wide: int = 0
+
+		l_narr_ret = i_narr_bytes
+		l_dtype_val = dict_CANP_CONV__DTYPE[i_enum_typ]
 		l_int_len = dict_SIZE_TYPE[i_enum_typ]
-		l_str_fun = sys._getframe().f_code.co_name
-
-		if l_int_len <= len(i_bytes_val) or l_int_len < 0:
-			if i_enum_typ in list_TYPE_BOOL:
-				# Boolean
-				l_any_ret = struct.unpack("?", i_bytes_val)
-			elif i_enum_typ in list_TYPE_INT:
-				# Integer
-				l_any_ret = int.from_bytes(i_bytes_val, byteorder = CANP_ENUM__BYTE_LITTLE)
-			elif i_enum_typ in list_TYPE_REAL:
-				# Real
-				if i_enum_typ == enum_TYPE.Real32:
-					l_any_ret = struct.unpack("f", i_bytes_val)
-				elif i_enum_typ == enum_TYPE.Real64:
-					l_any_ret = struct.unpack("d", i_bytes_val)
-				else:
-					#m_logs.error("conv.any_bytes.data.type.real.unknown")
-					pass
-			elif i_enum_typ in list_TYPE_STRING:
-				# String (assuming UTF-8 though)
-				l_any_ret = i_bytes_val.decode("utf-8")
+
+		if l_int_len < 0:
+			# Variable length (value by value, strings without their zero padding)
+			l_func_dec = dict_CANP_CONV__CODEC[i_enum_typ][CANP_CONV__CODEC_DEC]
+			l_narr_ret = np.empty(len(i_narr_bytes), dtype = l_dtype_val)
+			l_narr_ret[:] = [
+				l_any_val.rstrip("\x00") if isinstance(l_any_val, str) else l_any_val
+				for l_any_val in (
+					l_func_dec(bytearray(l_narr_row.tobytes()))
+					for l_narr_row in i_narr_bytes[:, i_int_off:])]
+		elif i_int_off + l_int_len <= i_narr_bytes.shape[1]:
+			l_narr_cols = i_narr_bytes[:, i_int_off:i_int_off + l_int_len]
+
+			if i_enum_typ == enum_TYPE.Boolean:
+				l_narr_ret = (l_narr_cols[:, 0] != 0)
 			elif i_enum_typ in list_TYPE_TIME:
-				# TODO : Time
-				#m_logs.error("conv.any_bytes.data.type.time.unknown")
-				l_any_ret = b'\x00'
+				l_narr_wide = np.ascontiguousarray(l_narr_cols).view(CANP_CONV__DTYPE_TIME).reshape(-1)
+				l_narr_ret = \
+					(l_narr_wide["ms"] & CANP_CONV__TIME_MS).astype(np.int64) \
+					+ l_narr_wide["days"].astype(np.int64) * CANP_CONV__TIME_DAY
+				if i_enum_typ == enum_TYPE.TimeOfDay:
+					l_narr_ret = CANP_CONV__TIME_EPOCH64 + l_narr_ret.astype("timedelta64[ms]")
+				else:
+					l_narr_ret = l_narr_ret.astype(l_dtype_val)
+			elif l_int_len == l_dtype_val.itemsize:
+				# Native width
+				l_narr_ret = np.ascontiguousarray(l_narr_cols).view(l_dtype_val).reshape(-1)
 			else:
-				# Go figure...
-				#m_logs.error("conv.any_bytes.data.type.unknown")
-				l_any_ret = b'\x00'
+				# 24/40/48/56 bits (widened, high bytes set by the shift back)
+				l_int_wide = l_dtype_val.itemsize
+				l_narr_wide = np.zeros((len(l_narr_cols), l_int_wide), dtype = np.uint8)
+				l_narr_wide[:, l_int_wide - l_int_len:] = l_narr_cols
+				l_narr_ret = l_narr_wide.view(l_dtype_val).reshape(-1) >> ((l_int_wide - l_int_len) * 8)
 		else:
-			#m_logs.error("conv.any_bytes.size.mismatch")
+			#m_logs.error("conv.narr_bytes.size.mismatch")
 			pass
 
-		return l_any_ret
+		return l_narr_ret
+
+	@staticmethod
+	def bytes_narr(
+				i_enum_typ: int,
+				i_narr_vals: Any = None
+			) -> Any:
+		""" DataType bytes matrix (N, size) from values array
+			Variable length types are zero padded up to the longest value
+		"""
+		l_narr_ret: Any = None
+		l_narr_vals: Any = None
+		l_narr_wide: Any = None
+		l_dtype_val: Any = None
+		l_int_len: int = 0
+
+		l_dtype_val = dict_CANP_CONV__DTYPE[i_enum_typ]
+		l_int_len = dict_SIZE_TYPE[i_enum_typ]
+
+		if l_int_len < 0:
+			l_func_enc = dict_CANP_CONV__CODEC[i_enum_typ][CANP_CONV__CODEC_ENC]
+			l_narr_ret = canp_conv.narr_rows([l_func_enc(l_any_val) for l_any_val in i_narr_vals])
+		elif i_enum_typ in list_TYPE_TIME:
+			if i_enum_typ == enum_TYPE.TimeOfDay:
+				l_narr_vals = (np.asarray(i_narr_vals, dtype = l_dtype_val) - CANP_CONV__TIME_EPOCH64).astype(np.int64)
+			else:
+				l_narr_vals = np.asarray(i_narr_vals, dtype = l_dtype_val).astype(np.int64)
+			l_narr_wide = np.empty(len(l_narr_vals), dtype = CANP_CONV__DTYPE_TIME)
+			l_narr_wide["ms"] = l_narr_vals % CANP_CONV__TIME_DAY
+			l_narr_wide["days"] = l_narr_vals // CANP_CONV__TIME_DAY
+			l_narr_ret = l_narr_wide.view(np.uint8).reshape(-1, l_int_len)
+		else:
+			# Integers kept by their low bytes (unsigned patterns wrapped for signed types)
+			l_narr_vals = np.asarray(i_narr_vals).astype(l_dtype_val)
+			l_narr_ret = np.ascontiguousarray(l_narr_vals.view(np.uint8).reshape(-1, l_dtype_val.itemsize)[:, :l_int_len])
+
+		return l_narr_ret
 
 	@staticmethod
 	def int_bytes(
@@ -295,13 +527,45 @@ class canp_conv:
 			CANP_ENUM__BYTE_BIG,
 			CANP_ENUM__BYTE_LITTLE)
 
+# Codecs (built once, single indexed call per value)
+dict_CANP_CONV__CODEC.update({
+		l_enum_typ: canp_conv.codec_new(l_enum_typ)
+		for l_enum_typ in dict_SIZE_TYPE})
+
 #  --- MAIN ---
 
 def __main__(i_list_args: List = []):
 	""" Basic self test (debugging)
 	"""
-	if False:
-		pass
+	if True:
+		print("--- CODEC ---")
+		l_int_loop = 100000
+		for l_enum_typ, l_any_val in [
+				(enum_TYPE.Boolean, True),
+				(enum_TYPE.Integer16, -2),
+				(enum_TYPE.Integer24, -3),
+				(enum_TYPE.Unsigned32, 0x80000000),
+				(enum_TYPE.Integer56, -(1 << 50)),
+				(enum_TYPE.Real32, 1.5),
+				(enum_TYPE.Real64, -0.25),
+				(enum_TYPE.VisibleString, "canette"),
+				(enum_TYPE.TimeOfDay, datetime(2024, 2, 29, 12, 34, 56, 789000)),
+				(enum_TYPE.TimeDifference, timedelta(days = 3, milliseconds = 1234))]:
+			l_bytes_val = canp_conv.bytes_any(l_enum_typ, l_any_val)
+			l_float_time = time.perf_counter()
+			for l_int_pos in range(l_int_loop):
+				l_any_ret = canp_conv.any_bytes(l_enum_typ, l_bytes_val)
+			l_float_time = time.perf_counter() - l_float_time
+			print(f"{l_enum_typ.name:<16} {l_bytes_val.hex():<16} {l_any_ret!r:<48} {l_any_ret == l_any_val} {l_float_time * 1e9 / l_int_loop:.0f} ns")
+
+		print("--- ARRAY ---")
+		l_narr_bytes = np.random.randint(0, 256, (1000000, 8), dtype = np.uint8)
+		for l_enum_typ in [enum_TYPE.Integer16, enum_TYPE.Integer24, enum_TYPE.Unsigned48, enum_TYPE.Real32, enum_TYPE.Real64]:
+			l_float_time = time.perf_counter()
+			l_narr_vals = canp_conv.narr_bytes(l_enum_typ, l_narr_bytes)
+			l_float_time = time.perf_counter() - l_float_time
+			l_bool_same = np.array_equal(canp_conv.bytes_narr(l_enum_typ, l_narr_vals), l_narr_bytes[:, :dict_SIZE_TYPE[l_enum_typ]])
+			print(f"{l_enum_typ.name:<16} {l_narr_vals.dtype} {l_narr_vals[:3]} {l_bool_same} {l_float_time * 1e9 / len(l_narr_vals):.1f} ns")
 	else:
 		pass
 
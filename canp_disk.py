@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_disk.py
+	Disk
+	Append-only column files, memory-mapped (histories spilled past the RAM budget)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from itertools import accumulate
+
+from typing import Any
+#from typing import Callable
+#from typing import Dict
+from typing import List
+from typing import Optional
+#from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Column files prefix
+CANP_DISK__FILE_HEAD = "canp_"
+
+# Offsets typecode (untyped column)
+CANP_DISK__CODE_OFFS = "<u8"
+
+#  --- CLASS ---
+
+class canp_disk:
+	""" Disk columns
+		RAM budget of the histories, then typed columns as numpy memmaps (grown in place)
+	"""
+
+	# RAM budget (bytes, 0 : never spilled)
+	m_int_budget: int = 0
+	# Bytes in RAM (every history buffer)
+	m_int_ram: int = 0
+	# Column files folder (temporary folder if None)
+	m_str_path: Optional[str] = None
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("disk")
+
+	@staticmethod
+	def budget_set(
+				i_int_bytes: int = 0,
+				i_str_path: Optional[str] = None
+			) -> None:
+		""" RAM budget of the histories (0 : never spilled) and column files folder
+			Histories growing past the budget switch to column files (see 'canp_hist.disk_spill')
+		"""
+		canp_disk.m_int_budget = int(i_int_bytes or 0)
+		canp_disk.m_str_path = i_str_path
+
+		if i_str_path is not None:
+			os.makedirs(i_str_path, exist_ok = True)
+
+	@staticmethod
+	def ram_take(
+				i_int_more: int = 0
+			) -> bool:
+		""" RAM of 'i_int_more' bytes added if in the budget (False if to spill)
+		"""
+		l_bool_ret: bool = True
+
+		if canp_disk.m_int_budget > 0 and canp_disk.m_int_ram + i_int_more > canp_disk.m_int_budget:
+			l_bool_ret = False
+		else:
+			canp_disk.m_int_ram += i_int_more
+
+		return l_bool_ret
+
+	@staticmethod
+	def file_new(
+				i_str_ext: str = "col"
+			) -> str:
+		""" Column file creation (empty, name unique)
+		"""
+		l_int_file: int = 0
+		l_str_ret: str = ""
+
+		l_int_file, l_str_ret = tempfile.mkstemp(
+			suffix = f".{i_str_ext}",
+			prefix = CANP_DISK__FILE_HEAD,
+			dir = canp_disk.m_str_path)
+		os.close(l_int_file)
+
+		canp_disk.m_logs.debug(f"disk.file_new.file[{l_str_ret}]")
+
+		return l_str_ret
+
+	@staticmethod
+	def file_del(
+				i_str_file: Optional[str] = None
+			) -> None:
+		""" Column file removal (left as is if still mapped somewhere)
+		"""
+		if i_str_file is not None:
+			try:
+				os.remove(i_str_file)
+				# - except OSError -
+			except OSError:
+				canp_disk.m_logs.debug(f"disk.file_del.file[{i_str_file}].busy")
+
+	@staticmethod
+	def narr_new(
+				i_any_dtype: Any = np.float64,
+				i_int_cap: int = 0
+			) -> Any:
+		""" Typed column of 'i_int_cap' values (memmap on a new file)
+		"""
+		return np.memmap(
+			canp_disk.file_new(np.dtype(i_any_dtype).char),
+			dtype = i_any_dtype,
+			mode = "w+",
+			shape = (max(1, i_int_cap),))
+
+	@staticmethod
+	def narr_grow(
+				i_narr_col: Any = None,
+				i_int_cap: int = 0
+			) -> Any:
+		""" Typed column grown to 'i_int_cap' values (file extended, values in place)
+			New memmap (views given before keep the previous mapping)
+		"""
+		i_narr_col.flush()
+
+		return np.memmap(
+			i_narr_col.filename,
+			dtype = i_narr_col.dtype,
+			mode = "r+",
+			shape = (i_int_cap,))
+
+class canp_disk_blob:
+	""" Untyped column
+		Pickled values appended to a file, their offsets in a typed column
+		Read as the former list of slots (length is the capacity, unwritten slots are None)
+	"""
+
+	# Values file (appended)
+	m_str_file: Optional[str] = None
+	m_file_data: Any = None
+	# Offsets (typed column, one more than the capacity)
+	m_narr_offs: Any = None
+	# Values written (and their bytes)
+	m_int_cnt: int = 0
+	m_int_off: int = 0
+
+	def __init__(self,
+				i_int_cap: int = 0
+			) -> None:
+		""" Constructor
+			'i_int_cap' : capacity (values)
+		"""
+		self.m_str_file = canp_disk.file_new("pkl")
+		self.m_file_data = open(self.m_str_file, "a+b")
+		self.m_narr_offs = canp_disk.narr_new(CANP_DISK__CODE_OFFS, i_int_cap + 1)
+		self.m_int_cnt = 0
+		self.m_int_off = 0
+
+	def __len__(self) -> int:
+		""" Size of (capacity)
+		"""
+		return len(self.m_narr_offs) - 1
+
+	def __getitem__(self,
+				i_any_pos: Any = 0
+			) -> Any:
+		""" Get at (value, list of them for a slice)
+		"""
+		l_any_ret: Any = None
+		l_range_pos: Any = None
+		l_int_beg: int = 0
+		l_int_end: int = 0
+		l_list_offs: List[int] = []
+		l_bytes_data: bytes = b""
+
+		if isinstance(i_any_pos, slice):
+			l_range_pos = range(*i_any_pos.indices(len(self)))
+			l_any_ret = [None] * len(l_range_pos)
+
+			# Written values in one read
+			l_int_end = min(max(l_range_pos, default = -1) + 1, self.m_int_cnt)
+			l_int_beg = min(l_range_pos, default = 0)
+			if l_int_end > l_int_beg:
+				l_list_offs = self.m_narr_offs[l_int_beg:l_int_end + 1].tolist()
+				l_bytes_data = self.data_read(l_list_offs[0], l_list_offs[-1])
+
+				for l_int_out, l_int_pos in enumerate(l_range_pos):
+					if l_int_pos < l_int_end:
+						l_any_ret[l_int_out] = pickle.loads(l_bytes_data[
+							l_list_offs[l_int_pos - l_int_beg] - l_list_offs[0]:
+							l_list_offs[l_int_pos - l_int_beg + 1] - l_list_offs[0]])
+		else:
+			if i_any_pos < 0:
+				i_any_pos += len(self)
+
+			if i_any_pos < 0 or i_any_pos >= len(self):
+				raise IndexError("canp_disk_blob index out of range")
+
+			if i_any_pos < self.m_int_cnt:
+				l_int_beg, l_int_end = self.m_narr_offs[i_any_pos:i_any_pos + 2].tolist()
+				l_any_ret = pickle.loads(self.data_read(l_int_beg, l_int_end))
+
+		return l_any_ret
+
+	def __setitem__(self,
+				i_any_pos: Any = 0,
+				i_any_val: Any = None
+			) -> None:
+		""" Set at (appended only, after the last written value)
+		"""
+		l_list_vals: List[Any] = []
+
+		if isinstance(i_any_pos, slice):
+			if (i_any_pos.start or 0) != self.m_int_cnt:
+				raise IndexError("canp_disk_blob append only")
+			l_list_vals = list(i_any_val)
+		else:
+			if i_any_pos != self.m_int_cnt:
+				raise IndexError("canp_disk_blob append only")
+			l_list_vals = [i_any_val]
+
+		self.data_write(l_list_vals)
+
+	def __del__(self) -> None:
+		""" Destructor (files removed)
+		"""
+		self.blob_del()
+
+	def data_read(self,
+				i_int_beg: int = 0,
+				i_int_end: int = 0
+			) -> bytes:
+		""" Values file read (bytes between the offsets)
+		"""
+		self.m_file_data.seek(i_int_beg)
+
+		return self.m_file_data.read(i_int_end - i_int_beg)
+
+	def data_write(self,
+				i_list_vals: List[Any] = []
+			) -> None:
+		""" Values appended (capacity grown if needed)
+		"""
+		l_list_data: List[bytes] = []
+		l_list_offs: List[int] = []
+		l_int_cnt: int = 0
+
+		l_list_data = [pickle.dumps(l_any_val, pickle.HIGHEST_PROTOCOL) for l_any_val in i_list_vals]
+		l_int_cnt = self.m_int_cnt + len(l_list_data)
+
+		if l_int_cnt > len(self):
+			self.cap_set(l_int_cnt)
+
+		if len(l_list_data) == 1:
+			self.m_int_off += len(l_list_data[0])
+			self.m_narr_offs[l_int_cnt] = self.m_int_off
+		elif len(l_list_data) > 1:
+			l_list_offs = list(accumulate(
+				(len(l_bytes_data) for l_bytes_data in l_list_data),
+				initial = self.m_int_off))
+			self.m_narr_offs[self.m_int_cnt + 1:l_int_cnt + 1] = l_list_offs[1:]
+			self.m_int_off = l_list_offs[-1]
+
+		# Buffered (flushed by the next seek)
+		self.m_file_data.write(b"".join(l_list_data))
+		self.m_int_cnt = l_int_cnt
+
+	def cap_set(self,
+				i_int_cap: int = 0
+			) -> None:
+		""" Capacity grown to 'i_int_cap' values
+		"""
+		if i_int_cap > len(self):
+			self.m_narr_offs = canp_disk.narr_grow(self.m_narr_offs, i_int_cap + 1)
+
+	def blob_del(self) -> None:
+		""" Files closed and removed
+		"""
+		if self.m_file_data is not None:
+			self.m_file_data.close()
+			self.m_file_data = None
+			canp_disk.file_del(self.m_str_file)
+
+		if self.m_narr_offs is not None:
+			l_str_file = self.m_narr_offs.filename
+			self.m_narr_offs = None
+			canp_disk.file_del(l_str_file)
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	if True:
+		print("--- COLUMN ---")
+		l_narr_col = canp_disk.narr_new(np.int32, 16)
+		l_narr_col[:16] = np.arange(16)
+		l_narr_col = canp_disk.narr_grow(l_narr_col, 1 << 20)
+		l_narr_col[16:] = -1
+		print(f"{len(l_narr_col)} values ({l_narr_col.filename}) : {l_narr_col[14:18]}")
+		canp_disk.file_del(l_narr_col.filename)
+
+		print("--- BLOB ---")
+		l_obj_blob = canp_disk_blob(4)
+		l_float_beg = time.perf_counter()
+		l_obj_blob[0:] = [(l_int_pos, bytes([l_int_pos & 0xFF] * 8)) for l_int_pos in range(100000)]
+		l_float_end = time.perf_counter()
+		print(f"{l_obj_blob.m_int_cnt} values in {l_float_end - l_float_beg:.3f} s : {l_obj_blob[-1]}, {l_obj_blob[3:5]}")
+		l_obj_blob.blob_del()
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
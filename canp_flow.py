@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_flow.py
+	Flow
+	Streaming frame sources and stages (generators, bounded memory)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+#from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+import can
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+
+
+from canp_capt import canp_capt
+
+
+from canp_form import canp_form
+
+from canp_form import CANP_FORM__CAPT
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__BLOCK_SIZE
+from canp_load import CANP_LOAD__COB_STD
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Frame record : (time, chan, cobid, data)
+# (142.844095, 2, 897, bytearray(b'\x6c\x4e\x00\x00\xfe\xff\xff\xff'))
+CANP_FLOW__IDX_TIME = 0
+CANP_FLOW__IDX_CHAN = 1
+CANP_FLOW__IDX_COBID = 2
+CANP_FLOW__IDX_DATA = 3
+
+# Standard (11 bits) identifier
+CANP_FLOW__COB_STD = CANP_LOAD__COB_STD
+
+# Bus polling (seconds)
+CANP_FLOW__BUS_TIMEOUT = 1.0
+
+# Frames decoded at once (bus latency vs call overhead)
+CANP_FLOW__DECODE_BATCH = 256
+
+# Seconds a frame waits for its batch at most (bus sources, see 'flow_decode')
+CANP_FLOW__DECODE_WAIT = 0.1
+
+# Idle marker (bus polled without frame, see 'can_frames')
+CANP_FLOW__IDLE = None
+
+#  --- CLASS ---
+
+class canp_flow:
+	""" CAN frame flow
+		Sources yield frame records, stages pull from a source and yield again
+		Bus sources may also yield idle markers (CANP_FLOW__IDLE), passed along by the stages
+	"""
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("flow")
+
+	# - Sources - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def log_blocks(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE,
+				i_str_form: str = CANP_ENUM__STR_EMPTY
+			) -> Iterator[Any]:
+		""" Records by block (any 'canp_form' format, one block in memory at a time)
+		"""
+		return canp_form.form_blocks(i_str_file, i_str_form, i_int_block)
+
+	@staticmethod
+	def log_frames(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE,
+				i_str_form: str = CANP_ENUM__STR_EMPTY
+			) -> Iterator[Tuple[float, int, int, bytearray]]:
+		""" Data frames from a log file (any 'canp_form' format)
+		"""
+		for l_narr_frame in canp_flow.log_blocks(i_str_file, i_int_block, i_str_form):
+			for l_list_frame in canp_load.list_narr(canp_load.narr_keep(l_narr_frame)):
+				yield tuple(l_list_frame)
+
+	@staticmethod
+	def can_frames(
+				i_str_card: str = CANP_ENUM__STR_EMPTY,
+				i_str_chan: str = CANP_ENUM__STR_EMPTY,
+				i_int_baud: int = 0,
+				i_int_count: int = 0,
+				i_float_timeout: float = CANP_FLOW__BUS_TIMEOUT,
+				i_bool_idle: bool = False
+			) -> Iterator[Tuple[float, int, int, bytearray]]:
+		""" Frames from a 'python-can' adapter
+			Stops after 'i_int_count' frames (0 = never)
+			With 'i_bool_idle', CANP_FLOW__IDLE is yielded when a poll times out (pending batches decoded, see 'flow_decode')
+		"""
+		l_int_count: int = 0
+		l_dict_chan: Dict[Any, int] = {}
+
+		try:
+			with can.interface.Bus(
+						bustype = i_str_card,
+						channel = i_str_chan,
+						bitrate = i_int_baud
+					) as l_obj_bus:
+				try:
+					while i_int_count == 0 or l_int_count < i_int_count:
+						# Read one frame at a time (beware of buffer occupation)
+						l_obj_msg = l_obj_bus.recv(i_float_timeout)
+						if l_obj_msg is not None:
+							yield (
+								l_obj_msg.timestamp,
+								canp_flow.chan_index(l_obj_msg.channel, l_dict_chan),
+								l_obj_msg.arbitration_id,
+								l_obj_msg.data)
+
+							# Limiter
+							l_int_count += 1
+						elif i_bool_idle == True:
+							yield CANP_FLOW__IDLE
+					else:
+						canp_flow.m_logs.info(f"flow.can_frames.limit_reached ({i_int_count})")
+				except GeneratorExit:
+					# Consumer stopped early
+					raise
+				except:
+					canp_flow.m_logs.error("flow.can_frames.error.unknown")
+		except GeneratorExit:
+			raise
+		except:
+			canp_flow.m_logs.error("flow.can_frames.error.connection")
+
+	@staticmethod
+	def chan_index(
+				i_any_chan: Any = None,
+				i_dict_chan: Dict[Any, int] = {}
+			) -> int:
+		""" Channel number of a 'python-can' message
+			None = 0, int kept, numeric str converted ('1' = 1)
+			Other names ('can0', 'vcan1', ...) numbered in order of appearance ('i_dict_chan' filled)
+		"""
+		l_int_ret: int = 0
+
+		if i_any_chan is None:
+			pass
+		elif isinstance(i_any_chan, int):
+			l_int_ret = i_any_chan
+		elif isinstance(i_any_chan, str) and i_any_chan.isdigit():
+			l_int_ret = int(i_any_chan)
+		else:
+			l_int_ret = i_dict_chan.setdefault(i_any_chan, len(i_dict_chan))
+
+		return l_int_ret
+
+	# - Stages - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def flow_filter(
+				i_iter_frame: Iterable[Tuple],
+				i_func_keep: Callable[[Tuple], bool]
+			) -> Iterator[Tuple]:
+		""" Frames kept by a predicate
+		"""
+		for l_tuple_frame in i_iter_frame:
+			if l_tuple_frame is CANP_FLOW__IDLE or i_func_keep(l_tuple_frame):
+				yield l_tuple_frame
+
+	@staticmethod
+	def flow_select(
+				i_iter_frame: Iterable[Tuple],
+				i_list_chan: List[int] = [],
+				i_list_cobid: List[int] = []
+			) -> Iterator[Tuple]:
+		""" Frames of some channels and/or cobids (empty list = all)
+		"""
+		l_set_chan = set(i_list_chan)
+		l_set_cobid = set(i_list_cobid)
+
+		for l_tuple_frame in i_iter_frame:
+			if l_tuple_frame is CANP_FLOW__IDLE:
+				yield l_tuple_frame
+			elif (not l_set_chan or l_tuple_frame[CANP_FLOW__IDX_CHAN] in l_set_chan) \
+			and (not l_set_cobid or l_tuple_frame[CANP_FLOW__IDX_COBID] in l_set_cobid):
+				yield l_tuple_frame
+
+	@staticmethod
+	def flow_window(
+				i_iter_frame: Iterable[Tuple],
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf")
+			) -> Iterator[Tuple]:
+		""" Frames within a time window [start, stop[
+			Stops pulling once past the window (frames expected in time order)
+		"""
+		for l_tuple_frame in i_iter_frame:
+			if l_tuple_frame is CANP_FLOW__IDLE:
+				yield l_tuple_frame
+				continue
+			if l_tuple_frame[CANP_FLOW__IDX_TIME] >= i_float_stop:
+				break
+			if l_tuple_frame[CANP_FLOW__IDX_TIME] >= i_float_start:
+				yield l_tuple_frame
+
+	@staticmethod
+	def flow_batch(
+				i_iter_frame: Iterable[Tuple],
+				i_float_span: float = 1.0
+			) -> Iterator[List[Tuple]]:
+		""" Frames grouped by consecutive time spans (tumbling window)
+		"""
+		l_list_batch: List[Tuple] = []
+		l_float_end: float = float("-inf")
+
+		for l_tuple_frame in i_iter_frame:
+			if l_tuple_frame is CANP_FLOW__IDLE:
+				# Spans follow the frame times only
+				continue
+
+			if l_tuple_frame[CANP_FLOW__IDX_TIME] >= l_float_end:
+				if len(l_list_batch) > 0:
+					yield l_list_batch
+				l_list_batch = []
+				l_float_end = l_tuple_frame[CANP_FLOW__IDX_TIME] + i_float_span
+
+			l_list_batch.append(l_tuple_frame)
+
+		if len(l_list_batch) > 0:
+			yield l_list_batch
+
+	@staticmethod
+	def flow_decode(
+				i_iter_frame: Iterable[Tuple],
+				i_obj_card: Any,
+				i_int_batch: int = CANP_FLOW__DECODE_BATCH,
+				i_float_wait: float = 0.0,
+				i_bool_keep: bool = False
+			) -> Iterator[Tuple]:
+		""" Frames decoded through a card (chan, node, ...) then passed along
+			Decoded by batches of 'i_int_batch' frames (see 'canp_card.frame_parse_many')
+			Bus sources : a batch is also decoded once its first frame waited 'i_float_wait' seconds (0.0 = never),
+			or when the source is idle (CANP_FLOW__IDLE, not passed along)
+			With 'i_bool_keep', a batch failing to decode is logged and the flow goes on
+			Chan and Node should already be configured first
+		"""
+		l_list_batch: List[Tuple] = []
+		l_float_first: float = 0.0
+		l_bool_flush: bool = False
+
+		for l_tuple_frame in i_iter_frame:
+			if l_tuple_frame is CANP_FLOW__IDLE:
+				l_bool_flush = len(l_list_batch) > 0
+			else:
+				if len(l_list_batch) == 0 and i_float_wait > 0.0:
+					l_float_first = time.monotonic()
+
+				l_list_batch.append(l_tuple_frame)
+
+				l_bool_flush = len(l_list_batch) >= i_int_batch \
+					or (i_float_wait > 0.0 and time.monotonic() - l_float_first >= i_float_wait)
+
+			if l_bool_flush == True:
+				canp_flow.batch_decode(l_list_batch, i_obj_card, i_bool_keep)
+				yield from l_list_batch
+				l_list_batch = []
+
+		if len(l_list_batch) > 0:
+			canp_flow.batch_decode(l_list_batch, i_obj_card, i_bool_keep)
+			yield from l_list_batch
+
+	@staticmethod
+	def batch_decode(
+				i_list_frame: List[Tuple],
+				i_obj_card: Any,
+				i_bool_keep: bool = False
+			) -> None:
+		""" Frames decoded through a card at once
+			With 'i_bool_keep', errors are logged instead of raised
+		"""
+		try:
+			i_obj_card.frame_parse_many(
+				[l_tuple_frame[CANP_FLOW__IDX_TIME] for l_tuple_frame in i_list_frame],
+				[l_tuple_frame[CANP_FLOW__IDX_CHAN] for l_tuple_frame in i_list_frame],
+				[l_tuple_frame[CANP_FLOW__IDX_COBID] for l_tuple_frame in i_list_frame],
+				[l_tuple_frame[CANP_FLOW__IDX_DATA] for l_tuple_frame in i_list_frame])
+			# - except Exception -
+		except Exception as l_obj_err:
+			if i_bool_keep == True:
+				canp_flow.m_logs.error(f"flow.batch_decode.error.unknown ({len(i_list_frame)} frames, {l_obj_err!r})")
+			else:
+				raise
+
+	# - Sinks - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def flow_sink(
+				i_iter_frame: Iterable[Any],
+				i_func_sink: Callable[[Any], None] = None
+			) -> int:
+		""" Flow consumer (optional callback on each item)
+			Returns the number of items pulled
+		"""
+		l_int_ret: int = 0
+
+		for l_any_item in i_iter_frame:
+			if i_func_sink is not None:
+				i_func_sink(l_any_item)
+			l_int_ret += 1
+
+		return l_int_ret
+
+	@staticmethod
+	def str_frame(
+				i_tuple_frame: Tuple
+			) -> str:
+		""" Candump line from a frame
+			'(142.844095) 2 381#6C4E0000FEFFFFFF'
+		"""
+		l_int_cobid = i_tuple_frame[CANP_FLOW__IDX_COBID]
+
+		if l_int_cobid <= CANP_FLOW__COB_STD:
+			l_str_cobid = f"{l_int_cobid:03X}"
+		else:
+			l_str_cobid = f"{l_int_cobid:08X}"
+
+		return f"({i_tuple_frame[CANP_FLOW__IDX_TIME]:.6f}) {i_tuple_frame[CANP_FLOW__IDX_CHAN]} {l_str_cobid}#{bytes(i_tuple_frame[CANP_FLOW__IDX_DATA]).hex().upper()}\n"
+
+	@staticmethod
+	def flow_record(
+				i_iter_frame: Iterable[Tuple],
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> Iterator[Tuple]:
+		""" Frames written into a log file while passed along (idle markers passed along only)
+			Binary capture for '.canp', candump format otherwise
+			Compressed on the fly if the extension asks for it ('.gz', '.xz', '.bz2')
+		"""
+		if canp_form.file_form(i_str_file) == CANP_FORM__CAPT:
+			l_obj_capt = canp_capt(i_str_file)
+			try:
+				for l_tuple_frame in i_iter_frame:
+					if l_tuple_frame is not CANP_FLOW__IDLE:
+						l_obj_capt.frame_add(*l_tuple_frame)
+					yield l_tuple_frame
+			finally:
+				l_obj_capt.close()
+		else:
+			with canp_form.file_open(i_str_file, "wb") as l_obj_file:
+				for l_tuple_frame in i_iter_frame:
+					if l_tuple_frame is not CANP_FLOW__IDLE:
+						l_obj_file.write(canp_flow.str_frame(l_tuple_frame).encode("ascii"))
+					yield l_tuple_frame
+
+	@staticmethod
+	def flow_dump(
+				i_iter_frame: Iterable[Tuple],
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> int:
+		""" Flow consumer writing a log file (candump format, compressed or not)
+			Returns the number of frames written
+		"""
+		l_int_ret: int = 0
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			l_int_ret = canp_flow.flow_sink(
+				canp_flow.flow_record(i_iter_frame, i_str_file))
+		else:
+			canp_flow.m_logs.error(f"flow.flow_dump.file[{i_str_file}].unknown")
+
+		return l_int_ret
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+
+	if True:
+		print("--- LOG FLOW ---")
+		# Node 1 tpdo3 frames over 1 second (stops reading past the window)
+		l_int_count = canp_flow.flow_sink(
+			canp_flow.flow_select(
+				canp_flow.flow_window(
+					canp_flow.log_frames(LOG_FILE),
+					150.0,
+					151.0),
+				i_list_cobid = [0x381]))
+		print(f"0x381 [150.0, 151.0[ : {l_int_count} frames")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
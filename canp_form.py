@@ -0,0 +1,1176 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_form.py
+	Format
+	Log format registry (content detection, one block parser per format)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+import binascii
+import bz2
+import gzip
+import io
+#import logging
+import lzma
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+#from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+from canp_enum import CANP_ENUM__BASE_DECI
+from canp_enum import CANP_ENUM__BASE_HEXA
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+from canp_enum import CANP_ENUM__STR_SPACE
+from canp_enum import CANP_ENUM__STR_ZERO
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__BLOCK_SIZE
+from canp_load import CANP_LOAD__COB_ERR
+from canp_load import CANP_LOAD__COB_STD
+from canp_load import CANP_LOAD__COL_CHAN
+from canp_load import CANP_LOAD__COL_COBID
+from canp_load import CANP_LOAD__COL_DATA
+from canp_load import CANP_LOAD__COL_DLC
+from canp_load import CANP_LOAD__COL_FLAG
+from canp_load import CANP_LOAD__COL_TIME
+from canp_load import CANP_LOAD__DATA_MAX
+from canp_load import CANP_LOAD__DTYPE_FRAME
+from canp_load import CANP_LOAD__FLAG_ERR
+from canp_load import CANP_LOAD__FLAG_EXT
+from canp_load import CANP_LOAD__FLAG_NONE
+from canp_load import CANP_LOAD__FLAG_RTR
+from canp_load import CANP_LOAD__FLAG_TX
+from canp_load import CANP_LOAD__LEN_STD
+
+
+from canp_capt import canp_capt
+
+from canp_capt import CANP_CAPT__EXT
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+from canp_path import canp_path
+from canp_path import CANP_PATH__IDX_EXT
+from canp_path import CANP_PATH__IDX_FILE
+
+#  --- GLOBAL ---
+
+# Format names (also the usual file extension)
+CANP_FORM__LOG = "log"					# candump -l, python-can 'CanutilsLogWriter'
+CANP_FORM__ASC = "asc"					# Vector ASCII
+CANP_FORM__TRC = "trc"					# PEAK PCAN-View trace
+CANP_FORM__CSV = "csv"					# python-can 'CSVWriter', spreadsheets
+CANP_FORM__CAPT = CANP_CAPT__EXT		# 'canp_capt' binary capture
+
+# Compression (name, magic number, usual extension)
+CANP_FORM__COMP_NONE = ""
+CANP_FORM__COMP_GZ = "gz"
+CANP_FORM__COMP_XZ = "xz"
+CANP_FORM__COMP_BZ2 = "bz2"
+
+dict_CANP_FORM__COMP_MAGIC = {
+	CANP_FORM__COMP_GZ: b"\x1f\x8b",
+	CANP_FORM__COMP_XZ: b"\xfd7zXZ\x00",
+	CANP_FORM__COMP_BZ2: b"BZh",
+}
+
+# Compression level when writing (speed over ratio, recording must keep up)
+dict_CANP_FORM__COMP_LEVEL = {
+	CANP_FORM__COMP_GZ: 6,
+	CANP_FORM__COMP_XZ: 1,
+	CANP_FORM__COMP_BZ2: 9,
+}
+
+# Buffer size (read and write)
+CANP_FORM__BUFF_SIZE = 1 << 20
+
+# Registry entry fields
+CANP_FORM__KEY_TEST = "test"			# (head bytes) -> bool
+CANP_FORM__KEY_PARSE = "parse"			# (block bytes, state dict) -> frame records
+CANP_FORM__KEY_DUMP = "dump"			# (frame records or None at the end, state dict) -> block bytes
+CANP_FORM__KEY_BLOCKS = "blocks"		# (file name, block size) -> frame records by block
+CANP_FORM__KEY_LOAD = "load"			# (file name) -> frame records
+
+# Bytes read for the detection
+CANP_FORM__HEAD_SIZE = 1 << 16
+
+# Follow state (one per followed file, see 'form_tail')
+CANP_FORM__TAIL_FORM = "form"			# Format (detected once the file has content)
+CANP_FORM__TAIL_INODE = "inode"			# File identity (rotation check)
+CANP_FORM__TAIL_OFFS = "offs"			# Bytes read (text) or records read (binary)
+CANP_FORM__TAIL_REST = "rest"			# Incomplete last line (text)
+CANP_FORM__TAIL_STATE = "state"			# Parser state (header settings)
+
+# Channel when the format has none
+CANP_FORM__CHAN_DEFAULT = 1
+
+# Vector ASC
+CANP_FORM__ASC_BASE = b"base"
+CANP_FORM__ASC_DEC = b"dec"
+CANP_FORM__ASC_RELATIVE = b"relative"
+CANP_FORM__ASC_LAST = b"last"
+CANP_FORM__ASC_ERROR = b"errorframe"
+CANP_FORM__ASC_EXT = b"x"
+CANP_FORM__ASC_DATA = b"d"
+CANP_FORM__ASC_REMOTE = b"r"
+CANP_FORM__ASC_TX = b"tx"
+list_CANP_FORM__ASC_DIR = [b"rx", b"tx"]
+list_CANP_FORM__ASC_HEAD = [b"date ", b"base ", b"begin triggerblock"]
+
+# PCAN TRC
+CANP_FORM__TRC_COMMENT = b";"
+CANP_FORM__TRC_VERSION = b";$FILEVERSION="
+CANP_FORM__TRC_START = b";$STARTTIME="
+CANP_FORM__TRC_COLUMNS = b";$COLUMNS="
+CANP_FORM__TRC_EPOCH = 25569			# Days from 1899-12-30 to 1970-01-01
+CANP_FORM__TRC_RTR = b"RTR"
+CANP_FORM__TRC_TX = b"Tx"
+
+# Columns by file version (2.1 declares its own in the header)
+# N : number, O : offset (ms), T : type, B : bus, I : id, d : direction, R : reserved, L : length, D : data
+dict_CANP_FORM__TRC_COLUMNS = {
+	b"1.0": b"N,O,I,L,D",
+	b"1.1": b"N,O,d,I,L,D",
+	b"1.2": b"N,O,B,d,I,L,D",
+	b"1.3": b"N,O,B,d,I,R,L,D",
+	b"2.0": b"N,O,T,I,d,L,D",
+	b"2.1": b"N,O,T,B,I,d,R,L,D",
+}
+
+# Columns needed (offset, type, bus, id, direction, length)
+list_CANP_FORM__TRC_POS = [b"O", b"T", b"B", b"I", b"d", b"L"]
+
+# Message types (2.x), others are events/status only
+dict_CANP_FORM__TRC_TYPE = {
+	b"DT": CANP_LOAD__FLAG_NONE,
+	b"FD": CANP_LOAD__FLAG_NONE,
+	b"FB": CANP_LOAD__FLAG_NONE,
+	b"RR": CANP_LOAD__FLAG_RTR,
+	b"ER": CANP_LOAD__FLAG_ERR,
+}
+
+# CSV column names (lower case, first match wins)
+list_CANP_FORM__CSV_TIME = [b"timestamp", b"time"]
+list_CANP_FORM__CSV_CHAN = [b"channel", b"chan", b"bus"]
+list_CANP_FORM__CSV_COBID = [b"arbitration_id", b"cobid", b"can_id", b"id"]
+list_CANP_FORM__CSV_DATA = [b"data", b"payload"]
+list_CANP_FORM__CSV_EXT = [b"extended", b"ext"]
+list_CANP_FORM__CSV_RTR = [b"remote", b"rtr"]
+list_CANP_FORM__CSV_ERR = [b"error", b"err"]
+list_CANP_FORM__CSV_SEP = [b",", b";", b"\t"]
+
+# Candump line (detection only)
+CANP_FORM__RE_LOG = re.compile(rb"^\s*\(\s*[0-9.]+\)\s+\S+\s+[0-9A-Fa-f]+#", re.MULTILINE)
+
+# Registry : name -> {test, parse, dump, blocks, load} (detection in insertion order)
+dict_CANP_FORM__LIST: Dict[str, Dict[str, Callable]] = {}
+
+#  --- CLASS ---
+
+class canp_form:
+	""" CAN log format registry
+		Every parser turns a block of complete lines into 'canp_load' records
+		A state dictionary (one per file) carries the header settings across blocks
+	"""
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("form")
+
+	@staticmethod
+	def file_comp(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_mode: str = "rb"
+			) -> str:
+		""" Compression of a file
+			From the magic number when reading, from the extension when writing
+		"""
+		l_str_ret: str = CANP_FORM__COMP_NONE
+
+		if "r" in i_str_mode:
+			with open(i_str_file, "rb") as l_obj_file:
+				l_bytes_magic = l_obj_file.read(8)
+
+			for l_str_comp, l_bytes_comp in dict_CANP_FORM__COMP_MAGIC.items():
+				if l_bytes_magic.startswith(l_bytes_comp):
+					l_str_ret = l_str_comp
+					break
+		else:
+			l_str_ext = canp_path.list_str(i_str_path = i_str_file)[CANP_PATH__IDX_EXT].lower()
+			if l_str_ext in dict_CANP_FORM__COMP_MAGIC:
+				l_str_ret = l_str_ext
+
+		return l_str_ret
+
+	@staticmethod
+	def file_open(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_mode: str = "rb"
+			) -> Any:
+		""" Binary file object, compressed or not ('.gz', '.xz', '.bz2')
+			Streamed (de)compression, nothing written to disk but the file itself
+		"""
+		l_str_comp = canp_form.file_comp(i_str_file, i_str_mode)
+
+		if l_str_comp == CANP_FORM__COMP_GZ:
+			l_obj_ret = gzip.open(i_str_file, i_str_mode, compresslevel = dict_CANP_FORM__COMP_LEVEL[l_str_comp])
+		elif l_str_comp == CANP_FORM__COMP_XZ:
+			if "r" in i_str_mode:
+				l_obj_ret = lzma.open(i_str_file, i_str_mode)
+			else:
+				l_obj_ret = lzma.open(i_str_file, i_str_mode, preset = dict_CANP_FORM__COMP_LEVEL[l_str_comp])
+		elif l_str_comp == CANP_FORM__COMP_BZ2:
+			l_obj_ret = bz2.open(i_str_file, i_str_mode, compresslevel = dict_CANP_FORM__COMP_LEVEL[l_str_comp])
+		else:
+			l_obj_ret = open(i_str_file, i_str_mode, buffering = CANP_FORM__BUFF_SIZE)
+
+		if l_str_comp != CANP_FORM__COMP_NONE:
+			# Large buffer on the plain side (fewer calls into the (de)compressor)
+			if "r" in i_str_mode:
+				l_obj_ret = io.BufferedReader(l_obj_ret, CANP_FORM__BUFF_SIZE)
+			else:
+				l_obj_ret = io.BufferedWriter(l_obj_ret, CANP_FORM__BUFF_SIZE)
+
+		return l_obj_ret
+
+	@staticmethod
+	def form_add(
+				i_str_form: str = CANP_ENUM__STR_EMPTY,
+				i_func_test: Callable[[bytes], bool] = None,
+				i_func_parse: Callable[[bytes, Dict], Any] = None,
+				i_func_dump: Callable[[Any, Dict], bytes] = None,
+				i_func_blocks: Callable[[str, int], Iterator[Any]] = None,
+				i_func_load: Callable[[str], Any] = None
+			) -> None:
+		""" Register (or replace) a format
+			Text formats give a block parser, binary ones their own block reader
+			Optional : writer (dump) and whole file loader (load)
+		"""
+		if i_str_form != CANP_ENUM__STR_EMPTY and i_func_test is not None \
+		and (i_func_parse is not None or i_func_blocks is not None):
+			dict_CANP_FORM__LIST[i_str_form] = {
+				CANP_FORM__KEY_TEST: i_func_test,
+				CANP_FORM__KEY_PARSE: i_func_parse,
+				CANP_FORM__KEY_DUMP: i_func_dump,
+				CANP_FORM__KEY_BLOCKS: i_func_blocks,
+				CANP_FORM__KEY_LOAD: i_func_load}
+		else:
+			canp_form.m_logs.error(f"form.form_add.form[{i_str_form}].invalid")
+
+	@staticmethod
+	def form_list(
+			) -> List[str]:
+		""" Registered formats (detection order)
+		"""
+		return list(dict_CANP_FORM__LIST.keys())
+
+	@staticmethod
+	def form_detect(
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> str:
+		""" Format of a file, from its content
+			Falls back on the file extension, then on candump
+		"""
+		l_str_ret: str = CANP_ENUM__STR_EMPTY
+
+		with canp_form.file_open(i_str_file) as l_obj_file:
+			l_bytes_head = l_obj_file.read(CANP_FORM__HEAD_SIZE)
+
+		# Complete lines only
+		l_int_eol = l_bytes_head.rfind(b"\n") + 1
+		if l_int_eol > 0:
+			l_bytes_head = l_bytes_head[:l_int_eol]
+
+		for l_str_form, l_dict_form in dict_CANP_FORM__LIST.items():
+			if l_dict_form[CANP_FORM__KEY_TEST](l_bytes_head) == True:
+				l_str_ret = l_str_form
+				break
+		else:
+			l_str_ret = canp_form.file_form(i_str_file)
+			if l_str_ret == CANP_ENUM__STR_EMPTY:
+				l_str_ret = CANP_FORM__LOG
+			canp_form.m_logs.warning(f"form.form_detect.file[{i_str_file}].unknown (assuming '{l_str_ret}')")
+
+		return l_str_ret
+
+	@staticmethod
+	def form_blocks(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_form: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Iterator[Any]:
+		""" Records by block (one block in memory at a time)
+			Format detected when not given
+		"""
+		l_dict_state: Dict = {}
+		l_bytes_tail: bytes = b""
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			if i_str_form == CANP_ENUM__STR_EMPTY:
+				i_str_form = canp_form.form_detect(i_str_file)
+
+			l_dict_form = dict_CANP_FORM__LIST.get(i_str_form)
+
+			if l_dict_form is None:
+				canp_form.m_logs.error(f"form.form_blocks.form[{i_str_form}].unknown")
+			elif l_dict_form[CANP_FORM__KEY_BLOCKS] is not None:
+				# Own reader (binary)
+				yield from l_dict_form[CANP_FORM__KEY_BLOCKS](i_str_file, i_int_block)
+			else:
+				l_func_parse = l_dict_form[CANP_FORM__KEY_PARSE]
+
+				with canp_form.file_open(i_str_file) as l_obj_file:
+					while True:
+						l_bytes_block = l_obj_file.read(i_int_block)
+						if not l_bytes_block:
+							break
+
+						# Cut at the last line boundary (keep the rest for later)
+						l_bytes_block = l_bytes_tail + l_bytes_block
+						l_int_eol = l_bytes_block.rfind(b"\n") + 1
+						l_bytes_tail = l_bytes_block[l_int_eol:]
+
+						if l_int_eol > 0:
+							yield l_func_parse(l_bytes_block[:l_int_eol], l_dict_state)
+
+					if l_bytes_tail.strip():
+						# Last line without EOL
+						yield l_func_parse(l_bytes_tail, l_dict_state)
+		else:
+			canp_form.m_logs.error(f"form.form_blocks.file[{i_str_file}].unknown")
+
+	@staticmethod
+	def form_tail(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_dict_tail: Dict = None,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Iterator[Any]:
+		""" Records appended since the previous call (by block)
+			The follow state is kept in 'i_dict_tail' (empty at first, one per file)
+			Incomplete last line kept for the next call, truncated or replaced file read again
+		"""
+		try:
+			l_obj_stat = os.stat(i_str_file)
+			# - except OSError -
+		except OSError:
+			canp_form.m_logs.error(f"form.form_tail.file[{i_str_file}].unknown")
+			l_obj_stat = None
+
+		if l_obj_stat is None or i_dict_tail is None:
+			pass
+		elif canp_form.file_comp(i_str_file) != CANP_FORM__COMP_NONE:
+			canp_form.m_logs.error(f"form.form_tail.file[{i_str_file}].compressed (follow not supported)")
+		else:
+			if i_dict_tail.get(CANP_FORM__TAIL_INODE) != l_obj_stat.st_ino \
+			or l_obj_stat.st_size < i_dict_tail.get(CANP_FORM__TAIL_OFFS, 0):
+				if len(i_dict_tail) > 0:
+					canp_form.m_logs.info(f"form.form_tail.file[{i_str_file}].reset (truncated or replaced)")
+
+				# From the start
+				i_dict_tail.clear()
+				i_dict_tail[CANP_FORM__TAIL_INODE] = l_obj_stat.st_ino
+				i_dict_tail[CANP_FORM__TAIL_FORM] = CANP_ENUM__STR_EMPTY
+				i_dict_tail[CANP_FORM__TAIL_OFFS] = 0
+				i_dict_tail[CANP_FORM__TAIL_REST] = b""
+				i_dict_tail[CANP_FORM__TAIL_STATE] = {}
+
+			if i_dict_tail[CANP_FORM__TAIL_FORM] == CANP_ENUM__STR_EMPTY and l_obj_stat.st_size > 0:
+				i_dict_tail[CANP_FORM__TAIL_FORM] = canp_form.form_detect(i_str_file)
+
+			l_dict_form = dict_CANP_FORM__LIST.get(i_dict_tail[CANP_FORM__TAIL_FORM])
+
+			if l_dict_form is None:
+				# Nothing yet
+				pass
+			elif l_dict_form[CANP_FORM__KEY_LOAD] is not None:
+				# Binary, complete records only (memory mapped again)
+				l_narr_frame = l_dict_form[CANP_FORM__KEY_LOAD](i_str_file)
+				l_int_offs = i_dict_tail[CANP_FORM__TAIL_OFFS]
+				i_dict_tail[CANP_FORM__TAIL_OFFS] = len(l_narr_frame)
+
+				if len(l_narr_frame) > l_int_offs:
+					yield l_narr_frame[l_int_offs:]
+			else:
+				l_func_parse = l_dict_form[CANP_FORM__KEY_PARSE]
+
+				with open(i_str_file, "rb") as l_obj_file:
+					l_obj_file.seek(i_dict_tail[CANP_FORM__TAIL_OFFS])
+
+					while True:
+						l_bytes_block = l_obj_file.read(i_int_block)
+						if not l_bytes_block:
+							break
+
+						i_dict_tail[CANP_FORM__TAIL_OFFS] += len(l_bytes_block)
+
+						# Cut at the last line boundary (the rest waits for the next call)
+						l_bytes_block = i_dict_tail[CANP_FORM__TAIL_REST] + l_bytes_block
+						l_int_eol = l_bytes_block.rfind(b"\n") + 1
+						i_dict_tail[CANP_FORM__TAIL_REST] = l_bytes_block[l_int_eol:]
+
+						if l_int_eol > 0:
+							yield l_func_parse(l_bytes_block[:l_int_eol], i_dict_tail[CANP_FORM__TAIL_STATE])
+
+	@staticmethod
+	def log_narr(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_str_form: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Any:
+		""" Log loader (any registered format)
+			Formats with a whole file loader skip the blocks (no copy)
+		"""
+		if i_str_form == CANP_ENUM__STR_EMPTY and isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			i_str_form = canp_form.form_detect(i_str_file)
+
+		l_dict_form = dict_CANP_FORM__LIST.get(i_str_form)
+
+		if l_dict_form is not None and l_dict_form[CANP_FORM__KEY_LOAD] is not None:
+			l_narr_ret = l_dict_form[CANP_FORM__KEY_LOAD](i_str_file)
+		else:
+			l_list_narr = list(canp_form.form_blocks(i_str_file, i_str_form, i_int_block))
+
+			if len(l_list_narr) == 1:
+				l_narr_ret = l_list_narr[0]
+			elif len(l_list_narr) > 1:
+				l_narr_ret = np.concatenate(l_list_narr)
+			else:
+				l_narr_ret = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		return l_narr_ret
+
+	@staticmethod
+	def file_form(
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> str:
+		""" Format from the file extension ('capture.asc.gz' -> 'asc'), empty if unknown
+		"""
+		l_list_path = canp_path.list_str(i_str_path = i_str_file)
+		l_str_ret = l_list_path[CANP_PATH__IDX_EXT].lower()
+
+		if l_str_ret in dict_CANP_FORM__COMP_MAGIC:
+			l_str_ret = canp_path.list_str(i_str_path = l_list_path[CANP_PATH__IDX_FILE])[CANP_PATH__IDX_EXT].lower()
+
+		if l_str_ret not in dict_CANP_FORM__LIST:
+			l_str_ret = CANP_ENUM__STR_EMPTY
+
+		return l_str_ret
+
+	@staticmethod
+	def log_conv(
+				i_str_src: str = CANP_ENUM__STR_EMPTY,
+				i_str_dst: str = CANP_ENUM__STR_EMPTY,
+				i_str_form: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> int:
+		""" Log converter (block by block, any format with a writer)
+			Destination format from its extension when not given, text compressed if asked for
+			Returns the number of frames written
+		"""
+		l_int_ret: int = 0
+		l_dict_state: Dict = {}
+
+		if i_str_form == CANP_ENUM__STR_EMPTY:
+			i_str_form = canp_form.file_form(i_str_dst)
+
+		l_dict_form = dict_CANP_FORM__LIST.get(i_str_form)
+
+		if l_dict_form is None or l_dict_form[CANP_FORM__KEY_DUMP] is None:
+			canp_form.m_logs.error(f"form.log_conv.form[{i_str_form}].unknown")
+		elif isinstance(i_str_src, str) and i_str_src != CANP_ENUM__STR_EMPTY:
+			l_func_dump = l_dict_form[CANP_FORM__KEY_DUMP]
+
+			if l_dict_form[CANP_FORM__KEY_BLOCKS] is not None:
+				# Binary formats stay uncompressed (memory mapped)
+				l_obj_file = open(i_str_dst, "wb")
+			else:
+				l_obj_file = canp_form.file_open(i_str_dst, "wb")
+
+			with l_obj_file:
+				for l_narr_frame in canp_form.form_blocks(i_str_src, i_int_block = i_int_block):
+					l_obj_file.write(l_func_dump(l_narr_frame, l_dict_state))
+					l_int_ret += len(l_narr_frame)
+
+				# Footer
+				l_obj_file.write(l_func_dump(None, l_dict_state))
+		else:
+			canp_form.m_logs.error(f"form.log_conv.file[{i_str_src}].unknown")
+
+		return l_int_ret
+
+	@staticmethod
+	def list_rows(
+				i_narr_frame: Any
+			) -> Iterator[Tuple[float, int, int, int, int, bytes]]:
+		""" Records as python values (time, chan, cobid, dlc, flag, data), for the writers
+		"""
+		l_list_data = i_narr_frame[CANP_LOAD__COL_DATA].tolist()
+
+		return zip(
+			i_narr_frame[CANP_LOAD__COL_TIME].tolist(),
+			i_narr_frame[CANP_LOAD__COL_CHAN].tolist(),
+			i_narr_frame[CANP_LOAD__COL_COBID].tolist(),
+			i_narr_frame[CANP_LOAD__COL_DLC].tolist(),
+			i_narr_frame[CANP_LOAD__COL_FLAG].tolist(),
+			(bytes(l_list_byte) for l_list_byte in l_list_data))
+
+	# - candump - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def log_test(
+				i_bytes_head: bytes
+			) -> bool:
+		""" '(142.844095) 2 381#6C4E0000FEFFFFFF'
+		"""
+		return CANP_FORM__RE_LOG.search(i_bytes_head) is not None
+
+	@staticmethod
+	def log_parse(
+				i_bytes_block: bytes,
+				i_dict_state: Dict
+			) -> Any:
+		""" Column-wise (stateless)
+		"""
+		return canp_load.narr_block(i_bytes_block)
+
+	@staticmethod
+	def log_dump(
+				i_narr_frame: Any,
+				i_dict_state: Dict
+			) -> bytes:
+		""" '(142.844095) 2 381#6C4E0000FEFFFFFF', '(142.844095) 2 00000381#R'
+			Extended and error frames on 8 digits (error flag in the identifier)
+		"""
+		l_list_line: List[str] = []
+
+		if i_narr_frame is not None:
+			for l_float_time, l_int_chan, l_int_cobid, l_int_dlc, l_int_flag, l_bytes_data in canp_form.list_rows(i_narr_frame):
+				if l_int_flag & CANP_LOAD__FLAG_ERR:
+					l_str_cobid = f"{l_int_cobid | CANP_LOAD__COB_ERR:08X}"
+				elif l_int_flag & CANP_LOAD__FLAG_EXT or l_int_cobid > CANP_LOAD__COB_STD:
+					l_str_cobid = f"{l_int_cobid:08X}"
+				else:
+					l_str_cobid = f"{l_int_cobid:03X}"
+
+				if l_int_flag & CANP_LOAD__FLAG_RTR:
+					l_str_data = "R"
+				else:
+					l_str_data = l_bytes_data[:l_int_dlc].hex().upper()
+
+				l_list_line.append(f"({l_float_time:.6f}) {l_int_chan} {l_str_cobid}#{l_str_data}\n")
+
+		return "".join(l_list_line).encode("ascii")
+
+	# - Vector ASC - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def asc_test(
+				i_bytes_head: bytes
+			) -> bool:
+		""" 'date ...', 'base hex  timestamps absolute', 'Begin Triggerblock ...'
+		"""
+		l_bool_ret: bool = False
+
+		for l_bytes_line in i_bytes_head.lower().splitlines():
+			l_bytes_line = l_bytes_line.lstrip()
+			if any(l_bytes_line.startswith(l_bytes_head) for l_bytes_head in list_CANP_FORM__ASC_HEAD):
+				l_bool_ret = True
+				break
+
+		return l_bool_ret
+
+	@staticmethod
+	def asc_parse(
+				i_bytes_block: bytes,
+				i_dict_state: Dict
+			) -> Any:
+		""" Line by line (variable tokens count)
+			'   0.000288 2  381             Rx   d 8 00 44 07 00 E7 FF FF FF  Length = 0 ...'
+			'   0.001000 1  18FEF100x       Tx   r 8'
+			'   0.002000 1  ErrorFrame'
+		"""
+		l_list_time: List[float] = []
+		l_list_chan: List[int] = []
+		l_list_cobid: List[int] = []
+		l_list_data: List[bytes] = []
+		l_list_flag: List[int] = []
+
+		l_int_base = i_dict_state.setdefault(CANP_FORM__ASC_BASE, CANP_ENUM__BASE_HEXA)
+		l_bool_rel = i_dict_state.setdefault(CANP_FORM__ASC_RELATIVE, False)
+		l_float_last = i_dict_state.get(CANP_FORM__ASC_LAST, 0.0)
+
+		for l_bytes_line in i_bytes_block.splitlines():
+			l_list_tok = l_bytes_line.split()
+
+			if len(l_list_tok) < 3:
+				continue
+
+			if l_list_tok[0].lower() == CANP_FORM__ASC_BASE:
+				# 'base hex  timestamps absolute'
+				if l_list_tok[1].lower() == CANP_FORM__ASC_DEC:
+					l_int_base = CANP_ENUM__BASE_DECI
+				else:
+					l_int_base = CANP_ENUM__BASE_HEXA
+				l_bool_rel = CANP_FORM__ASC_RELATIVE in l_bytes_line.lower()
+				i_dict_state[CANP_FORM__ASC_BASE] = l_int_base
+				i_dict_state[CANP_FORM__ASC_RELATIVE] = l_bool_rel
+				continue
+
+			if not l_list_tok[1].isdigit():
+				# Header, comments, events ('Start of measurement', 'CANFD', ...)
+				continue
+
+			try:
+				l_float_time = float(l_list_tok[0])
+				# - except ValueError -
+			except ValueError:
+				continue
+
+			if l_bool_rel == True:
+				# Relative to the previous event
+				l_float_time += l_float_last
+			l_float_last = l_float_time
+
+			l_int_flag = CANP_LOAD__FLAG_NONE
+			l_bytes_data = b""
+
+			try:
+				if l_list_tok[2].lower() == CANP_FORM__ASC_ERROR:
+					l_int_cobid = 0
+					l_int_flag = CANP_LOAD__FLAG_ERR
+				else:
+					l_bytes_id = l_list_tok[2]
+					if l_bytes_id[-1:].lower() == CANP_FORM__ASC_EXT:
+						l_int_flag |= CANP_LOAD__FLAG_EXT
+						l_bytes_id = l_bytes_id[:-1]
+					l_int_cobid = int(l_bytes_id, l_int_base)
+
+					if l_list_tok[3].lower() == CANP_FORM__ASC_TX:
+						l_int_flag |= CANP_LOAD__FLAG_TX
+
+					if l_list_tok[4] == CANP_FORM__ASC_REMOTE:
+						l_int_flag |= CANP_LOAD__FLAG_RTR
+					elif l_list_tok[4] == CANP_FORM__ASC_DATA:
+						l_int_dlc = int(l_list_tok[5], CANP_ENUM__BASE_HEXA)
+						l_list_byte = l_list_tok[6:6 + l_int_dlc]
+						if l_int_base == CANP_ENUM__BASE_HEXA:
+							l_bytes_data = bytes.fromhex(b"".join(l_list_byte).decode("ascii"))
+						else:
+							l_bytes_data = bytes(int(l_bytes_byte) for l_bytes_byte in l_list_byte)
+
+						if len(l_bytes_data) != l_int_dlc or l_int_dlc > CANP_LOAD__DATA_MAX:
+							raise ValueError
+					else:
+						raise ValueError
+				# - except (IndexError, ValueError) -
+			except (IndexError, ValueError):
+				if len(l_list_tok) > 3 and l_list_tok[3].lower() in list_CANP_FORM__ASC_DIR:
+					# Malformed frame (events and statistics are skipped)
+					canp_form.m_logs.error(f"form.asc_parse.line[{l_bytes_line[:64]}].unknown")
+				continue
+
+			l_list_time.append(l_float_time)
+			l_list_chan.append(int(l_list_tok[1]))
+			l_list_cobid.append(l_int_cobid)
+			l_list_data.append(l_bytes_data)
+			l_list_flag.append(l_int_flag)
+
+		i_dict_state[CANP_FORM__ASC_LAST] = l_float_last
+
+		return canp_load.narr_list(
+			l_list_time,
+			l_list_chan,
+			l_list_cobid,
+			l_list_data,
+			l_list_flag)
+
+	@staticmethod
+	def asc_dump(
+				i_narr_frame: Any,
+				i_dict_state: Dict
+			) -> bytes:
+		""" Header first, footer at the end (no frames)
+			'   0.000288 2  381             Rx   d 8 00 44 07 00 E7 FF FF FF'
+		"""
+		l_list_line: List[str] = []
+
+		if i_dict_state.get(CANP_FORM__ASC_BASE) is None:
+			i_dict_state[CANP_FORM__ASC_BASE] = CANP_ENUM__BASE_HEXA
+			l_str_date = time.strftime("%a %b %d %I:%M:%S.000 %p %Y")
+			l_list_line.append(f"date {l_str_date}\nbase hex  timestamps absolute\ninternal events logged\nBegin Triggerblock {l_str_date}\n")
+
+		if i_narr_frame is not None:
+			for l_float_time, l_int_chan, l_int_cobid, l_int_dlc, l_int_flag, l_bytes_data in canp_form.list_rows(i_narr_frame):
+				if l_int_flag & CANP_LOAD__FLAG_ERR:
+					l_list_line.append(f"{l_float_time:11.6f} {l_int_chan}  ErrorFrame\n")
+					continue
+
+				l_str_cobid = f"{l_int_cobid:X}"
+				if l_int_flag & CANP_LOAD__FLAG_EXT or l_int_cobid > CANP_LOAD__COB_STD:
+					l_str_cobid += "x"
+
+				l_str_dir = "Tx" if l_int_flag & CANP_LOAD__FLAG_TX else "Rx"
+
+				if l_int_flag & CANP_LOAD__FLAG_RTR:
+					l_str_data = f"r {l_int_dlc:X}"
+				else:
+					l_str_data = f"d {l_int_dlc:X} {l_bytes_data[:l_int_dlc].hex(' ').upper()}"
+
+				l_list_line.append(f"{l_float_time:11.6f} {l_int_chan}  {l_str_cobid:<15s} {l_str_dir}   {l_str_data}\n")
+		else:
+			l_list_line.append("End TriggerBlock\n")
+
+		return "".join(l_list_line).encode("ascii")
+
+	# - PCAN TRC - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def trc_test(
+				i_bytes_head: bytes
+			) -> bool:
+		""" ';$FILEVERSION=2.1' (1.1 and later) or ';   Message Number' (1.0)
+		"""
+		l_bytes_head = i_bytes_head.lstrip()
+
+		return l_bytes_head.startswith(CANP_FORM__TRC_VERSION) \
+			or (l_bytes_head.startswith(CANP_FORM__TRC_COMMENT) and b"Message Number" in l_bytes_head)
+
+	@staticmethod
+	def trc_pos(
+				i_list_cols: List[bytes]
+			) -> List[int]:
+		""" Positions of the needed columns (-1 if absent)
+		"""
+		return [
+			i_list_cols.index(l_bytes_col) if l_bytes_col in i_list_cols else -1
+			for l_bytes_col in list_CANP_FORM__TRC_POS]
+
+	@staticmethod
+	def trc_parse(
+				i_bytes_block: bytes,
+				i_dict_state: Dict
+			) -> Any:
+		""" Line by line (columns given by the header)
+			'      1      1059.900 DT 1 0300 Rx - 7  00 00 00 00 04 00 00'
+			'     1)      1841.0  Rx         0001  8  00 00 00 00 00 00 00 00'
+		"""
+		l_list_time: List[float] = []
+		l_list_chan: List[int] = []
+		l_list_cobid: List[int] = []
+		l_list_data: List[bytes] = []
+		l_list_flag: List[int] = []
+
+		l_float_start = i_dict_state.setdefault(CANP_FORM__TRC_START, 0.0)
+		l_list_cols = i_dict_state.setdefault(
+			CANP_FORM__TRC_COLUMNS,
+			dict_CANP_FORM__TRC_COLUMNS[b"1.0"].split(b","))
+
+		l_list_pos = canp_form.trc_pos(l_list_cols)
+
+		for l_bytes_line in i_bytes_block.splitlines():
+			if l_bytes_line.startswith(CANP_FORM__TRC_COMMENT):
+				# Header
+				if l_bytes_line.startswith(CANP_FORM__TRC_VERSION):
+					l_bytes_version = l_bytes_line[len(CANP_FORM__TRC_VERSION):].strip()
+					if l_bytes_version in dict_CANP_FORM__TRC_COLUMNS:
+						l_list_cols = dict_CANP_FORM__TRC_COLUMNS[l_bytes_version].split(b",")
+				elif l_bytes_line.startswith(CANP_FORM__TRC_COLUMNS):
+					l_list_cols = l_bytes_line[len(CANP_FORM__TRC_COLUMNS):].strip().split(b",")
+				elif l_bytes_line.startswith(CANP_FORM__TRC_START):
+					# Days since 1899-12-30 (OLE date)
+					l_float_start = (float(l_bytes_line[len(CANP_FORM__TRC_START):]) - CANP_FORM__TRC_EPOCH) * 86400.0
+				i_dict_state[CANP_FORM__TRC_START] = l_float_start
+				i_dict_state[CANP_FORM__TRC_COLUMNS] = l_list_cols
+				l_list_pos = canp_form.trc_pos(l_list_cols)
+				continue
+
+			(l_int_time, l_int_type, l_int_chan, l_int_cobid, l_int_dir, l_int_dlc) = l_list_pos
+
+			l_list_tok = l_bytes_line.split()
+			if len(l_list_tok) < len(l_list_cols) - 1:
+				# Data might be missing
+				continue
+
+			l_int_flag = CANP_LOAD__FLAG_NONE
+			l_bytes_data = b""
+
+			try:
+				if l_int_type >= 0:
+					# Data, remote or error (status and events are skipped)
+					l_int_flag = dict_CANP_FORM__TRC_TYPE[l_list_tok[l_int_type]]
+
+				l_float_time = l_float_start + (float(l_list_tok[l_int_time]) / 1000.0)
+				l_bytes_id = l_list_tok[l_int_cobid]
+				l_int_cobid = int(l_bytes_id, CANP_ENUM__BASE_HEXA)
+				if len(l_bytes_id) > 4:
+					l_int_flag |= CANP_LOAD__FLAG_EXT
+
+				if l_int_dir >= 0 and l_list_tok[l_int_dir] == CANP_FORM__TRC_TX:
+					l_int_flag |= CANP_LOAD__FLAG_TX
+
+				l_int_dlc = int(l_list_tok[l_int_dlc])
+				l_list_byte = l_list_tok[len(l_list_cols) - 1:]
+				if l_list_byte[:1] == [CANP_FORM__TRC_RTR]:
+					l_int_flag |= CANP_LOAD__FLAG_RTR
+				elif l_int_flag & (CANP_LOAD__FLAG_RTR | CANP_LOAD__FLAG_ERR) == 0:
+					l_bytes_data = bytes.fromhex(b"".join(l_list_byte[:l_int_dlc]).decode("ascii"))
+					if len(l_bytes_data) != l_int_dlc or l_int_dlc > CANP_LOAD__DATA_MAX:
+						raise ValueError
+
+				if l_int_chan >= 0:
+					l_int_chan = int(l_list_tok[l_int_chan])
+				else:
+					l_int_chan = CANP_FORM__CHAN_DEFAULT
+				# - except KeyError -
+			except KeyError:
+				# Not a frame
+				continue
+				# - except (IndexError, ValueError) -
+			except (IndexError, ValueError):
+				canp_form.m_logs.error(f"form.trc_parse.line[{l_bytes_line[:64]}].unknown")
+				continue
+
+			l_list_time.append(l_float_time)
+			l_list_chan.append(l_int_chan)
+			l_list_cobid.append(l_int_cobid)
+			l_list_data.append(l_bytes_data)
+			l_list_flag.append(l_int_flag)
+
+		return canp_load.narr_list(
+			l_list_time,
+			l_list_chan,
+			l_list_cobid,
+			l_list_data,
+			l_list_flag)
+
+	# - CSV - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	@staticmethod
+	def csv_find(
+				i_list_name: List[bytes],
+				i_list_alias: List[bytes]
+			) -> int:
+		""" Index of the first known column name (-1 if none)
+		"""
+		l_int_ret: int = -1
+
+		for l_bytes_alias in i_list_alias:
+			if l_bytes_alias in i_list_name:
+				l_int_ret = i_list_name.index(l_bytes_alias)
+				break
+
+		return l_int_ret
+
+	@staticmethod
+	def csv_head(
+				i_bytes_line: bytes
+			) -> Dict:
+		""" Header line into separator and column indexes (empty if not a frame header)
+		"""
+		l_dict_ret: Dict = {}
+
+		l_bytes_sep = max(list_CANP_FORM__CSV_SEP, key = i_bytes_line.count)
+		l_list_name = [l_bytes_name.strip().strip(b"\"'").lower() for l_bytes_name in i_bytes_line.split(l_bytes_sep)]
+
+		l_int_time = canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_TIME)
+		l_int_cobid = canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_COBID)
+
+		if l_int_time >= 0 and l_int_cobid >= 0:
+			l_dict_ret = {
+				"sep": l_bytes_sep,
+				"cols": len(l_list_name),
+				"time": l_int_time,
+				"chan": canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_CHAN),
+				"cobid": l_int_cobid,
+				"data": canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_DATA),
+				"ext": canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_EXT),
+				"rtr": canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_RTR),
+				"err": canp_form.csv_find(l_list_name, list_CANP_FORM__CSV_ERR),
+				# python-can writes the payload in base64
+				"b64": l_list_name[:2] == [b"timestamp", b"arbitration_id"]}
+
+		return l_dict_ret
+
+	@staticmethod
+	def csv_test(
+				i_bytes_head: bytes
+			) -> bool:
+		""" 'timestamp,arbitration_id,extended,remote,error,dlc,data'
+		"""
+		l_list_line = i_bytes_head.lstrip().split(b"\n", 1)
+
+		return len(canp_form.csv_head(l_list_line[0])) > 0
+
+	@staticmethod
+	def csv_lines(
+				i_list_line: List[bytes],
+				i_dict_head: Dict
+			) -> Any:
+		""" Line by line (slow path, quoted fields, missing columns, ...)
+			'1700000000.501,0x182,1,0,0,1,AA=='
+		"""
+		l_list_time: List[float] = []
+		l_list_chan: List[int] = []
+		l_list_cobid: List[int] = []
+		l_list_data: List[bytes] = []
+		l_list_flag: List[int] = []
+
+		for l_bytes_line in i_list_line:
+			l_list_tok = [l_bytes_tok.strip().strip(b"\"'") for l_bytes_tok in l_bytes_line.split(i_dict_head["sep"])]
+			l_int_flag = CANP_LOAD__FLAG_NONE
+			l_bytes_data = b""
+
+			try:
+				l_float_time = float(l_list_tok[i_dict_head["time"]])
+				l_bytes_id = l_list_tok[i_dict_head["cobid"]]
+				l_int_cobid = int(l_bytes_id, CANP_ENUM__BASE_HEXA)
+
+				if i_dict_head["ext"] >= 0:
+					if int(l_list_tok[i_dict_head["ext"]] or CANP_ENUM__STR_ZERO):
+						l_int_flag |= CANP_LOAD__FLAG_EXT
+				elif len(l_bytes_id.replace(b"0x", b"")) > CANP_LOAD__LEN_STD:
+					l_int_flag |= CANP_LOAD__FLAG_EXT
+
+				if i_dict_head["rtr"] >= 0 and int(l_list_tok[i_dict_head["rtr"]] or CANP_ENUM__STR_ZERO):
+					l_int_flag |= CANP_LOAD__FLAG_RTR
+
+				if i_dict_head["err"] >= 0 and int(l_list_tok[i_dict_head["err"]] or CANP_ENUM__STR_ZERO):
+					l_int_flag |= CANP_LOAD__FLAG_ERR
+
+				if i_dict_head["data"] >= 0 and l_int_flag & (CANP_LOAD__FLAG_RTR | CANP_LOAD__FLAG_ERR) == 0:
+					l_bytes_tok = l_list_tok[i_dict_head["data"]]
+					if i_dict_head["b64"] == True:
+						l_bytes_data = binascii.a2b_base64(l_bytes_tok, strict_mode = True)
+					else:
+						l_bytes_data = bytes.fromhex(l_bytes_tok.decode("ascii"))
+
+					if len(l_bytes_data) > CANP_LOAD__DATA_MAX:
+						raise ValueError
+
+				if i_dict_head["chan"] >= 0:
+					l_int_chan = int(l_list_tok[i_dict_head["chan"]] or CANP_ENUM__STR_ZERO)
+				else:
+					l_int_chan = CANP_FORM__CHAN_DEFAULT
+				# - except (IndexError, ValueError, binascii.Error) -
+			except (IndexError, ValueError, binascii.Error):
+				canp_form.m_logs.error(f"form.csv_lines.line[{l_bytes_line[:64]}].unknown")
+				continue
+
+			l_list_time.append(l_float_time)
+			l_list_chan.append(l_int_chan)
+			l_list_cobid.append(l_int_cobid)
+			l_list_data.append(l_bytes_data)
+			l_list_flag.append(l_int_flag)
+
+		return canp_load.narr_list(
+			l_list_time,
+			l_list_chan,
+			l_list_cobid,
+			l_list_data,
+			l_list_flag)
+
+	@staticmethod
+	def csv_parse(
+				i_bytes_block: bytes,
+				i_dict_state: Dict
+			) -> Any:
+		""" Column-wise (one cast per column)
+			Falls back to the line by line parser on unexpected content
+		"""
+		l_narr_ret: Any = None
+
+		l_list_line = [l_bytes_line for l_bytes_line in i_bytes_block.splitlines() if l_bytes_line.strip()]
+		l_dict_head = i_dict_state.get(CANP_FORM__CSV)
+
+		while l_dict_head is None and len(l_list_line) > 0:
+			# Header (first line that names the columns)
+			l_dict_head = canp_form.csv_head(l_list_line.pop(0))
+			if len(l_dict_head) > 0:
+				i_dict_state[CANP_FORM__CSV] = l_dict_head
+			else:
+				l_dict_head = None
+
+		if l_dict_head is not None:
+			# All fields at once, one column every 'cols' tokens
+			l_int_cols = l_dict_head["cols"]
+			l_int_rows = len(l_list_line)
+			l_list_tok = l_dict_head["sep"].join(l_list_line).split(l_dict_head["sep"])
+			l_list_col = [l_list_tok[l_int_loop::l_int_cols] for l_int_loop in range(l_int_cols)]
+
+			if l_int_rows > 0 and len(l_list_tok) == l_int_rows * l_int_cols:
+				try:
+					l_narr_flag = np.zeros(l_int_rows, dtype = np.uint8)
+					for l_str_key, l_int_flag in [
+							("ext", CANP_LOAD__FLAG_EXT),
+							("rtr", CANP_LOAD__FLAG_RTR),
+							("err", CANP_LOAD__FLAG_ERR)]:
+						if l_dict_head[l_str_key] >= 0:
+							l_narr_flag[np.array(l_list_col[l_dict_head[l_str_key]], dtype = np.bytes_).astype(np.int64) != 0] |= l_int_flag
+
+					l_list_cobid = l_list_col[l_dict_head["cobid"]]
+					if l_dict_head["ext"] < 0:
+						l_narr_flag[[len(l_bytes_id.replace(b"0x", b"")) > CANP_LOAD__LEN_STD for l_bytes_id in l_list_cobid]] |= CANP_LOAD__FLAG_EXT
+
+					if l_dict_head["data"] >= 0:
+						if l_dict_head["b64"] == True:
+							l_func_data = lambda i_bytes_tok: binascii.a2b_base64(i_bytes_tok, strict_mode = True)
+						else:
+							l_func_data = lambda i_bytes_tok: bytes.fromhex(i_bytes_tok.decode("ascii"))
+						l_list_data = list(map(l_func_data, l_list_col[l_dict_head["data"]]))
+					else:
+						l_list_data = [b""] * l_int_rows
+
+					if l_dict_head["chan"] >= 0:
+						l_list_chan = list(map(int, l_list_col[l_dict_head["chan"]]))
+					else:
+						l_list_chan = [CANP_FORM__CHAN_DEFAULT] * l_int_rows
+
+					if max(map(len, l_list_data)) <= CANP_LOAD__DATA_MAX:
+						l_narr_ret = canp_load.narr_list(
+							list(map(float, l_list_col[l_dict_head["time"]])),
+							l_list_chan,
+							[int(l_bytes_id, CANP_ENUM__BASE_HEXA) for l_bytes_id in l_list_cobid],
+							l_list_data,
+							l_narr_flag)
+
+						# No payload for remote and error frames
+						l_narr_nodata = (l_narr_flag & (CANP_LOAD__FLAG_RTR | CANP_LOAD__FLAG_ERR)) != 0
+						l_narr_ret[CANP_LOAD__COL_DLC][l_narr_nodata] = 0
+						l_narr_ret[CANP_LOAD__COL_DATA][l_narr_nodata] = 0
+					# - except (ValueError, binascii.Error) -
+				except (ValueError, binascii.Error):
+					# Quoted fields, empty values, ...
+					l_narr_ret = None
+
+			if l_narr_ret is None:
+				l_narr_ret = canp_form.csv_lines(l_list_line, l_dict_head)
+		else:
+			l_narr_ret = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		return l_narr_ret
+
+# Built-in formats (detection order, most specific first)
+canp_form.form_add(CANP_FORM__CAPT, canp_capt.capt_test, None, canp_capt.capt_dump, canp_capt.narr_blocks, canp_capt.narr_read)
+canp_form.form_add(CANP_FORM__TRC, canp_form.trc_test, canp_form.trc_parse)
+canp_form.form_add(CANP_FORM__ASC, canp_form.asc_test, canp_form.asc_parse, canp_form.asc_dump)
+canp_form.form_add(CANP_FORM__CSV, canp_form.csv_test, canp_form.csv_parse)
+canp_form.form_add(CANP_FORM__LOG, canp_form.log_test, canp_form.log_parse, canp_form.log_dump)
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+		Sample log converted with the 'python-can' writers, then loaded back
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+
+	if True:
+		import can
+
+		print("--- FORMAT BENCHMARK ---")
+		l_narr_frame = canp_form.log_narr(LOG_FILE)
+		l_list_msg = [
+			can.Message(
+				timestamp = l_float_time,
+				channel = l_int_chan,
+				arbitration_id = l_int_cobid,
+				is_extended_id = False,
+				data = l_any_data)
+			for l_float_time, l_int_chan, l_int_cobid, l_any_data in canp_load.list_narr(l_narr_frame)]
+
+		# Same approach as 'canp_card.log_parse' (regex, join, split, cast)
+		l_obj_re = re.compile(r"\(|\)| |\#|\n")
+
+		for l_str_form in canp_form.form_list():
+			l_str_file = f"canp_form.{l_str_form}"
+
+			if dict_CANP_FORM__LIST[l_str_form][CANP_FORM__KEY_BLOCKS] is not None:
+				# Binary, unknown to 'python-can'
+				l_float_time = time.perf_counter()
+				l_int_count = canp_form.log_conv(LOG_FILE, l_str_file)
+				l_float_conv = time.perf_counter() - l_float_time
+
+				l_float_time = time.perf_counter()
+				l_narr_load = canp_form.log_narr(l_str_file)
+				l_float_form = time.perf_counter() - l_float_time
+
+				print(f"{l_str_form} ({canp_form.form_detect(l_str_file)}) : converted {l_int_count} frames in {l_float_conv:.3f}s"
+					f", registry {len(l_narr_load)} frames in {l_float_form * 1000:.3f}ms"
+					f", same frames {np.array_equal(l_narr_frame, l_narr_load)}")
+
+				del l_narr_load
+				os.remove(l_str_file)
+				continue
+
+			with can.Logger(l_str_file) as l_obj_log:
+				for l_obj_msg in l_list_msg:
+					l_obj_log.on_message_received(l_obj_msg)
+
+			l_float_time = time.perf_counter()
+			l_int_count = 0
+			with open(l_str_file, newline = None) as l_obj_file:
+				for l_str_line in l_obj_file:
+					l_list_line = CANP_ENUM__STR_SPACE.join(l_obj_re.split(l_str_line)).split()
+					l_int_count += 1
+			l_float_line = time.perf_counter() - l_float_time
+
+			l_float_time = time.perf_counter()
+			l_int_can = sum(1 for _ in can.LogReader(l_str_file))
+			l_float_can = time.perf_counter() - l_float_time
+
+			l_float_time = time.perf_counter()
+			l_str_detect = canp_form.form_detect(l_str_file)
+			l_narr_load = canp_form.log_narr(l_str_file, l_str_detect)
+			l_float_form = time.perf_counter() - l_float_time
+
+			print(f"{l_str_form} ({l_str_detect}) : regex split {l_int_count} lines in {l_float_line:.3f}s"
+				f", python-can {l_int_can} frames in {l_float_can:.3f}s"
+				f", registry {len(l_narr_load)} frames in {l_float_form:.3f}s"
+				f" (x{l_float_line / l_float_form:.1f}, x{l_float_can / l_float_form:.1f})")
+
+			os.remove(l_str_file)
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -0,0 +1,1376 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_hist.py
+	History
+	Object values over time, stored column-wise in typed buffers
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from array import array
+from bisect import bisect_right
+from itertools import chain
+from itertools import islice
+from itertools import repeat
+
+from typing import Any
+#from typing import Callable
+#from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import enum_TYPE
+
+
+from canp_conv import dict_CANP_CONV__TYPE_CODE
+
+
+from canp_disk import canp_disk
+from canp_disk import canp_disk_blob
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Timestamps typecode
+CANP_HIST__CODE_TIME = "d"
+
+# Run ends typecode (change-only histories, see 'canp_hist_runs')
+CANP_HIST__CODE_RUNS = "q"
+
+# Change-only storage (see 'canp_hist_runs')
+CANP_HIST__RUNS_NONE = 0			# Every value stored
+CANP_HIST__RUNS_EXACT = 1			# Same values stored once, timestamps kept
+CANP_HIST__RUNS_SPREAD = 2			# Same values stored once, timestamps spread in runs (lossy)
+
+# Interval deviation allowed in a run (part of its period, new run past it, spread runs only)
+CANP_HIST__RUNS_JITTER = 0.5
+
+# First capacity (then doubled)
+CANP_HIST__CAP_MIN = 16
+
+# Integer typecodes range (key = typecode, value = (min, max))
+dict_CANP_HIST__CODE_INT = {
+		l_str_code: (
+			-(1 << (array(l_str_code).itemsize * 8 - 1)) if l_str_code.islower() else 0,
+			(1 << (array(l_str_code).itemsize * 8 - l_str_code.islower())) - 1)
+		for l_str_code in "bBhHiIlLqQ"
+	}
+
+# Real typecodes
+list_CANP_HIST__CODE_REAL = [
+		"f",
+		"d",
+	]
+
+# Retention policy (count, seconds, bytes), 0 : unbounded (see 'canp_hist.keep_set')
+CANP_HIST__KEEP_COUNT = 0			# Last N values
+CANP_HIST__KEEP_TIME = 1			# Last T seconds (from the newest timestamp)
+CANP_HIST__KEEP_BYTES = 2			# Byte budget (buffers, and untyped values estimated from a sample)
+CANP_HIST__KEEP_NONE = (0, 0.0, 0)
+
+# List slot (untyped values)
+CANP_HIST__SIZE_SLOT = 8
+
+# Values read at once from column files (iteration)
+CANP_HIST__DISK_PART = 65536
+
+#  --- CLASS ---
+
+class canp_hist:
+	""" Object history
+		Timestamps and values in typed buffers (capacity doubled when full)
+		Used as the former list of (time, value) tuples, numpy views without copy
+		Values not fitting the typecode switch the buffer to a wider one, then to a list
+		Booleans are stored as integers (read back as 0 / 1)
+		With a retention policy the buffers are a ring (oldest values overwritten, see 'keep_set')
+		Without, the buffers switch to column files past the RAM budget (see 'disk_spill')
+	"""
+
+	# Timestamps (array, capacity >= length)
+	m_arr_time: Any = None
+	# Values (array of 'm_str_code' with the same capacity, list if None)
+	m_any_vals: Any = None
+	# Values typecode (and python type stored as is)
+	m_str_code: Optional[str] = None
+	m_type_vals: Any = None
+	# Length
+	m_int_len: int = 0
+	# Oldest value position (ring)
+	m_int_head: int = 0
+
+	# Retention policy (count, seconds, bytes)
+	m_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+	# Values kept (capacity of the ring, 0 : unbounded, -1 : byte budget waiting for a value sample)
+	m_int_keep: int = 0
+	# Seconds kept (0.0 : unbounded)
+	m_float_keep: float = 0.0
+
+	# Buffers in column files (memmaps, 'canp_disk_blob' if not typed)
+	m_bool_disk: bool = False
+	# Bytes in RAM (counted in 'canp_disk.m_int_ram')
+	m_int_ram: int = 0
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("hist")
+
+	def __init__(self,
+				i_enum_typ: Any = None,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+			'i_enum_typ' : DataType of the object (values typecode, see 'dict_CANP_CONV__TYPE_CODE')
+			'i_tuple_keep' : retention policy (see 'keep_set')
+		"""
+		super().__init__(**i_dict_args)
+
+		try:
+			self.m_str_code = dict_CANP_CONV__TYPE_CODE[i_enum_typ]
+			# - except KeyError -
+		except KeyError:
+			self.m_str_code = None
+
+		self.m_type_vals = canp_hist.code_type(self.m_str_code)
+		self.m_arr_time = array(CANP_HIST__CODE_TIME)
+		self.m_any_vals = canp_hist.vals_new(self.m_str_code, 0)
+		self.m_int_len = 0
+		self.m_int_head = 0
+
+		if i_tuple_keep != CANP_HIST__KEEP_NONE:
+			self.keep_set(i_tuple_keep)
+
+	def __len__(self) -> int:
+		""" Size of (number of values)
+		"""
+		return self.m_int_len
+
+	def __getitem__(self,
+				i_any_pos: Any = -1
+			) -> Any:
+		""" Get at (time, value), list of them for a slice
+		"""
+		l_any_ret: Any = None
+		l_list_pos: List[int] = []
+		l_int_cap: int = 0
+
+		if isinstance(i_any_pos, slice):
+			# Ring positions (buffers left as is)
+			l_int_cap = len(self.m_arr_time)
+			l_list_pos = [(self.m_int_head + l_int_pos) % l_int_cap for l_int_pos in range(*i_any_pos.indices(self.m_int_len))]
+			l_any_ret = [(self.m_arr_time[l_int_pos], self.m_any_vals[l_int_pos]) for l_int_pos in l_list_pos]
+
+			if self.m_bool_disk == True:
+				l_any_ret = [canp_hist.disk_item(l_tuple_val, self.m_str_code) for l_tuple_val in l_any_ret]
+		else:
+			if i_any_pos < 0:
+				i_any_pos += self.m_int_len
+
+			if i_any_pos < 0 or i_any_pos >= self.m_int_len:
+				raise IndexError("canp_hist index out of range")
+
+			i_any_pos += self.m_int_head
+			if i_any_pos >= len(self.m_arr_time):
+				i_any_pos -= len(self.m_arr_time)
+
+			l_any_ret = (self.m_arr_time[i_any_pos], self.m_any_vals[i_any_pos])
+
+			if self.m_bool_disk == True:
+				l_any_ret = canp_hist.disk_item(l_any_ret, self.m_str_code)
+
+		return l_any_ret
+
+	def __setitem__(self,
+				i_float_time: float,
+				i_any_val: Any
+			) -> None:
+		""" Value storing at timestamp (appended, as the former dict of raw frames)
+		"""
+		self.append((i_float_time, i_any_val))
+
+	def __iter__(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of (time, value)
+		"""
+		l_iter_ret: Iterator[Tuple[float, Any]] = None
+
+		if self.m_bool_disk == True:
+			l_iter_ret = self.disk_iter()
+		else:
+			l_iter_ret = zip(
+				self.ring_iter(self.m_arr_time),
+				self.ring_iter(self.m_any_vals))
+
+		return l_iter_ret
+
+	def __eq__(self,
+				i_any_other: Any
+			) -> bool:
+		""" Same (time, value) sequence (history or list)
+		"""
+		l_bool_ret: bool = False
+
+		if isinstance(i_any_other, (canp_hist, list)):
+			l_bool_ret = (list(self) == list(i_any_other))
+
+		return l_bool_ret
+
+	def items(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of (time, value), as the former dict of raw frames
+		"""
+		return iter(self)
+
+	def __repr__(self) -> str:
+		""" Representation (as the list of (time, value))
+		"""
+		return repr(list(self))
+
+	def __del__(self) -> None:
+		""" Destructor (RAM given back to the budget, column files removed)
+		"""
+		canp_disk.m_int_ram -= self.m_int_ram
+		self.m_int_ram = 0
+
+		self.disk_free()
+
+	def __getstate__(self) -> Any:
+		""" Pickling (unused capacity left out, column files read back as buffers)
+		"""
+		l_any_time: Any = None
+		l_any_vals: Any = None
+
+		l_any_time = self.ring_span(self.m_arr_time)
+		l_any_vals = self.ring_span(self.m_any_vals)
+
+		if self.m_bool_disk == True:
+			l_any_time = array(CANP_HIST__CODE_TIME, l_any_time.tobytes())
+			if self.m_str_code is not None:
+				l_any_vals = array(self.m_str_code, l_any_vals.tobytes())
+
+		return {
+			"m_arr_time": l_any_time,
+			"m_any_vals": l_any_vals,
+			"m_str_code": self.m_str_code,
+			"m_type_vals": self.m_type_vals,
+			"m_int_len": self.m_int_len,
+			"m_tuple_keep": self.m_tuple_keep,
+			"m_int_keep": self.m_int_keep,
+			"m_float_keep": self.m_float_keep}
+
+	@staticmethod
+	def vals_new(
+				i_str_code: Optional[str] = None,
+				i_int_cap: int = 0
+			) -> Any:
+		""" Values buffer (array of capacity 'i_int_cap', list of empty slots if no typecode)
+		"""
+		l_any_ret: Any = None
+
+		if i_str_code is None:
+			l_any_ret = [None] * i_int_cap
+		else:
+			l_any_ret = array(i_str_code, bytes(array(i_str_code).itemsize * i_int_cap))
+
+		return l_any_ret
+
+	@staticmethod
+	def code_type(
+				i_str_code: Optional[str] = None
+			) -> Any:
+		""" Python type of the values stored as is (None if no typecode)
+		"""
+		l_type_ret: Any = None
+
+		if i_str_code in list_CANP_HIST__CODE_REAL:
+			l_type_ret = float
+		elif i_str_code is not None:
+			l_type_ret = int
+
+		return l_type_ret
+
+	@staticmethod
+	def vals_fit(
+				i_str_code: Optional[str] = None,
+				i_list_vals: List[Any] = []
+			) -> bool:
+		""" Values stored as is in the typecode (same type and value read back, booleans as integers 0 / 1)
+		"""
+		l_bool_ret: bool = True
+
+		if i_str_code is None or len(i_list_vals) == 0:
+			pass
+		elif i_str_code in list_CANP_HIST__CODE_REAL:
+			l_bool_ret = all(type(l_any_val) is float for l_any_val in i_list_vals)
+			if l_bool_ret == True and i_str_code == "f":
+				# Single precision (no rounding allowed)
+				l_bool_ret = (array(i_str_code, i_list_vals).tolist() == i_list_vals)
+		else:
+			l_bool_ret = all(type(l_any_val) is int or type(l_any_val) is bool for l_any_val in i_list_vals)
+			if l_bool_ret == True:
+				l_int_min, l_int_max = dict_CANP_HIST__CODE_INT[i_str_code]
+				l_bool_ret = (l_int_min <= min(i_list_vals) and max(i_list_vals) <= l_int_max)
+
+		return l_bool_ret
+
+	@staticmethod
+	def vals_code(
+				i_list_vals: List[Any] = []
+			) -> Optional[str]:
+		""" Widest typecode holding the values (None if not all integers or all reals)
+		"""
+		l_str_ret: Optional[str] = None
+
+		for l_str_code in ["q", "Q", "d"]:
+			if l_str_ret is None and canp_hist.vals_fit(l_str_code, i_list_vals) == True:
+				l_str_ret = l_str_code
+
+		return l_str_ret
+
+	@staticmethod
+	def size_any(
+				i_any_val: Any = None
+			) -> int:
+		""" Bytes of an untyped value (tuple items included, as raw frames)
+		"""
+		l_int_ret: int = 0
+
+		l_int_ret = sys.getsizeof(i_any_val)
+		if isinstance(i_any_val, tuple):
+			l_int_ret += sum(sys.getsizeof(l_any_item) for l_any_item in i_any_val)
+
+		return l_int_ret
+
+	@staticmethod
+	def disk_item(
+				i_tuple_val: Tuple[Any, Any] = (0.0, None),
+				i_str_code: Optional[str] = None
+			) -> Tuple[float, Any]:
+		""" Python (time, value) from column files (numpy scalars converted, as the arrays give)
+		"""
+		return (
+			i_tuple_val[0].item(),
+			i_tuple_val[1] if i_str_code is None else i_tuple_val[1].item())
+
+	def size_val(self,
+				i_any_val: Any = None
+			) -> int:
+		""" Bytes per value (timestamp included, 'i_any_val' : sample of untyped values, 0 if none)
+		"""
+		l_int_ret: int = 0
+
+		l_int_ret = self.m_arr_time.itemsize
+		if self.m_str_code is not None:
+			l_int_ret += np.dtype(self.m_str_code).itemsize
+		elif i_any_val is not None:
+			l_int_ret += CANP_HIST__SIZE_SLOT + canp_hist.size_any(i_any_val)
+		else:
+			l_int_ret = 0
+
+		return l_int_ret
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+			) -> None:
+		""" Retention policy (count, seconds, bytes), 0 : unbounded
+			Count and byte budget make a ring of fixed capacity (oldest values overwritten)
+			Seconds drop the values older than the newest timestamp minus T
+		"""
+		self.m_tuple_keep = tuple(i_tuple_keep)
+		self.m_float_keep = float(self.m_tuple_keep[CANP_HIST__KEEP_TIME] or 0.0)
+
+		if self.m_bool_disk == True and self.m_tuple_keep != CANP_HIST__KEEP_NONE:
+			# Rings in RAM only
+			self.disk_load()
+
+		self.keep_apply(self.m_any_vals[self.m_int_head] if self.m_int_len > 0 else None)
+
+		if self.m_float_keep > 0.0 and self.m_int_len > 0:
+			self.keep_time(self[-1][0])
+
+	def keep_apply(self,
+				i_any_val: Any = None
+			) -> None:
+		""" Ring capacity from the retention policy ('i_any_val' : sample of untyped values)
+		"""
+		l_int_keep: int = 0
+		l_int_bytes: int = 0
+		l_int_size: int = 0
+
+		l_int_keep = int(self.m_tuple_keep[CANP_HIST__KEEP_COUNT] or 0)
+		l_int_bytes = int(self.m_tuple_keep[CANP_HIST__KEEP_BYTES] or 0)
+
+		if l_int_bytes > 0:
+			# Sized at the first value if not typed
+			l_int_size = self.size_val(i_any_val)
+
+			if l_int_size > 0:
+				l_int_bytes = max(1, l_int_bytes // l_int_size)
+				if l_int_keep == 0 or l_int_bytes < l_int_keep:
+					l_int_keep = l_int_bytes
+			else:
+				l_int_keep = -1
+
+		self.m_int_keep = l_int_keep
+
+		if l_int_keep > 0:
+			self.ring_size(l_int_keep)
+		else:
+			self.ring_flat()
+
+	def keep_time(self,
+				i_float_time: float = 0.0
+			) -> None:
+		""" Values older than 'i_float_time' minus the seconds kept dropped (newest one kept)
+		"""
+		l_float_min: float = 0.0
+		l_int_cap: int = 0
+
+		l_float_min = i_float_time - self.m_float_keep
+		l_int_cap = len(self.m_arr_time)
+
+		while self.m_int_len > 1 and self.m_arr_time[self.m_int_head] < l_float_min:
+			if self.m_str_code is None:
+				self.m_any_vals[self.m_int_head] = None
+			self.m_int_head += 1
+			if self.m_int_head >= l_int_cap:
+				self.m_int_head = 0
+			self.m_int_len -= 1
+
+	def ring_flat(self) -> None:
+		""" Oldest value moved back to the first position (before a growth or a rebuild of the buffers)
+		"""
+		l_int_head: int = 0
+
+		l_int_head = self.m_int_head
+
+		if l_int_head != 0:
+			self.m_arr_time = self.m_arr_time[l_int_head:] + self.m_arr_time[:l_int_head]
+			self.m_any_vals = self.m_any_vals[l_int_head:] + self.m_any_vals[:l_int_head]
+			self.m_int_head = 0
+
+	def ring_span(self,
+				i_any_buf: Any = None
+			) -> Any:
+		""" Stored part of a buffer, oldest first (slice, two slices joined once if the ring wraps, buffers left as is)
+		"""
+		l_any_ret: Any = None
+		l_int_end: int = 0
+		l_int_cap: int = 0
+
+		l_int_end = self.m_int_head + self.m_int_len
+		l_int_cap = len(self.m_arr_time)
+
+		if l_int_end > l_int_cap:
+			l_any_ret = i_any_buf[self.m_int_head:] + i_any_buf[:l_int_end - l_int_cap]
+		else:
+			l_any_ret = i_any_buf[self.m_int_head:l_int_end]
+
+		return l_any_ret
+
+	def ring_iter(self,
+				i_any_buf: Any = None
+			) -> Iterator[Any]:
+		""" Iterator of the stored part of a buffer, oldest first (no copy)
+		"""
+		l_int_end: int = 0
+		l_int_cap: int = 0
+
+		l_int_end = self.m_int_head + self.m_int_len
+		l_int_cap = len(self.m_arr_time)
+
+		return chain(
+			islice(i_any_buf, self.m_int_head, min(l_int_end, l_int_cap)),
+			islice(i_any_buf, 0, max(0, l_int_end - l_int_cap)))
+
+	def ring_narr(self,
+				i_any_buf: Any = None,
+				i_obj_dtype: Any = None
+			) -> Any:
+		""" Stored part of a typed buffer, oldest first (numpy view, both parts concatenated if the ring wraps)
+		"""
+		l_narr_ret: Any = None
+		l_int_end: int = 0
+		l_int_cap: int = 0
+
+		l_int_end = self.m_int_head + self.m_int_len
+		l_int_cap = len(self.m_arr_time)
+
+		if self.m_int_len == 0:
+			l_narr_ret = np.empty(0, dtype = i_obj_dtype)
+		elif l_int_end > l_int_cap:
+			l_narr_ret = np.concatenate((
+				np.frombuffer(i_any_buf, dtype = i_obj_dtype, offset = self.m_int_head * i_obj_dtype.itemsize),
+				np.frombuffer(i_any_buf, dtype = i_obj_dtype, count = l_int_end - l_int_cap)))
+		else:
+			l_narr_ret = np.frombuffer(i_any_buf, dtype = i_obj_dtype, count = self.m_int_len, offset = self.m_int_head * i_obj_dtype.itemsize)
+
+		return l_narr_ret
+
+	def ring_size(self,
+				i_int_cap: int = 0
+			) -> None:
+		""" Ring capacity set to 'i_int_cap' (newest values kept)
+		"""
+		l_int_drop: int = 0
+
+		self.ring_flat()
+
+		if i_int_cap != len(self.m_arr_time):
+			l_int_drop = max(0, self.m_int_len - i_int_cap)
+			self.m_int_len -= l_int_drop
+
+			l_arr_time = array(CANP_HIST__CODE_TIME, bytes(array(CANP_HIST__CODE_TIME).itemsize * i_int_cap))
+			l_arr_time[:self.m_int_len] = self.m_arr_time[l_int_drop:l_int_drop + self.m_int_len]
+			self.m_arr_time = l_arr_time
+
+			l_any_vals = canp_hist.vals_new(self.m_str_code, i_int_cap)
+			l_any_vals[:self.m_int_len] = self.m_any_vals[l_int_drop:l_int_drop + self.m_int_len]
+			self.m_any_vals = l_any_vals
+
+	def ring_put(self,
+				i_list_time: List[float] = [],
+				i_list_vals: List[Any] = []
+			) -> None:
+		""" Values written after the newest one (room already made, wrapping around)
+		"""
+		l_int_cap: int = 0
+		l_int_pos: int = 0
+		l_int_cnt: int = 0
+		l_int_end: int = 0
+
+		l_int_cap = len(self.m_arr_time)
+		l_int_cnt = len(i_list_time)
+		l_int_pos = self.m_int_head + self.m_int_len
+		if l_int_pos >= l_int_cap:
+			l_int_pos -= l_int_cap
+
+		l_int_end = min(l_int_cnt, l_int_cap - l_int_pos)
+
+		for l_int_dst, l_int_src, l_int_stop in [
+				(l_int_pos, 0, l_int_end),
+				(0, l_int_end, l_int_cnt)]:
+			if l_int_stop > l_int_src:
+				l_int_next = l_int_dst + l_int_stop - l_int_src
+				self.m_arr_time[l_int_dst:l_int_next] = array(CANP_HIST__CODE_TIME, i_list_time[l_int_src:l_int_stop])
+				if self.m_str_code is None:
+					self.m_any_vals[l_int_dst:l_int_next] = i_list_vals[l_int_src:l_int_stop]
+				else:
+					self.m_any_vals[l_int_dst:l_int_next] = array(self.m_str_code, i_list_vals[l_int_src:l_int_stop])
+
+		self.m_int_len += l_int_cnt
+
+	def cap_grow(self,
+				i_int_need: int = 0
+			) -> None:
+		""" Capacity doubled until 'i_int_need' values fit
+			New buffers (views given before keep the previous ones)
+			Unbounded buffers past the RAM budget switch to column files
+		"""
+		l_int_cap: int = 0
+		l_int_more: int = 0
+		l_arr_time: Any = None
+		l_any_vals: Any = None
+
+		self.ring_flat()
+
+		l_int_cap = max(CANP_HIST__CAP_MIN, len(self.m_arr_time))
+		while l_int_cap < i_int_need:
+			l_int_cap *= 2
+
+		if l_int_cap > len(self.m_arr_time) and self.m_bool_disk == False and self.m_int_keep == 0:
+			l_int_more = l_int_cap * self.size_val(self.m_any_vals[self.m_int_len - 1] if self.m_int_len > 0 else None) - self.m_int_ram
+			if canp_disk.ram_take(l_int_more) == True:
+				self.m_int_ram += l_int_more
+			elif self.m_tuple_keep == CANP_HIST__KEEP_NONE:
+				self.disk_spill(l_int_cap)
+
+		if l_int_cap <= len(self.m_arr_time):
+			pass
+		elif self.m_bool_disk == True:
+			# Files extended
+			self.m_arr_time = canp_disk.narr_grow(self.m_arr_time, l_int_cap)
+			if self.m_str_code is None:
+				self.m_any_vals.cap_set(l_int_cap)
+			else:
+				self.m_any_vals = canp_disk.narr_grow(self.m_any_vals, l_int_cap)
+		else:
+			l_arr_time = array(CANP_HIST__CODE_TIME, bytes(array(CANP_HIST__CODE_TIME).itemsize * l_int_cap))
+			memoryview(l_arr_time)[:self.m_int_len] = memoryview(self.m_arr_time)[:self.m_int_len]
+			self.m_arr_time = l_arr_time
+
+			if self.m_str_code is None:
+				self.m_any_vals.extend([None] * (l_int_cap - len(self.m_any_vals)))
+			else:
+				l_any_vals = canp_hist.vals_new(self.m_str_code, l_int_cap)
+				memoryview(l_any_vals)[:self.m_int_len] = memoryview(self.m_any_vals)[:self.m_int_len]
+				self.m_any_vals = l_any_vals
+
+	def code_set(self,
+				i_str_code: Optional[str] = None
+			) -> None:
+		""" Values typecode change (stored values converted)
+		"""
+		l_list_vals: List[Any] = []
+		l_any_old: Any = None
+
+		if i_str_code != self.m_str_code:
+			self.ring_flat()
+
+			l_list_vals = self.list_vals()
+			l_any_old = self.m_any_vals
+
+			self.m_str_code = i_str_code
+			self.m_type_vals = canp_hist.code_type(self.m_str_code)
+			if self.m_bool_disk == True:
+				self.m_any_vals = canp_hist.disk_vals(self.m_str_code, len(self.m_arr_time))
+				canp_hist.disk_drop(l_any_old)
+			else:
+				self.m_any_vals = canp_hist.vals_new(self.m_str_code, len(self.m_arr_time))
+
+			if self.m_str_code is None:
+				self.m_any_vals[:self.m_int_len] = l_list_vals
+			else:
+				self.m_any_vals[:self.m_int_len] = array(self.m_str_code, l_list_vals)
+
+			if self.m_tuple_keep[CANP_HIST__KEEP_BYTES]:
+				# Budget in values of the new width
+				self.keep_apply(l_list_vals[-1] if len(l_list_vals) > 0 else None)
+
+	def append(self,
+				i_tuple_val: Tuple[float, Any] = (0.0, None)
+			) -> None:
+		""" Value storing (time, value)
+		"""
+		l_int_len: int = 0
+		l_int_pos: int = 0
+		l_any_val: Any = None
+		l_bool_fit: bool = False
+
+		l_int_len = self.m_int_len
+		l_any_val = i_tuple_val[1]
+
+		if l_int_len >= len(self.m_arr_time):
+			if self.m_int_keep < 0:
+				# Byte budget (first value as sample)
+				self.keep_apply(l_any_val)
+
+			if self.m_int_keep > 0 and l_int_len >= self.m_int_keep:
+				# Ring full (oldest value overwritten)
+				self.keep_drop(l_int_len - self.m_int_keep + 1)
+				l_int_len = self.m_int_len
+			elif l_int_len >= len(self.m_arr_time):
+				self.cap_grow(l_int_len + 1)
+
+		l_int_pos = self.m_int_head + l_int_len
+		if l_int_pos >= len(self.m_arr_time):
+			l_int_pos -= len(self.m_arr_time)
+
+		if self.m_str_code is None:
+			self.m_any_vals[l_int_pos] = l_any_val
+		else:
+			if type(l_any_val) is self.m_type_vals or (type(l_any_val) is bool and self.m_type_vals is int):
+				try:
+					self.m_any_vals[l_int_pos] = l_any_val
+					# - except OverflowError -
+					# Same value read back (single precision rounding, as python value from column files)
+					if self.m_bool_disk == True:
+						l_bool_fit = (self.m_any_vals[l_int_pos].item() == l_any_val)
+					else:
+						l_bool_fit = (self.m_any_vals[l_int_pos] == l_any_val)
+				except OverflowError:
+					pass
+
+			if l_bool_fit == False:
+				# Wider typecode (or list) for the stored and new values
+				self.code_set(canp_hist.vals_code(self.list_vals() + [l_any_val]))
+
+				l_int_len = self.m_int_len
+				if self.m_int_keep > 0 and l_int_len >= self.m_int_keep:
+					self.keep_drop(l_int_len - self.m_int_keep + 1)
+					l_int_len = self.m_int_len
+
+				l_int_pos = self.m_int_head + l_int_len
+				if l_int_pos >= len(self.m_arr_time):
+					l_int_pos -= len(self.m_arr_time)
+
+				self.m_any_vals[l_int_pos] = l_any_val
+
+		self.m_arr_time[l_int_pos] = i_tuple_val[0]
+		self.m_int_len = l_int_len + 1
+
+		if self.m_float_keep > 0.0:
+			self.keep_time(i_tuple_val[0])
+
+	def keep_drop(self,
+				i_int_drop: int = 0
+			) -> None:
+		""" Oldest values dropped
+		"""
+		l_int_cap: int = 0
+
+		l_int_cap = len(self.m_arr_time)
+		i_int_drop = min(i_int_drop, self.m_int_len)
+
+		if i_int_drop > 0:
+			if self.m_str_code is None:
+				# Values released
+				for l_int_pos in range(self.m_int_head, self.m_int_head + i_int_drop):
+					self.m_any_vals[l_int_pos % l_int_cap] = None
+
+			self.m_int_head = (self.m_int_head + i_int_drop) % l_int_cap
+			self.m_int_len -= i_int_drop
+
+	def extend(self,
+				i_iter_val: Any = []
+			) -> None:
+		""" Values storing [(time, value), ...]
+		"""
+		l_list_val: List[Tuple[float, Any]] = list(i_iter_val)
+
+		if len(l_list_val) > 0:
+			self.extend_cols(
+				[l_tuple_val[0] for l_tuple_val in l_list_val],
+				[l_tuple_val[1] for l_tuple_val in l_list_val])
+
+	def extend_cols(self,
+				i_list_time: List[float] = [],
+				i_list_vals: List[Any] = []
+			) -> None:
+		""" Values storing (timestamps and values columns)
+		"""
+		l_int_cnt: int = 0
+
+		l_int_cnt = len(i_list_time)
+
+		if self.m_str_code is not None and canp_hist.vals_fit(self.m_str_code, i_list_vals) == False:
+			# Wider typecode (or list) for the stored and new values
+			self.code_set(canp_hist.vals_code(self.list_vals() + list(i_list_vals)))
+
+		if self.m_int_keep < 0 and l_int_cnt > 0:
+			# Byte budget (last value as sample)
+			self.keep_apply(i_list_vals[-1])
+
+		if self.m_int_keep > 0:
+			if l_int_cnt >= self.m_int_keep:
+				# Newest values only
+				i_list_time = i_list_time[l_int_cnt - self.m_int_keep:]
+				i_list_vals = i_list_vals[l_int_cnt - self.m_int_keep:]
+				l_int_cnt = self.m_int_keep
+			self.keep_drop(self.m_int_len + l_int_cnt - self.m_int_keep)
+		elif self.m_int_len + l_int_cnt > len(self.m_arr_time):
+			self.cap_grow(self.m_int_len + l_int_cnt)
+
+		self.ring_put(i_list_time, i_list_vals)
+
+		if self.m_float_keep > 0.0 and l_int_cnt > 0:
+			self.keep_time(i_list_time[-1])
+
+	@staticmethod
+	def disk_vals(
+				i_str_code: Optional[str] = None,
+				i_int_cap: int = 0
+			) -> Any:
+		""" Values column file (memmap of capacity 'i_int_cap', 'canp_disk_blob' if no typecode)
+		"""
+		l_any_ret: Any = None
+
+		if i_str_code is None:
+			l_any_ret = canp_disk_blob(i_int_cap)
+		else:
+			l_any_ret = canp_disk.narr_new(np.dtype(i_str_code), i_int_cap)
+
+		return l_any_ret
+
+	@staticmethod
+	def disk_drop(
+				i_any_col: Any = None
+			) -> None:
+		""" Column file removal (memmap or 'canp_disk_blob')
+		"""
+		if isinstance(i_any_col, canp_disk_blob):
+			i_any_col.blob_del()
+		elif isinstance(i_any_col, np.memmap):
+			canp_disk.file_del(i_any_col.filename)
+
+	def disk_spill(self,
+				i_int_cap: int = 0
+			) -> None:
+		""" Buffers moved to column files of capacity 'i_int_cap' (RAM given back to the budget)
+			Reads stay the same (values, slices, numpy views), appends grow the files
+		"""
+		l_narr_time: Any = None
+		l_any_vals: Any = None
+
+		self.ring_flat()
+
+		l_narr_time = canp_disk.narr_new(np.float64, i_int_cap)
+		l_any_vals = canp_hist.disk_vals(self.m_str_code, i_int_cap)
+
+		if self.m_int_len > 0:
+			l_narr_time[:self.m_int_len] = self.narr_time()
+			if self.m_str_code is None:
+				l_any_vals[0:] = self.m_any_vals[:self.m_int_len]
+			else:
+				l_any_vals[:self.m_int_len] = self.narr_vals()
+
+		self.m_arr_time = l_narr_time
+		self.m_any_vals = l_any_vals
+		self.m_bool_disk = True
+
+		canp_disk.m_int_ram -= self.m_int_ram
+		self.m_int_ram = 0
+
+		self.m_logs.debug(f"hist.disk_spill.file[{l_narr_time.filename}].len[{self.m_int_len}]")
+
+	def disk_load(self) -> None:
+		""" Buffers read back from the column files (files removed)
+		"""
+		l_any_time: Any = None
+		l_any_vals: Any = None
+
+		if self.m_bool_disk == True:
+			l_any_time = self.m_arr_time
+			l_any_vals = self.m_any_vals
+
+			self.m_arr_time = array(CANP_HIST__CODE_TIME, l_any_time[:self.m_int_len].tobytes())
+			if self.m_str_code is None:
+				self.m_any_vals = l_any_vals[:self.m_int_len]
+			else:
+				self.m_any_vals = array(self.m_str_code, l_any_vals[:self.m_int_len].tobytes())
+			self.m_bool_disk = False
+
+			canp_hist.disk_drop(l_any_time)
+			canp_hist.disk_drop(l_any_vals)
+
+	def disk_free(self) -> None:
+		""" Column files removed (history left empty)
+		"""
+		if self.m_bool_disk == True:
+			canp_hist.disk_drop(self.m_arr_time)
+			canp_hist.disk_drop(self.m_any_vals)
+
+			self.m_arr_time = array(CANP_HIST__CODE_TIME)
+			self.m_any_vals = canp_hist.vals_new(self.m_str_code, 0)
+			self.m_int_len = 0
+			self.m_bool_disk = False
+
+	def disk_iter(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of (time, value) from the column files (read by parts)
+		"""
+		l_int_end: int = 0
+		l_any_vals: Any = None
+
+		for l_int_pos in range(0, self.m_int_len, CANP_HIST__DISK_PART):
+			l_int_end = min(l_int_pos + CANP_HIST__DISK_PART, self.m_int_len)
+
+			l_any_vals = self.m_any_vals[l_int_pos:l_int_end]
+			if self.m_str_code is not None:
+				l_any_vals = l_any_vals.tolist()
+
+			yield from zip(self.m_arr_time[l_int_pos:l_int_end].tolist(), l_any_vals)
+
+	def list_time(self) -> List[float]:
+		""" Timestamps (list copy)
+		"""
+		return self.ring_span(self.m_arr_time).tolist()
+
+	def list_vals(self) -> List[Any]:
+		""" Values (list copy)
+		"""
+		l_list_ret: List[Any] = []
+
+		if self.m_str_code is None:
+			l_list_ret = self.ring_span(self.m_any_vals)
+		else:
+			l_list_ret = self.ring_span(self.m_any_vals).tolist()
+
+		return l_list_ret
+
+	def narr_time(self) -> Any:
+		""" Timestamps (numpy view, no copy, single copy if the ring wraps)
+		"""
+		return self.ring_narr(self.m_arr_time, np.dtype(np.float64))
+
+	def narr_vals(self) -> Any:
+		""" Values (numpy view, no copy, single copy if the ring wraps, object array copy if not typed)
+		"""
+		l_narr_ret: Any = None
+
+		if self.m_str_code is None:
+			l_narr_ret = np.empty(self.m_int_len, dtype = object)
+			l_narr_ret[:] = self.ring_span(self.m_any_vals)
+		else:
+			l_narr_ret = self.ring_narr(self.m_any_vals, np.dtype(self.m_str_code))
+
+		return l_narr_ret
+
+class canp_hist_runs:
+	""" Object history, change-only
+		Repeated values stored once as a run (first time, value, end), read as the full history
+		Exact runs (default) keep every timestamp, only the values are grouped
+		Spread runs (lossy, opt-in) keep the first and last time of a run, samples read evenly spread in between
+		A value sampled off the period of its spread run starts a new one (see 'runs_step')
+		Read times of a spread run are then off by CANP_HIST__RUNS_JITTER of its period at most (first and last exact)
+		Runs in a 'canp_hist' (first time, value), retention policy applied to the runs
+	"""
+
+	# Runs (first time, value)
+	m_obj_hist: Any = None
+	# Storage (CANP_HIST__RUNS_EXACT or CANP_HIST__RUNS_SPREAD)
+	m_int_runs: int = CANP_HIST__RUNS_EXACT
+	# End of each run (values appended until its end), last time of each run (spread runs)
+	# Parallel to the runs, dropped ones trimmed by parts
+	m_arr_end: Any = None
+	m_arr_last: Any = None
+	# First run kept (position in the parallel arrays), and its first value (values appended before it)
+	m_int_off: int = 0
+	m_int_base: int = 0
+	# Timestamps (exact runs), from value 'm_int_time' on (dropped ones trimmed by parts)
+	m_arr_time: Any = None
+	m_int_time: int = 0
+	# Last value and first time of its run (run extended while the same)
+	m_any_last: Any = None
+	m_float_first: float = 0.0
+	# Length (values)
+	m_int_len: int = 0
+
+	def __init__(self,
+				i_enum_typ: Any = None,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				i_int_runs: int = CANP_HIST__RUNS_EXACT,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+			'i_enum_typ' : DataType of the object (see 'canp_hist')
+			'i_tuple_keep' : retention policy of the runs (see 'canp_hist.keep_set')
+			'i_int_runs' : timestamps kept (CANP_HIST__RUNS_EXACT) or spread in runs (CANP_HIST__RUNS_SPREAD)
+		"""
+		super().__init__(**i_dict_args)
+
+		self.m_obj_hist = canp_hist(i_enum_typ, i_tuple_keep)
+		self.m_int_runs = i_int_runs
+		self.m_arr_end = array(CANP_HIST__CODE_RUNS)
+		self.m_arr_last = array(CANP_HIST__CODE_TIME)
+		self.m_int_off = 0
+		self.m_int_base = 0
+		self.m_arr_time = array(CANP_HIST__CODE_TIME)
+		self.m_int_time = 0
+		self.m_any_last = None
+		self.m_float_first = 0.0
+		self.m_int_len = 0
+
+	def __len__(self) -> int:
+		""" Size of (number of values, runs expanded)
+		"""
+		return self.m_int_len
+
+	def __getitem__(self,
+				i_any_pos: Any = -1
+			) -> Any:
+		""" Get at (time, value), list of them for a slice
+			Run found by bisection of the run ends
+		"""
+		l_any_ret: Any = None
+		l_int_pos: int = 0
+		l_int_run: int = 0
+
+		if isinstance(i_any_pos, slice):
+			l_any_ret = list(zip(self.list_time()[i_any_pos], self.list_vals()[i_any_pos]))
+		else:
+			if i_any_pos < 0:
+				i_any_pos += self.m_int_len
+
+			if i_any_pos < 0 or i_any_pos >= self.m_int_len:
+				raise IndexError("canp_hist_runs index out of range")
+
+			l_int_pos = self.m_int_base + i_any_pos
+			l_int_run = bisect_right(self.m_arr_end, l_int_pos, self.m_int_off)
+
+			l_any_ret = (
+				self.time_at(l_int_run, l_int_pos),
+				self.m_any_last if i_any_pos == self.m_int_len - 1 else self.m_obj_hist[l_int_run - self.m_int_off][1])
+
+		return l_any_ret
+
+	def __setitem__(self,
+				i_float_time: float,
+				i_any_val: Any
+			) -> None:
+		""" Value storing at timestamp (appended)
+		"""
+		self.append((i_float_time, i_any_val))
+
+	def __iter__(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of (time, value), runs expanded
+		"""
+		return zip(self.list_time(), self.list_vals())
+
+	def __eq__(self,
+				i_any_other: Any
+			) -> bool:
+		""" Same (time, value) sequence (history or list)
+		"""
+		l_bool_ret: bool = False
+
+		if isinstance(i_any_other, (canp_hist, canp_hist_runs, list)):
+			l_bool_ret = (list(self) == list(i_any_other))
+
+		return l_bool_ret
+
+	def items(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of (time, value), as 'canp_hist'
+		"""
+		return iter(self)
+
+	def __repr__(self) -> str:
+		""" Representation (as the list of (time, value))
+		"""
+		return repr(list(self))
+
+	def run_start(self,
+				i_int_run: int = 0
+			) -> int:
+		""" First value of a run (position in the parallel arrays)
+		"""
+		l_int_ret: int = self.m_int_base
+
+		if i_int_run > self.m_int_off:
+			l_int_ret = self.m_arr_end[i_int_run - 1]
+
+		return l_int_ret
+
+	def time_at(self,
+				i_int_run: int = 0,
+				i_int_pos: int = 0
+			) -> float:
+		""" Timestamp of a value (run position in the parallel arrays, value position from the first one appended)
+			Spread runs as 'narr_time' (same rounding)
+		"""
+		l_float_ret: float = 0.0
+		l_int_start: int = 0
+		l_int_cnt: int = 0
+		l_float_first: float = 0.0
+
+		if self.m_int_runs == CANP_HIST__RUNS_EXACT:
+			l_float_ret = self.m_arr_time[i_int_pos - self.m_int_time]
+		else:
+			l_int_start = self.run_start(i_int_run)
+			l_int_cnt = self.m_arr_end[i_int_run] - l_int_start
+
+			if i_int_pos == self.m_arr_end[i_int_run] - 1:
+				# Last times as stored (no rounding)
+				l_float_ret = self.m_arr_last[i_int_run]
+			else:
+				l_float_first = self.m_obj_hist[i_int_run - self.m_int_off][0]
+				l_float_ret = l_float_first + (i_int_pos - l_int_start) * (
+					(self.m_arr_last[i_int_run] - l_float_first) / max(l_int_cnt - 1, 1))
+
+		return l_float_ret
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+			) -> None:
+		""" Retention policy of the runs (see 'canp_hist.keep_set')
+		"""
+		self.m_obj_hist.keep_set(i_tuple_keep)
+		self.runs_trim()
+
+	def runs_trim(self) -> None:
+		""" Runs dropped by the retention policy removed from the parallel arrays (length updated)
+		"""
+		l_int_off: int = 0
+		l_int_base: int = 0
+
+		l_int_off = len(self.m_arr_end) - len(self.m_obj_hist)
+
+		if l_int_off > self.m_int_off:
+			l_int_base = self.m_arr_end[l_int_off - 1]
+			self.m_int_len -= l_int_base - self.m_int_base
+			self.m_int_base = l_int_base
+			self.m_int_off = l_int_off
+
+			# Amortized (at least as many runs, or values, as kept)
+			if self.m_int_off >= max(CANP_HIST__CAP_MIN, len(self.m_obj_hist)):
+				del self.m_arr_end[:self.m_int_off]
+				if self.m_int_runs == CANP_HIST__RUNS_SPREAD:
+					del self.m_arr_last[:self.m_int_off]
+				self.m_int_off = 0
+
+			if self.m_int_base - self.m_int_time >= max(CANP_HIST__CAP_MIN, self.m_int_len):
+				del self.m_arr_time[:self.m_int_base - self.m_int_time]
+				self.m_int_time = self.m_int_base
+
+	@staticmethod
+	def runs_step(
+				i_float_first: float = 0.0,
+				i_float_last: float = 0.0,
+				i_int_cnt: int = 0,
+				i_float_time: float = 0.0
+			) -> bool:
+		""" Timestamp on the period of a run (any for a single value, within CANP_HIST__RUNS_JITTER)
+		"""
+		l_bool_ret: bool = True
+		l_float_step: float = 0.0
+
+		if i_int_cnt > 1:
+			l_float_step = (i_float_last - i_float_first) / (i_int_cnt - 1)
+			l_bool_ret = abs(i_float_time - i_float_last - l_float_step) <= CANP_HIST__RUNS_JITTER * l_float_step
+
+		return l_bool_ret
+
+	def append(self,
+				i_tuple_val: Tuple[float, Any] = (0.0, None)
+			) -> None:
+		""" Value storing (time, value), last run extended if the same value (on its period, spread runs)
+		"""
+		self.extend_cols([i_tuple_val[0]], [i_tuple_val[1]])
+
+	def extend(self,
+				i_iter_val: Any = []
+			) -> None:
+		""" Values storing [(time, value), ...]
+		"""
+		l_list_val: List[Tuple[float, Any]] = list(i_iter_val)
+
+		if len(l_list_val) > 0:
+			self.extend_cols(
+				[l_tuple_val[0] for l_tuple_val in l_list_val],
+				[l_tuple_val[1] for l_tuple_val in l_list_val])
+
+	def extend_cols(self,
+				i_list_time: List[float] = [],
+				i_list_vals: List[Any] = []
+			) -> None:
+		""" Values storing (timestamps and values columns), same values grouped (on the period of their run, spread runs)
+		"""
+		l_list_first: List[float] = []
+		l_list_vals: List[Any] = []
+		l_list_last: List[float] = []
+		l_list_end: List[int] = []
+		l_bool_spread: bool = False
+		l_float_first: float = 0.0
+		l_float_last: float = 0.0
+		l_int_cnt: int = 0
+		l_int_pos: int = 0
+		l_any_last: Any = None
+
+		l_bool_spread = (self.m_int_runs == CANP_HIST__RUNS_SPREAD)
+		l_int_pos = self.m_int_base + self.m_int_len
+
+		if self.m_int_len > 0:
+			# Last run (stored)
+			l_float_first = self.m_float_first
+			l_int_cnt = self.m_arr_end[-1] - self.run_start(len(self.m_arr_end) - 1)
+			l_any_last = self.m_any_last
+			if l_bool_spread == True:
+				l_float_last = self.m_arr_last[-1]
+
+		for l_float_time, l_any_val in zip(i_list_time, i_list_vals):
+			if l_int_cnt > 0 and type(l_any_val) is type(l_any_last) and l_any_val == l_any_last \
+			and (l_bool_spread == False or canp_hist_runs.runs_step(l_float_first, l_float_last, l_int_cnt, l_float_time) == True):
+				l_float_last = l_float_time
+				l_int_cnt += 1
+			else:
+				if len(l_list_first) > 0:
+					l_list_last[-1] = l_float_last
+					l_list_end[-1] = l_int_pos
+				elif l_int_cnt > 0:
+					if l_bool_spread == True:
+						self.m_arr_last[-1] = l_float_last
+					self.m_arr_end[-1] = l_int_pos
+
+				l_list_first.append(l_float_time)
+				l_list_vals.append(l_any_val)
+				l_list_last.append(l_float_time)
+				l_list_end.append(0)
+
+				l_float_first = l_float_time
+				l_float_last = l_float_time
+				l_int_cnt = 1
+				l_any_last = l_any_val
+
+			l_int_pos += 1
+
+		self.m_int_len += len(i_list_time)
+
+		if l_bool_spread == False:
+			self.m_arr_time.extend(i_list_time)
+
+		if len(l_list_first) > 0:
+			l_list_last[-1] = l_float_last
+			l_list_end[-1] = l_int_pos
+
+			self.m_obj_hist.extend_cols(l_list_first, l_list_vals)
+			self.m_arr_end.extend(l_list_end)
+			if l_bool_spread == True:
+				self.m_arr_last.extend(l_list_last)
+			self.m_float_first = l_float_first
+			self.m_any_last = l_any_last
+			self.runs_trim()
+		elif l_int_cnt > 0:
+			if l_bool_spread == True:
+				self.m_arr_last[-1] = l_float_last
+			self.m_arr_end[-1] = l_int_pos
+
+	def runs(self) -> Iterator[Tuple[float, float, int, Any]]:
+		""" Iterator of runs (first time, last time, count, value)
+		"""
+		l_list_last: List[float] = []
+
+		if self.m_int_runs == CANP_HIST__RUNS_SPREAD:
+			l_list_last = self.m_arr_last[self.m_int_off:].tolist()
+		else:
+			l_list_last = [
+				self.m_arr_time[l_int_end - 1 - self.m_int_time]
+				for l_int_end in islice(self.m_arr_end, self.m_int_off, None)]
+
+		return zip(
+			self.m_obj_hist.list_time(),
+			l_list_last,
+			self.narr_cnt().tolist(),
+			self.m_obj_hist.list_vals())
+
+	def narr_cnt(self) -> Any:
+		""" Count of each run (numpy copy, the arrays keep growing)
+		"""
+		return np.diff(np.array(self.m_arr_end[self.m_int_off:], dtype = np.int64), prepend = self.m_int_base)
+
+	def list_time(self) -> List[float]:
+		""" Timestamps (list copy, runs expanded)
+		"""
+		return self.narr_time().tolist()
+
+	def list_vals(self) -> List[Any]:
+		""" Values (list copy, runs expanded)
+		"""
+		return list(chain.from_iterable(
+			repeat(l_any_val, l_int_cnt)
+			for l_any_val, l_int_cnt in zip(
+				self.m_obj_hist.list_vals(),
+				self.narr_cnt().tolist())))
+
+	def narr_time(self) -> Any:
+		""" Timestamps (numpy copy, spread runs expanded evenly from their first to their last time)
+		"""
+		l_narr_ret: Any = np.empty(0, dtype = np.float64)
+		l_narr_cnt: Any = None
+		l_narr_first: Any = None
+		l_narr_last: Any = None
+		l_narr_run: Any = None
+		l_narr_step: Any = None
+
+		if self.m_int_len > 0 and self.m_int_runs == CANP_HIST__RUNS_EXACT:
+			l_narr_ret = np.frombuffer(self.m_arr_time, dtype = np.float64)[
+				self.m_int_base - self.m_int_time:
+				self.m_int_base - self.m_int_time + self.m_int_len].copy()
+		elif self.m_int_len > 0:
+			l_narr_cnt = self.narr_cnt()
+			l_narr_first = self.m_obj_hist.narr_time()
+			l_narr_last = np.array(self.m_arr_last[self.m_int_off:], dtype = np.float64)
+
+			# Run of each value, and its position in the run
+			l_narr_run = np.repeat(np.arange(len(l_narr_cnt)), l_narr_cnt)
+			l_narr_step = (l_narr_last - l_narr_first) / np.maximum(l_narr_cnt - 1, 1)
+
+			l_narr_ret = np.arange(self.m_int_len) - np.repeat(np.cumsum(l_narr_cnt) - l_narr_cnt, l_narr_cnt)
+			l_narr_ret = l_narr_first[l_narr_run] + l_narr_ret * l_narr_step[l_narr_run]
+
+			# Last times as stored (no rounding)
+			l_narr_ret[np.cumsum(l_narr_cnt) - 1] = l_narr_last
+
+		return l_narr_ret
+
+	def narr_vals(self) -> Any:
+		""" Values (numpy copy, runs expanded)
+		"""
+		return np.repeat(self.m_obj_hist.narr_vals(), self.narr_cnt())
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	if True:
+		print("--- HISTORY ---")
+		l_obj_hist = canp_hist(enum_TYPE.Integer32)
+		l_obj_hist.extend_cols([0.1 * l_int_pos for l_int_pos in range(1000)], list(range(1000)))
+		l_obj_hist.append((100.0, -1))
+		print(f"{len(l_obj_hist)} values ({l_obj_hist.m_str_code}) : {l_obj_hist[-1]}")
+		print(f"bytes per value : {(l_obj_hist.m_arr_time.itemsize + l_obj_hist.m_any_vals.itemsize)}")
+		l_obj_hist.append((100.1, 1 << 40))
+		print(f"{len(l_obj_hist)} values ({l_obj_hist.m_str_code}) : {l_obj_hist.narr_vals()[-3:]}")
+
+		print("--- BOOLEAN ---")
+		l_obj_hist = canp_hist(enum_TYPE.Boolean)
+		l_obj_hist.extend_cols([0.0, 0.1], [False, True])
+		l_obj_hist.append((0.2, False))
+		print(f"{len(l_obj_hist)} values ({l_obj_hist.m_str_code}, {type(l_obj_hist.m_any_vals).__name__}) : {l_obj_hist.list_vals()}")
+
+		print("--- RETENTION ---")
+		l_obj_hist = canp_hist(enum_TYPE.Integer16, (100, 0.0, 0))
+		for l_int_pos in range(100000):
+			l_obj_hist.append((0.001 * l_int_pos, l_int_pos & 0x7FFF))
+		print(f"{len(l_obj_hist)} values, capacity {len(l_obj_hist.m_arr_time)} : {l_obj_hist[0]} .. {l_obj_hist[-1]}")
+		l_obj_hist.keep_set((0, 0.01, 0))
+		print(f"{len(l_obj_hist)} values (last 10 ms) : {l_obj_hist.narr_vals()}")
+
+		print("--- DISK ---")
+		canp_disk.budget_set(1 << 16)
+		l_obj_hist = canp_hist(enum_TYPE.Integer32)
+		for l_int_pos in range(0, 1000000, 1000):
+			l_obj_hist.extend_cols([0.001 * l_int_pos for l_int_pos in range(l_int_pos, l_int_pos + 1000)], list(range(l_int_pos, l_int_pos + 1000)))
+		print(f"{len(l_obj_hist)} values, on disk {l_obj_hist.m_bool_disk} ({l_obj_hist.m_arr_time.filename}) : {l_obj_hist[-1]}, {l_obj_hist.narr_vals()[-3:]}")
+		canp_disk.budget_set(0)
+
+		print("--- RUNS ---")
+		l_obj_hist = canp_hist_runs(enum_TYPE.Unsigned8)
+		for l_int_pos in range(100000):
+			l_obj_hist.append((0.01 * l_int_pos, (l_int_pos // 10000) & 0x01))
+		l_obj_hist.append((2000.0, 1))
+		print(f"{len(l_obj_hist)} values in {len(l_obj_hist.m_obj_hist)} runs : {list(l_obj_hist.runs())[-2:]}")
+		print(f"{l_obj_hist[9999]}, {l_obj_hist[10000]}, {l_obj_hist[-1]} : {l_obj_hist.narr_vals()[9998:10002]}")
+		l_list_time = [0.01 * l_int_pos + 0.000003 * ((l_int_pos * 7) % 5) for l_int_pos in range(100000)]
+		for l_int_runs in [CANP_HIST__RUNS_EXACT, CANP_HIST__RUNS_SPREAD]:
+			l_obj_hist = canp_hist_runs(enum_TYPE.Unsigned8, i_int_runs = l_int_runs)
+			l_obj_hist.extend_cols(l_list_time, [(l_int_pos // 10000) & 0x01 for l_int_pos in range(100000)])
+			print(f"runs {l_int_runs} : {len(l_obj_hist.m_obj_hist)} runs, time error {np.abs(l_obj_hist.narr_time() - l_list_time).max():.6f}, {l_obj_hist[54321]} ({l_list_time[54321]})")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -0,0 +1,1016 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_jour.py
+	Journal
+	Raw frames of a chan, stored once in order, read through index views (per cobid, per node)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from heapq import merge
+from itertools import islice
+
+from typing import Any
+#from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__VAL_DEFAULT
+
+
+from canp_disk import canp_disk
+
+
+from canp_hist import canp_hist
+
+from canp_hist import CANP_HIST__CAP_MIN
+
+from canp_hist import CANP_HIST__DISK_PART
+
+from canp_hist import CANP_HIST__KEEP_BYTES
+from canp_hist import CANP_HIST__KEEP_COUNT
+from canp_hist import CANP_HIST__KEEP_NONE
+from canp_hist import CANP_HIST__KEEP_TIME
+
+from canp_hist import dict_CANP_HIST__CODE_INT
+
+
+from canp_load import CANP_LOAD__DATA_MAX
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Journal positions typecode (index views)
+CANP_JOUR__CODE_SEQ = "q"
+
+# Frames appended between two index trims (at least, bounded journal only)
+CANP_JOUR__TRIM_MIN = 1024
+
+# Columns typecodes (time, cobid, dlc, data bytes)
+CANP_JOUR__CODE_TIME = "d"
+CANP_JOUR__CODE_COBID = "H"
+CANP_JOUR__CODE_COBID_EXT = "I"		# Extended cobids (29 bits)
+CANP_JOUR__CODE_BYTE = "B"
+
+# Payload row once longer payloads were seen (CAN FD, see 'canp_jour.data_wide')
+CANP_JOUR__DATA_WIDE = 64
+
+#  --- CLASS ---
+
+class canp_jour:
+	""" Raw frames journal (one per chan)
+		Frames appended once in typed columns (time, cobid, dlc, data of CANP_LOAD__DATA_MAX bytes per frame)
+		Payload rows widened once a longer payload is stored (CAN FD, see 'data_wide')
+		Cobid and node index views hold journal positions (frames sharing a timestamp all kept)
+		Broadcast frames (sync) are indexed once, read by every node existing at that time
+		Read as the former dict of raw frames (key = cobid, CANP_ENUM__VAL_DEFAULT = last cobid)
+		With a retention policy the oldest frames are dropped from the head (rows moved back when half used)
+		Without, the columns switch to column files past the RAM budget (see 'disk_spill')
+	"""
+
+	# Timestamps (array, capacity >= rows)
+	m_arr_time: Any = None
+	# Cobids (array of 'm_str_cobid', same capacity)
+	m_arr_cobid: Any = None
+	m_str_cobid: str = CANP_JOUR__CODE_COBID
+	# Payload lengths (array, same capacity)
+	m_arr_dlc: Any = None
+	# Payloads (array of 'm_int_data' bytes per frame, zero padded)
+	m_arr_data: Any = None
+	m_int_data: int = CANP_LOAD__DATA_MAX
+	# Oldest frame kept (row), and row of the next frame
+	m_int_head: int = 0
+	m_int_end: int = 0
+
+	# Frames appended (position of the next one)
+	m_int_seq: int = 0
+	# Positions of each cobid (key = cobid)
+	m_dict_cobs: Dict[int, Any] = None
+	# Positions of the frames each node stored (key = node index)
+	m_dict_nodes: Dict[int, Any] = None
+	# Positions of the broadcast frames (shared by every node)
+	m_arr_bcast: Any = None
+	# Position of the first broadcast frame of each node (key = node index)
+	m_dict_born: Dict[int, int] = None
+	# Positions of each node merged with the broadcast frames (key = node index, value = [positions, last own, last broadcast])
+	m_dict_views: Dict[int, List[Any]] = None
+	# Last cobid (CANP_ENUM__VAL_DEFAULT if none)
+	m_int_last: int = CANP_ENUM__VAL_DEFAULT
+	# Position of the next index trim (bounded journal)
+	m_int_trim: int = 0
+
+	# Retention policy (count, seconds, bytes)
+	m_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+	# Frames kept (0 : unbounded)
+	m_int_keep: int = 0
+	# Seconds kept (0.0 : unbounded)
+	m_float_keep: float = 0.0
+
+	# Columns in column files (memmaps)
+	m_bool_disk: bool = False
+	# Bytes in RAM (counted in 'canp_disk.m_int_ram')
+	m_int_ram: int = 0
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("jour")
+
+	def __init__(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+			'i_tuple_keep' : retention policy of the frames (see 'keep_set')
+		"""
+		super().__init__(**i_dict_args)
+
+		self.m_arr_time = array(CANP_JOUR__CODE_TIME)
+		self.m_str_cobid = CANP_JOUR__CODE_COBID
+		self.m_arr_cobid = array(self.m_str_cobid)
+		self.m_arr_dlc = array(CANP_JOUR__CODE_BYTE)
+		self.m_arr_data = array(CANP_JOUR__CODE_BYTE)
+		self.m_int_data = CANP_LOAD__DATA_MAX
+		self.m_int_head = 0
+		self.m_int_end = 0
+
+		self.m_int_seq = 0
+		self.m_dict_cobs = {}
+		self.m_dict_nodes = {}
+		self.m_arr_bcast = array(CANP_JOUR__CODE_SEQ)
+		self.m_dict_born = {}
+		self.m_dict_views = {}
+		self.m_int_last = CANP_ENUM__VAL_DEFAULT
+		self.m_int_trim = 0
+
+		if i_tuple_keep != CANP_HIST__KEEP_NONE:
+			self.keep_set(i_tuple_keep)
+
+	def __len__(self) -> int:
+		""" Size of (number of frames kept)
+		"""
+		return self.m_int_end - self.m_int_head
+
+	def __iter__(self) -> Iterator[Tuple[float, Tuple[int, Any]]]:
+		""" Iterator of (time, (cobid, data)), in order (read by parts)
+		"""
+		l_int_base: int = 0
+
+		l_int_base = self.seq_base()
+
+		for l_int_pos in range(0, len(self), CANP_HIST__DISK_PART):
+			yield from self.frames(np.arange(
+				l_int_base + l_int_pos,
+				l_int_base + min(l_int_pos + CANP_HIST__DISK_PART, len(self))))
+
+	def __contains__(self,
+				i_int_cobid: int = 0
+			) -> bool:
+		""" Cobid present (or last cobid, if any)
+		"""
+		l_bool_ret: bool = False
+
+		if i_int_cobid == CANP_ENUM__VAL_DEFAULT:
+			l_bool_ret = (self.m_int_last != CANP_ENUM__VAL_DEFAULT)
+		else:
+			l_bool_ret = (i_int_cobid in self.m_dict_cobs)
+
+		return l_bool_ret
+
+	def __getitem__(self,
+				i_int_cobid: int = 0
+			) -> Any:
+		""" Get at (frames of a cobid as (time, data), last cobid for CANP_ENUM__VAL_DEFAULT, KeyError if absent)
+		"""
+		l_any_ret: Any = None
+
+		if i_int_cobid == CANP_ENUM__VAL_DEFAULT:
+			if self.m_int_last == CANP_ENUM__VAL_DEFAULT:
+				raise KeyError(i_int_cobid)
+			l_any_ret = self.m_int_last
+		else:
+			l_any_ret = canp_jour_view(self, self.m_dict_cobs[i_int_cobid], True)
+
+		return l_any_ret
+
+	def keys(self) -> List[int]:
+		""" Cobids (in order of appearance)
+		"""
+		return list(self.m_dict_cobs.keys())
+
+	def items(self) -> Iterator[Tuple[int, Any]]:
+		""" Iterator of (cobid, frames), then (CANP_ENUM__VAL_DEFAULT, last cobid), as the former dict
+		"""
+		for l_int_cobid in self.keys():
+			yield (l_int_cobid, self[l_int_cobid])
+
+		if self.m_int_last != CANP_ENUM__VAL_DEFAULT:
+			yield (CANP_ENUM__VAL_DEFAULT, self.m_int_last)
+
+	def __repr__(self) -> str:
+		""" Representation (as the former dict)
+		"""
+		return repr(dict(self.items()))
+
+	def __del__(self) -> None:
+		""" Destructor (RAM given back to the budget, column files removed)
+		"""
+		canp_disk.m_int_ram -= self.m_int_ram
+		self.m_int_ram = 0
+
+		self.disk_free()
+
+	def seq_base(self) -> int:
+		""" Position of the oldest frame kept
+		"""
+		return self.m_int_seq - len(self)
+
+	def size_row(self) -> int:
+		""" Bytes per frame (every column)
+		"""
+		return array(CANP_JOUR__CODE_TIME).itemsize \
+			+ array(self.m_str_cobid).itemsize \
+			+ array(CANP_JOUR__CODE_BYTE).itemsize * (1 + self.m_int_data)
+
+	def narr_bufs(self) -> Tuple[Any, Any, Any, Any]:
+		""" Columns as (time, cobid, dlc, data) (numpy views of the whole capacity, data as rows of 'm_int_data' bytes)
+		"""
+		l_list_ret: List[Any] = []
+
+		if self.m_bool_disk == True:
+			l_list_ret = [self.m_arr_time, self.m_arr_cobid, self.m_arr_dlc, self.m_arr_data]
+		else:
+			l_list_ret = [
+				np.frombuffer(self.m_arr_time, dtype = np.float64),
+				np.frombuffer(self.m_arr_cobid, dtype = np.dtype(self.m_str_cobid)),
+				np.frombuffer(self.m_arr_dlc, dtype = np.uint8),
+				np.frombuffer(self.m_arr_data, dtype = np.uint8)]
+
+		l_list_ret[3] = l_list_ret[3].reshape(-1, self.m_int_data)
+
+		return tuple(l_list_ret)
+
+	def narr_cols(self) -> Tuple[Any, Any, Any, Any]:
+		""" Frames kept as (time, cobid, dlc, data) columns (numpy views, no copy, see 'narr_bufs')
+		"""
+		return tuple(
+			l_narr_col[self.m_int_head:self.m_int_end]
+			for l_narr_col in self.narr_bufs())
+
+	def frame(self,
+				i_int_seq: int = 0
+			) -> Tuple[float, Tuple[int, Any]]:
+		""" Frame at position (time, (cobid, data)), IndexError if dropped
+		"""
+		l_int_pos: int = i_int_seq - self.seq_base()
+		l_int_row: int = 0
+		l_int_dlc: int = 0
+
+		if l_int_pos < 0:
+			raise IndexError("canp_jour frame dropped")
+
+		if l_int_pos >= len(self):
+			raise IndexError("canp_jour index out of range")
+
+		l_int_row = self.m_int_head + l_int_pos
+		l_int_dlc = int(self.m_arr_dlc[l_int_row])
+
+		return (
+			float(self.m_arr_time[l_int_row]),
+			(int(self.m_arr_cobid[l_int_row]),
+			bytearray(self.m_arr_data[
+				l_int_row * self.m_int_data:
+				l_int_row * self.m_int_data + l_int_dlc])))
+
+	def frames(self,
+				i_any_seqs: Any = []
+			) -> List[Tuple[float, Tuple[int, Any]]]:
+		""" Frames at positions (time, (cobid, data)), gathered from the columns at once
+		"""
+		l_narr_row: Any = None
+		l_bytes_data: bytes = b""
+
+		l_narr_row = np.asarray(i_any_seqs, dtype = np.int64) - self.seq_base()
+		l_narr_time, l_narr_cobid, l_narr_dlc, l_narr_data = self.narr_cols()
+		l_bytes_data = l_narr_data[l_narr_row].tobytes()
+
+		return [
+			(l_float_time, (l_int_cobid, bytearray(l_bytes_data[l_int_pos:l_int_pos + l_int_dlc])))
+			for l_float_time, l_int_cobid, l_int_dlc, l_int_pos in zip(
+				l_narr_time[l_narr_row].tolist(),
+				l_narr_cobid[l_narr_row].tolist(),
+				l_narr_dlc[l_narr_row].tolist(),
+				range(0, len(l_bytes_data), self.m_int_data))]
+
+	def append(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: Any = b''
+			) -> int:
+		""" Frame storing (returns its position)
+		"""
+		l_int_ret: int = self.m_int_seq
+		l_int_row: int = 0
+
+		if self.m_int_end >= len(self.m_arr_time):
+			self.cap_grow(1)
+
+		if i_int_cobid > dict_CANP_HIST__CODE_INT[self.m_str_cobid][1]:
+			self.cobid_wide()
+
+		if len(i_any_data) > self.m_int_data:
+			self.data_wide(len(i_any_data))
+
+		l_int_row = self.m_int_end
+		self.m_arr_time[l_int_row] = i_float_time
+		self.m_arr_cobid[l_int_row] = i_int_cobid
+		self.m_arr_dlc[l_int_row] = len(i_any_data)
+		memoryview(self.m_arr_data)[
+			l_int_row * self.m_int_data:
+			(l_int_row + 1) * self.m_int_data] = bytes(i_any_data).ljust(self.m_int_data, b'\x00')
+		self.m_int_end += 1
+
+		try:
+			self.m_dict_cobs[i_int_cobid].append(l_int_ret)
+			# - except KeyError -
+		except KeyError:
+			self.m_dict_cobs[i_int_cobid] = array(CANP_JOUR__CODE_SEQ, [l_int_ret])
+
+		self.m_int_last = i_int_cobid
+		self.m_int_seq += 1
+
+		if self.m_tuple_keep != CANP_HIST__KEEP_NONE:
+			self.keep_drop()
+
+			if self.m_int_seq >= self.m_int_trim:
+				self.seqs_trim()
+
+		return l_int_ret
+
+	def extend(self,
+				i_list_time: List[float] = [],
+				i_list_cobid: List[int] = [],
+				i_list_data: List[Any] = []
+			) -> int:
+		""" Frames storing, in order (returns the position of the first one)
+			Payloads joined, then scattered into their rows (see 'canp_load.narr_list')
+		"""
+		l_narr_dlc: Any = None
+		l_narr_byte: Any = None
+		l_narr_data: Any = None
+		l_int_data: int = CANP_LOAD__DATA_MAX
+
+		l_narr_dlc = np.fromiter(map(len, i_list_data), dtype = np.int64, count = len(i_list_data))
+		l_narr_byte = np.frombuffer(b"".join(map(bytes, i_list_data)), dtype = np.uint8)
+		if len(l_narr_dlc) > 0:
+			# Longer payloads (CAN FD) in wider rows
+			l_int_data = max(l_int_data, int(l_narr_dlc.max()))
+		l_narr_data = np.zeros((len(i_list_data), l_int_data), dtype = np.uint8)
+		l_narr_data[
+			np.repeat(np.arange(len(i_list_data)), l_narr_dlc),
+			np.arange(len(l_narr_byte)) - np.repeat(np.cumsum(l_narr_dlc) - l_narr_dlc, l_narr_dlc)] = l_narr_byte
+
+		return self.extend_cols(i_list_time, i_list_cobid, l_narr_dlc, l_narr_data)
+
+	def extend_cols(self,
+				i_any_time: Any = [],
+				i_any_cobid: Any = [],
+				i_any_dlc: Any = [],
+				i_any_data: Any = []
+			) -> int:
+		""" Frames storing from columns (time, cobid, dlc, data as rows of CANP_LOAD__DATA_MAX bytes or more), in order
+			Returns the position of the first one
+		"""
+		l_int_ret: int = self.m_int_seq
+		l_int_cnt: int = 0
+		l_narr_cobid: Any = None
+		l_narr_seq: Any = None
+		l_narr_order: Any = None
+		l_narr_uniq: Any = None
+		l_narr_first: Any = None
+		l_list_bound: List[int] = []
+		l_narr_data: Any = None
+		l_int_data: int = 0
+
+		l_int_cnt = len(i_any_time)
+
+		if l_int_cnt > 0:
+			l_narr_cobid = np.asarray(i_any_cobid, dtype = np.int64)
+			l_narr_data = np.asarray(i_any_data, dtype = np.uint8).reshape(l_int_cnt, -1)
+			l_int_data = l_narr_data.shape[1]
+
+			if self.m_int_end + l_int_cnt > len(self.m_arr_time):
+				self.cap_grow(l_int_cnt)
+
+			if int(l_narr_cobid.max()) > dict_CANP_HIST__CODE_INT[self.m_str_cobid][1]:
+				self.cobid_wide()
+
+			if l_int_data > self.m_int_data:
+				self.data_wide(l_int_data)
+
+			l_tuple_buf = self.narr_bufs()
+			for l_narr_buf, l_any_col in zip(l_tuple_buf, [i_any_time, l_narr_cobid, i_any_dlc]):
+				l_narr_buf[self.m_int_end:self.m_int_end + l_int_cnt] = l_any_col
+
+			# Narrower rows zero padded (rows may be reused)
+			l_tuple_buf[3][self.m_int_end:self.m_int_end + l_int_cnt, :l_int_data] = l_narr_data
+			l_tuple_buf[3][self.m_int_end:self.m_int_end + l_int_cnt, l_int_data:] = 0
+			self.m_int_end += l_int_cnt
+
+			# Positions of each cobid (grouped once, cobids in order of appearance)
+			l_narr_seq = np.arange(l_int_ret, l_int_ret + l_int_cnt, dtype = np.int64)
+			l_narr_order = np.argsort(l_narr_cobid, kind = "stable")
+			l_narr_uniq, l_narr_first = np.unique(l_narr_cobid[l_narr_order], return_index = True)
+			l_list_bound = l_narr_first.tolist() + [l_int_cnt]
+
+			for l_int_first, l_int_uniq in sorted(zip(l_narr_order[l_narr_first].tolist(), range(len(l_narr_uniq)))):
+				l_arr_seqs = self.m_dict_cobs.setdefault(int(l_narr_uniq[l_int_uniq]), array(CANP_JOUR__CODE_SEQ))
+				l_arr_seqs.frombytes(l_narr_seq[l_narr_order[l_list_bound[l_int_uniq]:l_list_bound[l_int_uniq + 1]]].tobytes())
+
+			self.m_int_last = int(l_narr_cobid[-1])
+			self.m_int_seq += l_int_cnt
+
+			if self.m_tuple_keep != CANP_HIST__KEEP_NONE:
+				self.keep_drop()
+
+				if self.m_int_seq >= self.m_int_trim:
+					self.seqs_trim()
+
+		return l_int_ret
+
+	def cap_grow(self,
+				i_int_cnt: int = 0
+			) -> None:
+		""" Room made for 'i_int_cnt' more frames (kept frames moved to the first rows, capacity doubled if needed)
+			New columns (views given before keep the previous ones)
+			Unbounded journal past the RAM budget switches to column files
+		"""
+		l_int_len: int = 0
+		l_int_need: int = 0
+		l_int_cap: int = 0
+		l_int_more: int = 0
+		l_tuple_src: Tuple[Any, Any, Any, Any] = ()
+
+		l_int_len = len(self)
+		l_int_need = l_int_len + i_int_cnt
+		if self.m_int_head > 0:
+			# Room for as many frames as kept (rows moved back once per as many frames appended)
+			l_int_need += l_int_len
+
+		l_int_cap = max(CANP_HIST__CAP_MIN, len(self.m_arr_time))
+		while l_int_cap < l_int_need:
+			l_int_cap *= 2
+
+		if l_int_cap > len(self.m_arr_time) and self.m_bool_disk == False and self.m_int_keep == 0:
+			l_int_more = l_int_cap * self.size_row() - self.m_int_ram
+			if canp_disk.ram_take(l_int_more) == True:
+				self.m_int_ram += l_int_more
+			elif self.m_tuple_keep == CANP_HIST__KEEP_NONE:
+				self.disk_spill(l_int_cap)
+
+		if self.m_bool_disk == True:
+			# Files extended (no retention, oldest frame on the first row)
+			if l_int_cap > len(self.m_arr_time):
+				self.m_arr_time = canp_disk.narr_grow(self.m_arr_time, l_int_cap)
+				self.m_arr_cobid = canp_disk.narr_grow(self.m_arr_cobid, l_int_cap)
+				self.m_arr_dlc = canp_disk.narr_grow(self.m_arr_dlc, l_int_cap)
+				self.m_arr_data = canp_disk.narr_grow(self.m_arr_data, l_int_cap * self.m_int_data)
+		elif l_int_cap > len(self.m_arr_time) or self.m_int_head > 0:
+			# Kept frames copied to the first rows (new columns, or moved back in place)
+			l_tuple_src = self.narr_cols()
+
+			if l_int_cap > len(self.m_arr_time):
+				self.m_arr_time = array(CANP_JOUR__CODE_TIME, bytes(array(CANP_JOUR__CODE_TIME).itemsize * l_int_cap))
+				self.m_arr_cobid = array(self.m_str_cobid, bytes(array(self.m_str_cobid).itemsize * l_int_cap))
+				self.m_arr_dlc = array(CANP_JOUR__CODE_BYTE, bytes(l_int_cap))
+				self.m_arr_data = array(CANP_JOUR__CODE_BYTE, bytes(l_int_cap * self.m_int_data))
+
+			for l_narr_buf, l_narr_src in zip(self.narr_bufs(), l_tuple_src):
+				l_narr_buf[:l_int_len] = l_narr_src
+
+			self.m_int_head = 0
+			self.m_int_end = l_int_len
+
+	def cobid_wide(self) -> None:
+		""" Cobids column switched to extended cobids (values kept)
+		"""
+		l_narr_cobid: Any = None
+
+		l_narr_cobid = self.narr_bufs()[1][:self.m_int_end]
+		self.m_str_cobid = CANP_JOUR__CODE_COBID_EXT
+
+		if self.m_bool_disk == True:
+			self.m_arr_cobid = canp_disk.narr_new(np.dtype(self.m_str_cobid), len(self.m_arr_time))
+			self.m_arr_cobid[:self.m_int_end] = l_narr_cobid
+			canp_disk.file_del(l_narr_cobid.filename)
+		else:
+			self.m_arr_cobid = array(self.m_str_cobid, bytes(array(self.m_str_cobid).itemsize * len(self.m_arr_time)))
+			self.narr_bufs()[1][:self.m_int_end] = l_narr_cobid
+
+		if self.m_tuple_keep[CANP_HIST__KEEP_BYTES]:
+			# Budget in frames of the new width
+			self.keep_count()
+
+	def data_wide(self,
+				i_int_len: int = 0
+			) -> None:
+		""" Payloads column switched to rows of at least 'i_int_len' bytes (CANP_JOUR__DATA_WIDE, payloads kept)
+		"""
+		l_narr_data: Any = None
+		l_any_old: Any = None
+		l_int_data: int = 0
+
+		l_narr_data = self.narr_bufs()[3][:self.m_int_end]
+		l_any_old = self.m_arr_data
+		l_int_data = self.m_int_data
+		self.m_int_data = max(CANP_JOUR__DATA_WIDE, i_int_len)
+
+		if self.m_bool_disk == True:
+			self.m_arr_data = canp_disk.narr_new(np.uint8, len(self.m_arr_time) * self.m_int_data)
+			self.narr_bufs()[3][:self.m_int_end, :l_int_data] = l_narr_data
+			canp_disk.file_del(l_any_old.filename)
+		else:
+			self.m_arr_data = array(CANP_JOUR__CODE_BYTE, bytes(len(self.m_arr_time) * self.m_int_data))
+			self.narr_bufs()[3][:self.m_int_end, :l_int_data] = l_narr_data
+
+		self.m_logs.debug(f"jour.data_wide.len[{self.m_int_data}]")
+
+		if self.m_tuple_keep[CANP_HIST__KEEP_BYTES]:
+			# Budget in frames of the new width
+			self.keep_count()
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+			) -> None:
+		""" Retention policy of the frames (count, seconds, bytes), 0 : unbounded (see 'canp_hist.keep_set')
+			Index views follow (positions of dropped frames trimmed)
+		"""
+		self.m_tuple_keep = tuple(i_tuple_keep)
+		self.m_float_keep = float(self.m_tuple_keep[CANP_HIST__KEEP_TIME] or 0.0)
+
+		self.keep_count()
+		self.keep_drop()
+
+		if self.m_tuple_keep != CANP_HIST__KEEP_NONE \
+		and (self.m_bool_disk == True or len(self.m_arr_time) > 2 * max(CANP_HIST__CAP_MIN, len(self))):
+			# Bounded journal in RAM only, capacity fit to the frames kept
+			self.cols_fit()
+
+		self.seqs_trim()
+
+	def keep_count(self) -> None:
+		""" Frames kept from the retention policy (count, and byte budget over the bytes per frame)
+		"""
+		l_int_keep: int = 0
+		l_int_bytes: int = 0
+
+		l_int_keep = int(self.m_tuple_keep[CANP_HIST__KEEP_COUNT] or 0)
+		l_int_bytes = int(self.m_tuple_keep[CANP_HIST__KEEP_BYTES] or 0)
+
+		if l_int_bytes > 0:
+			l_int_bytes = max(1, l_int_bytes // self.size_row())
+			if l_int_keep == 0 or l_int_bytes < l_int_keep:
+				l_int_keep = l_int_bytes
+
+		self.m_int_keep = l_int_keep
+
+	def keep_drop(self) -> None:
+		""" Oldest frames dropped (past the frames kept, or older than the newest timestamp minus the seconds kept)
+		"""
+		l_int_head: int = 0
+		l_float_min: float = 0.0
+
+		l_int_head = self.m_int_head
+
+		if self.m_int_keep > 0:
+			l_int_head = max(l_int_head, self.m_int_end - self.m_int_keep)
+
+		if self.m_float_keep > 0.0 and self.m_int_end > l_int_head:
+			# Newest one kept
+			l_float_min = self.m_arr_time[self.m_int_end - 1] - self.m_float_keep
+			while self.m_int_end - l_int_head > 1 and self.m_arr_time[l_int_head] < l_float_min:
+				l_int_head += 1
+
+		self.m_int_head = l_int_head
+
+	def disk_spill(self,
+				i_int_cap: int = 0
+			) -> None:
+		""" Columns moved to column files of capacity 'i_int_cap' (RAM given back to the budget)
+			Reads stay the same (frames, views, numpy columns), appends grow the files
+		"""
+		l_tuple_src: Tuple[Any, Any, Any, Any] = ()
+		l_int_len: int = 0
+
+		l_tuple_src = self.narr_cols()
+		l_int_len = len(self)
+
+		self.m_arr_time = canp_disk.narr_new(np.float64, i_int_cap)
+		self.m_arr_cobid = canp_disk.narr_new(np.dtype(self.m_str_cobid), i_int_cap)
+		self.m_arr_dlc = canp_disk.narr_new(np.uint8, i_int_cap)
+		self.m_arr_data = canp_disk.narr_new(np.uint8, i_int_cap * self.m_int_data)
+		self.m_bool_disk = True
+
+		for l_narr_buf, l_narr_src in zip(self.narr_bufs(), l_tuple_src):
+			l_narr_buf[:l_int_len] = l_narr_src
+
+		self.m_int_head = 0
+		self.m_int_end = l_int_len
+
+		canp_disk.m_int_ram -= self.m_int_ram
+		self.m_int_ram = 0
+
+		self.m_logs.debug(f"jour.disk_spill.file[{self.m_arr_time.filename}].len[{l_int_len}]")
+
+	def cols_fit(self) -> None:
+		""" Columns copied to arrays of the frames kept (column files removed, capacity grown again by the next frames)
+		"""
+		l_list_col: List[Any] = []
+		l_tuple_src: Tuple[Any, Any, Any, Any] = ()
+
+		l_list_col = [self.m_arr_time, self.m_arr_cobid, self.m_arr_dlc, self.m_arr_data]
+		l_tuple_src = self.narr_cols()
+
+		self.m_arr_time = array(CANP_JOUR__CODE_TIME, l_tuple_src[0].tobytes())
+		self.m_arr_cobid = array(self.m_str_cobid, l_tuple_src[1].tobytes())
+		self.m_arr_dlc = array(CANP_JOUR__CODE_BYTE, l_tuple_src[2].tobytes())
+		self.m_arr_data = array(CANP_JOUR__CODE_BYTE, l_tuple_src[3].tobytes())
+		self.m_int_end -= self.m_int_head
+		self.m_int_head = 0
+
+		if self.m_bool_disk == True:
+			self.m_bool_disk = False
+
+			for l_narr_col in l_list_col:
+				canp_disk.file_del(l_narr_col.filename)
+
+	def disk_free(self) -> None:
+		""" Column files removed (journal left without frames)
+		"""
+		if self.m_bool_disk == True:
+			for l_narr_col in [self.m_arr_time, self.m_arr_cobid, self.m_arr_dlc, self.m_arr_data]:
+				canp_disk.file_del(l_narr_col.filename)
+
+			self.m_arr_time = array(CANP_JOUR__CODE_TIME)
+			self.m_arr_cobid = array(self.m_str_cobid)
+			self.m_arr_dlc = array(CANP_JOUR__CODE_BYTE)
+			self.m_arr_data = array(CANP_JOUR__CODE_BYTE)
+			self.m_int_head = 0
+			self.m_int_end = 0
+			self.m_bool_disk = False
+
+	def node_add(self,
+				i_int_node: int = 0,
+				i_list_seq: List[int] = []
+			) -> None:
+		""" Frames stored by a node (positions, in order)
+		"""
+		try:
+			self.m_dict_nodes[i_int_node].extend(i_list_seq)
+			# - except KeyError -
+		except KeyError:
+			self.m_dict_nodes[i_int_node] = array(CANP_JOUR__CODE_SEQ, i_list_seq)
+
+	def node_born(self,
+				i_int_node: int = 0,
+				i_int_seq: int = 0
+			) -> None:
+		""" Broadcast frames read by a node from position 'i_int_seq' on (first call only)
+		"""
+		self.m_dict_born.setdefault(i_int_node, i_int_seq)
+
+	def bcast_add(self,
+				i_list_seq: List[int] = []
+			) -> None:
+		""" Broadcast frames (positions, in order), read by every node born before
+		"""
+		self.m_arr_bcast.extend(i_list_seq)
+
+	def node_seqs(self,
+				i_int_node: int = 0
+			) -> Any:
+		""" Positions of the frames of a node (None if none)
+			Broadcast frames merged in order once, positions added since merged at the next call (tail only)
+		"""
+		l_arr_ret: Any = None
+		l_list_view: List[Any] = []
+		l_arr_own: Any = None
+		l_int_own: int = 0
+		l_int_bcast: int = 0
+		l_int_pos: int = 0
+
+		l_arr_own = self.m_dict_nodes.get(i_int_node)
+
+		if i_int_node not in self.m_dict_born:
+			# No broadcast frame (own positions shared)
+			l_arr_ret = l_arr_own
+		else:
+			if l_arr_own is None:
+				l_arr_own = array(CANP_JOUR__CODE_SEQ)
+
+			l_list_view = self.m_dict_views.setdefault(i_int_node, [
+				array(CANP_JOUR__CODE_SEQ),
+				CANP_ENUM__VAL_DEFAULT,
+				CANP_ENUM__VAL_DEFAULT])
+
+			# Positions not merged yet (appended after the last ones merged)
+			l_int_own = bisect_right(l_arr_own, l_list_view[1])
+			l_int_bcast = max(
+				bisect_right(self.m_arr_bcast, l_list_view[2]),
+				bisect_left(self.m_arr_bcast, self.m_dict_born[i_int_node]))
+
+			if l_int_own < len(l_arr_own) or l_int_bcast < len(self.m_arr_bcast):
+				l_int_pos = bisect_left(l_list_view[0], min(
+					l_arr_own[l_int_own] if l_int_own < len(l_arr_own) else self.m_int_seq,
+					self.m_arr_bcast[l_int_bcast] if l_int_bcast < len(self.m_arr_bcast) else self.m_int_seq))
+
+				l_list_view[0][l_int_pos:] = array(CANP_JOUR__CODE_SEQ, merge(
+					islice(l_list_view[0], l_int_pos, None),
+					islice(l_arr_own, l_int_own, None),
+					islice(self.m_arr_bcast, l_int_bcast, None)))
+
+				if len(l_arr_own) > 0:
+					l_list_view[1] = l_arr_own[-1]
+				if len(self.m_arr_bcast) > 0:
+					l_list_view[2] = self.m_arr_bcast[-1]
+
+			if len(l_list_view[0]) > 0 or i_int_node in self.m_dict_nodes:
+				l_arr_ret = l_list_view[0]
+
+		return l_arr_ret
+
+	def node_view(self,
+				i_int_node: int = 0
+			) -> Any:
+		""" Frames stored by a node as (time, (cobid, data)) (None if none, as the former dict)
+			Broadcast frames merged in order (view follows the frames appended or dropped, see 'node_seqs')
+		"""
+		l_any_ret: Any = None
+
+		if self.node_seqs(i_int_node) is not None:
+			l_any_ret = canp_jour_view(self, None, False, i_int_node)
+
+		return l_any_ret
+
+	def seqs_trim(self) -> None:
+		""" Positions of dropped frames removed from the index views
+		"""
+		l_int_base: int = 0
+
+		l_int_base = self.seq_base()
+
+		for l_dict_seqs in [
+				self.m_dict_cobs,
+				self.m_dict_nodes,
+				{None: self.m_arr_bcast},
+				{l_int_node: l_list_view[0] for l_int_node, l_list_view in self.m_dict_views.items()}]:
+			for l_any_key, l_arr_seqs in list(l_dict_seqs.items()):
+				if len(l_arr_seqs) > 0 and l_arr_seqs[0] < l_int_base:
+					del l_arr_seqs[:bisect_left(l_arr_seqs, l_int_base)]
+					if len(l_arr_seqs) == 0 and l_dict_seqs is self.m_dict_cobs:
+						del l_dict_seqs[l_any_key]
+
+		# Amortized (at least as many frames as kept)
+		self.m_int_trim = self.m_int_seq + max(CANP_JOUR__TRIM_MIN, len(self))
+
+class canp_jour_view:
+	""" Journal index view
+		Frames of a cobid as (time, data), or of a node as (time, (cobid, data))
+		Positions shared with the journal (view follows the frames appended or dropped)
+	"""
+
+	# Journal
+	m_obj_jour: Any = None
+	# Journal positions (array, None for a node view)
+	m_arr_seqs: Any = None
+	# Frames read as (time, data)
+	m_bool_data: bool = False
+	# Node (positions merged with the broadcast frames, see 'canp_jour.node_seqs')
+	m_int_node: Optional[int] = None
+
+	def __init__(self,
+				i_obj_jour: Any = None,
+				i_arr_seqs: Any = None,
+				i_bool_data: bool = False,
+				i_int_node: Optional[int] = None
+			) -> None:
+		""" Constructor
+			'i_bool_data' : frames read as (time, data) (cobid view), otherwise (time, (cobid, data))
+			'i_int_node' : node view (positions from the journal at each read, 'i_arr_seqs' unused)
+		"""
+		self.m_obj_jour = i_obj_jour
+		self.m_arr_seqs = i_arr_seqs
+		self.m_bool_data = i_bool_data
+		self.m_int_node = i_int_node
+
+	def seqs(self) -> Any:
+		""" Journal positions (array)
+		"""
+		l_arr_ret: Any = self.m_arr_seqs
+
+		if self.m_int_node is not None:
+			l_arr_ret = self.m_obj_jour.node_seqs(self.m_int_node)
+			if l_arr_ret is None:
+				l_arr_ret = array(CANP_JOUR__CODE_SEQ)
+
+		return l_arr_ret
+
+	def seq_first(self,
+				i_arr_seqs: Any = None
+			) -> int:
+		""" Index of the first position still in the journal
+		"""
+		l_int_ret: int = 0
+
+		if i_arr_seqs is None:
+			i_arr_seqs = self.seqs()
+
+		if len(i_arr_seqs) > 0 and i_arr_seqs[0] < self.m_obj_jour.seq_base():
+			l_int_ret = bisect_left(i_arr_seqs, self.m_obj_jour.seq_base())
+
+		return l_int_ret
+
+	def __len__(self) -> int:
+		""" Size of (number of frames)
+		"""
+		l_arr_seqs: Any = self.seqs()
+
+		return len(l_arr_seqs) - self.seq_first(l_arr_seqs)
+
+	def frame(self,
+				i_int_seq: int = 0
+			) -> Tuple[float, Any]:
+		""" Frame at journal position, as read by the view
+		"""
+		l_tuple_ret: Tuple[float, Any] = self.m_obj_jour.frame(i_int_seq)
+
+		if self.m_bool_data == True:
+			l_tuple_ret = (l_tuple_ret[0], l_tuple_ret[1][1])
+
+		return l_tuple_ret
+
+	def frames(self,
+				i_any_seqs: Any = []
+			) -> List[Tuple[float, Any]]:
+		""" Frames at journal positions, as read by the view (gathered at once)
+		"""
+		l_list_ret: List[Tuple[float, Any]] = self.m_obj_jour.frames(i_any_seqs)
+
+		if self.m_bool_data == True:
+			l_list_ret = [(l_float_time, l_tuple_frame[1]) for l_float_time, l_tuple_frame in l_list_ret]
+
+		return l_list_ret
+
+	def __getitem__(self,
+				i_any_pos: Any = -1
+			) -> Any:
+		""" Get at (frame, list of them for a slice)
+		"""
+		l_any_ret: Any = None
+		l_arr_seqs: Any = None
+		l_int_first: int = 0
+
+		l_arr_seqs = self.seqs()
+		l_int_first = self.seq_first(l_arr_seqs)
+
+		if isinstance(i_any_pos, slice):
+			l_any_ret = self.frames(l_arr_seqs[l_int_first:][i_any_pos])
+		else:
+			if i_any_pos < 0:
+				i_any_pos += len(l_arr_seqs) - l_int_first
+
+			if i_any_pos < 0 or i_any_pos >= len(l_arr_seqs) - l_int_first:
+				raise IndexError("canp_jour_view index out of range")
+
+			l_any_ret = self.frame(l_arr_seqs[l_int_first + i_any_pos])
+
+		return l_any_ret
+
+	def __iter__(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of frames, in order (read by parts)
+		"""
+		l_arr_seqs: Any = self.seqs()
+
+		for l_int_pos in range(self.seq_first(l_arr_seqs), len(l_arr_seqs), CANP_HIST__DISK_PART):
+			yield from self.frames(l_arr_seqs[l_int_pos:l_int_pos + CANP_HIST__DISK_PART])
+
+	def __eq__(self,
+				i_any_other: Any
+			) -> bool:
+		""" Same frames (view, list or history)
+		"""
+		l_bool_ret: bool = False
+
+		if isinstance(i_any_other, (canp_jour_view, canp_hist, list)):
+			l_bool_ret = (list(self) == list(i_any_other))
+
+		return l_bool_ret
+
+	def items(self) -> Iterator[Tuple[float, Any]]:
+		""" Iterator of frames, as the former dict of raw frames (node view)
+		"""
+		return iter(self)
+
+	def __repr__(self) -> str:
+		""" Representation (as the list of frames)
+		"""
+		return repr(list(self))
+
+	def narr_seq(self) -> Any:
+		""" Journal positions (numpy copy)
+		"""
+		l_arr_seqs: Any = self.seqs()
+
+		return np.array(l_arr_seqs[self.seq_first(l_arr_seqs):], dtype = np.int64)
+
+	def narr_time(self) -> Any:
+		""" Timestamps (numpy, gathered from the journal)
+		"""
+		return self.m_obj_jour.narr_cols()[0][self.narr_seq() - self.m_obj_jour.seq_base()]
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	if True:
+		print("--- JOURNAL ---")
+		l_obj_jour = canp_jour()
+		l_float_beg = time.perf_counter()
+		l_int_seq = l_obj_jour.extend(
+			[0.001 * (l_int_pos // 2) for l_int_pos in range(100000)],
+			[0x181 + (l_int_pos & 1) for l_int_pos in range(100000)],
+			[bytes([l_int_pos & 0xFF] * 8) for l_int_pos in range(100000)])
+		l_obj_jour.node_add(1, list(range(l_int_seq, l_int_seq + 100000)))
+		l_float_end = time.perf_counter()
+		print(f"{len(l_obj_jour)} frames in {l_float_end - l_float_beg:.3f} s, cobids {l_obj_jour.keys()}, last {l_obj_jour[CANP_ENUM__VAL_DEFAULT]:#x}")
+		print(f"bytes per frame : {l_obj_jour.size_row()}, columns {[l_narr_col.dtype.str for l_narr_col in l_obj_jour.narr_cols()]}")
+		print(f"0x181 : {len(l_obj_jour[0x181])} frames, last {l_obj_jour[0x181][-1]}")
+		print(f"node 1 : {len(l_obj_jour.node_view(1))} frames (same timestamps kept), first {l_obj_jour.node_view(1)[0:2]}")
+
+		l_obj_view = l_obj_jour.node_view(1)
+		l_int_seq = l_obj_jour.append(50.0, 0x080, b"")
+		l_obj_jour.node_born(1, 0)
+		l_obj_jour.node_born(2, l_int_seq)
+		l_obj_jour.bcast_add([l_int_seq])
+		l_int_seq = l_obj_jour.append(50.1, 0x181, b"\x01\x02")
+		l_obj_jour.node_add(1, [l_int_seq])
+		print(f"sync : node 1 {len(l_obj_view)} frames, last {l_obj_view[-2:]}, node 2 {l_obj_jour.node_view(2)[:]}")
+
+		l_obj_jour.append(50.2, 0x18000181, b"\x03")
+		print(f"extended : {l_obj_jour.m_str_cobid}, last {l_obj_jour.frame(l_obj_jour.m_int_seq - 1)}")
+
+		l_obj_jour.append(50.3, 0x181, bytes(range(12)))
+		l_obj_jour.extend([50.4], [0x181], [bytes(range(20))])
+		print(f"can fd : {l_obj_jour.m_int_data} bytes per row, last {l_obj_jour.frames([l_obj_jour.m_int_seq - 2, l_obj_jour.m_int_seq - 1])}")
+
+		l_obj_jour.keep_set((1000, 0.0, 0))
+		print(f"bounded : {len(l_obj_jour)} frames, node 1 {len(l_obj_jour.node_view(1))} frames from {l_obj_jour.node_view(1).narr_time()[0]}")
+		for l_int_pos in range(100000):
+			l_obj_jour.append(100.0 + 0.001 * l_int_pos, 0x281, b"\x00" * (l_int_pos & 7))
+		print(f"ring : {len(l_obj_jour)} frames, capacity {len(l_obj_jour.m_arr_time)}, first {l_obj_jour.frame(l_obj_jour.seq_base())}")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -0,0 +1,592 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_load.py
+	Loader
+	Bulk log loading (column-wise, into numpy structured arrays)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+#from typing import Callable
+#from typing import Dict
+from typing import List
+#from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+from canp_enum import CANP_ENUM__BASE_DECI
+from canp_enum import CANP_ENUM__BASE_HEXA
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+from canp_enum import CANP_ENUM__STR_HASHTAG
+from canp_enum import CANP_ENUM__STR_SPACE
+from canp_enum import CANP_ENUM__STR_ZERO
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Block size (bytes read at once, cut at the last line boundary)
+CANP_LOAD__BLOCK_SIZE = 1 << 24
+
+# Maximum payload (classic CAN)
+CANP_LOAD__DATA_MAX = 8
+
+# Column names
+CANP_LOAD__COL_TIME = "time"
+CANP_LOAD__COL_CHAN = "chan"
+CANP_LOAD__COL_COBID = "cobid"
+CANP_LOAD__COL_DLC = "dlc"
+CANP_LOAD__COL_FLAG = "flag"
+CANP_LOAD__COL_DATA = "data"
+
+# Frame flags (bit field)
+CANP_LOAD__FLAG_NONE = 0x00
+CANP_LOAD__FLAG_EXT = 0x01				# 29 bits identifier
+CANP_LOAD__FLAG_RTR = 0x02				# Remote frame (no payload)
+CANP_LOAD__FLAG_ERR = 0x04				# Error frame (no payload)
+CANP_LOAD__FLAG_TX = 0x08				# Transmitted by the logger itself
+
+# Frame record (one row per frame, payload zero padded, 24 bytes)
+CANP_LOAD__DTYPE_FRAME = np.dtype([
+		(CANP_LOAD__COL_TIME, "<f8"),
+		(CANP_LOAD__COL_CHAN, "<u2"),
+		(CANP_LOAD__COL_COBID, "<u4"),
+		(CANP_LOAD__COL_DLC, "u1"),
+		(CANP_LOAD__COL_FLAG, "u1"),
+		(CANP_LOAD__COL_DATA, "u1", (CANP_LOAD__DATA_MAX,)),
+	])
+
+# Standard (11 bits) identifier
+CANP_LOAD__COB_STD = 0x7FF
+CANP_LOAD__COB_COUNT = CANP_LOAD__COB_STD + 1
+
+# Acceptance filter : (cobid, mask), frame kept if (frame cobid & mask) == (cobid & mask)
+CANP_LOAD__FILT_COBID = 0
+CANP_LOAD__FILT_MASK = 1
+
+# Error frame identifier (SocketCAN 'CAN_ERR_FLAG', as written by candump)
+CANP_LOAD__COB_ERR = 0x20000000
+CANP_LOAD__COB_MASK = 0x1FFFFFFF
+
+# Hexadecimal digit value (key = ascii code, 0 for anything else)
+CANP_LOAD__NARR_HEX = np.zeros(256, dtype = np.uint8)
+for l_int_loop, l_int_char in enumerate(b"0123456789ABCDEF"):
+	CANP_LOAD__NARR_HEX[l_int_char] = l_int_loop
+	CANP_LOAD__NARR_HEX[bytes([l_int_char]).lower()[0]] = l_int_loop
+
+# Token width (fixed size byte strings)
+CANP_LOAD__LEN_CHAN = 16				# Channel number or interface name ('can0', 'vcan12', ...)
+CANP_LOAD__LEN_COBID = 8				# 29 bits identifier (8 hex digits)
+CANP_LOAD__LEN_DATA = 1 + (2 * CANP_LOAD__DATA_MAX)	# '#' + 16 hex digits
+CANP_LOAD__LEN_STD = 3					# 11 bits identifier (3 hex digits)
+
+# Candump line '(142.844095) 2 381#6C4E0000FEFFFFFF' turned into 4 tokens
+# Optional direction '(1700000000.500000) can1 181#00 R' turned into 5 tokens
+CANP_LOAD__LOG_TOKENS = 4
+CANP_LOAD__LOG_TOKENS_DIR = 5
+CANP_LOAD__LOG_TABLE = bytes.maketrans(b"()", b"  ")
+CANP_LOAD__LOG_HASH = b"#"
+CANP_LOAD__LOG_HASH_SPLIT = b" #"
+CANP_LOAD__LOG_RTR = b"R"
+CANP_LOAD__LOG_RX = b"R"
+CANP_LOAD__LOG_TX = b"T"
+
+# Local settings (might be present in other files yet with different values)
+
+CANP_LOG__IDX_TIME = 0
+CANP_LOG__IDX_CHAN = 1
+CANP_LOG__IDX_COBID = 2
+CANP_LOG__IDX_DATA = 3
+CANP_LOG__IDX_FLAG = 4
+
+#  --- CLASS ---
+
+class canp_load:
+	""" CAN log loader
+	"""
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("load")
+
+	@staticmethod
+	def narr_int(
+				i_narr_str: Any,
+				i_int_base: int = CANP_ENUM__BASE_HEXA
+			) -> Any:
+		""" Integers from fixed size strings of digits (numpy 'S' array)
+			Strings are left aligned, zero padded (numpy default)
+		"""
+		l_int_len = i_narr_str.dtype.itemsize
+		l_narr_char = i_narr_str.view(np.uint8).reshape(-1, l_int_len)
+		l_narr_ret = np.zeros(len(l_narr_char), dtype = np.uint32)
+
+		for l_int_loop in range(l_int_len):
+			# One digit at a time (only where there is one)
+			l_narr_digit = l_narr_char[:, l_int_loop]
+			l_narr_ret = np.where(
+				l_narr_digit != 0,
+				(l_narr_ret * i_int_base) + CANP_LOAD__NARR_HEX[l_narr_digit],
+				l_narr_ret)
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_data(
+				i_narr_data: Any,
+				i_int_skip: int = 0
+			) -> Any:
+		""" Payloads (n x 8 bytes) and dlc from fixed size hex strings
+			'i_int_skip' leading characters are ignored ('#' separator)
+		"""
+		l_int_len = i_narr_data.dtype.itemsize
+		l_narr_char = i_narr_data.view(np.uint8).reshape(-1, l_int_len)[:, i_int_skip:i_int_skip + (2 * CANP_LOAD__DATA_MAX)]
+
+		# Hex digits count (ascii never zero)
+		l_narr_dlc = (np.count_nonzero(l_narr_char, axis = 1) // 2).astype(np.uint8)
+
+		l_narr_ret = np.zeros((len(l_narr_char), CANP_LOAD__DATA_MAX), dtype = np.uint8)
+		l_narr_ret[:, :l_narr_char.shape[1] // 2] = \
+			(CANP_LOAD__NARR_HEX[l_narr_char[:, 0::2]] << 4) \
+			| CANP_LOAD__NARR_HEX[l_narr_char[:, 1::2]]
+
+		return l_narr_ret, l_narr_dlc
+
+	@staticmethod
+	def narr_chan(
+				i_list_chan: List[bytes]
+			) -> Any:
+		""" Channel numbers from channel tokens ('2', 'can0', 'vcan12', ...)
+			Only the digits are kept
+		"""
+		l_narr_chan = np.array(i_list_chan, dtype = np.bytes_)
+		l_narr_char = l_narr_chan.view(np.uint8)
+		l_narr_char[(l_narr_char < ord(CANP_ENUM__STR_ZERO)) | (l_narr_char > ord("9"))] = 0
+
+		return canp_load.narr_int(l_narr_chan, CANP_ENUM__BASE_DECI)
+
+	@staticmethod
+	def list_line(
+				i_str_line: str
+			) -> List[Any]:
+		""" Frame from one candump line (slow path)
+			Returns an empty list if the line is not a frame
+		"""
+		l_list_ret: List[Any] = []
+
+		# '(142.844095) 2 381#6C4E0000FEFFFFFF'
+		# '(1700000000.700000) can0 00000701#R R'
+		l_str_head, l_str_hash, l_str_tail = i_str_line.partition(CANP_ENUM__STR_HASHTAG)
+		l_list_line = l_str_head.replace("(", " ").replace(")", " ").split()
+		# ['142.844095', '2', '381']
+
+		l_list_tail = l_str_tail.split()
+		if len(l_list_tail) == 0 or l_str_tail[:1].isspace():
+			# Empty data (sync, ...)
+			l_list_tail.insert(0, CANP_ENUM__STR_EMPTY)
+		# ['6C4E0000FEFFFFFF'] or ['R', 'R'] (data, direction)
+
+		if l_str_hash == CANP_ENUM__STR_HASHTAG and len(l_list_line) == CANP_LOG__IDX_DATA:
+			try:
+				l_int_flag = CANP_LOAD__FLAG_NONE
+				l_int_cobid = int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_COBID], CANP_ENUM__BASE_HEXA)
+
+				if len(l_list_line[CANP_LOG__IDX_COBID]) > CANP_LOAD__LEN_STD:
+					l_int_flag |= CANP_LOAD__FLAG_EXT
+
+				if l_int_cobid & CANP_LOAD__COB_ERR:
+					l_int_flag |= CANP_LOAD__FLAG_ERR
+					l_int_cobid &= CANP_LOAD__COB_MASK
+
+				if l_list_tail[0].startswith(CANP_LOAD__LOG_RTR.decode()):
+					l_int_flag |= CANP_LOAD__FLAG_RTR
+					l_any_data = bytearray()
+				else:
+					l_any_data = bytearray.fromhex(l_list_tail[0])
+
+				if len(l_list_tail) > 1 and l_list_tail[1] == CANP_LOAD__LOG_TX.decode():
+					l_int_flag |= CANP_LOAD__FLAG_TX
+
+				l_list_ret = [
+					float(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_TIME]),
+					int(CANP_ENUM__STR_ZERO + CANP_ENUM__STR_EMPTY.join(
+						l_str_char for l_str_char in l_list_line[CANP_LOG__IDX_CHAN] if l_str_char.isdigit())),
+					l_int_cobid,
+					l_any_data,
+					l_int_flag]
+				# - except ValueError -
+			except ValueError:
+				pass
+
+		return l_list_ret
+
+	@staticmethod
+	def narr_list(
+				i_list_time: List[float],
+				i_list_chan: List[int],
+				i_list_cobid: List[int],
+				i_list_data: List[bytes],
+				i_list_flag: List[int]
+			) -> Any:
+		""" Frames from columns of values (payloads of at most 8 bytes)
+		"""
+		l_narr_ret = np.zeros(len(i_list_time), dtype = CANP_LOAD__DTYPE_FRAME)
+		l_narr_ret[CANP_LOAD__COL_TIME] = i_list_time
+		l_narr_ret[CANP_LOAD__COL_CHAN] = i_list_chan
+		l_narr_ret[CANP_LOAD__COL_COBID] = i_list_cobid
+		l_narr_ret[CANP_LOAD__COL_FLAG] = i_list_flag
+
+		# Payloads joined, then scattered into their rows
+		l_narr_dlc = np.fromiter(map(len, i_list_data), dtype = np.int64, count = len(i_list_data))
+		l_narr_byte = np.frombuffer(b"".join(i_list_data), dtype = np.uint8)
+		l_narr_row = np.repeat(np.arange(len(i_list_data)), l_narr_dlc)
+		l_narr_col = np.arange(len(l_narr_byte)) - np.repeat(np.cumsum(l_narr_dlc) - l_narr_dlc, l_narr_dlc)
+		l_narr_ret[CANP_LOAD__COL_DLC] = l_narr_dlc
+		l_narr_ret[CANP_LOAD__COL_DATA][l_narr_row, l_narr_col] = l_narr_byte
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_lines(
+				i_bytes_block: bytes
+			) -> Any:
+		""" Frames from candump lines (slow path, line by line)
+		"""
+		l_list_time: List[float] = []
+		l_list_chan: List[int] = []
+		l_list_cobid: List[int] = []
+		l_list_data: List[bytes] = []
+		l_list_flag: List[int] = []
+
+		for l_bytes_line in i_bytes_block.splitlines():
+			l_list_line = canp_load.list_line(l_bytes_line.decode("ascii", "replace"))
+			if len(l_list_line) > 0 and len(l_list_line[CANP_LOG__IDX_DATA]) <= CANP_LOAD__DATA_MAX:
+				l_list_time.append(l_list_line[CANP_LOG__IDX_TIME])
+				l_list_chan.append(l_list_line[CANP_LOG__IDX_CHAN])
+				l_list_cobid.append(l_list_line[CANP_LOG__IDX_COBID])
+				l_list_data.append(bytes(l_list_line[CANP_LOG__IDX_DATA]))
+				l_list_flag.append(l_list_line[CANP_LOG__IDX_FLAG])
+			elif l_bytes_line.strip():
+				canp_load.m_logs.error(f"load.narr_lines.line[{l_bytes_line[:64]}].unknown")
+
+		return canp_load.narr_list(
+			l_list_time,
+			l_list_chan,
+			l_list_cobid,
+			l_list_data,
+			l_list_flag)
+
+	@staticmethod
+	def narr_block(
+				i_bytes_block: bytes
+			) -> Any:
+		""" Frames from a block of complete candump lines (column-wise)
+			Falls back to the line by line parser on unexpected content
+		"""
+		l_narr_ret: Any = None
+
+		# '(142.844095) 2 381#6C4E0000FEFFFFFF' -> ' 142.844095  2 381 #6C4E0000FEFFFFFF'
+		# Keeping '#' glued to the data so that empty payloads still make a token
+		l_list_tok = i_bytes_block.translate(CANP_LOAD__LOG_TABLE).replace(
+			CANP_LOAD__LOG_HASH,
+			CANP_LOAD__LOG_HASH_SPLIT).split()
+
+		# Without then with a direction token ('R'/'T') at the end of the lines
+		for l_int_cols in [CANP_LOAD__LOG_TOKENS, CANP_LOAD__LOG_TOKENS_DIR]:
+			if len(l_list_tok) % l_int_cols == 0:
+				l_narr_data = np.array(l_list_tok[CANP_LOG__IDX_DATA::l_int_cols], dtype = f"S{CANP_LOAD__LEN_DATA + 1}")
+				l_narr_char = l_narr_data.view(np.uint8).reshape(-1, CANP_LOAD__LEN_DATA + 1)
+				l_narr_cobid = np.array(l_list_tok[CANP_LOG__IDX_COBID::l_int_cols], dtype = np.bytes_)
+
+				# Every 4th (5th) token a payload, nothing longer than classic CAN
+				if np.all(l_narr_char[:, 0] == CANP_LOAD__LOG_HASH[0]) \
+				and not np.any(l_narr_char[:, CANP_LOAD__LEN_DATA]) \
+				and l_narr_cobid.dtype.itemsize <= CANP_LOAD__LEN_COBID:
+					l_narr_flag = np.zeros(len(l_narr_data), dtype = np.uint8)
+
+					if l_int_cols == CANP_LOAD__LOG_TOKENS_DIR:
+						l_narr_dir = np.array(l_list_tok[CANP_LOAD__LOG_TOKENS::l_int_cols], dtype = np.bytes_)
+						if not np.all((l_narr_dir == CANP_LOAD__LOG_RX) | (l_narr_dir == CANP_LOAD__LOG_TX)):
+							continue
+						l_narr_flag[l_narr_dir == CANP_LOAD__LOG_TX] |= CANP_LOAD__FLAG_TX
+
+					try:
+						l_narr_ret = np.empty(len(l_narr_data), dtype = CANP_LOAD__DTYPE_FRAME)
+						l_narr_ret[CANP_LOAD__COL_TIME] = np.array(
+							l_list_tok[CANP_LOG__IDX_TIME::l_int_cols]).astype(np.float64)
+						l_narr_ret[CANP_LOAD__COL_CHAN] = canp_load.narr_chan(
+							l_list_tok[CANP_LOG__IDX_CHAN::l_int_cols])
+						(l_narr_ret[CANP_LOAD__COL_DATA],
+						l_narr_ret[CANP_LOAD__COL_DLC]) = canp_load.narr_data(
+							l_narr_data,
+							i_int_skip = 1)
+						# - except ValueError -
+					except ValueError:
+						# Non numeric time/chan (comments, ...)
+						l_narr_ret = None
+						break
+
+					# Identifier (3 digits standard, 8 digits extended, error flag)
+					l_narr_int = canp_load.narr_int(l_narr_cobid)
+					if l_narr_cobid.dtype.itemsize > CANP_LOAD__LEN_STD:
+						l_narr_flag[l_narr_cobid.view(np.uint8).reshape(-1, l_narr_cobid.dtype.itemsize)[:, CANP_LOAD__LEN_STD] != 0] |= CANP_LOAD__FLAG_EXT
+					l_narr_flag[(l_narr_int & CANP_LOAD__COB_ERR) != 0] |= CANP_LOAD__FLAG_ERR
+					l_narr_ret[CANP_LOAD__COL_COBID] = l_narr_int & CANP_LOAD__COB_MASK
+
+					# Remote request ('381#R', no payload)
+					l_narr_rtr = l_narr_char[:, 1] == CANP_LOAD__LOG_RTR[0]
+					l_narr_flag[l_narr_rtr] |= CANP_LOAD__FLAG_RTR
+					l_narr_ret[CANP_LOAD__COL_DLC][l_narr_rtr] = 0
+					l_narr_ret[CANP_LOAD__COL_DATA][l_narr_rtr] = 0
+
+					l_narr_ret[CANP_LOAD__COL_FLAG] = l_narr_flag
+					break
+
+		if l_narr_ret is None:
+			l_narr_ret = canp_load.narr_lines(i_bytes_block)
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_accept(
+				i_list_filter: List[Tuple[int, int]] = []
+			) -> Any:
+		""" Acceptance table of the standard identifiers (2048 booleans, all kept if no filter)
+		"""
+		l_narr_cobid = np.arange(CANP_LOAD__COB_COUNT, dtype = np.uint32)
+
+		if len(i_list_filter) > 0:
+			l_narr_ret = np.zeros(CANP_LOAD__COB_COUNT, dtype = np.bool_)
+			for l_tuple_filter in i_list_filter:
+				l_int_mask = l_tuple_filter[CANP_LOAD__FILT_MASK]
+				l_narr_ret |= (l_narr_cobid & l_int_mask) == (l_tuple_filter[CANP_LOAD__FILT_COBID] & l_int_mask)
+		else:
+			l_narr_ret = np.ones(CANP_LOAD__COB_COUNT, dtype = np.bool_)
+
+		return l_narr_ret
+
+	@staticmethod
+	def bool_accept(
+				i_int_cobid: int,
+				i_list_filter: List[Tuple[int, int]] = []
+			) -> bool:
+		""" Identifier accepted by at least one filter (or no filter at all)
+		"""
+		l_bool_ret: bool = len(i_list_filter) == 0
+
+		for l_int_cobid, l_int_mask in i_list_filter:
+			if (i_int_cobid & l_int_mask) == (l_int_cobid & l_int_mask):
+				l_bool_ret = True
+				break
+
+		return l_bool_ret
+
+	@staticmethod
+	def narr_filter(
+				i_narr_frame: Any,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf"),
+				i_list_chan: List[int] = [],
+				i_list_filter: List[Tuple[int, int]] = []
+			) -> Any:
+		""" Frames within a time window [start, stop[, on some channels, accepted by some filters
+			Empty lists keep everything, nothing copied when every frame is kept
+		"""
+		l_narr_ret = i_narr_frame
+		l_narr_keep = np.ones(len(i_narr_frame), dtype = np.bool_)
+
+		if i_float_start > 0.0 or i_float_stop < float("inf"):
+			l_narr_time = i_narr_frame[CANP_LOAD__COL_TIME]
+			l_narr_keep &= (l_narr_time >= i_float_start) & (l_narr_time < i_float_stop)
+
+		if len(i_list_chan) > 0:
+			l_narr_keep &= np.isin(i_narr_frame[CANP_LOAD__COL_CHAN], i_list_chan)
+
+		if len(i_list_filter) > 0:
+			l_narr_cobid = i_narr_frame[CANP_LOAD__COL_COBID]
+			l_narr_std = l_narr_cobid <= CANP_LOAD__COB_STD
+
+			# Standard identifiers through the table, extended ones filter by filter
+			l_narr_accept = np.zeros(len(i_narr_frame), dtype = np.bool_)
+			l_narr_accept[l_narr_std] = canp_load.narr_accept(i_list_filter)[l_narr_cobid[l_narr_std]]
+
+			if not np.all(l_narr_std):
+				l_narr_ext = l_narr_cobid[~l_narr_std]
+				l_narr_match = np.zeros(len(l_narr_ext), dtype = np.bool_)
+				for l_int_cobid, l_int_mask in i_list_filter:
+					l_narr_match |= (l_narr_ext & l_int_mask) == (l_int_cobid & l_int_mask)
+				l_narr_accept[~l_narr_std] = l_narr_match
+
+			l_narr_keep &= l_narr_accept
+
+		if not np.all(l_narr_keep):
+			l_narr_ret = i_narr_frame[l_narr_keep]
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_keep(
+				i_narr_frame: Any
+			) -> Any:
+		""" Data frames only (remote and error frames carry nothing to decode)
+		"""
+		l_narr_ret = i_narr_frame
+
+		l_narr_keep = (i_narr_frame[CANP_LOAD__COL_FLAG] & (CANP_LOAD__FLAG_RTR | CANP_LOAD__FLAG_ERR)) == 0
+		if not np.all(l_narr_keep):
+			l_narr_ret = i_narr_frame[l_narr_keep]
+
+		return l_narr_ret
+
+	@staticmethod
+	def log_narr(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Any:
+		""" Log loader (candump format)
+			Read file by large blocks, parse them column-wise
+		"""
+		l_list_narr: List[Any] = []
+		l_bytes_tail: bytes = b""
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			with open(i_str_file, "rb") as l_obj_file:
+				while True:
+					l_bytes_block = l_obj_file.read(i_int_block)
+					if not l_bytes_block:
+						break
+
+					# Cut at the last line boundary (keep the rest for later)
+					l_bytes_block = l_bytes_tail + l_bytes_block
+					l_int_eol = l_bytes_block.rfind(b"\n") + 1
+					l_bytes_tail = l_bytes_block[l_int_eol:]
+
+					if l_int_eol > 0:
+						l_list_narr.append(canp_load.narr_block(l_bytes_block[:l_int_eol]))
+
+				if l_bytes_tail.strip():
+					# Last line without EOL
+					l_list_narr.append(canp_load.narr_block(l_bytes_tail))
+		else:
+			canp_load.m_logs.error(f"load.log_narr.file[{i_str_file}].unknown")
+
+		if len(l_list_narr) == 1:
+			l_narr_ret = l_list_narr[0]
+		elif len(l_list_narr) > 1:
+			l_narr_ret = np.concatenate(l_list_narr)
+		else:
+			l_narr_ret = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		return l_narr_ret
+
+	@staticmethod
+	def list_narr(
+				i_narr_frame: Any
+			) -> List[List[Any]]:
+		""" Frames as lists from records
+			[[142.844095, 2, 897, bytearray(b'\x6c\x4e\x00\x00\xfe\xff\xff\xff')], ...]
+		"""
+		l_list_time = i_narr_frame[CANP_LOAD__COL_TIME].tolist()
+		l_list_chan = i_narr_frame[CANP_LOAD__COL_CHAN].tolist()
+		l_list_cobid = i_narr_frame[CANP_LOAD__COL_COBID].tolist()
+		l_list_dlc = i_narr_frame[CANP_LOAD__COL_DLC].tolist()
+		l_bytes_data = np.ascontiguousarray(i_narr_frame[CANP_LOAD__COL_DATA]).tobytes()
+
+		return [
+			[l_float_time,
+			l_int_chan,
+			l_int_cobid,
+			bytearray(l_bytes_data[l_int_pos:l_int_pos + l_int_dlc])]
+			for l_float_time, l_int_chan, l_int_cobid, l_int_dlc, l_int_pos in zip(
+				l_list_time,
+				l_list_chan,
+				l_list_cobid,
+				l_list_dlc,
+				range(0, len(l_bytes_data), CANP_LOAD__DATA_MAX))]
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+
+	if True:
+		print("--- LOG INGESTION ---")
+		# Same approach as 'canp_card.log_parse' (regex, join, split, cast)
+		l_obj_re = re.compile(r"\(|\)| |\#|\n")
+		l_float_time = time.perf_counter()
+		l_int_count = 0
+		with open(LOG_FILE, newline = None) as l_obj_file:
+			for l_str_line in l_obj_file:
+				l_list_line = CANP_ENUM__STR_SPACE.join(l_obj_re.split(l_str_line)).split()
+				if len(l_list_line) == CANP_LOG__IDX_DATA:
+					l_list_line.append(CANP_ENUM__STR_EMPTY)
+				l_list_line = [
+					float(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_TIME]),
+					int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_CHAN]),
+					int(CANP_ENUM__STR_ZERO + l_list_line[CANP_LOG__IDX_COBID], CANP_ENUM__BASE_HEXA),
+					bytearray.fromhex(l_list_line[CANP_LOG__IDX_DATA])]
+				l_int_count += 1
+		l_float_line = time.perf_counter() - l_float_time
+		print(f"line by line : {l_int_count} frames in {l_float_line:.3f}s")
+
+		l_float_time = time.perf_counter()
+		l_narr_frame = canp_load.log_narr(LOG_FILE)
+		l_float_bulk = time.perf_counter() - l_float_time
+		print(f"bulk : {len(l_narr_frame)} frames in {l_float_bulk:.3f}s (x{l_float_line / l_float_bulk:.1f})")
+
+		print("--- LOG PARSING (end to end) ---")
+		# Baseline reader vs column-wise loader, same file (imported here, 'canp_card' imports this module)
+		from canp_card import canp_card
+
+		l_float_time = time.perf_counter()
+		canp_card().log_parse(LOG_FILE, i_bool_bulk = False)
+		l_float_base = time.perf_counter() - l_float_time
+		print(f"log_parse line by line : {l_float_base:.3f}s")
+
+		l_float_time = time.perf_counter()
+		canp_card().log_parse(LOG_FILE)
+		l_float_full = time.perf_counter() - l_float_time
+		print(f"log_parse bulk : {l_float_full:.3f}s (x{l_float_base / l_float_full:.1f})")
+		print(f"loader alone : {l_float_bulk:.3f}s (x{l_float_base / l_float_bulk:.1f} vs log_parse line by line)")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -24,22 +24,28 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from datetime import date, timedelta
 
 from typing import Any
-#from typing import Callable
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 #from typing import Union
 
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # External libraries (installed with pip, conda, setup.py, ...)
 
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
 # . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
 
 # Included libraries (this module, local files)
 
 from canp_conf import canp_conf
 
+from canp_conf import CANP_CONF__CPA__CP_LEN
 from canp_conf import CANP_CONF__CPA_RPDO_MP
 from canp_conf import CANP_CONF__CPA_TPDO_MP
 
@@ -53,13 +59,27 @@ from canp_conf import enum_CANP_CONF__TYPE
 
 
 from canp_conv import canp_conv
+from canp_conv import dict_CANP_CONV__DTYPE
+
+from canp_objs import canp_objs
+from canp_objs import canp_objs_ent
+
+from canp_objs import CANP_OBJS__SUB_BITS
+from canp_objs import CANP_OBJS__SUB_MASK
+
+from canp_hist import canp_hist
+from canp_hist import canp_hist_runs
+
+from canp_hist import CANP_HIST__KEEP_NONE
+from canp_hist import CANP_HIST__RUNS_NONE
+from canp_hist import CANP_HIST__RUNS_EXACT
 
 
 from canp_enum import CANP_ENUM__APP_NAME
 from canp_enum import CANP_ENUM__BYTE_LITTLE
 
 from canp_enum import CANP_ENUM__HEAD_DATA
-from canp_enum import CANP_ENUM__HEAD_LIST
+#from canp_enum import CANP_ENUM__HEAD_LIST
 from canp_enum import CANP_ENUM__HEAD_MAIN
 #from canp_enum import CANP_ENUM__HEAD_NAME
 
@@ -72,7 +92,9 @@ from canp_enum import CANP_ENUM__STR_EMPTY
 
 from canp_enum import CANP_ENUM__VAL_DEFAULT
 
+from canp_enum import dict_SIZE_TYPE
 from canp_enum import enum_TYPE
+from canp_enum import list_TYPE_INT, list_TYPE_SINT
 
 
 from canp_args import canp_args
@@ -132,6 +154,50 @@ CANP_LOG__IDX_TIME = 0
 CANP_LOG__IDX_COBID = 1
 CANP_LOG__IDX_DATA = 2
 
+# Dispatch table (key = cobid, standard identifiers)
+CANP_NODE__DISP_SIZE = 0x800
+CANP_NODE__DISP_FUNC = 0
+CANP_NODE__DISP_PDO = 1
+
+# Pdo decoder (compiled mapping)
+CANP_NODE__PDO_OBJS = 0				# Objects compiled against
+CANP_NODE__PDO_BITS = 1				# Mapped bits
+CANP_NODE__PDO_CHECK = 2			# Dlc check (valid mapping)
+CANP_NODE__PDO_STEP = 3				# Mapped objects
+CANP_NODE__PDO_STORE = 4			# Mapping objects mapped (decoded frame by frame)
+
+# Pdo decoder step (mapped object)
+CANP_NODE__STEP_SHIFT = 0
+CANP_NODE__STEP_MASK = 1
+CANP_NODE__STEP_SIZE = 2
+CANP_NODE__STEP_KIND = 3
+CANP_NODE__STEP_TYPE = 4
+CANP_NODE__STEP_IDX = 5
+CANP_NODE__STEP_SUB = 6
+CANP_NODE__STEP_SLOT = 7
+CANP_NODE__STEP_SIGN = 8
+
+# Mapped object conversion
+CANP_NODE__KIND_INT = 0				# Integer (masked value as is)
+CANP_NODE__KIND_RAW = 1				# Bytes (no conversion)
+CANP_NODE__KIND_CONV = 2			# Converted ('canp_conv.any_bytes')
+CANP_NODE__KIND_STORE = 3			# Through 'obj_store' (mapping objects)
+CANP_NODE__KIND_SINT = 4			# Signed integer (masked value sign extended)
+
+# Decoding modes (see 'frame_parse_many')
+CANP_NODE__DECODE_FRAME = 0			# Frame by frame
+CANP_NODE__DECODE_VECT = 1			# Pdo streams vectorized (between sdo frames)
+CANP_NODE__DECODE_LAZY = 2			# Pdo payloads kept raw (objects decoded on access)
+
+CANP_NODE__VECT_BITS = 64			# Payload as uint64
+CANP_NODE__VECT_MIN = 64			# Pdo frames worth vectorizing
+
+# Lazy segment (payloads decoded by the same decoder)
+CANP_NODE__LAZY_PDO = 0				# Pdo decoder
+CANP_NODE__LAZY_TIME = 1			# Timestamps
+CANP_NODE__LAZY_DATA = 2			# Payloads
+CANP_NODE__LAZY_DONE = 3			# Objects already decoded (index, sub-index)
+
 
 CANP_NODE__NMT_OP = 0x01				# Operational (1)
 CANP_NODE__NMT_STOP = 0x02				# Stopped (2)
@@ -157,6 +223,9 @@ dict_CANP_NODE__NMT_FSM = {
 		CANP_NODE__NMT_RSTCOMM: [CANP_NODE__NMT_PREOP],
 	}
 
+# Nmt states typecode (one byte per node, see 'canp_chan.m_narr_nmt')
+CANP_NODE__NMT_DTYPE = np.uint8
+
 
 CANP_NODE__EMCY__DLC = 8
 
@@ -293,6 +362,18 @@ dict_CANP_NODE__SDO_SERR: Dict[int, str] = {
 # Configuration files (key = filename)
 g_dict_confs: Optional[Dict[str, canp_conf]] = None
 
+# Default values of configuration files (key = filename, bytes, shared, read only)
+g_dict_dflts: Optional[Dict[Tuple[str, bool], canp_objs]] = None
+
+# Dispatch table without configuration (shared, read only)
+g_list_disp: Optional[List[Tuple[Callable, int]]] = None
+
+# Dispatch tables of configuration files (key = filename, shared, read only)
+g_dict_disps: Optional[Dict[str, List[Tuple[Callable, int]]]] = None
+
+# Nmt transitions (key = [state, command], value = next state, shared, read only)
+g_narr_nmt: Any = None
+
 #  --- CLASS ---
 
 class canp_node:
@@ -301,17 +382,36 @@ class canp_node:
 
 	# Configuration object (for 'raw frame' into 'object' conversion)
 	m_cls_cnfs: Optional[canp_conf] = None
-	# Frames analysed (key = timestamp)
-	m_dict_raws: Optional[Dict[float, Any]] = None
-	# Objects stored (key = index, sub-indexes)
-	m_dict_objs: Optional[Dict[int, Any]] = None
+	# Configuration file (cache key)
+	m_str_conf: str = CANP_ENUM__STR_EMPTY
+	# Objects stored (flat, key = (index << 8) | sub-index, see 'canp_objs')
+	m_cls_objs: Optional[canp_objs] = None
+	# Frame dispatch (key = cobid, handler and pdo)
+	m_list_disp: Optional[List[Tuple[Callable, int]]] = None
+	# Pdo decoders (key = mapping index, compiled on first frame)
+	m_dict_pdos: Optional[Dict[int, Any]] = None
+	# Decoding mode
+	m_int_decode: int = CANP_NODE__DECODE_VECT
+	# Pdo payloads not decoded yet (key = mapping index, segments)
+	m_dict_lazy: Optional[Dict[int, List[List[Any]]]] = None
+	# Objects decoded on access in lazy mode (None = all)
+	m_set_want: Optional[Set[Tuple[int, int]]] = None
+	# Retention policy of objects (count, seconds, bytes, see 'canp_hist.keep_set')
+	m_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+	# Retention policy of some objects (key = (index, sub-index), sub-index None = whole index)
+	m_dict_keep: Optional[Dict[Tuple[int, Optional[int]], Tuple[int, float, int]]] = None
+	# Change-only storage of some objects (key = (index, sub-index), sub-index None = whole index, see 'canp_hist_runs')
+	m_dict_runs: Optional[Dict[Tuple[int, Optional[int]], int]] = None
 
 	# Logger object
 	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("node")
 
 	m_int_date: int = 0
 	m_int_time: int = 0
-	m_int_nmt: int = 0x0
+	# Nmt states (one per node index, shared with the chan, see 'canp_chan.m_narr_nmt')
+	m_narr_nmt: Any = None
+	# Node index (nmt state slot)
+	m_int_node: int = 0
 	m_int_idx: int = 0
 	m_int_sub: int = 0
 	m_int_cmd: int = 0
@@ -325,6 +425,10 @@ class canp_node:
 		"""
 		super().__init__(**i_dict_args)
 
+		# Own state until linked to a chan (see 'nmt_link')
+		self.m_narr_nmt = np.zeros(1, dtype = CANP_NODE__NMT_DTYPE)
+		self.m_int_node = 0
+
 	def __getitem__(self,
 				i_int_index: int = -1
 			) -> Any:
@@ -332,11 +436,19 @@ class canp_node:
 		"""
 		l_any_ret: Any = None
 
+		if self.m_dict_lazy is not None:
+			# Pending pdo payloads (lazy mode)
+			self.obj_lazy(i_int_idx = i_int_index)
+
 		try:
-			l_any_ret = self.m_dict_objs[i_int_index]
+			# Thin view (sub-indexes read from the flat table)
+			l_any_ret = self.m_cls_objs[i_int_index]
 			# - except KeyError -
+			# - except TypeError - None
 		except KeyError:
 			pass
+		except TypeError:
+			pass
 
 		return l_any_ret
 
@@ -345,8 +457,8 @@ class canp_node:
 		"""
 		l_int_ret: int = 0
 
-		if self.m_dict_objs is not None:
-			l_int_ret = len(self.m_dict_objs)
+		if self.m_cls_objs is not None:
+			l_int_ret = len(self.m_cls_objs)
 
 		return l_int_ret
 
@@ -356,11 +468,228 @@ class canp_node:
 		"""
 		l_list_ret: list = []
 
-		if self.m_dict_objs is not None:
-			l_list_ret = self.m_dict_objs.keys()
+		if self.m_cls_objs is not None:
+			l_list_ret = self.m_cls_objs.keys()
 
 		return l_list_ret
 
+	def obj_slot(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> canp_objs_ent:
+		""" Object slot (created if needed, one probe otherwise)
+			Default value copied on first write (copy-on-write over the shared defaults)
+		"""
+		l_obj_ret: canp_objs_ent = None
+
+		if self.m_cls_objs is None:
+			self.m_cls_objs = canp_objs()
+
+		try:
+			# Check entry
+			l_obj_ret = self.m_cls_objs.m_dict_ents[(i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub]
+			# - except KeyError -
+		except KeyError:
+			if self.m_cls_objs.m_cls_base is not None:
+				try:
+					# Default value (own copy)
+					l_obj_ret = self.m_cls_objs.m_cls_base.ent_get(i_int_idx, i_int_sub).copy()
+					# - except KeyError -
+				except KeyError:
+					pass
+
+			if l_obj_ret is None:
+				# Create entry (history typed by the configuration)
+				l_obj_ret = canp_node.ent_new(self.m_cls_cnfs, i_int_idx, i_int_sub)
+
+			if self.m_dict_runs is not None and self.runs_get(i_int_idx, i_int_sub) != CANP_HIST__RUNS_NONE:
+				# Change-only (runs of the same value)
+				l_obj_ret.m_obj_hist = canp_node.hist_runs(l_obj_ret.m_obj_hist, l_obj_ret.m_any_typ, self.runs_get(i_int_idx, i_int_sub))
+
+			if self.m_tuple_keep != CANP_HIST__KEEP_NONE or self.m_dict_keep is not None:
+				l_obj_ret.m_obj_hist.keep_set(self.keep_get(i_int_idx, i_int_sub))
+
+			self.m_cls_objs.ent_set(i_int_idx, i_int_sub, l_obj_ret)
+
+		return l_obj_ret
+
+	@staticmethod
+	def ent_new(
+				i_cls_cnfs: Optional[canp_conf] = None,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> canp_objs_ent:
+		""" Object entry (history typed by the configuration, if any)
+		"""
+		l_any_conf: Any = None
+
+		if i_cls_cnfs is not None:
+			l_any_conf = i_cls_cnfs.ent_obj(i_int_idx, i_int_sub)
+
+		return canp_objs_ent(
+			None if l_any_conf is None else l_any_conf.get(enum_CANP_CONF__TYPE.DataType),
+			l_any_conf)
+
+	def nmt_get(self) -> int:
+		""" Nmt state (0x0 : none yet)
+		"""
+		return int(self.m_narr_nmt[self.m_int_node])
+
+	def nmt_set(self,
+				i_int_nmt: int = 0x0
+			) -> None:
+		""" Nmt state set
+		"""
+		self.m_narr_nmt[self.m_int_node] = i_int_nmt
+
+	def nmt_link(self,
+				i_narr_nmt: Any = None,
+				i_int_node: int = 0
+			) -> None:
+		""" Nmt state moved into the states of a chan (slot 'i_int_node', updated there by broadcasts)
+		"""
+		i_narr_nmt[i_int_node] = self.nmt_get()
+
+		self.m_narr_nmt = i_narr_nmt
+		self.m_int_node = i_int_node
+
+	@staticmethod
+	def nmt_table(
+			) -> Any:
+		""" Nmt transitions, as 'frame_nmt' (built once, shared)
+			Next state of every [state, command] pair, state unchanged if not allowed
+		"""
+		global g_narr_nmt
+
+		if g_narr_nmt is None:
+			l_narr_nmt = np.empty((256, 256), dtype = CANP_NODE__NMT_DTYPE)
+			l_narr_nmt[:] = np.arange(256, dtype = CANP_NODE__NMT_DTYPE)[:, None]
+
+			for l_int_cmd in list_CANP_NODE__NMT_FSM:
+				# First command (any listed)
+				l_narr_nmt[0x0, l_int_cmd] = l_int_cmd
+
+			for l_int_nmt, l_list_cmd in dict_CANP_NODE__NMT_FSM.items():
+				l_narr_nmt[l_int_nmt, l_list_cmd] = l_list_cmd
+
+			g_narr_nmt = l_narr_nmt
+
+		return g_narr_nmt
+
+	def keep_set(self,
+				i_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE,
+				i_int_idx: Optional[int] = None,
+				i_int_sub: Optional[int] = None
+			) -> None:
+		""" Retention policy (count, seconds, bytes), 0 : unbounded (see 'canp_hist.keep_set')
+			Whole node if 'i_int_idx' is None, otherwise that object (whole index if 'i_int_sub' is None)
+			Objects set on their own keep their policy
+		"""
+		if i_int_idx is None:
+			self.m_tuple_keep = tuple(i_tuple_keep)
+		else:
+			if self.m_dict_keep is None:
+				self.m_dict_keep = {}
+			self.m_dict_keep[(i_int_idx, i_int_sub)] = tuple(i_tuple_keep)
+
+		self.keep_apply()
+
+	def keep_get(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> Tuple[int, float, int]:
+		""" Retention policy of an object (its own, its index one, then the node one)
+		"""
+		l_tuple_ret: Tuple[int, float, int] = self.m_tuple_keep
+
+		if self.m_dict_keep is not None:
+			l_tuple_ret = self.m_dict_keep.get(
+				(i_int_idx, i_int_sub),
+				self.m_dict_keep.get((i_int_idx, None), l_tuple_ret))
+
+		return l_tuple_ret
+
+	def keep_apply(self) -> None:
+		""" Retention policies applied to the stored objects
+		"""
+		if self.m_cls_objs is not None:
+			for l_int_key, l_obj_ent in self.m_cls_objs.m_dict_ents.items():
+				l_obj_ent.m_obj_hist.keep_set(self.keep_get(
+					l_int_key >> CANP_OBJS__SUB_BITS,
+					l_int_key & CANP_OBJS__SUB_MASK))
+
+	def runs_set(self,
+				i_int_idx: int = 0,
+				i_int_sub: Optional[int] = None,
+				i_int_runs: int = CANP_HIST__RUNS_EXACT
+			) -> None:
+		""" Change-only storage of an object (whole index if 'i_int_sub' is None, see 'canp_hist_runs')
+			Repeated values stored once as a run, read back as the full history
+			'i_int_runs' : CANP_HIST__RUNS_EXACT (timestamps kept), CANP_HIST__RUNS_SPREAD (lossy) or CANP_HIST__RUNS_NONE
+		"""
+		if self.m_dict_runs is None:
+			self.m_dict_runs = {}
+		self.m_dict_runs[(i_int_idx, i_int_sub)] = int(i_int_runs)
+
+		self.runs_apply()
+
+	def runs_get(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> int:
+		""" Change-only storage of an object (its own, then its index one, CANP_HIST__RUNS_NONE if none)
+		"""
+		l_int_ret: int = CANP_HIST__RUNS_NONE
+
+		if self.m_dict_runs is not None:
+			l_int_ret = self.m_dict_runs.get(
+				(i_int_idx, i_int_sub),
+				self.m_dict_runs.get((i_int_idx, None), l_int_ret))
+
+		return l_int_ret
+
+	def runs_apply(self) -> None:
+		""" Change-only storage applied to the stored objects (histories converted)
+		"""
+		l_int_runs: int = CANP_HIST__RUNS_NONE
+		l_int_was: int = CANP_HIST__RUNS_NONE
+
+		if self.m_cls_objs is not None:
+			for l_int_key, l_obj_ent in self.m_cls_objs.m_dict_ents.items():
+				l_int_runs = self.runs_get(
+					l_int_key >> CANP_OBJS__SUB_BITS,
+					l_int_key & CANP_OBJS__SUB_MASK)
+
+				l_int_was = CANP_HIST__RUNS_NONE
+				if isinstance(l_obj_ent.m_obj_hist, canp_hist_runs):
+					l_int_was = l_obj_ent.m_obj_hist.m_int_runs
+
+				if l_int_was != l_int_runs:
+					l_obj_ent.m_obj_hist = canp_node.hist_runs(l_obj_ent.m_obj_hist, l_obj_ent.m_any_typ, l_int_runs)
+					l_obj_ent.m_obj_hist.keep_set(self.keep_get(
+						l_int_key >> CANP_OBJS__SUB_BITS,
+						l_int_key & CANP_OBJS__SUB_MASK))
+
+	@staticmethod
+	def hist_runs(
+				i_obj_hist: Any = None,
+				i_any_typ: Any = None,
+				i_int_runs: int = CANP_HIST__RUNS_EXACT
+			) -> Any:
+		""" History converted (change-only or full, values stored so far kept)
+		"""
+		l_obj_ret: Any = None
+
+		if i_int_runs != CANP_HIST__RUNS_NONE:
+			l_obj_ret = canp_hist_runs(i_any_typ, i_int_runs = i_int_runs)
+		else:
+			l_obj_ret = canp_hist(i_any_typ)
+
+		if len(i_obj_hist) > 0:
+			l_obj_ret.extend_cols(i_obj_hist.list_time(), i_obj_hist.list_vals())
+
+		return l_obj_ret
+
 	def obj_store(self,
 				i_int_idx: int = 0,
 				i_int_sub: int = 0,
@@ -370,36 +699,20 @@ class canp_node:
 			) -> None:
 		""" Object storing
 		"""
+		l_obj_ent: canp_objs_ent = None
 		l_any_data: Any = None
 
 		l_any_data = i_any_data
 
-		if self.m_dict_objs is None:
-			self.m_dict_objs = {}
-
-		try:
-			# Check index
-			self.m_dict_objs[i_int_idx]
-			# - except KeyError -
-		except KeyError:
-			# Create dict
-			self.m_dict_objs[i_int_idx] = {}
+		if self.m_dict_lazy is not None:
+			# Pending pdo payloads first (history order)
+			self.obj_lazy(i_int_idx = i_int_idx)
 
-		try:
-			# Check sub-index
-			self.m_dict_objs[i_int_idx][i_int_sub]
-			# - except KeyError -
-		except KeyError:
-			# Create dict
-			self.m_dict_objs[i_int_idx][i_int_sub] = {}
+		if self.m_dict_pdos is not None and i_int_idx in self.m_dict_pdos:
+			# Pdo mapping changed (compiled again on next frame)
+			del self.m_dict_pdos[i_int_idx]
 
-		try:
-			# Check accumulator (special index)
-			self.m_dict_objs[i_int_idx][i_int_sub][CANP_ENUM__HEAD_LIST]
-			# - except KeyError -
-		except KeyError:
-			# Create list
-			self.m_dict_objs[i_int_idx][i_int_sub][CANP_ENUM__HEAD_LIST] = []
+		l_obj_ent = self.obj_slot(i_int_idx, i_int_sub)
 
 		if i_bool_bytes == False:
 			if isinstance(i_any_data, bytearray) or isinstance(i_any_data, bytes):
@@ -411,146 +724,499 @@ class canp_node:
 						i_any_data)
 
 		# Storing raw data (last value)
-		self.m_dict_objs[i_int_idx][i_int_sub][CANP_ENUM__HEAD_DATA] = l_any_data
+		l_obj_ent.m_any_data = l_any_data
 
 		# Encapsulate for storage (tuple)
 		l_any_data = (i_float_time, l_any_data)
-		self.m_dict_objs[i_int_idx][i_int_sub][CANP_ENUM__HEAD_LIST].append(l_any_data)
+		l_obj_ent.m_obj_hist.append(l_any_data)
+
+	def pdo_kind(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0,
+				i_int_len: int = 0
+			) -> Tuple[int, Any]:
+		""" Mapped object conversion (kind, data type), as 'canp_conf.conv_obj' would do
+		"""
+		l_int_kind: int = CANP_NODE__KIND_RAW
+		l_any_typ: Any = None
+
+		if (i_int_idx >= CANP_CONF__CPA_RPDO_MP and i_int_idx < (CANP_CONF__CPA_RPDO_MP + CANP_CONF__CPA__CP_LEN)) \
+			or (i_int_idx >= CANP_CONF__CPA_TPDO_MP and i_int_idx < (CANP_CONF__CPA_TPDO_MP + CANP_CONF__CPA__CP_LEN)):
+			# Mapping object (decoders depend on it)
+			l_int_kind = CANP_NODE__KIND_STORE
+		else:
+			l_any_typ = self.m_cls_cnfs.type_obj(i_int_idx, i_int_sub)
+			if l_any_typ is not None:
+				try:
+					l_int_size = dict_SIZE_TYPE[l_any_typ]
+					# - except KeyError -
+					if l_int_size <= i_int_len or l_int_size < 0:
+						if l_any_typ in list_TYPE_SINT:
+							# Two's complement of the masked value
+							l_int_kind = CANP_NODE__KIND_SINT
+						elif l_any_typ in list_TYPE_INT:
+							# Integer value is the masked value itself
+							l_int_kind = CANP_NODE__KIND_INT
+						else:
+							l_int_kind = CANP_NODE__KIND_CONV
+				except KeyError:
+					self.m_cls_cnfs.m_logs.error(f"conf.conv_obj.idx[{i_int_idx:#x}].sub[{i_int_sub:#x}].data.type.unknown")
+
+		return (l_int_kind, l_any_typ)
+
+	def pdo_compile(self,
+				i_int_pdo: int = 0
+			) -> Tuple[Any, ...]:
+		""" Pdo decoder (mapping checked once, offsets/masks/slots precomputed)
+			(objects, mapped bits, dlc check, [(shift, mask, size, kind, type, index, sub-index, slot, sign bit), ...], mapping objects)
+		"""
+		l_list_step: List[Tuple[Any, ...]] = []
+		l_bool_check: bool = False
+		l_any_data: Any = CANP_ENUM__STR_EMPTY
+		l_int_bits: int = 0
+		l_int_idx: int = 0
+		l_int_sub: int = 0
+		l_int_max: int = 0
+		l_int_map: int = 0
+		l_int_len: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+		l_str_chk: str = CANP_ENUM__STR_EMPTY
+
+		l_str_err = f"node.pdo_dispatch.pdo.map[{i_int_pdo:#x}]"
+		l_str_chk = "(check config file)"
+
+		try:
+			# Configuration object
+			l_obj_idx = self.m_cls_cnfs[i_int_pdo]
+			# - except KeyError -
+			# ParameterName=
+			# SubNumber=
+			# ObjectType=
+			# ...
+
+			# Check object integrity ---------------------
+			# TODO DUPLICATE START : canp_conf.check_obj
+			try:
+				# Maximum sub-index
+				l_int_max = l_obj_idx[CANP_ENUM__VAL_DEFAULT][enum_CANP_CONF__TYPE.SubNumber]
+				# - except KeyError -
+				if l_int_max > 0:
+					l_int_len = len(self.m_cls_objs.ent_list(i_int_pdo))
+					if l_int_max > l_int_len:
+						pass
+						#self.m_logs.error(f"{l_str_err}.sub[{l_int_max}].map[{l_int_len}].inconsistent {l_str_chk}".rstrip())
+
+					try:
+						# Number of mapped objects (variable)
+						l_any_data = self.m_cls_objs.ent_get(i_int_pdo, 0)[CANP_ENUM__HEAD_DATA]
+						# - except KeyError -
+						if isinstance(l_any_data, bytearray):
+							l_int_map = canp_conv.int_bytes(l_any_data)
+						elif isinstance(l_any_data, int):
+							l_int_map = l_any_data
+
+						if l_int_map > 0:
+							l_int_len -= 1
+							if l_int_map < l_int_len:
+								pass
+								#self.m_logs.error(f"{l_str_err}.max[{l_int_map}].map[{l_int_len}].unmapped {l_str_chk}".rstrip())
+							elif l_int_map != l_int_len:
+								pass
+								self.m_logs.error(f"{l_str_err}.max[{l_int_map}].map[{l_int_len}].inconsistent {l_str_chk}".rstrip())
+
+							# DUPLICATE END : canp_conf.check_obj
+							# Check object integrity ---------------------
+
+							l_bool_check = True
+							l_int_idx = 0
+
+							for l_int_loop in range(1, l_int_map + 1):
+								# Each mapped object (1 to 64 bits)
+								try:
+									# Pdo register
+									l_obj_pdo = self.m_cls_objs.ent_get(i_int_pdo, l_int_loop)
+									# - except KeyError -
+									try:
+										# Mapped cobid+len
+										l_any_data = l_obj_pdo[CANP_ENUM__HEAD_DATA]
+										# - except KeyError -
+										if isinstance(l_any_data, bytearray):
+											l_int_idx = canp_conv.int_bytes(l_any_data)
+										elif isinstance(l_any_data, int):
+											l_int_idx = l_any_data
+
+										# Target object
+										l_int_len = (l_int_idx >> 0) & 0xFF
+										l_int_sub = (l_int_idx >> 8) & 0xFF
+										l_int_obj = (l_int_idx >> 16) & 0xFFFF
+
+										if l_int_len > 0:
+											# Byte sized (rounded up, bit fields of any length)
+											l_int_size = (l_int_len + 7) // 8
+
+											l_int_kind, l_any_typ = self.pdo_kind(l_int_obj, l_int_sub, l_int_size)
+
+											l_list_step.append((
+												l_int_bits,
+												(1 << l_int_len) - 1,
+												l_int_size,
+												l_int_kind,
+												l_any_typ,
+												l_int_obj,
+												l_int_sub,
+												None if l_int_kind == CANP_NODE__KIND_STORE else self.obj_slot(l_int_obj, l_int_sub),
+												1 << (dict_SIZE_TYPE[l_any_typ] * 8 - 1) if l_int_kind == CANP_NODE__KIND_SINT else 0))
+
+											l_int_bits += l_int_len
+									except KeyError:
+										self.m_logs.error(f"{l_str_err}.data.unknown")
+								except KeyError:
+									self.m_logs.error(f"{l_str_err}.unknown")
+						else:
+							self.m_logs.error(f"{l_str_err}.map.zero")
+					except KeyError:
+						self.m_logs.error(f"{l_str_err}.map.unknown")
+				else:
+					self.m_logs.error(f"{l_str_err}.max.zero")
+			except KeyError:
+				self.m_logs.error(f"{l_str_err}.max.unknown")
+		except KeyError:
+			self.m_logs.error(f"{l_str_err}.unknown")
+
+		return (
+			self.m_cls_objs,
+			l_int_bits,
+			l_bool_check,
+			l_list_step,
+			any(l_tuple_step[CANP_NODE__STEP_KIND] == CANP_NODE__KIND_STORE for l_tuple_step in l_list_step))
+
+	def pdo_decoder(self,
+				i_int_pdo: int = 0
+			) -> Tuple[Any, ...]:
+		""" Pdo decoder (compiled again if missing or outdated)
+		"""
+		l_tuple_ret: Tuple[Any, ...] = None
+
+		try:
+			# Compiled decoder
+			l_tuple_ret = self.m_dict_pdos[i_int_pdo]
+			# - except KeyError - index
+			# - except TypeError - None
+		except KeyError:
+			pass
+		except TypeError:
+			self.m_dict_pdos = {}
+
+		if l_tuple_ret is None or l_tuple_ret[CANP_NODE__PDO_OBJS] is not self.m_cls_objs:
+			l_tuple_ret = self.pdo_compile(i_int_pdo)
+			self.m_dict_pdos[i_int_pdo] = l_tuple_ret
+
+		return l_tuple_ret
+
+	@staticmethod
+	def step_conv(
+				i_int_kind: int = CANP_NODE__KIND_INT,
+				i_int_size: int = 0,
+				i_any_typ: Any = None,
+				i_list_int: List[int] = [],
+				i_int_sign: int = 0
+			) -> List[Any]:
+		""" Mapped object values (masked integers converted as 'pdo_dispatch' does)
+		"""
+		l_list_ret: List[Any] = i_list_int
+		l_int_mask: int = 0
+
+		if i_int_kind == CANP_NODE__KIND_SINT:
+			l_int_mask = (i_int_sign << 1) - 1
+			l_list_ret = [((l_int_val & l_int_mask) ^ i_int_sign) - i_int_sign for l_int_val in i_list_int]
+		elif i_int_kind == CANP_NODE__KIND_RAW:
+			l_list_ret = [
+				bytearray(l_int_val.to_bytes(i_int_size, byteorder = CANP_ENUM__BYTE_LITTLE))
+				for l_int_val in i_list_int]
+		elif i_int_kind == CANP_NODE__KIND_CONV:
+			l_list_ret = [
+				canp_conv.any_bytes(
+					i_any_typ,
+					bytearray(l_int_val.to_bytes(i_int_size, byteorder = CANP_ENUM__BYTE_LITTLE)))
+				for l_int_val in i_list_int]
+
+		return l_list_ret
+
+	@staticmethod
+	def step_narr(
+				i_int_kind: int = CANP_NODE__KIND_INT,
+				i_int_size: int = 0,
+				i_any_typ: Any = None,
+				i_narr_int: Any = None,
+				i_int_sign: int = 0
+			) -> List[Any]:
+		""" Mapped object values from a masked integers column (uint64)
+			Signed and converted values decoded at once (see 'canp_conv.narr_bytes'), the others as 'step_conv'
+		"""
+		l_list_ret: List[Any] = []
+
+		if (i_int_kind == CANP_NODE__KIND_SINT or i_int_kind == CANP_NODE__KIND_CONV) \
+		and dict_CANP_CONV__DTYPE[i_any_typ].kind != "O":
+			l_list_ret = canp_conv.narr_bytes(
+				i_any_typ,
+				i_narr_int.astype("<u8").view(np.uint8).reshape(-1, 8)).tolist()
+		else:
+			l_list_ret = canp_node.step_conv(i_int_kind, i_int_size, i_any_typ, i_narr_int.tolist(), i_int_sign)
+
+		return l_list_ret
+
+	def lazy_set(self,
+				i_bool_lazy: bool = True,
+				i_set_want: Optional[Set[Tuple[int, int]]] = None
+			) -> None:
+		""" Lazy decoding (pdo payloads kept raw, objects decoded on first access)
+			'i_set_want' : objects (index, sub-index) decoded on access, the others stay undecoded (None = all)
+		"""
+		if i_bool_lazy == True:
+			self.m_int_decode = CANP_NODE__DECODE_LAZY
+		elif self.m_int_decode == CANP_NODE__DECODE_LAZY:
+			if self.m_dict_lazy is not None:
+				# Pending payloads (decoded before the next frames)
+				for l_int_idx in sorted({
+						l_tuple_step[CANP_NODE__STEP_IDX]
+						for l_list_segs in self.m_dict_lazy.values()
+						for l_list_seg in l_list_segs
+						for l_tuple_step in l_list_seg[CANP_NODE__LAZY_PDO][CANP_NODE__PDO_STEP]}):
+					self.obj_lazy(i_int_idx = l_int_idx)
+
+			self.m_dict_lazy = None
+			self.m_int_decode = CANP_NODE__DECODE_VECT
+
+		if i_set_want is None:
+			self.m_set_want = None
+		else:
+			self.m_set_want = set(i_set_want)
+
+	def obj_lazy(self,
+				i_int_idx: int = 0
+			) -> None:
+		""" Pending pdo payloads decoding (objects of this index, once)
+			Histories fed by several pdos are merged by timestamp
+		"""
+		l_dict_hist: Dict[Tuple[int, int], List[Any]] = {}
+		l_tuple_key: Tuple[int, int] = None
+		l_narr_data: Any = None
+		l_list_val: List[Any] = []
+
+		for l_int_pdo, l_list_segs in self.m_dict_lazy.items():
+			for l_tuple_pdo, l_list_time, l_list_data, l_set_done in l_list_segs:
+				l_narr_data = None
+
+				for l_int_shift, l_int_mask, l_int_size, l_int_kind, l_any_typ, l_int_idx, l_int_sub, l_obj_ent, l_int_sign in l_tuple_pdo[CANP_NODE__PDO_STEP]:
+					l_tuple_key = (l_int_idx, l_int_sub)
+
+					if l_int_idx == i_int_idx and l_tuple_key not in l_set_done \
+					and (self.m_set_want is None or l_tuple_key in self.m_set_want):
+						l_set_done.add(l_tuple_key)
+
+						if l_int_shift + l_int_mask.bit_length() <= CANP_NODE__VECT_BITS \
+						and all(len(l_any_data) * 8 <= CANP_NODE__VECT_BITS for l_any_data in l_list_data):
+							if l_narr_data is None:
+								# Payloads (zero padded, as the integer of the frame)
+								l_narr_data = np.frombuffer(
+									b"".join([l_any_data.ljust(8, b"\x00") for l_any_data in l_list_data]),
+									dtype = "<u8")
+							l_list_val = canp_node.step_narr(
+								l_int_kind,
+								l_int_size,
+								l_any_typ,
+								(l_narr_data >> np.uint64(l_int_shift)) & np.uint64(l_int_mask),
+								l_int_sign)
+						else:
+							l_list_val = canp_node.step_conv(l_int_kind, l_int_size, l_any_typ, [
+								(int.from_bytes(l_any_data, byteorder = CANP_ENUM__BYTE_LITTLE) >> l_int_shift) & l_int_mask
+								for l_any_data in l_list_data], l_int_sign)
+
+						l_dict_hist.setdefault(l_tuple_key, [l_obj_ent, set(), []])
+						l_dict_hist[l_tuple_key][1].add(l_int_pdo)
+						l_dict_hist[l_tuple_key][2].extend(zip(
+							l_list_time,
+							l_list_val))
+
+		for l_obj_ent, l_set_pdo, l_list_hist in l_dict_hist.values():
+			if len(l_set_pdo) > 1:
+				l_list_hist.sort(key = lambda l_tuple_val: l_tuple_val[0])
+
+			if len(l_list_hist) > 0:
+				l_obj_ent.m_any_data = l_list_hist[-1][1]
+				l_obj_ent.m_obj_hist.extend(l_list_hist)
+
+	def pdo_lazy(self,
+				i_int_pdo: int = 0,
+				i_bytes_data: bytearray = b"",
+				i_float_time: float = 0.0,
+				i_tuple_pdo: Tuple[Any, ...] = None
+			) -> None:
+		""" Pdo payload kept raw (decoded on access, see 'obj_lazy')
+		"""
+		l_list_segs: List[List[Any]] = None
+
+		if self.m_dict_lazy is None:
+			self.m_dict_lazy = {}
+
+		l_list_segs = self.m_dict_lazy.setdefault(i_int_pdo, [])
+
+		if len(l_list_segs) == 0 \
+		or l_list_segs[-1][CANP_NODE__LAZY_PDO] is not i_tuple_pdo \
+		or len(l_list_segs[-1][CANP_NODE__LAZY_DONE]) > 0:
+			# New segment (mapping changed or objects already decoded)
+			l_list_segs.append([i_tuple_pdo, [], [], set()])
+
+		l_list_segs[-1][CANP_NODE__LAZY_TIME].append(i_float_time)
+		l_list_segs[-1][CANP_NODE__LAZY_DATA].append(i_bytes_data)
+
+	def pdo_many(self,
+				i_dict_pos: Dict[int, List[int]] = {},
+				i_list_time: List[float] = [],
+				i_list_data: List[bytearray] = []
+			) -> None:
+		""" Pdo streams decoding (vectorized, same result as 'pdo_dispatch' on each frame in order)
+			'i_dict_pos' : frame positions of each pdo (key = mapping index)
+			Payloads are stacked as little-endian uint64 then each mapped object is shifted and masked at once
+			Objects fed by several pdos get their values merged back in frame order
+		"""
+		l_dict_pos: Dict[int, List[int]] = {}
+		l_dict_hist: Dict[Tuple[int, int], List[Any]] = {}
+		l_list_pos: List[int] = []
+		l_bool_vect: bool = True
+		l_int_count: int = 0
+
+		if self.m_cls_cnfs is not None:
+			for l_int_pdo, l_list_pos in i_dict_pos.items():
+				# Same guard as 'pdo_dispatch'
+				l_list_pos = [
+					l_int_pos for l_int_pos in l_list_pos
+					if isinstance(i_list_data[l_int_pos], bytearray) and len(i_list_data[l_int_pos]) > 0]
+
+				if l_int_pdo > 0 and len(l_list_pos) > 0:
+					l_dict_pos[l_int_pdo] = l_list_pos
+					l_int_count += len(l_list_pos)
+
+					# Decoders (compiled in order of appearance, as frame by frame)
+					l_tuple_pdo = self.pdo_decoder(l_int_pdo)
+					if l_tuple_pdo[CANP_NODE__PDO_STORE] == True:
+						# Mapping object target
+						l_bool_vect = False
+
+					for l_tuple_step in l_tuple_pdo[CANP_NODE__PDO_STEP]:
+						if l_tuple_step[CANP_NODE__STEP_SHIFT] + l_tuple_step[CANP_NODE__STEP_MASK].bit_length() > CANP_NODE__VECT_BITS:
+							# Beyond 64 bits
+							l_bool_vect = False
+
+					for l_int_pos in l_list_pos:
+						if len(i_list_data[l_int_pos]) * 8 > CANP_NODE__VECT_BITS:
+							l_bool_vect = False
+
+			if l_bool_vect == False or l_int_count < CANP_NODE__VECT_MIN:
+				# Frame by frame (in order)
+				for l_int_pdo, l_int_pos in sorted(
+						((l_int_pdo, l_int_pos) for l_int_pdo, l_list_pos in l_dict_pos.items() for l_int_pos in l_list_pos),
+						key = lambda l_tuple_pos: l_tuple_pos[1]):
+					self.pdo_dispatch(
+						i_int_pdo = l_int_pdo,
+						i_bytes_data = i_list_data[l_int_pos],
+						i_float_time = i_list_time[l_int_pos])
+			else:
+				for l_int_pdo, l_list_pos in l_dict_pos.items():
+					l_tuple_pdo = self.m_dict_pdos[l_int_pdo]
+
+					# Payloads (zero padded, as the integer of the frame)
+					l_narr_data = np.frombuffer(
+						b"".join([i_list_data[l_int_pos].ljust(8, b"\x00") for l_int_pos in l_list_pos]),
+						dtype = "<u8")
+					l_narr_pos = np.array(l_list_pos, dtype = np.int64)
+
+					for l_int_shift, l_int_mask, l_int_size, l_int_kind, l_any_typ, l_int_idx, l_int_sub, l_obj_ent, l_int_sign in l_tuple_pdo[CANP_NODE__PDO_STEP]:
+						l_list_val = canp_node.step_narr(
+							l_int_kind,
+							l_int_size,
+							l_any_typ,
+							(l_narr_data >> np.uint64(l_int_shift)) & np.uint64(l_int_mask),
+							l_int_sign)
+
+						l_dict_hist.setdefault((l_int_idx, l_int_sub), [l_obj_ent, [], []])
+						l_dict_hist[(l_int_idx, l_int_sub)][1].append(l_narr_pos)
+						l_dict_hist[(l_int_idx, l_int_sub)][2].extend(l_list_val)
+
+					if l_tuple_pdo[CANP_NODE__PDO_CHECK] == True:
+						for l_int_pos in l_list_pos:
+							l_int_dlc = len(i_list_data[l_int_pos]) * 8 - l_tuple_pdo[CANP_NODE__PDO_BITS]
+							if l_int_dlc < 0:
+								self.m_logs.error(f"node.pdo_dispatch.pdo.map[{l_int_pdo:#x}].data.dlc.overshoot[{l_int_dlc}] (check config file)")
+
+				# Histories (frame order)
+				for l_obj_ent, l_list_narr, l_list_val in l_dict_hist.values():
+					if len(l_list_narr) == 1:
+						l_list_pos = l_list_narr[0].tolist()
+					else:
+						l_narr_pos = np.concatenate(l_list_narr)
+						l_narr_ord = np.argsort(l_narr_pos, kind = "stable")
+						l_list_pos = l_narr_pos[l_narr_ord].tolist()
+						l_list_val = [l_list_val[l_int_ord] for l_int_ord in l_narr_ord.tolist()]
+
+					l_obj_ent.m_any_data = l_list_val[-1]
+					l_obj_ent.m_obj_hist.extend_cols(
+						[i_list_time[l_int_pos] for l_int_pos in l_list_pos],
+						l_list_val)
 
 	def pdo_dispatch(self,
 				i_int_pdo: int = 0,
 				i_bytes_data: bytearray = b"",
 				i_float_time: float = 0.0
 			) -> None:
-		""" Object dispatching
+		""" Object dispatching (compiled decoder, see 'pdo_compile')
 		"""
 		if i_int_pdo > 0 and isinstance(i_bytes_data, bytearray) and len(i_bytes_data) > 0:
-			#l_enum_typ: enum_TYPE = enum_TYPE.VisibleString
+			l_tuple_pdo: Tuple[Any, ...] = None
 			l_any_data: Any = CANP_ENUM__STR_EMPTY
 			l_int_data: int = 0
-			l_int_mask: int = 0
 			l_int_dlc: int = 0
-			l_int_idx: int = 0
-			l_int_sub: int = 0
-			l_int_max: int = 0
-			l_int_len: int = 0
-			l_str_err: str = CANP_ENUM__STR_EMPTY
-			l_str_chk: str = CANP_ENUM__STR_EMPTY
 
 			if self.m_cls_cnfs is not None:
-				l_str_err = f"node.pdo_dispatch.pdo.map[{i_int_pdo:#x}]"
-				l_str_chk = "(check config file)"
+				l_tuple_pdo = self.pdo_decoder(i_int_pdo)
 
-				try:
-					# Configuration object
-					l_dict_idx = self.m_cls_cnfs.m_dict_obj[i_int_pdo]
-					# - except KeyError -
-					# ParameterName=
-					# SubNumber=
-					# ObjectType=
-					# ...
+				if self.m_int_decode == CANP_NODE__DECODE_LAZY and l_tuple_pdo[CANP_NODE__PDO_STORE] == False:
+					self.pdo_lazy(i_int_pdo, i_bytes_data, i_float_time, l_tuple_pdo)
+				else:
+					l_int_data = int.from_bytes(i_bytes_data, byteorder = CANP_ENUM__BYTE_LITTLE)
 
-					# Check object integrity ---------------------
-					# TODO DUPLICATE START : canp_conf.check_obj
-					try:
-						# Maximum sub-index
-						l_int_max = l_dict_idx[CANP_ENUM__VAL_DEFAULT][enum_CANP_CONF__TYPE.SubNumber]
-						# - except KeyError -
-						if l_int_max > 0:
-							l_int_len = len(self.m_dict_objs[i_int_pdo])
-							if l_int_max > l_int_len:
-								pass
-								#self.m_logs.error(f"{l_str_err}.sub[{l_int_max}].map[{l_int_len}].inconsistent {l_str_chk}".rstrip())
+					for l_int_shift, l_int_mask, l_int_size, l_int_kind, l_any_typ, l_int_idx, l_int_sub, l_obj_ent, l_int_sign in l_tuple_pdo[CANP_NODE__PDO_STEP]:
+						l_any_data = (l_int_data >> l_int_shift) & l_int_mask
 
-							try:
-								# Number of mapped objects (variable)
-								l_any_data = self.m_dict_objs[i_int_pdo][0][CANP_ENUM__HEAD_DATA]
-								# - except KeyError -
-								if isinstance(l_any_data, bytearray):
-									l_int_map = canp_conv.int_bytes(l_any_data)
-								elif isinstance(l_any_data, int):
-									l_int_map = l_any_data
-
-								if l_int_map > 0:
-									l_int_len -= 1
-									if l_int_map < l_int_len:
-										pass
-										#self.m_logs.error(f"{l_str_err}.max[{l_int_map}].map[{l_int_len}].unmapped {l_str_chk}".rstrip())
-									elif l_int_map != l_int_len:
-										pass
-										self.m_logs.error(f"{l_str_err}.max[{l_int_map}].map[{l_int_len}].inconsistent {l_str_chk}".rstrip())
-
-									# DUPLICATE END : canp_conf.check_obj
-									# Check object integrity ---------------------
-
-									l_int_data = canp_conv.int_bytes(i_bool_bytes = i_bytes_data)
-									l_int_dlc = len(i_bytes_data) * 8
-
-									for l_int_loop in range(1, l_int_map + 1):
-										# Each mapped object (1 to 64 bits)
-										l_str_map = f"map[{i_int_pdo:#x}].sub[{l_int_loop}]"
-										try:
-											# Pdo register
-											l_dict_pdo = self.m_dict_objs[i_int_pdo][l_int_loop]
-											# - except KeyError -
-											try:
-												# Mapped cobid+len
-												l_any_data = l_dict_pdo[CANP_ENUM__HEAD_DATA]
-												# - except KeyError -
-												if isinstance(l_any_data, bytearray):
-													l_int_idx = canp_conv.int_bytes(l_any_data)
-												elif isinstance(l_any_data, int):
-													l_int_idx = l_any_data
-
-												# Target object
-												l_int_len = (l_int_idx >> 0) & 0xFF
-												l_int_sub = (l_int_idx >> 8) & 0xFF
-												l_int_idx = (l_int_idx >> 16) & 0xFFFF
-
-												if l_int_len > 0:
-													l_int_mask = (2 ** l_int_len) - 1
-													l_any_data = l_int_data & l_int_mask
-													l_int_data >>= l_int_len
-													l_int_dlc -= l_int_len
-
-													# Byte sized
-													if l_int_len >= 8:
-														l_int_len //= 8
-													else:
-														l_int_len = 1
-
-													# Type conversion is done by the store
-													l_any_data = bytearray(
-														l_any_data.to_bytes(
-															l_int_len,
-															byteorder = CANP_ENUM__BYTE_LITTLE))
-
-													self.obj_store(
-														i_int_idx = l_int_idx,
-														i_int_sub = l_int_sub,
-														i_any_data = l_any_data,
-														i_float_time = i_float_time)
-											except KeyError:
-												self.m_logs.error(f"{l_str_err}.data.unknown")
-										except KeyError:
-											self.m_logs.error(f"{l_str_err}.unknown")
-
-									if l_int_dlc > 0:
-										pass
-										#self.m_logs.error(f"{l_str_err}.data.dlc.leftover[{l_int_dlc}] {l_str_chk}".rstrip())
-									elif l_int_dlc < 0:
-										pass
-										self.m_logs.error(f"{l_str_err}.data.dlc.overshoot[{l_int_dlc}] {l_str_chk}".rstrip())
-								else:
-									self.m_logs.error(f"{l_str_err}.map.zero")
-							except KeyError:
-								self.m_logs.error(f"{l_str_err}.map.unknown")
+						if l_int_kind == CANP_NODE__KIND_STORE:
+							# Type conversion is done by the store
+							self.obj_store(
+								i_int_idx = l_int_idx,
+								i_int_sub = l_int_sub,
+								i_any_data = bytearray(l_any_data.to_bytes(l_int_size, byteorder = CANP_ENUM__BYTE_LITTLE)),
+								i_float_time = i_float_time)
 						else:
-							self.m_logs.error(f"{l_str_err}.max.zero")
-					except KeyError:
-						self.m_logs.error(f"{l_str_err}.max.unknown")
-				except KeyError:
-					self.m_logs.error(f"{l_str_err}.unknown")
+							if l_int_kind == CANP_NODE__KIND_SINT:
+								l_any_data = ((l_any_data & ((l_int_sign << 1) - 1)) ^ l_int_sign) - l_int_sign
+							elif l_int_kind == CANP_NODE__KIND_RAW:
+								l_any_data = bytearray(l_any_data.to_bytes(l_int_size, byteorder = CANP_ENUM__BYTE_LITTLE))
+							elif l_int_kind == CANP_NODE__KIND_CONV:
+								l_any_data = canp_conv.any_bytes(
+									l_any_typ,
+									bytearray(l_any_data.to_bytes(l_int_size, byteorder = CANP_ENUM__BYTE_LITTLE)))
+
+							# Storing (last value, then history)
+							l_obj_ent.m_any_data = l_any_data
+							l_obj_ent.m_obj_hist.append((i_float_time, l_any_data))
+
+				if l_tuple_pdo[CANP_NODE__PDO_CHECK] == True:
+					l_int_dlc = len(i_bytes_data) * 8 - l_tuple_pdo[CANP_NODE__PDO_BITS]
+					if l_int_dlc > 0:
+						pass
+						#self.m_logs.error(f"node.pdo_dispatch.pdo.map[{i_int_pdo:#x}].data.dlc.leftover[{l_int_dlc}] (check config file)")
+					elif l_int_dlc < 0:
+						pass
+						self.m_logs.error(f"node.pdo_dispatch.pdo.map[{i_int_pdo:#x}].data.dlc.overshoot[{l_int_dlc}] (check config file)")
 
 	def conf_load(self,
 				i_str_file: str = CANP_ENUM__STR_EMPTY,
@@ -558,13 +1224,10 @@ class canp_node:
 				i_bool_bytes: bool = False
 			) -> None:
 		""" Node configuration
+			Objects layered over the default values shared by every node (see 'conf_dflt')
 		"""
 		if i_str_file != CANP_ENUM__STR_EMPTY:
-			l_enum_typ: enum_TYPE = enum_TYPE.VisibleString
-			l_bool_ok: bool = False
-			l_any_data: Any = 0
-			l_int_idx: int = 0
-			l_int_sub: int = 0
+			l_cls_prev: Optional[canp_conf] = None
 
 			# Access global bank
 			global g_dict_confs
@@ -582,192 +1245,155 @@ class canp_node:
 				g_dict_confs[i_str_file] = canp_conf(i_str_file)
 
 			# Set configuration
+			l_cls_prev = self.m_cls_cnfs
 			self.m_cls_cnfs = g_dict_confs[i_str_file]
+			self.m_str_conf = i_str_file
+
+			if self.m_cls_cnfs is not l_cls_prev:
+				# Pdo decoders (conversions depend on the configuration)
+				self.m_dict_pdos = None
+
+			if l_cls_prev is None and (self.m_list_disp is None or self.m_list_disp is g_list_disp):
+				# Dispatch table (shared by the nodes of this configuration)
+				self.m_list_disp = canp_node.disp_conf(i_str_file)
+			elif self.m_cls_cnfs is not l_cls_prev or self.m_list_disp is None:
+				# Dispatch table (entries depending on either configuration)
+				self.disp_build(
+					canp_node.disp_cobids(l_cls_prev)
+					+ canp_node.disp_cobids(self.m_cls_cnfs))
+
+			# Parameter/default values (creation / reset, nothing copied)
+			if i_bool_force == True or self.m_cls_objs is None:
+				self.m_cls_objs = canp_objs(canp_node.conf_dflt(i_str_file, i_bool_bytes))
+				# Pending payloads of the former objects
+				self.m_dict_lazy = None
+
+	@staticmethod
+	def conf_dflt(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_bool_bytes: bool = False
+			) -> canp_objs:
+		""" Default values of a loaded configuration (built once, shared by the nodes, read only)
+			Same objects as stored one by one before, own entries are copied on first write (see 'obj_slot')
+		"""
+		l_cls_ret: canp_objs = None
+		l_cls_cnfs: canp_conf = None
+		l_enum_typ: enum_TYPE = enum_TYPE.VisibleString
+		l_obj_ent: canp_objs_ent = None
+		l_bool_ok: bool = False
+		l_any_data: Any = 0
+		l_int_idx: int = 0
+		l_int_sub: int = 0
 
-			# Import parameter/default values (creation / reset)
-			if i_bool_force == True or self.m_dict_objs is None:
-				for l_int_idx, l_dict_idx in self.m_cls_cnfs.m_dict_obj.items():
-					for l_int_sub, l_dict_sub in l_dict_idx.items():
-						# Check object integrity ---------------------
-						# TODO DUPLICATE START : canp_conf.check_obj
-						l_bool_ok = False
+		# Access global bank
+		global g_dict_dflts
+
+		if g_dict_dflts is None:
+			g_dict_dflts = {}
+
+		try:
+			# Check if default values already built (key = filename, bytes)
+			l_cls_ret = g_dict_dflts[(i_str_file, i_bool_bytes)]
+			# - except KeyError - index
+		except KeyError:
+			l_cls_ret = canp_objs()
+			l_cls_cnfs = g_dict_confs[i_str_file]
+
+			for l_int_idx, l_obj_idx in l_cls_cnfs.m_cls_objs.items():
+				for l_int_sub, l_obj_cnf in l_obj_idx.items():
+					# Check object integrity ---------------------
+					# TODO DUPLICATE START : canp_conf.check_obj
+					l_bool_ok = False
+					try:
+						# Parameter value (from DCF file)
+						l_any_data = l_obj_cnf[enum_CANP_CONF__TYPE.ParameterValue]
+						# - except KeyError -
+						l_bool_ok = True
+					except KeyError:
 						try:
-							# Parameter value (from DCF file)
-							l_any_data = l_dict_sub[enum_CANP_CONF__TYPE.ParameterValue]
+							# Default value (from EDS file)
+							l_any_data = l_obj_cnf[enum_CANP_CONF__TYPE.DefaultValue]
 							# - except KeyError -
 							l_bool_ok = True
 						except KeyError:
-							try:
-								# Default value (from EDS file)
-								l_any_data = l_dict_sub[enum_CANP_CONF__TYPE.DefaultValue]
-								# - except KeyError -
-								l_bool_ok = True
-							except KeyError:
-								pass
+							pass
+
+					if l_bool_ok == True:
+						try:
+							# Data type
+							l_enum_typ = l_obj_cnf[enum_CANP_CONF__TYPE.DataType]
+							# - except KeyError -
+							if isinstance(l_any_data, str):
+								# Conversion (if needed)
+								l_any_data = canp_conv.any_str(
+									l_enum_typ,
+									l_any_data)
+
+							if l_int_sub < 0:
+								l_int_sub = 0
+
+							if i_bool_bytes == True:
+								# Convert and store into bytes (later conversion needed)
+								l_any_data = canp_conv.bytes_any(
+									l_enum_typ,
+									l_any_data)
+							elif isinstance(l_any_data, bytearray) or isinstance(l_any_data, bytes):
+								# Trying to decode using conf (as 'obj_store')
+								l_any_data = l_cls_cnfs.conv_obj(
+									l_int_idx,
+									l_int_sub,
+									l_any_data)
 
-						if l_bool_ok == True:
 							try:
-								# Data type
-								l_enum_typ = l_dict_sub[enum_CANP_CONF__TYPE.DataType]
+								l_obj_ent = l_cls_ret.ent_get(l_int_idx, l_int_sub)
 								# - except KeyError -
-								if isinstance(l_any_data, str):
-									# Conversion (if needed)
-									l_any_data = canp_conv.any_str(
-										l_enum_typ,
-										l_any_data)
-
-								if i_bool_bytes == True:
-									# Convert and store into bytes (later conversion needed)
-									l_any_data = canp_conv.bytes_any(
-										l_enum_typ,
-										l_any_data)
-
-								if l_int_sub < 0:
-									l_int_sub = 0
-
-								self.obj_store(
-									i_int_idx = l_int_idx,
-									i_int_sub = l_int_sub,
-									i_any_data = l_any_data,
-									i_bool_bytes = i_bool_bytes)
 							except KeyError:
-								# No data type ?
-								pass
+								l_obj_ent = l_cls_ret.ent_set(l_int_idx, l_int_sub, canp_node.ent_new(l_cls_cnfs, l_int_idx, l_int_sub))
 
-	def frame_parse(self,
-				i_list_frame: List[Any] = [],
-				i_float_time: float = 0.0,
-				i_int_cobid: int = 0,
-				i_any_data: bytearray = b'',
-			) -> None:
-		""" Frame parser
+							l_obj_ent.m_any_data = l_any_data
+							l_obj_ent.m_obj_hist.append((0.0, l_any_data))
+						except KeyError:
+							# No data type ?
+							pass
+
+			g_dict_dflts[(i_str_file, i_bool_bytes)] = l_cls_ret
+
+		return l_cls_ret
+
+	@staticmethod
+	def disp_entry(
+				i_cls_cnfs: Optional[canp_conf] = None,
+				i_int_cobid: int = 0
+			) -> Tuple[Callable, int]:
+		""" Frame handler for a cobid (handler, pdo)
+			Same precedence as the CiA 301 cobid ladder (conf lookups first)
 		"""
-		# [142.844095, 897, b'\x6c\x4e\x00\x00\xfe\xff\xff\xff']
-		# 0 : timestamp (float)
-		# 1 : cobid (int)
-		# 2 : frame (bytearray, dlc = len)
-		l_byte_data: bytearray = b''
-		#l_float_time: float = 0.0
-		l_bool_toggle: bool = False
-		l_bool_store: bool = False
+		l_func_ret: Callable = canp_node.frame_unknown
 		l_int_cobid: int = 0
 		l_int_node: int = 0
-		l_int_data: int = 0
-		l_int_dlc: int = 0
-		l_int_cmd: int = 0
 		l_int_pdo: int = 0
-		l_int_idx: int = 0
-		l_int_sub: int = 0
-		l_int_chk: int = 0
-		l_str_err: str = CANP_ENUM__STR_EMPTY
-
-		if len(i_list_frame) >= (CANP_LOG__IDX_DATA + 1):
-			# Via list
-			i_float_time = i_list_frame[CANP_LOG__IDX_TIME]
-			i_int_cobid = i_list_frame[CANP_LOG__IDX_COBID]
-			i_any_data = i_list_frame[CANP_LOG__IDX_DATA]
-		else:
-			# Via args
-			pass
 
 		l_int_cobid = i_int_cobid
 		l_int_node = l_int_cobid & CANP_ENUM__NODE_MAX
 		l_int_cobid -= l_int_node
-		l_int_dlc = len(i_any_data)
-
-		l_str_err = "node.frame_parse"
 
 		if l_int_cobid == CANP_NODE__COB_NMT and l_int_node == 0:
-			# nmt (0x000 / 0)
-			if l_int_dlc == CANP_NODE__NMT__DLC:
-				l_int_cmd = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:1])
-				if l_int_cmd in list_CANP_NODE__NMT_FSM:
-					if self.m_int_nmt == 0x0:
-						self.m_logs.info(f"{l_str_err}.nmt.fsm.init")
-						self.m_int_nmt = l_int_cmd
-					if self.m_int_nmt != l_int_cmd:
-						if l_int_cmd in dict_CANP_NODE__NMT_FSM[self.m_int_nmt]:
-							self.m_int_nmt = l_int_cmd
-							# transition() callback
-
-							l_bool_store = True
-						else:
-							self.m_logs.error(f"{l_str_err}.nmt.fsm.error")
-					else:
-						self.m_logs.error(f"{l_str_err}.nmt.fsm.same")
-				else:
-					self.m_logs.error(f"{l_str_err}.nmt.cmd.unlisted")
-			else:
-				self.m_logs.error(f"{l_str_err}.nmt.dlc.mismatch")
+			l_func_ret = canp_node.frame_nmt
 		elif l_int_cobid == CANP_NODE__COB_RES1 and l_int_node != 0:
-			# reserved (0x000 / 0)
-			self.m_logs.info(f"{l_str_err}.res1")
+			l_func_ret = canp_node.frame_res1
 		elif l_int_cobid == CANP_NODE__COB_SYNC and l_int_node == 0:
-			# synchro (0x080 / 128)
-			if l_int_dlc == 0:
-				l_bool_store = True
-			else:
-				self.m_logs.error(f"{l_str_err}.sync.dlc.mismatch")
+			l_func_ret = canp_node.frame_sync
 		elif l_int_cobid == CANP_NODE__COB_EMCY and l_int_node != 0:
-			# emergency (0x080 / 128) -> 0x1014-0x1015
-			if l_int_dlc == CANP_NODE__EMCY__DLC:
-				# EMCY l_error_code
-				l_int_data = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:2])
-				# l_error_register (0x1001:0)
-				l_int_data = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[2:3])
-				# MANUFACTURER l_error_code
-				l_int_data = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[3:8])
-
-				l_bool_store = True
-			else:
-				self.m_logs.error(f"{l_str_err}.emcy.dlc.mismatch")
+			l_func_ret = canp_node.frame_emcy
 		elif l_int_cobid == CANP_NODE__COB_TIME and l_int_node != 0:
-			# time (0x100 / 256)
-			if l_int_dlc == CANP_NODE__TIME__DLC:
-				# time (ms since midnight)
-				l_int_data = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:4])
-				self.m_int_time = l_int_data
-				l_int_h = l_int_data // 3600000
-				l_int_m = l_int_data % 3600000
-				l_int_s = l_int_m % 60000
-				l_int_ms = l_int_s % 1000
-				l_int_s = l_int_s // 1000
-				l_int_m = l_int_m // 60000
-				self.m_logs.info(f"{l_str_err}.time.time={l_int_h}h{l_int_m}m{l_int_s}s{l_int_ms}ms")
-
-				# days (since 01/01/84)
-				l_int_data = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[4:6])
-				self.m_int_date = l_int_data
-				l_obj_epoch = date(1984, 1, 1)
-				l_obj_delta = timedelta(days = l_int_data)
-				l_obj_date = l_obj_epoch + l_obj_delta
-				self.m_logs.info(f"{l_str_err}.time.date={l_obj_date.year}y{l_obj_date.month}m{l_obj_date.day}d")
-
-				# byte 6-7 = 0
-				l_int_chk = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[6:8])
-
-				l_bool_store = True
-			else:
-				self.m_logs.error(f"{l_str_err}.time.dlc.mismatch")
-		elif ((self.m_cls_cnfs is not None and l_int_cobid in self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX]) \
+			l_func_ret = canp_node.frame_time
+		elif ((i_cls_cnfs is not None and l_int_cobid in i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX]) \
 			or l_int_cobid in list_CANP_NODE__COB_TPDO):
 			# Tpdo (pdo lookup)
-			l_bool_store = True
+			l_func_ret = canp_node.frame_pdo
 
-			if (self.m_cls_cnfs is not None and l_int_cobid in self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX]):
-				# Same as above, yet shall be cached by the interpreter/compiler
-				try:
-					l_int_pdo = self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX][l_int_cobid]
-					# - except KeyError -
-				except KeyError:
-					pass
+			if (i_cls_cnfs is not None and l_int_cobid in i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX]):
+				l_int_pdo = i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX][l_int_cobid]
 			else:
 				l_int_pdo = l_int_cobid
 				l_int_pdo -= 0x080
@@ -777,24 +1403,13 @@ class canp_node:
 				# CANP_NODE__COB_TPDO3 : (0x380 / 896) -> 0x1802 / 0x1A02
 				# CANP_NODE__COB_TPDO4 : (0x480 / 1152) -> 0x1803 / 0x1A03
 				l_int_pdo = CANP_CONF__CPA_TPDO_MP + l_int_pdo - 1
-
-			#self.m_logs.warning(f"{l_str_err}.tpdo[{l_int_pdo:#x}]=...")
-			self.pdo_dispatch(
-				i_int_pdo = l_int_pdo,
-				i_bytes_data = i_any_data,
-				i_float_time = i_float_time)
-		elif ((self.m_cls_cnfs is not None and l_int_cobid in self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX]) \
+		elif ((i_cls_cnfs is not None and l_int_cobid in i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX]) \
 			or l_int_cobid in list_CANP_NODE__COB_RPDO):
 			# Rpdo (pdo lookup)
-			l_bool_store = True
+			l_func_ret = canp_node.frame_pdo
 
-			if (self.m_cls_cnfs is not None and l_int_cobid in self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX]):
-				# Same as above, yet shall be cached by the interpreter/compiler
-				try:
-					l_int_pdo = self.m_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX][l_int_cobid]
-					# - except KeyError -
-				except KeyError:
-					pass
+			if (i_cls_cnfs is not None and l_int_cobid in i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX]):
+				l_int_pdo = i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX][l_int_cobid]
 			else:
 				l_int_pdo = l_int_cobid
 				l_int_pdo -= 0x080
@@ -804,327 +1419,832 @@ class canp_node:
 				# CANP_NODE__COB_RPDO3 : (0x400 / 1024) -> 0x1402 / 0x1602
 				# CANP_NODE__COB_RPDO4 : (0x500 / 1280) -> 0x1403 / 0x1603
 				l_int_pdo = CANP_CONF__CPA_RPDO_MP + l_int_pdo - 1
-
-			#self.m_logs.warning(f"{l_str_err}.rsdo[{l_int_pdo:#x}]=...")
-			self.pdo_dispatch(
-				i_int_pdo = l_int_pdo,
-				i_bytes_data = i_any_data,
-				i_float_time = i_float_time)
-		elif ((self.m_cls_cnfs is not None and l_int_cobid == self.m_cls_cnfs.m_list_sdo[CANP_CONF__SDO_TX]) \
+		elif ((i_cls_cnfs is not None and l_int_cobid == i_cls_cnfs.m_list_sdo[CANP_CONF__SDO_TX]) \
 			or l_int_cobid == CANP_NODE__COB_TSDO) and l_int_node != 0:
-			# Tsdo (0x580 / 1408) (conf lookup) -> 0x1200:2
-			if l_int_dlc == CANP_NODE__TSDO__DLC:
-				l_int_cmd = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:1])
-				if l_int_cmd in list_CANP_NODE__TSDO_CMD:
-					l_int_idx = canp_conv.int_bytes(
-						i_bool_bytes = i_any_data[1:3])
-					l_int_sub = canp_conv.int_bytes(
-						i_bool_bytes = i_any_data[3:4])
-					l_int_chk = 0
-
-					# Default state for now
+			l_func_ret = canp_node.frame_tsdo
+		elif ((i_cls_cnfs is not None and l_int_cobid == i_cls_cnfs.m_list_sdo[CANP_CONF__SDO_RX]) \
+			or l_int_cobid == CANP_NODE__COB_RSDO) and l_int_node != 0:
+			l_func_ret = canp_node.frame_rsdo
+		elif l_int_cobid == CANP_NODE__COB_RES2:
+			l_func_ret = canp_node.frame_res2
+		elif l_int_cobid == CANP_NODE__COB_ECP and l_int_node != 0:
+			l_func_ret = canp_node.frame_ecp
+		elif l_int_cobid == CANP_NODE__COB_RES3:
+			l_func_ret = canp_node.frame_res3
+		else:
+			l_func_ret = canp_node.frame_unknown
+
+		return (l_func_ret, l_int_pdo)
+
+	@staticmethod
+	def disp_cobids(
+				i_cls_cnfs: Optional[canp_conf] = None
+			) -> List[int]:
+		""" Cobids depending on a configuration (pdo and sdo lookups)
+		"""
+		l_list_ret: List[int] = []
+
+		if i_cls_cnfs is not None:
+			l_list_ret.extend(i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_TX].keys())
+			l_list_ret.extend(i_cls_cnfs.m_list_pdo[CANP_CONF__PDO_RX].keys())
+			l_list_ret.extend(i_cls_cnfs.m_list_sdo)
+
+		return l_list_ret
+
+	@staticmethod
+	def disp_default(
+			) -> List[Tuple[Callable, int]]:
+		""" Dispatch table without configuration (built once, shared)
+		"""
+		global g_list_disp
+
+		if g_list_disp is None:
+			g_list_disp = [
+				canp_node.disp_entry(None, l_int_cobid)
+				for l_int_cobid in range(CANP_NODE__DISP_SIZE)]
+
+		return g_list_disp
+
+	def disp_build(self,
+				i_list_cobid: Optional[List[int]] = None
+			) -> None:
+		""" Dispatch table (key = cobid, standard identifiers only)
+			Full build if no cobid given, otherwise only the entries of their function codes
+		"""
+		if i_list_cobid is None:
+			if self.m_cls_cnfs is None:
+				# Shared (read only)
+				self.m_list_disp = canp_node.disp_default()
+			else:
+				self.m_list_disp = [
+					canp_node.disp_entry(self.m_cls_cnfs, l_int_cobid)
+					for l_int_cobid in range(CANP_NODE__DISP_SIZE)]
+		else:
+			if self.m_list_disp is None:
+				# Own copy before update
+				self.m_list_disp = list(canp_node.disp_default())
+			elif canp_node.disp_shared(self.m_list_disp) == True:
+				# Own copy before update
+				self.m_list_disp = list(self.m_list_disp)
+
+			canp_node.disp_update(self.m_list_disp, self.m_cls_cnfs, i_list_cobid)
+
+	@staticmethod
+	def disp_update(
+				i_list_disp: List[Tuple[Callable, int]] = [],
+				i_cls_cnfs: Optional[canp_conf] = None,
+				i_list_cobid: List[int] = []
+			) -> None:
+		""" Dispatch table update (entries of the function codes of the cobids)
+		"""
+		l_int_base: int = 0
+
+		for l_int_base in sorted(set(
+				l_int_cobid & ~CANP_ENUM__NODE_MAX
+				for l_int_cobid in i_list_cobid
+				if isinstance(l_int_cobid, int) and 0 <= l_int_cobid < CANP_NODE__DISP_SIZE)):
+			# Whole function code (all node ids)
+			for l_int_cobid in range(l_int_base, l_int_base + CANP_ENUM__NODE_MAX + 1):
+				i_list_disp[l_int_cobid] = canp_node.disp_entry(i_cls_cnfs, l_int_cobid)
+
+	@staticmethod
+	def disp_conf(
+				i_str_file: str = CANP_ENUM__STR_EMPTY
+			) -> List[Tuple[Callable, int]]:
+		""" Dispatch table of a loaded configuration (built once, shared, read only)
+			Same as the table of a node without configuration updated for this one
+		"""
+		l_list_ret: List[Tuple[Callable, int]] = None
+
+		global g_dict_disps
+
+		if g_dict_disps is None:
+			g_dict_disps = {}
+
+		try:
+			# Check if dispatch table already built (key = filename)
+			l_list_ret = g_dict_disps[i_str_file]
+			# - except KeyError - index
+		except KeyError:
+			l_list_ret = list(canp_node.disp_default())
+			canp_node.disp_update(l_list_ret, g_dict_confs[i_str_file], canp_node.disp_cobids(g_dict_confs[i_str_file]))
+			g_dict_disps[i_str_file] = l_list_ret
+
+		return l_list_ret
+
+	@staticmethod
+	def disp_shared(
+				i_list_disp: Optional[List[Tuple[Callable, int]]] = None
+			) -> bool:
+		""" Dispatch table shared between nodes (read only)
+		"""
+		return i_list_disp is g_list_disp \
+			or (g_dict_disps is not None and any(i_list_disp is l_list_disp for l_list_disp in g_dict_disps.values()))
+
+	def frame_parse(self,
+				i_list_frame: List[Any] = [],
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+			) -> bool:
+		""" Frame parser
+			Single lookup into the dispatch table (cobid -> handler, pdo)
+			Returns True if the frame is to be kept in the node raw frames (see 'canp_jour.node_add')
+		"""
+		# [142.844095, 897, b'\x6c\x4e\x00\x00\xfe\xff\xff\xff']
+		# 0 : timestamp (float)
+		# 1 : cobid (int)
+		# 2 : frame (bytearray, dlc = len)
+		l_tuple_disp: Tuple[Callable, int] = None
+		l_bool_store: bool = False
+
+		if len(i_list_frame) >= (CANP_LOG__IDX_DATA + 1):
+			# Via list
+			i_float_time = i_list_frame[CANP_LOG__IDX_TIME]
+			i_int_cobid = i_list_frame[CANP_LOG__IDX_COBID]
+			i_any_data = i_list_frame[CANP_LOG__IDX_DATA]
+		else:
+			# Via args
+			pass
+
+		if self.m_list_disp is None:
+			self.disp_build()
+
+		if 0 <= i_int_cobid < CANP_NODE__DISP_SIZE:
+			l_tuple_disp = self.m_list_disp[i_int_cobid]
+		else:
+			# Extended identifier (not tabulated)
+			l_tuple_disp = canp_node.disp_entry(self.m_cls_cnfs, i_int_cobid)
+
+		l_bool_store = l_tuple_disp[CANP_NODE__DISP_FUNC](
+			self,
+			i_float_time,
+			i_int_cobid,
+			i_any_data,
+			l_tuple_disp[CANP_NODE__DISP_PDO])
+
+		return l_bool_store
+
+	def frame_parse_many(self,
+				i_list_time: List[float] = [],
+				i_list_cobid: List[int] = [],
+				i_list_data: List[bytearray] = []
+			) -> Tuple[List[int], List[int]]:
+		""" Frames parser (batch, same as 'frame_parse' on each frame in order)
+			Pdo frames are decoded per stream in 'CANP_NODE__DECODE_VECT' mode (see 'pdo_many')
+			Returns the positions of the frames that failed (KeyError), and of the frames to keep
+		"""
+		l_list_ret: List[int] = []
+		l_list_keep: List[int] = []
+		l_list_disp: List[Tuple[Callable, int]] = None
+		l_tuple_disp: Tuple[Callable, int] = None
+		l_dict_pdo: Dict[int, List[int]] = {}
+		l_list_store: List[bool] = []
+		l_bool_store: bool = False
+		l_bool_vect: bool = (self.m_int_decode == CANP_NODE__DECODE_VECT)
+
+		if self.m_list_disp is None:
+			self.disp_build()
+
+		l_list_disp = self.m_list_disp
+
+		for l_int_pos, (l_float_time, l_int_cobid, l_any_data) in enumerate(zip(
+				i_list_time,
+				i_list_cobid,
+				i_list_data)):
+			l_bool_store = False
+
+			try:
+				if 0 <= l_int_cobid < CANP_NODE__DISP_SIZE:
+					l_tuple_disp = l_list_disp[l_int_cobid]
+				else:
+					# Extended identifier (not tabulated)
+					l_tuple_disp = canp_node.disp_entry(self.m_cls_cnfs, l_int_cobid)
+
+				if l_bool_vect == True and l_tuple_disp[CANP_NODE__DISP_FUNC] is canp_node.frame_pdo:
+					# Pdo stream (decoded later)
+					l_dict_pdo.setdefault(l_tuple_disp[CANP_NODE__DISP_PDO], []).append(l_int_pos)
 					l_bool_store = True
+				else:
+					if len(l_dict_pdo) > 0 and l_tuple_disp[CANP_NODE__DISP_FUNC] in (canp_node.frame_tsdo, canp_node.frame_rsdo):
+						# Sdo may change the mapping (decode pending pdo frames first)
+						self.pdo_many(l_dict_pdo, i_list_time, i_list_data)
+						l_dict_pdo = {}
+
+					l_bool_store = l_tuple_disp[CANP_NODE__DISP_FUNC](
+						self,
+						l_float_time,
+						l_int_cobid,
+						l_any_data,
+						l_tuple_disp[CANP_NODE__DISP_PDO])
+				# - except KeyError -
+			except KeyError:
+				l_list_ret.append(l_int_pos)
 
-					if l_int_cmd == CANP_NODE__TSDO_RECVX:
-						# 0x41 : Receiving 'x bytes'
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
-						if self.m_int_acc == 0:
-							self.m_int_idx = l_int_idx
-							self.m_int_sub = l_int_sub
-							self.m_int_acc = l_int_data
-						else:
-							self.m_int_acc = 0	# debug
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.tsdo.recvx.unfinished")
-					elif l_int_cmd == CANP_NODE__TSDO_RECV4:
-						# 0x43 : Receive '4 bytes'
-						l_byte_data = i_any_data[4:8]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
+			l_list_store.append(l_bool_store)
+
+		if len(l_dict_pdo) > 0:
+			self.pdo_many(l_dict_pdo, i_list_time, i_list_data)
+
+		l_list_keep = [l_int_pos for l_int_pos, l_bool_store in enumerate(l_list_store) if l_bool_store == True]
+
+		return (l_list_ret, l_list_keep)
+
+	# - Handlers (dispatch table) - - - - - - - - - - - - - - - - - - - - - -
+
+	def frame_nmt(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Nmt (0x000 / 0)
+		"""
+		l_int_cmd: int = 0
+		l_int_nmt: int = 0x0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		# nmt (0x000 / 0)
+		if l_int_dlc == CANP_NODE__NMT__DLC:
+			l_int_cmd = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:1])
+			l_int_nmt = self.nmt_get()
+			if l_int_cmd in list_CANP_NODE__NMT_FSM:
+				if l_int_nmt == 0x0:
+					self.m_logs.info(f"{l_str_err}.nmt.fsm.init")
+					l_int_nmt = l_int_cmd
+					self.nmt_set(l_int_nmt)
+				if l_int_nmt != l_int_cmd:
+					if l_int_cmd in dict_CANP_NODE__NMT_FSM[l_int_nmt]:
+						self.nmt_set(l_int_cmd)
+						# transition() callback
+
+						l_bool_store = True
+					else:
+						self.m_logs.error(f"{l_str_err}.nmt.fsm.error")
+				else:
+					self.m_logs.error(f"{l_str_err}.nmt.fsm.same")
+			else:
+				self.m_logs.error(f"{l_str_err}.nmt.cmd.unlisted")
+		else:
+			self.m_logs.error(f"{l_str_err}.nmt.dlc.mismatch")
+
+		return l_bool_store
+
+	def frame_res1(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Reserved (0x000 / 0, node)
+		"""
+		l_bool_store: bool = False
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_str_err = "node.frame_parse"
+
+		# reserved (0x000 / 0)
+		self.m_logs.info(f"{l_str_err}.res1")
+
+		return l_bool_store
+
+	def frame_sync(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Synchro (0x080 / 128)
+		"""
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		# synchro (0x080 / 128)
+		if l_int_dlc == 0:
+			l_bool_store = True
+		else:
+			self.m_logs.error(f"{l_str_err}.sync.dlc.mismatch")
+
+		return l_bool_store
+
+	def frame_emcy(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Emergency (0x080 / 128, node) -> 0x1014-0x1015
+		"""
+		l_int_data: int = 0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		# emergency (0x080 / 128) -> 0x1014-0x1015
+		if l_int_dlc == CANP_NODE__EMCY__DLC:
+			# EMCY l_error_code
+			l_int_data = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:2])
+			# l_error_register (0x1001:0)
+			l_int_data = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[2:3])
+			# MANUFACTURER l_error_code
+			l_int_data = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[3:8])
+
+			l_bool_store = True
+		else:
+			self.m_logs.error(f"{l_str_err}.emcy.dlc.mismatch")
+
+		return l_bool_store
+
+	def frame_time(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Time (0x100 / 256)
+		"""
+		l_int_data: int = 0
+		l_int_chk: int = 0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		# time (0x100 / 256)
+		if l_int_dlc == CANP_NODE__TIME__DLC:
+			# time (ms since midnight)
+			l_int_data = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:4])
+			self.m_int_time = l_int_data
+			l_int_h = l_int_data // 3600000
+			l_int_m = l_int_data % 3600000
+			l_int_s = l_int_m % 60000
+			l_int_ms = l_int_s % 1000
+			l_int_s = l_int_s // 1000
+			l_int_m = l_int_m // 60000
+			self.m_logs.info(f"{l_str_err}.time.time={l_int_h}h{l_int_m}m{l_int_s}s{l_int_ms}ms")
+
+			# days (since 01/01/84)
+			l_int_data = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[4:6])
+			self.m_int_date = l_int_data
+			l_obj_epoch = date(1984, 1, 1)
+			l_obj_delta = timedelta(days = l_int_data)
+			l_obj_date = l_obj_epoch + l_obj_delta
+			self.m_logs.info(f"{l_str_err}.time.date={l_obj_date.year}y{l_obj_date.month}m{l_obj_date.day}d")
+
+			# byte 6-7 = 0
+			l_int_chk = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[6:8])
+
+			l_bool_store = True
+		else:
+			self.m_logs.error(f"{l_str_err}.time.dlc.mismatch")
+
+		return l_bool_store
+
+	def frame_pdo(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Tpdo/Rpdo (pdo resolved by the dispatch table)
+		"""
+		#self.m_logs.warning(f"node.frame_parse.pdo[{i_int_pdo:#x}]=...")
+		self.pdo_dispatch(
+			i_int_pdo = i_int_pdo,
+			i_bytes_data = i_any_data,
+			i_float_time = i_float_time)
+
+		return True
+
+	def frame_tsdo(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Tsdo (0x580 / 1408) (conf lookup) -> 0x1200:2
+		"""
+		l_byte_data: bytearray = b''
+		l_int_data: int = 0
+		l_int_cmd: int = 0
+		l_int_idx: int = 0
+		l_int_sub: int = 0
+		l_int_chk: int = 0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		if l_int_dlc == CANP_NODE__TSDO__DLC:
+			l_int_cmd = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:1])
+			if l_int_cmd in list_CANP_NODE__TSDO_CMD:
+				l_int_idx = canp_conv.int_bytes(
+					i_bool_bytes = i_any_data[1:3])
+				l_int_sub = canp_conv.int_bytes(
+					i_bool_bytes = i_any_data[3:4])
+				l_int_chk = 0
+
+				# Default state for now
+				l_bool_store = True
+
+				if l_int_cmd == CANP_NODE__TSDO_RECVX:
+					# 0x41 : Receiving 'x bytes'
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+					if self.m_int_acc == 0:
+						self.m_int_idx = l_int_idx
+						self.m_int_sub = l_int_sub
+						self.m_int_acc = l_int_data
+					else:
+						self.m_int_acc = 0	# debug
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.tsdo.recvx.unfinished")
+				elif l_int_cmd == CANP_NODE__TSDO_RECV4:
+					# 0x43 : Receive '4 bytes'
+					l_byte_data = i_any_data[4:8]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					self.obj_store(
+						i_int_idx = l_int_idx,
+						i_int_sub = l_int_sub,
+						i_any_data = l_byte_data,
+						i_float_time = i_float_time)
+				elif l_int_cmd == CANP_NODE__TSDO_RECV3:
+					# 0x47 : Receive '3 bytes'
+					l_byte_data = i_any_data[4:7]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[7:8])
+					if l_int_chk == 0:
 						self.obj_store(
 							i_int_idx = l_int_idx,
 							i_int_sub = l_int_sub,
 							i_any_data = l_byte_data,
 							i_float_time = i_float_time)
-					elif l_int_cmd == CANP_NODE__TSDO_RECV3:
-						# 0x47 : Receive '3 bytes'
-						l_byte_data = i_any_data[4:7]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[7:8])
-						if l_int_chk == 0:
-							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
-								i_float_time = i_float_time)
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.tsdo.recv3.chk")
-					elif l_int_cmd == CANP_NODE__TSDO_RECV2:
-						# 0x4B : Receive '2 bytes'
-						l_byte_data = i_any_data[4:6]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[6:8])
-						if l_int_chk == 0:
-							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
-								i_float_time = i_float_time)
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.tsdo.recv3.chk")
+				elif l_int_cmd == CANP_NODE__TSDO_RECV2:
+					# 0x4B : Receive '2 bytes'
+					l_byte_data = i_any_data[4:6]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[6:8])
+					if l_int_chk == 0:
+						self.obj_store(
+							i_int_idx = l_int_idx,
+							i_int_sub = l_int_sub,
+							i_any_data = l_byte_data,
+							i_float_time = i_float_time)
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.tsdo.recv2.chk")
+				elif l_int_cmd == CANP_NODE__TSDO_RECV1:
+					# 0x4F : Receive '1 byte'
+					l_byte_data = i_any_data[4:5]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[5:8])
+					if l_int_chk == 0:
+						self.obj_store(
+							i_int_idx = l_int_idx,
+							i_int_sub = l_int_sub,
+							i_any_data = l_byte_data,
+							i_float_time = i_float_time)
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.tsdo.recv1.chk")
+				elif l_int_cmd == CANP_NODE__TSDO_SENDACK:
+					# 0x60 : Send ACK
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+					if l_int_chk == 0:
+						self.m_logs.info(f"{l_str_err}.tsdo.sendack")
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.tsdo.sendack.chk")
+				elif l_int_cmd == CANP_NODE__TSDO_SENDERR:
+					# 0x80 : Send ERROR
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+				else:
+					l_bool_store = False
+					self.m_logs.error(f"{l_str_err}.tsdo.cmd.unknown")
+			else:
+				if l_int_cmd >= 0x00 and l_int_cmd <= 0x1F:
+					# 0x00-0x1F : Receiving '...'
+					if l_int_cmd == 0x00:
+						self.m_int_cmd = 0
+						self.m_byte_acc = b''
+
+					if l_int_cmd == self.m_int_cmd:
+						if self.m_int_acc >= 7:
+							self.m_byte_acc.append(
+								i_any_data[1:8])
+							self.m_int_acc -= 7
+						elif self.m_int_acc > 0:
+							self.m_byte_acc.append(
+								i_any_data[1:(self.m_int_acc + 1)])
+							self.m_int_acc = 0
 						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.tsdo.recv2.chk")
-					elif l_int_cmd == CANP_NODE__TSDO_RECV1:
-						# 0x4F : Receive '1 byte'
-						l_byte_data = i_any_data[4:5]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[5:8])
-						if l_int_chk == 0:
+							pass
+
+						if self.m_int_acc == 0:
 							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
+								i_int_idx = self.m_int_idx,
+								i_int_sub = self.m_int_sub,
+								i_any_data = self.m_byte_acc,
 								i_float_time = i_float_time)
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.tsdo.recv1.chk")
-					elif l_int_cmd == CANP_NODE__TSDO_SENDACK:
-						# 0x60 : Send ACK
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
-						if l_int_chk == 0:
-							self.m_logs.info(f"{l_str_err}.tsdo.sendack")
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.tsdo.sendack.chk")
-					elif l_int_cmd == CANP_NODE__TSDO_SENDERR:
-						# 0x80 : Send ERROR
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
+
+						self.m_int_cmd += 1
+						l_bool_store = True
 					else:
-						l_bool_store = False
-						self.m_logs.error(f"{l_str_err}.tsdo.cmd.unknown")
+						self.m_logs.error(f"{l_str_err}.tsdo.recvx.unordered")
+
+					if self.m_int_acc == 0:
+						self.m_int_idx = 0
+						self.m_int_sub = 0
+						self.m_byte_acc = b''
 				else:
-					if l_int_cmd >= 0x00 and l_int_cmd <= 0x1F:
-						# 0x00-0x1F : Receiving '...'
-						if l_int_cmd == 0x00:
-							self.m_int_cmd = 0
-							self.m_byte_acc = b''
-
-						if l_int_cmd == self.m_int_cmd:
-							if self.m_int_acc >= 7:
-								self.m_byte_acc.append(
-									i_any_data[1:8])
-								self.m_int_acc -= 7
-							elif self.m_int_acc > 0:
-								self.m_byte_acc.append(
-									i_any_data[1:(self.m_int_acc + 1)])
-								self.m_int_acc = 0
-							else:
-								pass
+					self.m_logs.error(f"{l_str_err}.tsdo.cmd.unlisted")
+		else:
+			self.m_logs.error(f"{l_str_err}.tsdo.dlc.mismatch")
 
-							if self.m_int_acc == 0:
-								self.obj_store(
-									i_int_idx = self.m_int_idx,
-									i_int_sub = self.m_int_sub,
-									i_any_data = self.m_byte_acc,
-									i_float_time = i_float_time)
+		return l_bool_store
 
-							self.m_int_cmd += 1
-							l_bool_store = True
-						else:
-							self.m_logs.error(f"{l_str_err}.tsdo.recvx.unordered")
+	def frame_rsdo(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Rsdo (0x600 / 1536) (conf lookup) -> 0x1200:1
+		"""
+		l_byte_data: bytearray = b''
+		l_int_data: int = 0
+		l_int_cmd: int = 0
+		l_int_idx: int = 0
+		l_int_sub: int = 0
+		l_int_chk: int = 0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
 
-						if self.m_int_acc == 0:
-							self.m_int_idx = 0
-							self.m_int_sub = 0
-							self.m_byte_acc = b''
-					else:
-						self.m_logs.error(f"{l_str_err}.tsdo.cmd.unlisted")
-			else:
-				self.m_logs.error(f"{l_str_err}.tsdo.dlc.mismatch")
-		elif ((self.m_cls_cnfs is not None \
-				and l_int_cobid == self.m_cls_cnfs.m_list_sdo[CANP_CONF__SDO_RX]) \
-			or l_int_cobid == CANP_NODE__COB_RSDO) and l_int_node != 0:
-			# Rsdo (0x600 / 1536) (conf lookup) -> 0x1200:1
-			if l_int_dlc == CANP_NODE__RSDO__DLC:
-				l_int_cmd = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:1])
-				if l_int_cmd in list_CANP_NODE__RSDO_CMD:
-					l_int_idx = canp_conv.int_bytes(
-						i_bool_bytes = i_any_data[1:3])
-					l_int_sub = canp_conv.int_bytes(
-						i_bool_bytes = i_any_data[3:4])
-					l_int_chk = 0
-
-					# Default state for now
-					l_bool_store = True
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		if l_int_dlc == CANP_NODE__RSDO__DLC:
+			l_int_cmd = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:1])
+			if l_int_cmd in list_CANP_NODE__RSDO_CMD:
+				l_int_idx = canp_conv.int_bytes(
+					i_bool_bytes = i_any_data[1:3])
+				l_int_sub = canp_conv.int_bytes(
+					i_bool_bytes = i_any_data[3:4])
+				l_int_chk = 0
+
+				# Default state for now
+				l_bool_store = True
 
-					if l_int_cmd == CANP_NODE__RSDO_SEND4:
-						# 0x23 : Send '4 bytes'
-						l_byte_data = i_any_data[4:8]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
+				if l_int_cmd == CANP_NODE__RSDO_SEND4:
+					# 0x23 : Send '4 bytes'
+					l_byte_data = i_any_data[4:8]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					self.obj_store(
+						i_int_idx = l_int_idx,
+						i_int_sub = l_int_sub,
+						i_any_data = l_byte_data)
+						# i_float_time = i_float_time)
+				elif l_int_cmd == CANP_NODE__RSDO_SEND3:
+					# 0x27 : Send '3 bytes'
+					l_byte_data = i_any_data[4:7]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[7:8])
+					if l_int_chk == 0:
 						self.obj_store(
 							i_int_idx = l_int_idx,
 							i_int_sub = l_int_sub,
-							i_any_data = l_byte_data)
-							# i_float_time = i_float_time)
-					elif l_int_cmd == CANP_NODE__RSDO_SEND3:
-						# 0x27 : Send '3 bytes'
-						l_byte_data = i_any_data[4:7]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[7:8])
-						if l_int_chk == 0:
-							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
-								i_float_time = i_float_time)
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.send3.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_SEND2:
-						# 0x2B : Send '2 bytes'
-						l_byte_data = i_any_data[4:6]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[6:8])
-						if l_int_chk == 0:
-							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
-								i_float_time = i_float_time)
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.send2.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_SEND1:
-						# 0x2F : Send '1 byte'
-						l_byte_data = i_any_data[4:5]
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = l_byte_data)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[5:8])
-						if l_int_chk == 0:
-							self.obj_store(
-								i_int_idx = l_int_idx,
-								i_int_sub = l_int_sub,
-								i_any_data = l_byte_data,
-								i_float_time = i_float_time)
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.send1.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_RDOBJ:
-						# 0x40 : Read 'object'
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
-						if l_int_chk == 0:
-							self.m_logs.info(f"{l_str_err}.rsdo.rdobj")
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.rdobj.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_RDTGL0:
-						# 0x60 : Read '...' (toggle 0)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
-						if l_int_chk == 0:
-							self.m_logs.info(f"{l_str_err}.rsdo.rdtgl0")
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.rdtgl0.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_RDTGL1:
-						# 0x70 : Read '...' (toggle 1)
-						l_int_chk = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
-						if l_int_chk == 0:
-							self.m_logs.info(f"{l_str_err}.rsdo.rdtgl1")
-						else:
-							l_bool_store = False
-							self.m_logs.error(f"{l_str_err}.rsdo.rdtgl1.chk")
-					elif l_int_cmd == CANP_NODE__RSDO_SENDABRT:
-						# 0x80 : Send ABORT (l_error_code)
-						l_int_data = canp_conv.int_bytes(
-							i_bool_bytes = i_any_data[4:8])
+							i_any_data = l_byte_data,
+							i_float_time = i_float_time)
 					else:
 						l_bool_store = False
-						self.m_logs.error(f"{l_str_err}.rsdo.cmd.unknown")
-				else:
-					self.m_logs.error(f"{l_str_err}.rsdo.cmd.unlisted")
-			else:
-				self.m_logs.error(f"{l_str_err}.rsdo.dlc.mismatch")
-		elif l_int_cobid == CANP_NODE__COB_RES2:
-			# reserved (0x680 / 1664)
-			# May be be configured as PDO (aka 0x1815:TPDOXpar / 0x1A15:TPDOXmap)
-			self.m_logs.error(f"{l_str_err}.res2 (unmapped xpdo?)")
-			# TODO
-		elif l_int_cobid == CANP_NODE__COB_ECP and l_int_node != 0:
-			# ecp (0x700 / 1792) -> 0x1016-0x1017
-			if l_int_dlc == CANP_NODE__ECP__DLC:
-				l_int_cmd = canp_conv.int_bytes(
-					i_bool_bytes = i_any_data[0:1])
-				if l_int_cmd >= CANP_NODE__ECP_TOGGLE:
-					# 0x8x : Toggle (at each Tx)
-					l_int_cmd -= CANP_NODE__ECP_TOGGLE
-					l_bool_toggle = True
-					# TODO : handle toggle bit
-				if l_int_cmd in list_CANP_NODE__ECP_CMD:
-					l_bool_store = True
-					if l_int_cmd == CANP_NODE__ECP_BOOT:
-						# 0x00 : Bootup
-						self.m_logs.warning(f"{l_str_err}.ecp.cmd.bootup")
-						pass
-						# TODO
-					elif l_int_cmd == CANP_NODE__ECP_STOP:
-						# 0x04 : Stopped
-						self.m_logs.warning(f"{l_str_err}.ecp.cmd.stop")
-						pass
-						# TODO
-					elif l_int_cmd == CANP_NODE__ECP_OP:
-						# 0x05 : Operational
-						self.m_logs.warning(f"{l_str_err}.ecp.cmd.op")
-						pass
-						# TODO
-					elif l_int_cmd == CANP_NODE__ECP_PREOP:
-						# 0x7F : Pre-operational
-						self.m_logs.warning(f"{l_str_err}.ecp.cmd.preop")
-						pass
-						# TODO
+						self.m_logs.error(f"{l_str_err}.rsdo.send3.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_SEND2:
+					# 0x2B : Send '2 bytes'
+					l_byte_data = i_any_data[4:6]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[6:8])
+					if l_int_chk == 0:
+						self.obj_store(
+							i_int_idx = l_int_idx,
+							i_int_sub = l_int_sub,
+							i_any_data = l_byte_data,
+							i_float_time = i_float_time)
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.rsdo.send2.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_SEND1:
+					# 0x2F : Send '1 byte'
+					l_byte_data = i_any_data[4:5]
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = l_byte_data)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[5:8])
+					if l_int_chk == 0:
+						self.obj_store(
+							i_int_idx = l_int_idx,
+							i_int_sub = l_int_sub,
+							i_any_data = l_byte_data,
+							i_float_time = i_float_time)
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.rsdo.send1.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_RDOBJ:
+					# 0x40 : Read 'object'
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+					if l_int_chk == 0:
+						self.m_logs.info(f"{l_str_err}.rsdo.rdobj")
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.rsdo.rdobj.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_RDTGL0:
+					# 0x60 : Read '...' (toggle 0)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+					if l_int_chk == 0:
+						self.m_logs.info(f"{l_str_err}.rsdo.rdtgl0")
+					else:
+						l_bool_store = False
+						self.m_logs.error(f"{l_str_err}.rsdo.rdtgl0.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_RDTGL1:
+					# 0x70 : Read '...' (toggle 1)
+					l_int_chk = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
+					if l_int_chk == 0:
+						self.m_logs.info(f"{l_str_err}.rsdo.rdtgl1")
 					else:
 						l_bool_store = False
-						self.m_logs.error(f"{l_str_err}.ecp.cmd.unknown")
+						self.m_logs.error(f"{l_str_err}.rsdo.rdtgl1.chk")
+				elif l_int_cmd == CANP_NODE__RSDO_SENDABRT:
+					# 0x80 : Send ABORT (l_error_code)
+					l_int_data = canp_conv.int_bytes(
+						i_bool_bytes = i_any_data[4:8])
 				else:
-					self.m_logs.error(f"{l_str_err}.ecp.cmd.unlisted")
+					l_bool_store = False
+					self.m_logs.error(f"{l_str_err}.rsdo.cmd.unknown")
 			else:
-				self.m_logs.error(f"{l_str_err}.ecp.dlc.mismatch")
-		elif l_int_cobid == CANP_NODE__COB_RES3:
-			# reserved (0x780 / 1920)
-			self.m_logs.error(f"{l_str_err}.res3 (unmapped xpdo?)")
+				self.m_logs.error(f"{l_str_err}.rsdo.cmd.unlisted")
 		else:
-			# unknown COBID
-			self.m_logs.error(f"{l_str_err}.cobid.unknown")
+			self.m_logs.error(f"{l_str_err}.rsdo.dlc.mismatch")
 
-		if l_bool_store == True:
-			l_any_data: Any = (i_int_cobid, i_any_data)
-			try:
-				# Store raw data (key = timestamp, beware of overwrite)
-				self.m_dict_raws[i_float_time] = l_any_data
-				# - except KeyError - index
-				# - except TypeError - None
-			except TypeError:
-				# Create dict
-				self.m_dict_raws = {i_float_time: l_any_data}
+		return l_bool_store
+
+	def frame_res2(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Reserved (0x680 / 1664)
+		"""
+		l_bool_store: bool = False
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_str_err = "node.frame_parse"
+
+		# reserved (0x680 / 1664)
+		# May be be configured as PDO (aka 0x1815:TPDOXpar / 0x1A15:TPDOXmap)
+		self.m_logs.error(f"{l_str_err}.res2 (unmapped xpdo?)")
+		# TODO
+
+		return l_bool_store
+
+	def frame_ecp(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Ecp (0x700 / 1792) -> 0x1016-0x1017
+		"""
+		l_bool_toggle: bool = False
+		l_int_cmd: int = 0
+		l_bool_store: bool = False
+		l_int_dlc: int = 0
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_int_dlc = len(i_any_data)
+		l_str_err = "node.frame_parse"
+
+		# ecp (0x700 / 1792) -> 0x1016-0x1017
+		if l_int_dlc == CANP_NODE__ECP__DLC:
+			l_int_cmd = canp_conv.int_bytes(
+				i_bool_bytes = i_any_data[0:1])
+			if l_int_cmd >= CANP_NODE__ECP_TOGGLE:
+				# 0x8x : Toggle (at each Tx)
+				l_int_cmd -= CANP_NODE__ECP_TOGGLE
+				l_bool_toggle = True
+				# TODO : handle toggle bit
+			if l_int_cmd in list_CANP_NODE__ECP_CMD:
+				l_bool_store = True
+				if l_int_cmd == CANP_NODE__ECP_BOOT:
+					# 0x00 : Bootup
+					self.m_logs.warning(f"{l_str_err}.ecp.cmd.bootup")
+					pass
+					# TODO
+				elif l_int_cmd == CANP_NODE__ECP_STOP:
+					# 0x04 : Stopped
+					self.m_logs.warning(f"{l_str_err}.ecp.cmd.stop")
+					pass
+					# TODO
+				elif l_int_cmd == CANP_NODE__ECP_OP:
+					# 0x05 : Operational
+					self.m_logs.warning(f"{l_str_err}.ecp.cmd.op")
+					pass
+					# TODO
+				elif l_int_cmd == CANP_NODE__ECP_PREOP:
+					# 0x7F : Pre-operational
+					self.m_logs.warning(f"{l_str_err}.ecp.cmd.preop")
+					pass
+					# TODO
+				else:
+					l_bool_store = False
+					self.m_logs.error(f"{l_str_err}.ecp.cmd.unknown")
+			else:
+				self.m_logs.error(f"{l_str_err}.ecp.cmd.unlisted")
+		else:
+			self.m_logs.error(f"{l_str_err}.ecp.dlc.mismatch")
+
+		return l_bool_store
+
+	def frame_res3(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Reserved (0x780 / 1920)
+		"""
+		l_bool_store: bool = False
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_str_err = "node.frame_parse"
+
+		# reserved (0x780 / 1920)
+		self.m_logs.error(f"{l_str_err}.res3 (unmapped xpdo?)")
+
+		return l_bool_store
+
+	def frame_unknown(self,
+				i_float_time: float = 0.0,
+				i_int_cobid: int = 0,
+				i_any_data: bytearray = b'',
+				i_int_pdo: int = 0
+			) -> bool:
+		""" Unknown cobid
+		"""
+		l_bool_store: bool = False
+		l_str_err: str = CANP_ENUM__STR_EMPTY
+
+		l_str_err = "node.frame_parse"
+
+		# unknown COBID
+		self.m_logs.error(f"{l_str_err}.cobid.unknown")
+
+		return l_bool_store
 
 #  --- MAIN ---
 
@@ -1136,6 +2256,12 @@ def __main__(i_list_args: List = []):
 		EDS_FILE = "PAC-P3_v1.0.eds"
 		caneton = canp_node()
 		caneton.conf_load(i_str_file = EDS_FILE)
+
+		print("--- PDO BITS ---")
+		# TPDO2 : 0x6041 (16 bits), 0x2000.1 (4 bits), 0x2000.2 (12 bits, not byte aligned)
+		caneton.frame_parse(i_list_frame = [0.0, 0x000, bytearray(b"\x01\x00")])
+		caneton.frame_parse(i_list_frame = [1.0, 0x281, bytearray(b"\x34\x12\xFA\xFF")])
+		print(f"0x6041 : {caneton[0x6041][0].m_obj_hist[-1]}, 0x2000.1 : {caneton[0x2000][1].m_obj_hist[-1]}, 0x2000.2 : {caneton[0x2000][2].m_obj_hist[-1]} (4095 expected)")
 	else:
 		pass
 
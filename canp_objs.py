@@ -0,0 +1,440 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_objs.py
+	Objects
+	Object dictionary, flat table keyed by (index << 8) | sub-index
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+#from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__HEAD_DATA
+from canp_enum import CANP_ENUM__HEAD_LIST
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__VAL_DEFAULT
+
+from canp_enum import enum_TYPE
+
+
+from canp_hist import canp_hist
+
+
+from canp_args import canp_args
+
+#  --- GLOBAL ---
+
+# Key of (index, sub-index)
+CANP_OBJS__SUB_BITS = 8
+CANP_OBJS__SUB_MASK = 0xFF
+
+#  --- CLASS ---
+
+class canp_objs:
+	""" Object dictionary
+		Entries in one flat dict (key = (index << 8) | sub-index), one probe per object
+		Index headers (sub-index CANP_ENUM__VAL_DEFAULT) kept aside
+		'objs[index][sub-index]' still works through a thin view (see 'canp_objs_view')
+		Layered over a base table if any (read only, shared), entries stored here hide the base ones
+		Indexes and sub-indexes of the base come first, then the ones only stored here
+	"""
+
+	# Entries (key = (index << 8) | sub-index)
+	m_dict_ents: Optional[Dict[int, Any]] = None
+	# Sub-indexes (key = index, in order of creation)
+	m_dict_subs: Optional[Dict[int, List[int]]] = None
+	# Index headers (key = index)
+	m_dict_head: Optional[Dict[int, Any]] = None
+	# Base table (read only, None if not layered)
+	m_cls_base: Optional["canp_objs"] = None
+
+	def __init__(self,
+				i_cls_base: Optional["canp_objs"] = None,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+		"""
+		super().__init__(**i_dict_args)
+
+		self.m_dict_ents = {}
+		self.m_dict_subs = {}
+		self.m_dict_head = {}
+		self.m_cls_base = i_cls_base
+
+	def __getitem__(self,
+				i_int_idx: int = 0
+			) -> "canp_objs_view":
+		""" Get at (key = object index, KeyError if absent)
+		"""
+		if i_int_idx not in self:
+			raise KeyError(i_int_idx)
+
+		return canp_objs_view(self, i_int_idx)
+
+	def __len__(self) -> int:
+		""" Size of (number of indexes)
+		"""
+		return len(self.keys())
+
+	def __contains__(self,
+				i_int_idx: int = 0
+			) -> bool:
+		""" Index present
+		"""
+		return i_int_idx in self.m_dict_subs or (self.m_cls_base is not None and i_int_idx in self.m_cls_base)
+
+	def __iter__(self) -> Iterator[int]:
+		""" Iterator of indexes (in order of creation)
+		"""
+		return iter(self.keys())
+
+	def keys(self) -> Any:
+		""" Indexes (in order of creation, base first)
+		"""
+		l_any_ret: Any = None
+
+		if self.m_cls_base is None:
+			l_any_ret = self.m_dict_subs.keys()
+		else:
+			l_any_ret = list(self.m_cls_base.keys())
+			l_any_ret.extend(l_int_idx for l_int_idx in self.m_dict_subs if l_int_idx not in self.m_cls_base)
+
+		return l_any_ret
+
+	def items(self) -> Iterator[Tuple[int, "canp_objs_view"]]:
+		""" Iterator of (index, view)
+		"""
+		return ((l_int_idx, canp_objs_view(self, l_int_idx)) for l_int_idx in self.keys())
+
+	@staticmethod
+	def key(
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> int:
+		""" Entry key (index, sub-index)
+		"""
+		return (i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub
+
+	def ent_get(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> Any:
+		""" Entry (KeyError if absent, index header if sub-index is CANP_ENUM__VAL_DEFAULT)
+		"""
+		l_any_ret: Any = None
+
+		try:
+			if i_int_sub == CANP_ENUM__VAL_DEFAULT:
+				l_any_ret = self.m_dict_head[i_int_idx]
+			else:
+				l_any_ret = self.m_dict_ents[(i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub]
+			# - except KeyError -
+		except KeyError:
+			if self.m_cls_base is None:
+				raise
+
+			l_any_ret = self.m_cls_base.ent_get(i_int_idx, i_int_sub)
+
+		return l_any_ret
+
+	def ent_set(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0,
+				i_any_ent: Any = None
+			) -> Any:
+		""" Entry storing (returned)
+		"""
+		l_list_subs: List[int] = self.m_dict_subs.setdefault(i_int_idx, [])
+
+		if i_int_sub == CANP_ENUM__VAL_DEFAULT:
+			self.m_dict_head[i_int_idx] = i_any_ent
+		else:
+			if i_int_sub < 0 or i_int_sub > CANP_OBJS__SUB_MASK:
+				raise KeyError(i_int_sub)
+
+			l_int_key = (i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub
+			if l_int_key not in self.m_dict_ents:
+				l_list_subs.append(i_int_sub)
+
+			self.m_dict_ents[l_int_key] = i_any_ent
+
+		return i_any_ent
+
+	def ent_list(self,
+				i_int_idx: int = 0
+			) -> List[int]:
+		""" Sub-indexes of an index (KeyError if absent, header not included, base first)
+		"""
+		l_list_ret: List[int] = None
+
+		if self.m_cls_base is None or i_int_idx not in self.m_cls_base:
+			l_list_ret = self.m_dict_subs[i_int_idx]
+		else:
+			l_list_ret = list(self.m_cls_base.ent_list(i_int_idx))
+			l_list_ret.extend(
+				l_int_sub for l_int_sub in self.m_dict_subs.get(i_int_idx, [])
+				if ((i_int_idx << CANP_OBJS__SUB_BITS) | l_int_sub) not in self.m_cls_base.m_dict_ents)
+
+		return l_list_ret
+
+	def ent_own(self,
+				i_int_idx: int = 0,
+				i_int_sub: int = 0
+			) -> bool:
+		""" Entry stored in this table (not read from the base)
+		"""
+		return ((i_int_idx << CANP_OBJS__SUB_BITS) | i_int_sub) in self.m_dict_ents
+
+class canp_objs_view:
+	""" Object index (view over 'canp_objs', nothing copied)
+		Read as the former dict of sub-indexes, CANP_ENUM__VAL_DEFAULT first if the index has a header
+	"""
+
+	__slots__ = ("m_cls_objs", "m_int_idx")
+
+	def __init__(self,
+				i_cls_objs: canp_objs,
+				i_int_idx: int = 0
+			) -> None:
+		""" Constructor
+		"""
+		self.m_cls_objs = i_cls_objs
+		self.m_int_idx = i_int_idx
+
+	def __getitem__(self,
+				i_int_sub: int = 0
+			) -> Any:
+		""" Get at (key = sub-index, KeyError if absent)
+		"""
+		return self.m_cls_objs.ent_get(self.m_int_idx, i_int_sub)
+
+	def __setitem__(self,
+				i_int_sub: int = 0,
+				i_any_ent: Any = None
+			) -> None:
+		""" Set at (key = sub-index)
+		"""
+		self.m_cls_objs.ent_set(self.m_int_idx, i_int_sub, i_any_ent)
+
+	def __len__(self) -> int:
+		""" Size of (number of sub-indexes, header included)
+		"""
+		return len(self.keys())
+
+	def __contains__(self,
+				i_int_sub: int = 0
+			) -> bool:
+		""" Sub-index present
+		"""
+		l_bool_ret: bool = False
+
+		try:
+			self.m_cls_objs.ent_get(self.m_int_idx, i_int_sub)
+			# - except KeyError -
+			l_bool_ret = True
+		except KeyError:
+			pass
+
+		return l_bool_ret
+
+	def __iter__(self) -> Iterator[int]:
+		""" Iterator of sub-indexes
+		"""
+		return iter(self.keys())
+
+	def keys(self) -> List[int]:
+		""" Sub-indexes (header first)
+		"""
+		l_list_ret: List[int] = []
+
+		if self.m_int_idx in self.m_cls_objs.m_dict_head:
+			l_list_ret.append(CANP_ENUM__VAL_DEFAULT)
+
+		l_list_ret.extend(self.m_cls_objs.ent_list(self.m_int_idx))
+
+		return l_list_ret
+
+	def values(self) -> Iterator[Any]:
+		""" Iterator of entries
+		"""
+		return (self.m_cls_objs.ent_get(self.m_int_idx, l_int_sub) for l_int_sub in self.keys())
+
+	def items(self) -> Iterator[Tuple[int, Any]]:
+		""" Iterator of (sub-index, entry)
+		"""
+		return ((l_int_sub, self.m_cls_objs.ent_get(self.m_int_idx, l_int_sub)) for l_int_sub in self.keys())
+
+	def get(self,
+				i_int_sub: int = 0,
+				i_any_def: Any = None
+			) -> Any:
+		""" Get at (default if absent)
+		"""
+		l_any_ret: Any = i_any_def
+
+		try:
+			l_any_ret = self.m_cls_objs.ent_get(self.m_int_idx, i_int_sub)
+			# - except KeyError -
+		except KeyError:
+			pass
+
+		return l_any_ret
+
+class canp_objs_ent:
+	""" Object entry (node side)
+		Last value, data type, history and configuration entry in slots
+		Read as the former dict (CANP_ENUM__HEAD_LIST, then CANP_ENUM__HEAD_DATA once stored)
+	"""
+
+	__slots__ = ("m_any_data", "m_any_typ", "m_obj_hist", "m_any_conf")
+
+	def __init__(self,
+				i_any_typ: Any = None,
+				i_any_conf: Any = None
+			) -> None:
+		""" Constructor
+			'i_any_typ' : DataType of the object (history typecode, None if unknown)
+			'm_any_data' is left unset until the first value is stored
+		"""
+		self.m_any_typ = i_any_typ
+		self.m_obj_hist = canp_hist(i_any_typ)
+		self.m_any_conf = i_any_conf
+
+	def copy(self) -> "canp_objs_ent":
+		""" Copy (own history, see 'canp_objs.m_cls_base')
+		"""
+		l_obj_ret: canp_objs_ent = canp_objs_ent(self.m_any_typ, self.m_any_conf)
+
+		l_obj_ret.m_obj_hist.extend_cols(self.m_obj_hist.list_time(), self.m_obj_hist.list_vals())
+
+		if hasattr(self, "m_any_data"):
+			l_obj_ret.m_any_data = self.m_any_data
+
+		return l_obj_ret
+
+	def __getitem__(self,
+				i_str_key: str = CANP_ENUM__HEAD_DATA
+			) -> Any:
+		""" Get at (CANP_ENUM__HEAD_DATA or CANP_ENUM__HEAD_LIST, KeyError if absent)
+		"""
+		l_any_ret: Any = None
+
+		if i_str_key == CANP_ENUM__HEAD_LIST:
+			l_any_ret = self.m_obj_hist
+		elif i_str_key == CANP_ENUM__HEAD_DATA:
+			try:
+				l_any_ret = self.m_any_data
+				# - except AttributeError - not stored yet
+			except AttributeError:
+				raise KeyError(i_str_key)
+		else:
+			raise KeyError(i_str_key)
+
+		return l_any_ret
+
+	def __setitem__(self,
+				i_str_key: str = CANP_ENUM__HEAD_DATA,
+				i_any_val: Any = None
+			) -> None:
+		""" Set at (CANP_ENUM__HEAD_DATA or CANP_ENUM__HEAD_LIST)
+		"""
+		if i_str_key == CANP_ENUM__HEAD_LIST:
+			self.m_obj_hist = i_any_val
+		elif i_str_key == CANP_ENUM__HEAD_DATA:
+			self.m_any_data = i_any_val
+		else:
+			raise KeyError(i_str_key)
+
+	def __contains__(self,
+				i_str_key: str = CANP_ENUM__HEAD_DATA
+			) -> bool:
+		""" Key present
+		"""
+		return i_str_key in self.keys()
+
+	def keys(self) -> List[str]:
+		""" Keys (CANP_ENUM__HEAD_DATA only once stored)
+		"""
+		l_list_ret: List[str] = [CANP_ENUM__HEAD_LIST]
+
+		if hasattr(self, "m_any_data"):
+			l_list_ret.append(CANP_ENUM__HEAD_DATA)
+
+		return l_list_ret
+
+	def items(self) -> Iterator[Tuple[str, Any]]:
+		""" Iterator of (key, value)
+		"""
+		return ((l_str_key, self[l_str_key]) for l_str_key in self.keys())
+
+	def get(self,
+				i_str_key: str = CANP_ENUM__HEAD_DATA,
+				i_any_def: Any = None
+			) -> Any:
+		""" Get at (default if absent)
+		"""
+		l_any_ret: Any = i_any_def
+
+		try:
+			l_any_ret = self[i_str_key]
+			# - except KeyError -
+		except KeyError:
+			pass
+
+		return l_any_ret
+
+	def __repr__(self) -> str:
+		""" Representation (as the former dict)
+		"""
+		return repr(dict(self.items()))
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	if True:
+		print("--- OBJECTS ---")
+		l_cls_objs = canp_objs()
+		l_obj_ent = l_cls_objs.ent_set(0x6064, 0, canp_objs_ent(enum_TYPE.Integer32))
+		l_obj_ent.m_any_data = 1234
+		l_obj_ent.m_obj_hist.append((0.1, 1234))
+		print(f"{len(l_cls_objs)} index, key {canp_objs.key(0x6064, 0):#x} : {l_cls_objs[0x6064][0]}")
+		print(f"entry {sys.getsizeof(l_obj_ent)} bytes, former dict {sys.getsizeof({CANP_ENUM__HEAD_LIST: None, CANP_ENUM__HEAD_DATA: None})} bytes")
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -0,0 +1,609 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_pool.py
+	Pool
+	Multi-process log parsing (chunked loading, node streams decoded by frame ranges)
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import Any
+#from typing import Callable
+from typing import Dict
+from typing import List
+#from typing import Optional
+from typing import Set
+from typing import Tuple
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__NODE_MAX
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+
+from canp_enum import CANP_ENUM__VAL_DEFAULT
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__BLOCK_SIZE
+from canp_load import CANP_LOAD__COL_CHAN
+from canp_load import CANP_LOAD__COL_COBID
+from canp_load import CANP_LOAD__COL_DATA
+from canp_load import CANP_LOAD__COL_DLC
+from canp_load import CANP_LOAD__COL_TIME
+from canp_load import CANP_LOAD__DTYPE_FRAME
+
+
+from canp_hist import canp_hist
+
+from canp_hist import CANP_HIST__KEEP_NONE
+
+
+from canp_node import canp_node
+
+from canp_node import CANP_NODE__COB_NMT
+from canp_node import CANP_NODE__COB_SYNC
+from canp_node import CANP_NODE__DECODE_LAZY
+from canp_node import CANP_NODE__DISP_FUNC
+from canp_node import CANP_NODE__DISP_SIZE
+from canp_node import CANP_NODE__NMT__DLC
+from canp_node import CANP_NODE__PDO_STORE
+
+
+from canp_objs import CANP_OBJS__SUB_BITS
+from canp_objs import CANP_OBJS__SUB_MASK
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Node of broadcast frames
+CANP_POOL__NODE_ALL = 0
+
+# Frames of a node stream range (streams cut in ranges past twice as many)
+CANP_POOL__RANGE_MIN = 4096
+
+# Range task fields (see 'node_ranges')
+CANP_POOL__RANGE_WARM = 0			# State frames before the range (no pdo)
+CANP_POOL__RANGE_FRAME = 1			# Frames of the range
+CANP_POOL__RANGE_BEG = 2			# First frame (position in the node stream)
+
+#  --- CLASS ---
+
+class canp_pool:
+	""" CAN multi-process parser
+	"""
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("pool")
+
+	@staticmethod
+	def jobs_count(
+				i_int_jobs: int = 0
+			) -> int:
+		""" Number of processes (0 = all cores)
+		"""
+		l_int_ret: int = i_int_jobs
+
+		if l_int_ret <= 0:
+			l_int_ret = os.cpu_count() or 1
+
+		return l_int_ret
+
+	@staticmethod
+	def list_chunk(
+				i_str_file: str,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> List[Tuple[int, int]]:
+		""" Byte ranges [start, stop[ cut at line boundaries
+		"""
+		l_list_ret: List[Tuple[int, int]] = []
+		l_int_size = os.path.getsize(i_str_file)
+		l_int_start = 0
+
+		with open(i_str_file, "rb") as l_obj_file:
+			while l_int_start < l_int_size:
+				l_int_stop = l_int_start + i_int_block
+				if l_int_stop < l_int_size:
+					# Move to the next line start
+					l_obj_file.seek(l_int_stop)
+					l_int_stop += len(l_obj_file.readline())
+				else:
+					l_int_stop = l_int_size
+
+				l_list_ret.append((l_int_start, l_int_stop))
+				l_int_start = l_int_stop
+
+		return l_list_ret
+
+	@staticmethod
+	def narr_chunk(
+				i_tuple_args: Tuple[str, int, int]
+			) -> Any:
+		""" Frames from one byte range (worker side)
+		"""
+		l_str_file, l_int_start, l_int_stop = i_tuple_args
+
+		with open(l_str_file, "rb") as l_obj_file:
+			l_obj_file.seek(l_int_start)
+			l_bytes_block = l_obj_file.read(l_int_stop - l_int_start)
+
+		return canp_load.narr_block(l_bytes_block)
+
+	@staticmethod
+	def log_narr(
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_int_jobs: int = 0,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> Any:
+		""" Log loader (candump format, chunks loaded in parallel)
+			Records are merged back in timestamp order
+		"""
+		l_narr_ret: Any = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			l_list_chunk = [
+				(i_str_file, l_int_start, l_int_stop)
+				for l_int_start, l_int_stop in canp_pool.list_chunk(i_str_file, i_int_block)]
+
+			if len(l_list_chunk) > 1 and canp_pool.jobs_count(i_int_jobs) > 1:
+				with ProcessPoolExecutor(max_workers = canp_pool.jobs_count(i_int_jobs)) as l_obj_pool:
+					l_list_narr = list(l_obj_pool.map(canp_pool.narr_chunk, l_list_chunk))
+			else:
+				l_list_narr = [canp_pool.narr_chunk(l_tuple_chunk) for l_tuple_chunk in l_list_chunk]
+
+			if len(l_list_narr) > 0:
+				l_narr_ret = np.concatenate(l_list_narr)
+				l_narr_ret = l_narr_ret[np.argsort(l_narr_ret[CANP_LOAD__COL_TIME], kind = "stable")]
+		else:
+			canp_pool.m_logs.error(f"pool.log_narr.file[{i_str_file}].unknown")
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_node(
+				i_narr_frame: Any
+			) -> Any:
+		""" Target node of each frame (same rules as 'canp_chan.frame_parse')
+			CANP_POOL__NODE_ALL for broadcast frames (nmt to all, sync)
+		"""
+		l_narr_cobid = i_narr_frame[CANP_LOAD__COL_COBID]
+		l_narr_dlc = i_narr_frame[CANP_LOAD__COL_DLC]
+
+		l_narr_ret = (l_narr_cobid & CANP_ENUM__NODE_MAX).astype(np.int32)
+
+		# Nmt : node from frame (byte 1)
+		l_narr_nmt = (l_narr_cobid == CANP_NODE__COB_NMT) & (l_narr_dlc == CANP_NODE__NMT__DLC)
+		l_narr_ret[l_narr_nmt] = i_narr_frame[CANP_LOAD__COL_DATA][l_narr_nmt, 1]
+
+		return l_narr_ret
+
+	@staticmethod
+	def narr_bcast(
+				i_narr_frame: Any,
+				i_narr_node: Any
+			) -> Any:
+		""" Broadcast frames mask (nmt to all, sync)
+		"""
+		l_narr_cobid = i_narr_frame[CANP_LOAD__COL_COBID]
+		l_narr_dlc = i_narr_frame[CANP_LOAD__COL_DLC]
+
+		return (i_narr_node == CANP_POOL__NODE_ALL) & (
+			((l_narr_cobid == CANP_NODE__COB_NMT) & (l_narr_dlc == CANP_NODE__NMT__DLC))
+			| ((l_narr_cobid == CANP_NODE__COB_SYNC) & (l_narr_dlc == 0)))
+
+	@staticmethod
+	def node_work(
+				i_tuple_args: Tuple[Any, Any]
+			) -> Any:
+		""" Node decoding (worker side)
+			Frames are parsed in order, the node state (nmt, sdo, pdo mapping) follows
+			Returns the node and the positions of the frames it keeps (see 'canp_jour.node_add')
+		"""
+		l_list_kept: List[int] = []
+
+		l_obj_node, l_narr_frame = i_tuple_args
+
+		l_list_frame = canp_pool.list_frame(l_narr_frame)
+		if len(l_list_frame) > 0:
+			_, l_list_kept = l_obj_node.frame_parse_many(*zip(*l_list_frame))
+
+		# Shared configuration is linked back by the caller (not sent back)
+		l_obj_node.m_cls_cnfs = None
+
+		return (l_obj_node, l_list_kept)
+
+	@staticmethod
+	def node_ranges(
+				i_obj_node: Any,
+				i_narr_frame: Any,
+				i_int_ranges: int = 1
+			) -> List[Tuple[Any, Any, int]]:
+		""" Node stream cut in 'i_int_ranges' frame ranges
+			Each range comes with the state frames before it (all but pdo), replayed first by its worker
+			Returns [(state frames, range frames, first frame), ...]
+		"""
+		l_list_ret: List[Tuple[Any, Any, int]] = []
+		l_list_beg: List[int] = [0]
+		l_int_len: int = len(i_narr_frame)
+
+		if i_int_ranges > 1:
+			l_list_beg.extend(sorted(set(
+				(l_int_range * l_int_len) // i_int_ranges
+				for l_int_range in range(1, i_int_ranges))))
+
+			# State frames (pdo frames only feed histories, see 'canp_node.pdo_many')
+			if i_obj_node.m_list_disp is None:
+				i_obj_node.disp_build()
+
+			l_narr_pdo = np.array([
+				l_tuple_disp[CANP_NODE__DISP_FUNC] is canp_node.frame_pdo
+				for l_tuple_disp in i_obj_node.m_list_disp])
+			l_narr_cobid = i_narr_frame[CANP_LOAD__COL_COBID]
+			l_narr_state = (l_narr_cobid >= CANP_NODE__DISP_SIZE) \
+				| ~l_narr_pdo[np.minimum(l_narr_cobid, CANP_NODE__DISP_SIZE - 1)]
+		else:
+			l_narr_state = np.zeros(l_int_len, dtype = bool)
+
+		for l_int_beg, l_int_end in zip(l_list_beg, l_list_beg[1:] + [l_int_len]):
+			l_list_ret.append((
+				i_narr_frame[:l_int_beg][l_narr_state[:l_int_beg]],
+				i_narr_frame[l_int_beg:l_int_end],
+				l_int_beg))
+
+		return l_list_ret
+
+	@staticmethod
+	def range_work(
+				i_tuple_args: Tuple[Any, Any, Any, bool, bool]
+			) -> Any:
+		""" Node range decoding (worker side)
+			State frames before the range replayed first (sdo, nmt, pdo mapping), then the range in order
+			Histories restart with the range (retention left to the caller, see 'node_merge')
+			Returns the node (last range only, histories left to the caller),
+			the history of each object over the range {key : (times, values)},
+			the positions of the frames kept, and whether pdo frames store mapping objects
+		"""
+		l_dict_hist: Dict[int, Tuple[List[float], List[Any]]] = {}
+		l_set_own: Set[int] = set()
+		l_list_kept: List[int] = []
+		l_tuple_keep: Tuple[int, float, int] = CANP_HIST__KEEP_NONE
+		l_dict_keep: Any = None
+		l_obj_base: Any = None
+		l_int_pos: int = 0
+		l_bool_store: bool = False
+
+		l_obj_node, l_narr_warm, l_narr_frame, l_bool_first, l_bool_last = i_tuple_args
+
+		if l_bool_first == False:
+			l_list_frame = canp_pool.list_frame(l_narr_warm)
+			if len(l_list_frame) > 0:
+				l_obj_node.frame_parse_many(*zip(*l_list_frame))
+
+			# Values of the previous ranges dropped, none trimmed meanwhile (counted from here)
+			l_tuple_keep, l_dict_keep = l_obj_node.m_tuple_keep, l_obj_node.m_dict_keep
+			l_obj_node.m_tuple_keep, l_obj_node.m_dict_keep = CANP_HIST__KEEP_NONE, None
+
+			if l_obj_node.m_cls_objs is not None:
+				l_obj_base = l_obj_node.m_cls_objs.m_cls_base
+				for l_int_key, l_obj_ent in l_obj_node.m_cls_objs.m_dict_ents.items():
+					l_obj_ent.m_obj_hist = type(l_obj_ent.m_obj_hist)(l_obj_ent.m_any_typ)
+					l_set_own.add(l_int_key)
+
+		l_list_frame = canp_pool.list_frame(l_narr_frame)
+		if len(l_list_frame) > 0:
+			_, l_list_kept = l_obj_node.frame_parse_many(*zip(*l_list_frame))
+
+		if l_obj_node.m_cls_objs is not None:
+			for l_int_key, l_obj_ent in l_obj_node.m_cls_objs.m_dict_ents.items():
+				l_int_pos = 0
+				if l_bool_first == False and l_int_key not in l_set_own and l_obj_base is not None:
+					try:
+						# Default value copied on first write (see 'node_merge')
+						l_int_pos = len(l_obj_base.ent_get(
+							l_int_key >> CANP_OBJS__SUB_BITS,
+							l_int_key & CANP_OBJS__SUB_MASK).m_obj_hist)
+						# - except KeyError -
+					except KeyError:
+						pass
+
+				l_dict_hist[l_int_key] = (
+					l_obj_ent.m_obj_hist.list_time()[l_int_pos:],
+					l_obj_ent.m_obj_hist.list_vals()[l_int_pos:])
+
+				if l_bool_last == True:
+					# Rebuilt by the caller (not sent back twice)
+					l_obj_ent.m_obj_hist = None
+
+		if l_bool_first == False:
+			l_obj_node.m_tuple_keep, l_obj_node.m_dict_keep = l_tuple_keep, l_dict_keep
+
+		if l_obj_node.m_dict_pdos is not None:
+			l_bool_store = any(l_tuple_pdo[CANP_NODE__PDO_STORE] for l_tuple_pdo in l_obj_node.m_dict_pdos.values())
+
+		# Shared configuration is linked back by the caller (not sent back)
+		l_obj_node.m_cls_cnfs = None
+
+		return (l_obj_node if l_bool_last == True else None, l_dict_hist, l_list_kept, l_bool_store)
+
+	@staticmethod
+	def node_merge(
+				i_obj_node: Any,
+				i_list_hist: List[Dict[int, Tuple[List[float], List[Any]]]] = []
+			) -> None:
+		""" Node of the last range completed (histories of every range appended in order)
+			Objects first stored after the first range start from their default value, as when parsed in order
+		"""
+		l_list_seg: List[Tuple[List[float], List[Any]]] = []
+		l_obj_base: Any = None
+		l_obj_ent: Any = None
+		l_obj_hist: Any = None
+		l_int_idx: int = 0
+		l_int_sub: int = 0
+
+		if i_obj_node.m_cls_objs is not None:
+			l_obj_base = i_obj_node.m_cls_objs.m_cls_base
+
+		for l_int_key in dict.fromkeys(l_int_key for l_dict_hist in i_list_hist for l_int_key in l_dict_hist):
+			l_int_idx = l_int_key >> CANP_OBJS__SUB_BITS
+			l_int_sub = l_int_key & CANP_OBJS__SUB_MASK
+
+			l_list_seg = []
+			if l_int_key in i_list_hist[0]:
+				l_list_seg = [i_list_hist[0][l_int_key]]
+			elif l_obj_base is not None:
+				try:
+					# Default value (as copied on first write, see 'canp_node.obj_slot')
+					l_obj_hist = l_obj_base.ent_get(l_int_idx, l_int_sub).m_obj_hist
+					# - except KeyError -
+					l_list_seg = [(l_obj_hist.list_time(), l_obj_hist.list_vals())]
+				except KeyError:
+					pass
+
+			l_list_seg.extend(l_dict_hist[l_int_key] for l_dict_hist in i_list_hist[1:] if l_int_key in l_dict_hist)
+
+			l_obj_ent = i_obj_node.obj_slot(l_int_idx, l_int_sub)
+
+			l_obj_hist = canp_node.hist_runs(
+				canp_hist(l_obj_ent.m_any_typ),
+				l_obj_ent.m_any_typ,
+				i_obj_node.runs_get(l_int_idx, l_int_sub))
+			if i_obj_node.m_tuple_keep != CANP_HIST__KEEP_NONE or i_obj_node.m_dict_keep is not None:
+				l_obj_hist.keep_set(i_obj_node.keep_get(l_int_idx, l_int_sub))
+
+			for l_list_time, l_list_vals in l_list_seg:
+				if len(l_list_time) > 0:
+					l_obj_hist.extend_cols(l_list_time, l_list_vals)
+
+			l_obj_ent.m_obj_hist = l_obj_hist
+			if len(l_obj_hist) > 0:
+				l_obj_ent.m_any_data = l_obj_hist[-1][1]
+
+	@staticmethod
+	def list_frame(
+				i_narr_frame: Any
+			) -> List[Tuple[float, int, bytearray]]:
+		""" Frames as (time, cobid, data) tuples
+		"""
+		return [
+			(l_list_frame[0], l_list_frame[2], l_list_frame[3])
+			for l_list_frame in canp_load.list_narr(i_narr_frame)]
+
+	@staticmethod
+	def chan_parse(
+				i_obj_chan: Any,
+				i_narr_frame: Any,
+				i_int_jobs: int = 1
+			) -> List[Any]:
+		""" Channel frames dispatch (node streams, cut in ranges when there are more jobs than nodes)
+			Sync frames are not sent to the nodes (stored once, see 'canp_jour.bcast_add')
+			Journal positions are given from the next frame on, the frames are stored after (see 'chan_store')
+			Returns the tasks [(node id, node, node conf, journal positions of its frames, frames, ranges), ...]
+		"""
+		l_list_ret: List[Any] = []
+		l_dict_first: Dict[int, int] = {}
+		l_int_ranges: int = 1
+
+		l_narr_node = canp_pool.narr_node(i_narr_frame)
+		l_narr_bcast = canp_pool.narr_bcast(i_narr_frame, l_narr_node)
+		l_narr_valid = l_narr_node <= CANP_ENUM__NODE_MAX
+		l_narr_sync = l_narr_bcast & (i_narr_frame[CANP_LOAD__COL_COBID] == CANP_NODE__COB_SYNC)
+
+		# Journal positions (valid frames stored in order, see 'chan_store')
+		l_narr_seq = i_obj_chan.m_obj_jour.m_int_seq + np.cumsum(l_narr_valid) - 1
+
+		# Node creation (in order of appearance, as the sequential parser)
+		l_narr_own = ~l_narr_bcast & l_narr_valid
+		l_narr_uniq, l_narr_first = np.unique(l_narr_node[l_narr_own], return_index = True)
+		l_narr_first = np.flatnonzero(l_narr_own)[l_narr_first]
+		for l_int_first, l_int_node in sorted(zip(l_narr_first.tolist(), l_narr_uniq.tolist())):
+			if i_obj_chan[l_int_node] is None:
+				i_obj_chan.node_set(l_int_node)
+				l_dict_first[l_int_node] = l_int_first
+
+		l_narr_index = np.arange(len(i_narr_frame))
+		for l_int_node, l_obj_node in list(i_obj_chan.m_dict_nodes.items()):
+			# Sync frames once the node exists (from its first frame, or from this batch on)
+			if l_int_node in l_dict_first:
+				i_obj_chan.m_obj_jour.node_born(l_int_node, int(l_narr_seq[l_dict_first[l_int_node]]))
+			else:
+				i_obj_chan.m_obj_jour.node_born(l_int_node, i_obj_chan.m_obj_jour.m_int_seq)
+
+			# Own frames, plus nmt broadcast frames once the node exists
+			l_narr_mask = (l_narr_own & (l_narr_node == l_int_node)) \
+				| (l_narr_bcast & ~l_narr_sync & (l_narr_index > l_dict_first.get(l_int_node, CANP_ENUM__VAL_DEFAULT)))
+
+			if np.any(l_narr_mask):
+				# Share of the jobs (lazy decoding keeps payloads, not cut)
+				l_int_ranges = 1
+				if i_int_jobs > 1 and l_obj_node.m_int_decode != CANP_NODE__DECODE_LAZY:
+					l_int_ranges = min(
+						-(-i_int_jobs * int(np.count_nonzero(l_narr_mask)) // int(np.count_nonzero(l_narr_valid))),
+						int(np.count_nonzero(l_narr_mask)) // (2 * CANP_POOL__RANGE_MIN))
+
+				l_list_ret.append((
+					l_int_node,
+					l_obj_node,
+					l_obj_node.m_cls_cnfs,
+					l_narr_seq[l_narr_mask],
+					i_narr_frame[l_narr_mask],
+					canp_pool.node_ranges(l_obj_node, i_narr_frame[l_narr_mask], l_int_ranges)))
+
+		return l_list_ret
+
+	@staticmethod
+	def chan_store(
+				i_obj_chan: Any,
+				i_narr_frame: Any
+			) -> None:
+		""" Channel raw frames store (journal columns, in order, sync frames indexed once)
+			Same frames and positions as dispatched by 'chan_parse'
+		"""
+		l_narr_node = canp_pool.narr_node(i_narr_frame)
+		l_narr_valid = l_narr_node <= CANP_ENUM__NODE_MAX
+		l_narr_sync = canp_pool.narr_bcast(i_narr_frame, l_narr_node) \
+			& (i_narr_frame[CANP_LOAD__COL_COBID] == CANP_NODE__COB_SYNC)
+
+		if np.any(l_narr_valid):
+			l_int_seq = i_obj_chan.m_obj_jour.extend_cols(
+				i_narr_frame[CANP_LOAD__COL_TIME][l_narr_valid],
+				i_narr_frame[CANP_LOAD__COL_COBID][l_narr_valid],
+				i_narr_frame[CANP_LOAD__COL_DLC][l_narr_valid],
+				i_narr_frame[CANP_LOAD__COL_DATA][l_narr_valid])
+
+			i_obj_chan.m_obj_jour.bcast_add((l_int_seq + np.cumsum(l_narr_valid) - 1)[l_narr_sync].tolist())
+
+	@staticmethod
+	def card_parse(
+				i_obj_card: Any,
+				i_narr_frame: Any,
+				i_int_jobs: int = 0
+			) -> None:
+		""" Frames parser (through chan, node streams decoded in parallel)
+			Nodes are decoded in this process when a single task is left (one job or one short stream)
+			Chan and Node should already be configured first
+		"""
+		l_list_task: List[Any] = []
+		l_list_work: List[Any] = []
+		l_list_chan: List[Tuple[Any, Any]] = []
+		l_int_jobs: int = canp_pool.jobs_count(i_int_jobs)
+		l_int_work: int = 0
+		i_narr_frame = canp_load.narr_keep(i_narr_frame)
+		l_narr_chan = i_narr_frame[CANP_LOAD__COL_CHAN]
+
+		for l_int_chan in np.unique(l_narr_chan).tolist():
+			i_obj_card.chan_set(l_int_chan)
+			l_obj_chan = i_obj_card[l_int_chan]
+			l_list_chan.append((l_obj_chan, i_narr_frame[l_narr_chan == l_int_chan]))
+
+			for l_tuple_task in canp_pool.chan_parse(
+					l_obj_chan,
+					l_list_chan[-1][1],
+					l_int_jobs):
+				l_list_task.append((l_obj_chan,) + l_tuple_task)
+
+		l_int_work = sum(len(l_tuple_task[-1]) for l_tuple_task in l_list_task)
+
+		if l_int_jobs > 1 and l_int_work > 1:
+			with ProcessPoolExecutor(max_workers = min(l_int_jobs, l_int_work)) as l_obj_pool:
+				for _, _, l_obj_node, _, _, l_narr_frame, l_list_range in l_list_task:
+					if len(l_list_range) == 1:
+						l_list_work.append(l_obj_pool.submit(canp_pool.node_work, (l_obj_node, l_narr_frame)))
+					else:
+						l_list_work.append([
+							l_obj_pool.submit(canp_pool.range_work, (
+								l_obj_node,
+								l_tuple_range[CANP_POOL__RANGE_WARM],
+								l_tuple_range[CANP_POOL__RANGE_FRAME],
+								l_int_range == 0,
+								l_int_range == len(l_list_range) - 1))
+							for l_int_range, l_tuple_range in enumerate(l_list_range)])
+
+				# Channel raw frames stored while the nodes are decoded
+				for l_obj_chan, l_narr_frame in l_list_chan:
+					canp_pool.chan_store(l_obj_chan, l_narr_frame)
+
+				l_list_work = [
+					l_any_work.result() if not isinstance(l_any_work, list) else [l_obj_work.result() for l_obj_work in l_any_work]
+					for l_any_work in l_list_work]
+		else:
+			for l_obj_chan, l_narr_frame in l_list_chan:
+				canp_pool.chan_store(l_obj_chan, l_narr_frame)
+
+			l_list_work = [
+				canp_pool.node_work((l_obj_node, l_narr_frame))
+				for _, _, l_obj_node, _, _, l_narr_frame, _ in l_list_task]
+
+		# Merge back (decoded nodes replace the original ones)
+		for (l_obj_chan, l_int_node, l_obj_orig, l_cls_cnfs, l_narr_seq, l_narr_frame, l_list_range), l_any_work in zip(l_list_task, l_list_work):
+			if isinstance(l_any_work, list) and any(l_tuple_work[3] for l_tuple_work in l_any_work):
+				# Pdo frames storing mapping objects (ranges depend on each other, decoded in order here)
+				canp_pool.m_logs.info(f"pool.card_parse.node[{l_int_node}].ranges.mapping")
+				l_any_work = canp_pool.node_work((l_obj_orig, l_narr_frame))
+
+			if isinstance(l_any_work, list):
+				l_obj_node = l_any_work[-1][0]
+				l_obj_node.m_cls_cnfs = l_cls_cnfs
+				canp_pool.node_merge(l_obj_node, [l_tuple_work[1] for l_tuple_work in l_any_work])
+
+				l_list_kept = [
+					l_int_kept + l_tuple_range[CANP_POOL__RANGE_BEG]
+					for l_tuple_range, l_tuple_work in zip(l_list_range, l_any_work)
+					for l_int_kept in l_tuple_work[2]]
+			else:
+				l_obj_node, l_list_kept = l_any_work
+				l_obj_node.m_cls_cnfs = l_cls_cnfs
+
+			l_obj_node.nmt_link(l_obj_chan.m_narr_nmt, l_int_node)
+			l_obj_chan.m_dict_nodes[l_int_node] = l_obj_node
+
+			if len(l_list_kept) > 0:
+				l_obj_chan.m_obj_jour.node_add(l_int_node, l_narr_seq[l_list_kept].tolist())
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	if False:
+		pass
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# author: d.koch
+# coding: utf-8
+# naming: pep-0008
+# typing: pep-0484
+# docstring: pep-0257
+# indentation: tabulation
+
+""" canp_seek.py
+	Seeker
+	Memory mapped log reader with a sparse time/offset index
+"""
+
+#  --- IMPORT ---
+
+# Standard libraries (installed with python)
+
+#import logging
+import mmap
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from typing import Any
+#from typing import Callable
+#from typing import Dict
+from typing import List
+#from typing import Optional
+#from typing import Union
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# External libraries (installed with pip, conda, setup.py, ...)
+
+# python3 -m pip install --upgrade numpy
+import numpy as np
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+
+# Included libraries (this module, local files)
+
+from canp_enum import CANP_ENUM__APP_NAME
+
+from canp_enum import CANP_ENUM__HEAD_MAIN
+
+from canp_enum import CANP_ENUM__STR_EMPTY
+
+
+from canp_load import canp_load
+
+from canp_load import CANP_LOAD__BLOCK_SIZE
+from canp_load import CANP_LOAD__COL_COBID
+from canp_load import CANP_LOAD__COL_DLC
+from canp_load import CANP_LOAD__COL_TIME
+from canp_load import CANP_LOAD__DTYPE_FRAME
+
+
+from canp_args import canp_args
+from canp_logs import canp_logs
+
+#  --- GLOBAL ---
+
+# Index file (next to the log file)
+CANP_SEEK__STR_EXT = ".idx"
+CANP_SEEK__INT_VERSION = 1
+
+# Lines between two index points
+CANP_SEEK__STEP = 4096
+
+# Index columns
+CANP_SEEK__COL_TIME = "time"			# Timestamp of the first frame
+CANP_SEEK__COL_OFFS = "offs"			# Byte offset of the first line
+CANP_SEEK__COL_SYNC = "sync"			# Sync frames before the first line
+CANP_SEEK__COL_SIZE = "size"			# Log file size (staleness check)
+CANP_SEEK__COL_MTIME = "mtime"			# Log file mtime (staleness check)
+CANP_SEEK__COL_VERSION = "version"
+
+# Sync frame (candump, cobid 0x080 and no data)
+CANP_SEEK__COB_SYNC = 0x080
+
+list_CANP_SEEK__SYNC = [
+		b" 080#\n",
+		b" 080#\r",
+	]
+
+#  --- CLASS ---
+
+class canp_seek:
+	""" CAN log seeker
+	"""
+
+	# Log file name
+	m_str_file: str = CANP_ENUM__STR_EMPTY
+	# Memory mapped log file
+	m_obj_mmap: Any = None
+	# Index columns (see CANP_SEEK__COL_*)
+	m_narr_time: Any = None
+	m_narr_offs: Any = None
+	m_narr_sync: Any = None
+
+	# Logger object
+	m_logs = canp_logs.logger(CANP_ENUM__APP_NAME).getChild("seek")
+
+	def __init__(self,
+				i_str_file: str = CANP_ENUM__STR_EMPTY,
+				i_bool_save: bool = True,
+				**i_dict_args: Any
+			) -> None:
+		""" Constructor
+			Index is loaded if still valid, rebuilt (and saved) otherwise
+		"""
+		super().__init__(**i_dict_args)
+
+		if isinstance(i_str_file, str) and i_str_file != CANP_ENUM__STR_EMPTY:
+			self.m_str_file = i_str_file
+
+			with open(i_str_file, "rb") as l_obj_file:
+				if os.fstat(l_obj_file.fileno()).st_size > 0:
+					self.m_obj_mmap = mmap.mmap(
+						l_obj_file.fileno(),
+						0,
+						access = mmap.ACCESS_READ)
+				else:
+					self.m_obj_mmap = b""
+
+			if self.idx_load() == False:
+				self.idx_build()
+				if i_bool_save == True:
+					self.idx_save()
+		else:
+			self.m_logs.error(f"seek.__init__.file[{i_str_file}].unknown")
+
+	def __len__(self) -> int:
+		""" Size of (number of index points)
+		"""
+		l_int_ret: int = 0
+
+		if self.m_narr_offs is not None:
+			l_int_ret = len(self.m_narr_offs)
+
+		return l_int_ret
+
+	def close(self,
+			) -> None:
+		""" Release the memory mapped file
+		"""
+		if isinstance(self.m_obj_mmap, mmap.mmap):
+			self.m_obj_mmap.close()
+
+		self.m_obj_mmap = None
+
+	def idx_file(self,
+			) -> str:
+		""" Index file name
+		"""
+		return self.m_str_file + CANP_SEEK__STR_EXT
+
+	def idx_stat(self,
+			) -> List[int]:
+		""" Log file signature [size, mtime]
+		"""
+		l_obj_stat = os.stat(self.m_str_file)
+
+		return [l_obj_stat.st_size, l_obj_stat.st_mtime_ns]
+
+	def idx_load(self,
+			) -> bool:
+		""" Index loading (if present and still matching the log file)
+		"""
+		l_bool_ret: bool = False
+
+		try:
+			with open(self.idx_file(), "rb") as l_obj_file:
+				l_dict_idx = np.load(l_obj_file)
+				# - except OSError -
+				# - except ValueError -
+				if int(l_dict_idx[CANP_SEEK__COL_VERSION]) == CANP_SEEK__INT_VERSION \
+				and [int(l_dict_idx[CANP_SEEK__COL_SIZE]), int(l_dict_idx[CANP_SEEK__COL_MTIME])] == self.idx_stat():
+					self.m_narr_time = l_dict_idx[CANP_SEEK__COL_TIME]
+					self.m_narr_offs = l_dict_idx[CANP_SEEK__COL_OFFS]
+					self.m_narr_sync = l_dict_idx[CANP_SEEK__COL_SYNC]
+					l_bool_ret = True
+				else:
+					self.m_logs.info(f"seek.idx_load.file[{self.idx_file()}].stale")
+			# - except FileNotFoundError -
+		except FileNotFoundError:
+			pass
+		except (KeyError, OSError, ValueError):
+			self.m_logs.warning(f"seek.idx_load.file[{self.idx_file()}].corrupted")
+
+		return l_bool_ret
+
+	def idx_save(self,
+			) -> None:
+		""" Index saving (next to the log file)
+		"""
+		l_list_stat = self.idx_stat()
+
+		try:
+			with open(self.idx_file(), "wb") as l_obj_file:
+				np.savez(
+					l_obj_file,
+					**{
+						CANP_SEEK__COL_VERSION: CANP_SEEK__INT_VERSION,
+						CANP_SEEK__COL_SIZE: l_list_stat[0],
+						CANP_SEEK__COL_MTIME: l_list_stat[1],
+						CANP_SEEK__COL_TIME: self.m_narr_time,
+						CANP_SEEK__COL_OFFS: self.m_narr_offs,
+						CANP_SEEK__COL_SYNC: self.m_narr_sync,
+					})
+			# - except OSError -
+		except OSError:
+			self.m_logs.warning(f"seek.idx_save.file[{self.idx_file()}].readonly")
+
+	def idx_build(self,
+				i_int_step: int = CANP_SEEK__STEP,
+				i_int_block: int = CANP_LOAD__BLOCK_SIZE
+			) -> None:
+		""" Index building (one pass over the memory mapped file)
+		"""
+		l_list_time: List[float] = []
+		l_list_offs: List[int] = []
+		l_list_sync: List[int] = []
+		l_int_size: int = len(self.m_obj_mmap)
+		l_int_base: int = 0
+		l_int_line: int = 0
+		l_int_sync: int = 0
+
+		while l_int_base < l_int_size:
+			# Block cut at the last line boundary
+			l_bytes_block = self.m_obj_mmap[l_int_base:l_int_base + i_int_block]
+			l_int_eol = l_bytes_block.rfind(b"\n") + 1
+			if l_int_eol > 0 and l_int_base + len(l_bytes_block) < l_int_size:
+				l_bytes_block = l_bytes_block[:l_int_eol]
+
+			# Line starts (relative to the block)
+			l_narr_eol = np.flatnonzero(np.frombuffer(l_bytes_block, dtype = np.uint8) == ord("\n")) + 1
+			l_narr_line = np.concatenate(([0], l_narr_eol[l_narr_eol < len(l_bytes_block)]))
+
+			# Index points (every 'i_int_step' lines, file wise)
+			l_int_prev = 0
+			for l_int_offs in l_narr_line[(-l_int_line) % i_int_step::i_int_step].tolist():
+				for l_bytes_sync in list_CANP_SEEK__SYNC:
+					l_int_sync += l_bytes_block.count(l_bytes_sync, l_int_prev, l_int_offs)
+				l_int_prev = l_int_offs
+
+				l_list_time.append(self.line_time(l_int_base + l_int_offs))
+				l_list_offs.append(l_int_base + l_int_offs)
+				l_list_sync.append(l_int_sync)
+
+			for l_bytes_sync in list_CANP_SEEK__SYNC:
+				l_int_sync += l_bytes_block.count(l_bytes_sync, l_int_prev)
+
+			l_int_line += len(l_narr_line)
+			l_int_base += len(l_bytes_block)
+
+		# Index points without frame (header, comments) get the next known time
+		l_float_next = float("inf")
+		for l_int_loop in reversed(range(len(l_list_time))):
+			if l_list_time[l_int_loop] != l_list_time[l_int_loop]:
+				# nan
+				l_list_time[l_int_loop] = l_float_next
+			else:
+				l_float_next = l_list_time[l_int_loop]
+
+		self.m_narr_time = np.array(l_list_time, dtype = np.float64)
+		self.m_narr_offs = np.array(l_list_offs, dtype = np.uint64)
+		self.m_narr_sync = np.array(l_list_sync, dtype = np.uint64)
+
+	def line_time(self,
+				i_int_offs: int = 0
+			) -> float:
+		""" Timestamp of the first frame at (or after) a byte offset (nan if none nearby)
+		"""
+		l_float_ret: float = float("nan")
+		l_int_offs: int = i_int_offs
+
+		for l_int_loop in range(CANP_SEEK__STEP):
+			l_int_eol = self.m_obj_mmap.find(b"\n", l_int_offs)
+			if l_int_eol < 0:
+				l_int_eol = len(self.m_obj_mmap)
+
+			l_list_line = canp_load.list_line(
+				self.m_obj_mmap[l_int_offs:l_int_eol].decode("ascii", "replace"))
+			if len(l_list_line) > 0:
+				l_float_ret = l_list_line[0]
+				break
+
+			l_int_offs = l_int_eol + 1
+			if l_int_offs >= len(self.m_obj_mmap):
+				break
+
+		return l_float_ret
+
+	def narr_offs(self,
+				i_int_start: int = 0,
+				i_int_stop: int = -1
+			) -> Any:
+		""" Frames from a byte range (line aligned)
+		"""
+		l_narr_ret: Any = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		if i_int_stop < 0:
+			i_int_stop = len(self.m_obj_mmap)
+
+		if i_int_start < i_int_stop:
+			l_narr_ret = canp_load.narr_block(
+				self.m_obj_mmap[i_int_start:i_int_stop])
+
+		return l_narr_ret
+
+	def narr_time(self,
+				i_float_start: float = 0.0,
+				i_float_stop: float = float("inf")
+			) -> Any:
+		""" Frames within a time window [start, stop[
+			Only the index points around the window are parsed
+		"""
+		l_narr_ret: Any = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+
+		if len(self) > 0 and i_float_start < i_float_stop:
+			# Last index point before the window, first index point after it
+			l_int_start = int(np.searchsorted(self.m_narr_time, i_float_start, side = "left")) - 1
+			l_int_stop = int(np.searchsorted(self.m_narr_time, i_float_stop, side = "left"))
+
+			l_narr_ret = self.narr_offs(
+				int(self.m_narr_offs[max(l_int_start, 0)]),
+				int(self.m_narr_offs[l_int_stop]) if l_int_stop < len(self) else -1)
+
+			l_narr_time = l_narr_ret[CANP_LOAD__COL_TIME]
+			l_narr_ret = l_narr_ret[(l_narr_time >= i_float_start) & (l_narr_time < i_float_stop)]
+
+		return l_narr_ret
+
+	def narr_sync(self,
+				i_int_sync: int = 0,
+				i_int_count: int = 1
+			) -> Any:
+		""" Frames from the N-th sync (0 based) up to the (N + count)-th sync
+			Only the index points around the window are parsed
+		"""
+		l_narr_ret: Any = np.zeros(0, dtype = CANP_LOAD__DTYPE_FRAME)
+		l_list_narr: List[Any] = []
+		l_bool_start: bool = False
+		l_bool_stop: bool = False
+
+		if len(self) > 0 and i_int_sync >= 0 and i_int_count > 0:
+			# Last index point before the requested sync
+			l_int_point = max(int(np.searchsorted(self.m_narr_sync, i_int_sync, side = "right")) - 1, 0)
+			l_int_sync = int(self.m_narr_sync[l_int_point])
+
+			# Parse index point after index point, until the last sync is seen
+			while l_int_point < len(self) and l_bool_stop == False:
+				l_narr_frame = self.narr_offs(
+					int(self.m_narr_offs[l_int_point]),
+					int(self.m_narr_offs[l_int_point + 1]) if l_int_point + 1 < len(self) else -1)
+
+				# Syncs in this part (numbered from 'l_int_sync')
+				l_narr_pos = np.flatnonzero(
+					(l_narr_frame[CANP_LOAD__COL_COBID] == CANP_SEEK__COB_SYNC)
+					& (l_narr_frame[CANP_LOAD__COL_DLC] == 0))
+				l_int_first = 0
+				l_int_last = len(l_narr_frame)
+
+				if l_bool_start == False:
+					if 0 <= i_int_sync - l_int_sync < len(l_narr_pos):
+						l_int_first = int(l_narr_pos[i_int_sync - l_int_sync])
+						l_bool_start = True
+					else:
+						l_int_first = l_int_last
+
+				if 0 <= i_int_sync + i_int_count - l_int_sync < len(l_narr_pos):
+					l_int_last = int(l_narr_pos[i_int_sync + i_int_count - l_int_sync])
+					l_bool_stop = True
+
+				l_list_narr.append(l_narr_frame[l_int_first:l_int_last])
+				l_int_sync += len(l_narr_pos)
+				l_int_point += 1
+
+			if len(l_list_narr) > 0:
+				l_narr_ret = np.concatenate(l_list_narr)
+
+		return l_narr_ret
+
+#  --- MAIN ---
+
+def __main__(i_list_args: List = []):
+	""" Basic self test (debugging)
+	"""
+	LOG_FILE = "python_can.logger_c_2_all_axis_rot.log"
+
+	if True:
+		print("--- LOG SEEK ---")
+		l_obj_seek = canp_seek(LOG_FILE)
+		print(f"index points : {len(l_obj_seek)}")
+		l_narr_frame = l_obj_seek.narr_time(160.0, 161.0)
+		print(f"[160.0, 161.0[ : {len(l_narr_frame)} frames")
+		l_narr_frame = l_obj_seek.narr_sync(1000, 1)
+		print(f"sync[1000] : {len(l_narr_frame)} frames from {l_narr_frame[CANP_LOAD__COL_TIME][0]}")
+		l_obj_seek.close()
+	else:
+		pass
+
+if __name__ == CANP_ENUM__HEAD_MAIN:
+	""" Routine selector
+	"""
+	canp_args.dispatch(i_list_globals = globals())
@@ -170,10 +170,18 @@ def __main__(i_list_args: List = []):
 			i_int_node = CANP_TEST__NODE_GRIP,
 			i_str_file = CANP_TEST__FILE_DCF)
 
+		# Only the position is used below (other objects left undecoded)
+		for l_int_node in [CANP_TEST__NODE_AXIS_X, CANP_TEST__NODE_AXIS_Y, CANP_TEST__NODE_AXIS_Z]:
+			l_obj_can.node_lazy(
+				i_int_chan = CANP_TEST__CHAN,
+				i_int_node = l_int_node,
+				i_set_want = {(CANP_TEST__POS_OBJ, CANP_TEST__POS_SUB)})
+
 		# Select the data source (LOG file or real time CAN data)
 		if True:
 			g_logs.debug("--- CAN LOG PARSE ---")
-			l_obj_can.log_parse(
+			# Decoded once, then reloaded from the cache (same log and EDS/DCF files)
+			l_obj_can.cache_parse(
 				i_str_file = CANP_TEST__FILE_LOG)
 		else:
 			g_logs.debug("--- CAN BUS PARSE ---")
@@ -207,8 +215,8 @@ def __main__(i_list_args: List = []):
 		# Extracting X axis data (with numpy conversion)
 		l_list_x_can = l_obj_can[CANP_TEST__CHAN][CANP_TEST__NODE_AXIS_X][CANP_TEST__POS_OBJ][CANP_TEST__POS_SUB][CANP_ENUM__HEAD_LIST]
 		l_narr_x_can = np.zeros((len(l_list_x_can), 2))
-		l_narr_x_can[:, CANP_TEST__ARR_TMP] = [f[CANP_TEST__ARR_TMP] for f in l_list_x_can]
-		l_narr_x_can[:, CANP_TEST__ARR_POS] = [f[CANP_TEST__ARR_POS] / l_float_pos_ratio for f in l_list_x_can]
+		l_narr_x_can[:, CANP_TEST__ARR_TMP] = l_list_x_can.narr_time()
+		l_narr_x_can[:, CANP_TEST__ARR_POS] = l_list_x_can.narr_vals() / l_float_pos_ratio
 
 		# Starting timestamp (exact or manual value)
 		l_float_tmp_start = l_list_x_can[0][CANP_TEST__ARR_TMP]
@@ -229,8 +237,8 @@ def __main__(i_list_args: List = []):
 		# Extracting Y axis data (with numpy conversion)
 		l_list_y_can = l_obj_can[CANP_TEST__CHAN][CANP_TEST__NODE_AXIS_Y][CANP_TEST__POS_OBJ][0][CANP_ENUM__HEAD_LIST]
 		l_narr_y_can = np.zeros((len(l_list_y_can), 2))
-		l_narr_y_can[:, CANP_TEST__ARR_TMP] = [f[CANP_TEST__ARR_TMP] for f in l_list_y_can]
-		l_narr_y_can[:, CANP_TEST__ARR_POS] = [f[CANP_TEST__ARR_POS] / l_float_pos_ratio for f in l_list_y_can]
+		l_narr_y_can[:, CANP_TEST__ARR_TMP] = l_list_y_can.narr_time()
+		l_narr_y_can[:, CANP_TEST__ARR_POS] = l_list_y_can.narr_vals() / l_float_pos_ratio
 
 		# Offsetting time and position (plus zipping them)
 		l_list_y_ref_tmp = [ts + l_float_tmp_start for ts in [0.0, 16.15, 19.86, 20.81, 24.51, 53.0]]
@@ -247,8 +255,8 @@ def __main__(i_list_args: List = []):
 		# Extracting Z axis data (with numpy conversion)
 		l_list_z_can = l_obj_can[CANP_TEST__CHAN][CANP_TEST__NODE_AXIS_Z][CANP_TEST__POS_OBJ][0][CANP_ENUM__HEAD_LIST]
 		l_narr_z_can = np.zeros((len(l_list_z_can), 2))
-		l_narr_z_can[:, CANP_TEST__ARR_TMP] = [f[CANP_TEST__ARR_TMP] for f in l_list_z_can]
-		l_narr_z_can[:, CANP_TEST__ARR_POS] = [f[CANP_TEST__ARR_POS] / l_float_pos_ratio for f in l_list_z_can]
+		l_narr_z_can[:, CANP_TEST__ARR_TMP] = l_list_z_can.narr_time()
+		l_narr_z_can[:, CANP_TEST__ARR_POS] = l_list_z_can.narr_vals() / l_float_pos_ratio
 
 		# Offsetting time and position (plus zipping them)
 		l_list_z_ref_tmp = [ts + l_float_tmp_start for ts in [0.0, 26.38, 30.23, 30.71, 34.57, 53.0]]